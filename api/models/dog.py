@@ -119,6 +119,8 @@ class Animal(AnimalBase):
     breed_slug: str | None = None
     organization: Organization | None = None
     adoption_check_data: dict[str, Any] | None = None
+    # Another organization's listing of the same dog, when this looks like a cross-post
+    duplicate_of_id: int | None = None
 
 
 class AnimalFilter(BaseModel):
@@ -74,6 +74,10 @@ class AnimalFilterRequest(BaseModel):
 
     # Organization filter
     organization_id: int | None = Field(default=None, description="Filter by specific organization")
+    hide_duplicates: bool = Field(
+        default=False,
+        description="Hide likely duplicates of another organization's listed dog, showing each cross-posted dog once",
+    )
 
     # Availability and confidence
     availability_confidence: str = Field(
@@ -255,6 +259,7 @@ class AnimalFilterCountRequest(BaseModel):
 
     # Organization filter (context for counting)
     organization_id: int | None = Field(default=None, description="Organization context for counting")
+    hide_duplicates: bool = Field(default=False, description="Duplicate hiding context for counting")
 
     # Availability and confidence (context for counting)
     availability_confidence: str = Field(
@@ -13,6 +13,7 @@ from api.models.requests import AnimalFilterCountRequest, AnimalFilterRequest
 from api.models.responses import BreedStatsResponse, FilterCountsResponse
 from api.services import AnimalService
 from api.utils.sql_utils import escape_like_pattern
+from utils.metadata_dictionary import metadata_dictionary
 
 logger = logging.getLogger(__name__)
 
@@ -107,20 +108,7 @@ async def get_distinct_location_countries(
 ):
     """Get a distinct list of countries where organizations are located."""
     try:
-        # Query distinct, non-null, non-empty countries from the organizations
-        # table
-        cursor.execute(
-            """
-            SELECT DISTINCT country
-            FROM organizations
-            WHERE country IS NOT NULL AND country != '' AND active = TRUE
-            ORDER BY country ASC
-            """
-        )
-        results = cursor.fetchall()
-        # Extract the country name from each dictionary in the results
-        countries = [row["country"] for row in results]
-        return countries
+        return metadata_dictionary.get(cursor).location_countries
     except psycopg2.Error as db_err:
         handle_database_error(db_err, "get_distinct_location_countries")
     except Exception as e:
@@ -146,20 +134,7 @@ async def get_distinct_available_countries(
 ):
     """Get a distinct list of countries organizations can adopt to (from service_regions)."""
     try:
-        # Query distinct, non-null, non-empty countries from the service_regions table
-        # Also join with organizations to ensure we only consider active orgs
-        cursor.execute(
-            """
-            SELECT DISTINCT sr.country
-            FROM service_regions sr
-            JOIN organizations o ON sr.organization_id = o.id
-            WHERE sr.country IS NOT NULL AND sr.country != '' AND o.active = TRUE
-            ORDER BY sr.country ASC
-            """
-        )
-        results = cursor.fetchall()
-        countries = [row["country"] for row in results]
-        return countries
+        return metadata_dictionary.get(cursor).available_countries
     except psycopg2.Error as db_err:
         handle_database_error(db_err, "get_distinct_available_countries")
     except Exception as e:
@@ -186,20 +161,7 @@ async def get_distinct_available_regions(
 ):
     """Get a distinct list of regions within a specific country organizations can adopt to."""
     try:
-        # Query distinct regions from service_regions table for consistency
-        cursor.execute(
-            """
-            SELECT DISTINCT sr.region
-            FROM service_regions sr
-            JOIN organizations o ON sr.organization_id = o.id
-            WHERE sr.country = %s AND sr.region IS NOT NULL AND sr.region != '' AND o.active = TRUE
-            ORDER BY sr.region ASC
-            """,
-            (country,),  # Pass the country as a parameter
-        )
-        results = cursor.fetchall()
-        regions = [row["region"] for row in results]
-        return regions
+        return metadata_dictionary.get(cursor).regions_for(country)
     except psycopg2.Error as db_err:
         handle_database_error(db_err, f"get_distinct_available_regions({country})")
     except Exception as e:
@@ -259,17 +221,18 @@ async def get_stats_by_country(
         - countries: List of countries with dog counts and organization counts
     """
     try:
+        # Per-organization counters from animal_statistics; no animals scan.
         query = """
             SELECT
                 o.country as code,
                 o.country as name,
-                COUNT(a.id) as count,
-                COUNT(DISTINCT a.organization_id) as organizations
-            FROM animals a
-            JOIN organizations o ON a.organization_id = o.id
-            WHERE a.active = true AND o.active = true AND a.animal_type = 'dog'
+                SUM(s.active_dog_count)::int as count,
+                COUNT(*) as organizations
+            FROM animal_statistics s
+            JOIN organizations o ON s.organization_id = o.id
+            WHERE o.active = true AND s.active_dog_count > 0
             GROUP BY o.country
-            ORDER BY COUNT(a.id) DESC
+            ORDER BY SUM(s.active_dog_count) DESC
         """
         cursor.execute(query)
         countries = cursor.fetchall()
@@ -491,7 +454,14 @@ async def get_filter_counts(
 async def get_statistics(
     cursor: RealDictCursor = Depends(get_pooled_db_cursor),
 ):
-    """Get aggregated statistics about available dogs and organizations."""
+    """
+    Get aggregated statistics about available dogs and organizations.
+
+    Counts come from the animal_statistics counters. An organization's
+    new_this_week rises as dogs are added but only drops when the scraper cron
+    reconciles the counters (Mon/Thu/Sat), so a dog can count as new for up to
+    three days past its seventh.
+    """
     try:
         animal_service = AnimalService(cursor)
         return animal_service.get_statistics()
@@ -518,7 +488,12 @@ async def get_random_animals(
     status: str | None = Query("available", description="Animal status"),
     cursor: RealDictCursor = Depends(get_pooled_db_cursor),
 ):
-    """Get random available dogs for featured section."""
+    """
+    Get random available dogs for featured section.
+
+    The order is the stored weekly shuffle (services/weekly_shuffle.py), so it
+    is stable within a week and read straight from idx_animals_shuffle.
+    """
     try:
         query = """
             SELECT id, name, slug, animal_type, breed, standardized_breed, breed_group,
@@ -530,7 +505,7 @@ async def get_random_animals(
                    dog_profiler_data
             FROM animals
             WHERE animal_type = 'dog' AND status = %s AND active = true
-            ORDER BY (abs(hashtext(id::text || to_char(now(), 'IYYY-IW'))) %% 1000)
+            ORDER BY shuffle_key, id
             LIMIT %s
         """
         params = [status, limit]
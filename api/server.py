@@ -0,0 +1,245 @@
+# api/server.py
+
+"""
+Production launch profile for the API.
+
+start.sh used to run a single uvicorn process with default settings. This
+module sizes the worker count, imports the app once and pre-forks the
+workers from it, and sets connection timeouts for the traffic the API
+actually serves: Vercel ISR revalidation fetches arriving through Railway's
+edge proxy.
+
+Worker count:
+- CPU bound: 2 x CPUs + 1, where CPUs honours the container's cgroup quota
+  rather than the host's core count.
+- Pool bound: every worker opens its own psycopg2 pool of up to
+  DB_POOL_MAX_CONN connections, so the workers must fit inside the
+  database's connection budget (DB_MAX_CONNECTIONS less
+  DB_RESERVED_CONNECTIONS for the scraper cron and migrations). Unless
+  DB_POOL_MAX_CONN is set, workers launched here get PREFORK_POOL_MAX_CONN
+  rather than the single-process default of 50, which would leave room for
+  only one worker.
+- WEB_CONCURRENCY overrides both.
+
+Protocol: Railway's edge terminates TLS and HTTP/2; the hop to the app is
+HTTP/1.1. What matters on that hop is that the app never closes an idle
+keep-alive connection before the proxy does, otherwise a revalidation burst
+races the close and sees connection resets. API_KEEP_ALIVE therefore
+defaults well above the proxy's idle timeout.
+
+Usage:
+    python -m api.server
+"""
+
+import gc
+import logging
+import math
+import os
+import signal
+import socket
+import sys
+import time
+from dataclasses import dataclass
+
+import uvicorn
+
+logger = logging.getLogger(__name__)
+
+APP = "api.main:app"
+
+DEFAULT_DB_MAX_CONNECTIONS = 100
+DEFAULT_DB_RESERVED_CONNECTIONS = 20
+PREFORK_POOL_MAX_CONN = 12
+DEFAULT_KEEP_ALIVE_SECONDS = 75
+DEFAULT_GRACEFUL_SHUTDOWN_SECONDS = 20
+DEFAULT_BACKLOG = 2048
+
+# A worker that exits sooner than this after being forked is failing at
+# startup; respawning it would only loop.
+MIN_WORKER_UPTIME_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class ServerProfile:
+    """Settings for one API launch."""
+
+    host: str
+    port: int
+    workers: int
+    pool_max_conn: int
+    keep_alive: int
+    graceful_shutdown: int
+    backlog: int
+    sizing: str
+
+
+def available_cpus() -> int:
+    """CPUs this process may use, honouring a cgroup v2 quota when one is set."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+
+    return cpus
+
+
+def autosize_workers(cpus: int, pool_max_conn: int, db_max_connections: int, reserved_connections: int) -> tuple[int, str]:
+    """
+    Pick the worker count and name the limit that decided it.
+
+    Returns:
+        (workers, "cpu" | "pool")
+    """
+    cpu_bound = 2 * cpus + 1
+    pool_bound = max(1, (db_max_connections - reserved_connections) // max(1, pool_max_conn))
+    if pool_bound < cpu_bound:
+        return pool_bound, "pool"
+    return cpu_bound, "cpu"
+
+
+def load_profile(env: dict[str, str] | None = None) -> ServerProfile:
+    """Build the launch profile from the environment."""
+    env = os.environ if env is None else env
+    pool_max_conn = int(env.get("DB_POOL_MAX_CONN", PREFORK_POOL_MAX_CONN))
+
+    if env.get("WEB_CONCURRENCY"):
+        workers, sizing = max(1, int(env["WEB_CONCURRENCY"])), "WEB_CONCURRENCY"
+    else:
+        workers, sizing = autosize_workers(
+            available_cpus(),
+            pool_max_conn,
+            int(env.get("DB_MAX_CONNECTIONS", DEFAULT_DB_MAX_CONNECTIONS)),
+            int(env.get("DB_RESERVED_CONNECTIONS", DEFAULT_DB_RESERVED_CONNECTIONS)),
+        )
+
+    return ServerProfile(
+        host=env.get("API_HOST", "0.0.0.0"),
+        port=int(env.get("PORT", 8080)),
+        workers=workers,
+        pool_max_conn=pool_max_conn,
+        keep_alive=int(env.get("API_KEEP_ALIVE", DEFAULT_KEEP_ALIVE_SECONDS)),
+        graceful_shutdown=int(env.get("API_GRACEFUL_SHUTDOWN", DEFAULT_GRACEFUL_SHUTDOWN_SECONDS)),
+        backlog=int(env.get("API_BACKLOG", DEFAULT_BACKLOG)),
+        sizing=sizing,
+    )
+
+
+def build_config(profile: ServerProfile) -> uvicorn.Config:
+    return uvicorn.Config(
+        APP,
+        host=profile.host,
+        port=profile.port,
+        proxy_headers=True,
+        forwarded_allow_ips="*",
+        timeout_keep_alive=profile.keep_alive,
+        timeout_graceful_shutdown=profile.graceful_shutdown,
+        backlog=profile.backlog,
+    )
+
+
+class PreforkSupervisor:
+    """
+    Fork uvicorn workers from a parent that has already imported the app.
+
+    The app and every module it imports are loaded once and shared
+    copy-on-write. Database pools are created per worker by the app's
+    lifespan, after the fork, so no connection is shared between processes.
+    """
+
+    def __init__(self, config: uvicorn.Config, sock: socket.socket, workers: int):
+        self.config = config
+        self.sock = sock
+        self.workers = workers
+        self.children: dict[int, float] = {}
+        self.stopping = False
+        self.exit_code = 0
+
+    def run(self) -> int:
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+
+        # Objects that exist now are never collected, so the collector won't
+        # touch (and un-share) their pages in the workers.
+        gc.freeze()
+        for _ in range(self.workers):
+            self._spawn()
+
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            started = self.children.pop(pid, time.monotonic())
+            if self.stopping:
+                continue
+
+            code = os.waitstatus_to_exitcode(status)
+            if time.monotonic() - started < MIN_WORKER_UPTIME_SECONDS:
+                logger.error(f"Worker {pid} exited during startup (code {code}); stopping")
+                self.exit_code = 1
+                self._stop_children()
+            else:
+                logger.warning(f"Worker {pid} exited (code {code}); respawning")
+                self._spawn()
+
+        return self.exit_code
+
+    def _spawn(self) -> None:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            code = 0
+            try:
+                uvicorn.Server(self.config).run(sockets=[self.sock])
+            except BaseException:
+                logger.exception("Worker crashed")
+                code = 1
+            finally:
+                os._exit(code)
+        self.children[pid] = time.monotonic()
+
+    def _handle_stop(self, signum, frame) -> None:
+        self.stopping = True
+        self._stop_children()
+
+    def _stop_children(self) -> None:
+        self.stopping = True
+        for pid in self.children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+
+def serve(profile: ServerProfile) -> int:
+    # Read by api.database.connection_pool when the app is imported, below
+    os.environ["DB_POOL_MAX_CONN"] = str(profile.pool_max_conn)
+    config = build_config(profile)
+    logger.info(
+        f"Starting API: {profile.workers} worker(s) sized by {profile.sizing}, pool of {profile.pool_max_conn} per worker, "
+        f"keep-alive {profile.keep_alive}s, graceful shutdown {profile.graceful_shutdown}s, backlog {profile.backlog}"
+    )
+    if profile.sizing == "pool":
+        logger.warning(f"Worker count limited to {profile.workers} by the database connection budget; lower DB_POOL_MAX_CONN ({profile.pool_max_conn}) or raise DB_MAX_CONNECTIONS to run more")
+
+    if profile.workers == 1:
+        uvicorn.Server(config).run()
+        return 0
+
+    config.load()
+    sock = config.bind_socket()
+    return PreforkSupervisor(config, sock, profile.workers).run()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(serve(load_profile()))
@@ -0,0 +1,127 @@
+# api/services/animal_id_cache.py
+
+"""
+Per-ID cache with multi-get semantics for batch animal lookups.
+
+Batch endpoints are called with overlapping ID lists - the favourites page
+re-requests the same dogs plus one, the MCP server looks up detail sets that
+share most of their members. Caching whole lists under a hash of the IDs
+means two lists sharing 49 of 50 dogs share no work. Caching per ID lets a
+request query only the IDs that are not already held, and return the rest
+from memory in the caller's order.
+
+Instances are process-wide: services are built per request, so a cache held
+on the service instance would be discarded before it could ever hit. Callers
+get copies, so a response adjusted for one request never leaks into the next.
+
+Nothing invalidates these caches when scrapes, the adoption checker or stale
+detection write to animals: those run in other processes. A batch response
+can therefore be up to its cache's TTL out of date (5 minutes for batch
+rows, 1 minute for enhanced bulk data).
+"""
+
+import copy
+import threading
+from collections.abc import Callable, Iterable
+from typing import Generic, TypeVar
+
+from cachetools import TTLCache
+
+V = TypeVar("V")
+
+
+class AnimalIdCache(Generic[V]):
+    """TTL cache keyed by animal ID, read and filled in batches."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    @property
+    def maxsize(self) -> int:
+        return int(self._cache.maxsize)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+    def __contains__(self, animal_id: object) -> bool:
+        with self._lock:
+            return animal_id in self._cache
+
+    def get_many(self, animal_ids: Iterable[int]) -> tuple[dict[int, V], list[int]]:
+        """
+        Split IDs into cached values and IDs still to be fetched.
+
+        Returns:
+            Tuple of ({id: copy of value} for hits, missing IDs in first-seen
+            order). Duplicate IDs are reported once.
+        """
+        found: dict[int, V] = {}
+        missing: list[int] = []
+
+        with self._lock:
+            for animal_id in dict.fromkeys(animal_ids):
+                value = self._cache.get(animal_id)
+                if value is None:
+                    missing.append(animal_id)
+                else:
+                    found[animal_id] = value
+
+        return {animal_id: copy.deepcopy(value) for animal_id, value in found.items()}, missing
+
+    def set_many(self, values: dict[int, V]) -> None:
+        """Store values under their animal IDs."""
+        with self._lock:
+            for animal_id, value in values.items():
+                self._cache[animal_id] = value
+
+    def fetch_many(
+        self,
+        animal_ids: list[int],
+        loader: Callable[[list[int]], dict[int, V]],
+        on_hit: Callable[[V], None] | None = None,
+    ) -> tuple[list[V], int]:
+        """
+        Return values for the given IDs in caller order, loading only misses.
+
+        Args:
+            animal_ids: Requested IDs; order is preserved, duplicates collapse
+            loader: Called once with the uncached IDs, returns {id: value} for
+                those that exist. IDs it omits are left out of the result and
+                are not cached, so a dog that appears later is picked up.
+            on_hit: Called with the copy of each value served from the cache,
+                e.g. to flag it as cached
+
+        Returns:
+            Tuple of (values in request order, number of cache hits). The
+            values are the caller's own copies.
+        """
+        found, missing = self.get_many(animal_ids)
+        hits = len(found)
+        if on_hit:
+            for value in found.values():
+                on_hit(value)
+
+        if missing:
+            loaded = loader(missing)
+            if loaded:
+                self.set_many(loaded)
+                found.update({animal_id: copy.deepcopy(value) for animal_id, value in loaded.items()})
+
+        ordered = [found[animal_id] for animal_id in dict.fromkeys(animal_ids) if animal_id in found]
+        return ordered, hits
+
+    def invalidate(self, animal_id: int | None = None) -> None:
+        """Drop one animal, or everything when no ID is given."""
+        with self._lock:
+            if animal_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(animal_id, None)
+
+
+# Process-wide caches shared by every request-scoped service instance.
+# Not invalidated by scrapes; entries are served until their TTL expires.
+animal_batch_cache: AnimalIdCache = AnimalIdCache(maxsize=2000, ttl=300)  # /api/animals/batch rows
+enhanced_bulk_cache: AnimalIdCache = AnimalIdCache(maxsize=2000, ttl=60)  # /enhanced/bulk responses
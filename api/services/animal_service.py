@@ -18,12 +18,18 @@ from api.exceptions import APIException
 from api.models.dog import Animal
 from api.models.requests import AnimalFilterCountRequest, AnimalFilterRequest
 from api.models.responses import FilterCountsResponse, FilterOption
+from api.services.animal_id_cache import AnimalIdCache, animal_batch_cache
 from api.utils.json_parser import build_organization_object, parse_json_field
 from api.utils.sql_utils import escape_like_pattern
 from utils.breed_utils import QUALIFYING_BREED_MIN_COUNT, generate_breed_slug
+from utils.metadata_dictionary import MetadataDictionary, metadata_dictionary
 
 logger = logging.getLogger(__name__)
 
+# An animal listed by another organization that is still listed: with
+# hide_duplicates, only the original of a cross-posted dog is shown
+DUPLICATE_LISTED_CONDITION = "NOT EXISTS (SELECT 1 FROM animals d WHERE d.id = a.duplicate_of_id AND d.active = true)"
+
 
 def _normalize_url(url: str | None) -> str | None:
     """Normalize protocol-relative URLs to HTTPS."""
@@ -35,9 +41,11 @@ def _normalize_url(url: str | None) -> str | None:
 class AnimalService:
     """Service layer for animal operations."""
 
-    def __init__(self, cursor: RealDictCursor):
+    def __init__(self, cursor: RealDictCursor, batch_cache: AnimalIdCache | None = None, metadata: MetadataDictionary | None = None):
         self.cursor = cursor
         self.batch_executor = create_batch_executor(cursor)
+        self.batch_cache = batch_cache if batch_cache is not None else animal_batch_cache
+        self.metadata = metadata if metadata is not None else metadata_dictionary
 
     def get_animals(self, filters: AnimalFilterRequest) -> list[Animal]:
         """
@@ -442,40 +450,19 @@ class AnimalService:
             )
 
     def get_animals_by_ids(self, animal_ids: list[int]) -> list[Animal]:
-        """Get multiple animals by their IDs, for batch retrieval (e.g. favorites)."""
+        """Get multiple animals by their IDs, for batch retrieval (e.g. favorites).
+
+        Animals are cached per ID, so overlapping batches only query the IDs
+        not already held. Results follow the order of ``animal_ids``; IDs that
+        do not resolve to an active dog are omitted.
+        """
         if not animal_ids:
             return []
 
         try:
-            query = """
-                SELECT a.id, a.slug, a.name, a.animal_type, a.breed, a.standardized_breed, a.breed_group,
-                       a.primary_breed, a.breed_type, a.breed_confidence, a.secondary_breed, a.breed_slug,
-                       a.age_text, a.age_min_months, a.age_max_months, a.sex, a.size, a.standardized_size,
-                       a.status, a.primary_image_url, a.adoption_url, a.organization_id, a.external_id,
-                       a.language, a.properties, a.created_at, a.updated_at, a.last_scraped_at,
-                       a.availability_confidence, a.last_seen_at, a.consecutive_scrapes_missing,
-                       a.dog_profiler_data,
-                       o.name as org_name,
-                       o.slug as org_slug,
-                       o.city as org_city,
-                       o.country as org_country,
-                       o.website_url as org_website_url,
-                       o.logo_url as org_logo_url,
-                       o.social_media as org_social_media,
-                       o.ships_to as org_ships_to
-                FROM animals a
-                LEFT JOIN organizations o ON a.organization_id = o.id
-                WHERE a.id = ANY(%s)
-                  AND a.animal_type = 'dog'
-                  AND o.active = TRUE
-                ORDER BY a.name ASC
-            """
-
-            self.cursor.execute(query, [animal_ids])
-            animal_rows = self.cursor.fetchall()
-            logger.info(f"Batch fetch: requested {len(animal_ids)} IDs, found {len(animal_rows)} animals")
-
-            return self._build_animals_response(animal_rows)
+            animals, hits = self.batch_cache.fetch_many(animal_ids, self._fetch_animals_by_ids)
+            logger.info(f"Batch fetch: requested {len(animal_ids)} IDs, {hits} cached, found {len(animals)} animals")
+            return animals
 
         except Exception as e:
             logger.exception(f"Error in batch fetch for {len(animal_ids)} animals: {e}")
@@ -485,6 +472,35 @@ class AnimalService:
                 error_code="INTERNAL_ERROR",
             )
 
+    def _fetch_animals_by_ids(self, animal_ids: list[int]) -> dict[int, Animal]:
+        """Load animals for the given IDs in one query, keyed by ID."""
+        query = """
+            SELECT a.id, a.slug, a.name, a.animal_type, a.breed, a.standardized_breed, a.breed_group,
+                   a.primary_breed, a.breed_type, a.breed_confidence, a.secondary_breed, a.breed_slug,
+                   a.age_text, a.age_min_months, a.age_max_months, a.sex, a.size, a.standardized_size,
+                   a.status, a.primary_image_url, a.adoption_url, a.organization_id, a.external_id,
+                   a.language, a.properties, a.created_at, a.updated_at, a.last_scraped_at,
+                   a.availability_confidence, a.last_seen_at, a.consecutive_scrapes_missing,
+                   a.dog_profiler_data, a.duplicate_of_id,
+                   o.name as org_name,
+                   o.slug as org_slug,
+                   o.city as org_city,
+                   o.country as org_country,
+                   o.website_url as org_website_url,
+                   o.logo_url as org_logo_url,
+                   o.social_media as org_social_media,
+                   o.ships_to as org_ships_to
+            FROM animals a
+            LEFT JOIN organizations o ON a.organization_id = o.id
+            WHERE a.id = ANY(%s)
+              AND a.animal_type = 'dog'
+              AND o.active = TRUE
+        """
+
+        self.cursor.execute(query, [animal_ids])
+        animal_rows = self.cursor.fetchall()
+        return {animal.id: animal for animal in self._build_animals_response(animal_rows)}
+
     def _build_single_animal_response(self, row: dict) -> Animal:
         """Build a single animal response with adoption data if available."""
         # Parse properties JSON field properly
@@ -558,26 +574,7 @@ class AnimalService:
         with its crosses.
         """
         try:
-            query = """
-                SELECT DISTINCT primary_breed
-                FROM animals
-                WHERE primary_breed IS NOT NULL
-                  AND primary_breed != ''
-                  AND primary_breed NOT IN ('Yes', 'No', 'Unknown')
-                  AND LENGTH(primary_breed) > 1
-                  AND status = 'available'
-                  AND active = true
-            """
-            params = []
-
-            if breed_group and breed_group != "Any group":
-                query += " AND breed_group = %s"
-                params.append(breed_group)
-
-            query += " ORDER BY primary_breed"
-
-            self.cursor.execute(query, tuple(params))
-            return [row["primary_breed"] for row in self.cursor.fetchall()]
+            return self.metadata.get(self.cursor).breeds_for(breed_group)
 
         except Exception as e:
             logger.error(f"Error in get_distinct_breeds: {e}")
@@ -590,20 +587,7 @@ class AnimalService:
     def get_distinct_breed_groups(self) -> list[str]:
         """Get distinct breed groups."""
         try:
-            self.cursor.execute(
-                """
-                SELECT DISTINCT breed_group
-                FROM animals
-                WHERE breed_group IS NOT NULL
-                  AND breed_group != ''
-                  AND breed_group NOT IN ('Unknown')
-                  AND status = 'available'
-                  AND active = true
-                ORDER BY breed_group
-            """
-            )
-
-            return [row["breed_group"] for row in self.cursor.fetchall()]
+            return self.metadata.get(self.cursor).breed_groups
 
         except Exception as e:
             logger.error(f"Error in get_distinct_breed_groups: {e}")
@@ -614,68 +598,39 @@ class AnimalService:
             )
 
     def get_statistics(self) -> dict[str, Any]:
-        """Get aggregated statistics about animals and organizations."""
-        try:
-            stats = {}
-
-            # Get total available dogs count
-            self.cursor.execute(
-                """
-                SELECT COUNT(*) as total
-                FROM animals
-                WHERE status = 'available'
-                  AND active = true
-                  AND availability_confidence IN ('high', 'medium')
-            """
-            )
-            stats["total_dogs"] = self.cursor.fetchone()["total"]
-
-            # Get total active organizations count
-            self.cursor.execute(
-                """
-                SELECT COUNT(*) as total
-                FROM organizations
-                WHERE active = TRUE
-            """
-            )
-            stats["total_organizations"] = self.cursor.fetchone()["total"]
-
-            # Get countries with dog counts
-            self.cursor.execute(
-                """
-                SELECT o.country, COUNT(a.id) as count
-                FROM animals a
-                JOIN organizations o ON a.organization_id = o.id
-                WHERE a.status = 'available'
-                  AND a.active = true
-                  AND a.availability_confidence IN ('high', 'medium')
-                  AND o.active = TRUE
-                  AND o.country IS NOT NULL
-                GROUP BY o.country
-                ORDER BY count DESC, o.country ASC
-            """
-            )
-            stats["countries"] = [{"country": row["country"], "count": row["count"]} for row in self.cursor.fetchall()]
+        """
+        Get aggregated statistics about animals and organizations.
 
-            # Get organizations with statistics
+        Reads the per-organization counters in animal_statistics (one row per
+        organization) rather than aggregating the animals table. new_this_week
+        lags until the next reconciliation once a dog passes seven days.
+        """
+        try:
             self.cursor.execute(
                 """
                 SELECT o.id, o.name, o.slug, o.logo_url, o.country, o.city, o.ships_to, o.service_regions,
-                       o.social_media, o.website_url, o.description,
-                       COUNT(a.id) as dog_count,
-                       COUNT(CASE WHEN a.created_at >= NOW() - INTERVAL '7 days' THEN 1 END) as new_this_week
+                       o.social_media, o.website_url, o.description, o.active,
+                       COALESCE(s.available_count, 0) as dog_count,
+                       COALESCE(s.new_this_week, 0) as new_this_week
                 FROM organizations o
-                LEFT JOIN animals a ON o.id = a.organization_id
-                    AND a.status = 'available'
-                    AND a.active = true
-                    AND a.availability_confidence IN ('high', 'medium')
-                WHERE o.active = TRUE
-                GROUP BY o.id, o.name, o.slug, o.logo_url, o.country, o.city, o.ships_to, o.service_regions,
-                         o.social_media, o.website_url, o.description
-                HAVING COUNT(a.id) > 0
+                LEFT JOIN animal_statistics s ON s.organization_id = o.id
                 ORDER BY dog_count DESC, o.name ASC
             """
             )
+            rows = self.cursor.fetchall()
+            active_rows = [row for row in rows if row["active"]]
+
+            country_counts: dict[str, int] = {}
+            for row in active_rows:
+                if row["country"] is not None and row["dog_count"] > 0:
+                    country_counts[row["country"]] = country_counts.get(row["country"], 0) + row["dog_count"]
+
+            stats = {
+                "total_dogs": sum(row["dog_count"] for row in rows),
+                "total_organizations": len(active_rows),
+                "countries": [{"country": country, "count": count} for country, count in sorted(country_counts.items(), key=lambda item: (-item[1], item[0]))],
+            }
+
             stats["organizations"] = [
                 {
                     "id": row["id"],
@@ -692,7 +647,8 @@ class AnimalService:
                     "website_url": row["website_url"],
                     "description": row["description"],
                 }
-                for row in self.cursor.fetchall()
+                for row in active_rows
+                if row["dog_count"] > 0
             ]
 
             return stats
@@ -1269,7 +1225,7 @@ class AnimalService:
                    a.status, a.primary_image_url, a.adoption_url, a.organization_id, a.external_id,
                    a.language, a.properties, a.created_at, a.updated_at, a.last_scraped_at,
                    a.availability_confidence, a.last_seen_at, a.consecutive_scrapes_missing,
-                   a.dog_profiler_data,
+                   a.dog_profiler_data, a.duplicate_of_id,
                    o.name as org_name,
                    o.slug as org_slug,
                    o.city as org_city,
@@ -1365,6 +1321,9 @@ class AnimalService:
             conditions.append("a.organization_id = %s")
             params.append(filters.organization_id)
 
+        if filters.hide_duplicates:
+            conditions.append(DUPLICATE_LISTED_CONDITION)
+
         if filters.location_country:
             conditions.append("o.country = %s")
             params.append(filters.location_country)
@@ -1413,7 +1372,8 @@ class AnimalService:
             order_clause = get_order_clause()
             query = f"{query_base}{joins} WHERE {where_clause} {order_clause} LIMIT %s OFFSET %s"
         elif filters.curation_type == "diverse":
-            # For diverse curation, maintain original random ordering per organization
+            # One dog per organization, picked by the stored weekly shuffle order
+            # (services/weekly_shuffle.py) so the index supplies the ordering
             query = f"""
                 SELECT DISTINCT ON (a.organization_id)
                        a.id, a.slug, a.name, a.animal_type, a.breed, a.standardized_breed, a.breed_group,
@@ -1422,7 +1382,7 @@ class AnimalService:
                        a.status, a.primary_image_url, a.adoption_url, a.organization_id, a.external_id,
                        a.language, a.properties, a.created_at, a.updated_at, a.last_scraped_at,
                        a.availability_confidence, a.last_seen_at, a.consecutive_scrapes_missing,
-                       a.dog_profiler_data,
+                       a.dog_profiler_data, a.duplicate_of_id,
                        o.name as org_name,
                        o.slug as org_slug,
                        o.city as org_city,
@@ -1435,7 +1395,7 @@ class AnimalService:
                 LEFT JOIN organizations o ON a.organization_id = o.id
                 {joins}
                 WHERE {where_clause}
-                ORDER BY a.organization_id, (abs(hashtext(a.id::text || to_char(now(), 'IYYY-IW'))) %% 1000)
+                ORDER BY a.organization_id, a.shuffle_key, a.id
                 LIMIT %s OFFSET %s
             """
         else:
@@ -1583,6 +1543,9 @@ class AnimalService:
             conditions.append("a.organization_id = %s")
             params.append(filters.organization_id)
 
+        if filters.hide_duplicates:
+            conditions.append(DUPLICATE_LISTED_CONDITION)
+
         # Profiler-based filters (LLM-enriched dog_profiler_data JSONB)
         if filters.energy_level:
             conditions.append("a.dog_profiler_data->>'energy_level' = %s")
@@ -13,7 +13,6 @@ Following CLAUDE.md principles:
 - Early returns
 """
 
-import hashlib
 import json
 import logging
 import time
@@ -30,10 +29,17 @@ from api.models.enhanced_animal import (
     EnhancedAnimalResponse,
     EnhancedAttributes,
 )
+from api.services.animal_id_cache import AnimalIdCache, enhanced_bulk_cache
 
 logger = logging.getLogger(__name__)
 
 
+def _mark_cached(response: EnhancedAnimalResponse) -> None:
+    """Flag a response served from the bulk cache."""
+    if response.metadata:
+        response.metadata["cached"] = True
+
+
 class EnhancedAnimalService:
     """Service for handling enhanced animal data operations."""
 
@@ -76,13 +82,13 @@ class EnhancedAnimalService:
                 details={"query": query[:100], "error": str(last_exception)},
             )
 
-    def __init__(self, cursor: RealDictCursor, max_retries: int = 3):
+    def __init__(self, cursor: RealDictCursor, max_retries: int = 3, bulk_cache: AnimalIdCache | None = None):
         """Initialize with database cursor and caches."""
         self.cursor = cursor
         self.max_retries = max_retries
         # Separate caches for different use cases
         self._detail_cache = TTLCache(maxsize=500, ttl=300)  # 5 min for detail pages
-        self._bulk_cache = TTLCache(maxsize=200, ttl=60)  # 1 min for bulk ops
+        self._bulk_cache = bulk_cache if bulk_cache is not None else enhanced_bulk_cache  # per-ID, shared across requests
         self._content_cache = TTLCache(maxsize=1000, ttl=300)  # 5 min for descriptions
 
         # Metrics counters
@@ -212,27 +218,24 @@ class EnhancedAnimalService:
 
     def get_bulk_enhanced(self, animal_ids: list[int]) -> list[EnhancedAnimalResponse]:
         """
-        Bulk retrieval with efficient batching.
+        Bulk retrieval with per-ID caching.
+
+        Only IDs missing from the cache are queried, so overlapping requests
+        share work. Results follow the order of ``animal_ids``.
 
         Performance target: <500ms for 100 animals
         """
         start_time = time.time()
 
-        # Use hash of sorted IDs as cache key for memory efficiency
-        cache_key = self._generate_bulk_cache_key(animal_ids)
-
-        # Check bulk cache
-        if cache_key in self._bulk_cache:
-            self._metrics["cache_hits"]["bulk"] += 1
-            cached = self._bulk_cache[cache_key]
-            # Mark as cached in metadata
-            for item in cached:
-                if item.metadata:
-                    item.metadata["cached"] = True
-            self._track_response_time(start_time)
-            return cached
+        responses, hits = self._bulk_cache.fetch_many(animal_ids, self._fetch_bulk_enhanced, on_hit=_mark_cached)
+        self._metrics["cache_hits"]["bulk"] += hits
+        self._metrics["cache_misses"]["bulk"] += len(dict.fromkeys(animal_ids)) - hits
 
-        self._metrics["cache_misses"]["bulk"] += 1
+        self._track_response_time(start_time)
+        return responses
+
+    def _fetch_bulk_enhanced(self, animal_ids: list[int]) -> dict[int, EnhancedAnimalResponse]:
+        """Load enhanced responses for uncached IDs in one query."""
         self._metrics["db_queries"]["bulk"] += 1
         logger.debug(f"Bulk cache miss for {len(animal_ids)} animals, fetching from database")
 
@@ -250,24 +253,12 @@ class EnhancedAnimalService:
                 END as has_data
             FROM animals
             WHERE id = ANY(%s)
-            ORDER BY id
         """
 
         self._execute_with_retry(query, (animal_ids,))
         results = self.cursor.fetchall()
 
-        responses = []
-        for row in results:
-            response = self._build_enhanced_response(dict(row))
-            responses.append(response)
-
-        # Cache the bulk result
-        if len(responses) <= 100:  # Only cache reasonable sized requests
-            self._bulk_cache[cache_key] = responses
-            logger.debug(f"Cached bulk result for {len(responses)} animals with key {cache_key}")
-
-        self._track_response_time(start_time)
-        return responses
+        return {row["id"]: self._build_enhanced_response(dict(row)) for row in results}
 
     def get_attributes(self, animal_ids: list[int], attributes: list[str]) -> dict[int, dict[str, Any]]:
         """
@@ -487,19 +478,6 @@ class EnhancedAnimalService:
         # If we can't parse it, return None
         return None
 
-    def _generate_bulk_cache_key(self, animal_ids: list[int]) -> str:
-        """
-        Generate memory-efficient cache key for bulk operations.
-
-        Uses SHA256 hash of sorted IDs to reduce memory footprint.
-        """
-        # Sort IDs for consistent hashing
-        sorted_ids = sorted(animal_ids)
-        # Create string representation
-        ids_str = ",".join(map(str, sorted_ids))
-        # Generate hash (first 16 chars is sufficient for uniqueness)
-        return hashlib.sha256(ids_str.encode()).hexdigest()[:16]
-
     def _ensure_list(self, value: Any) -> list[str]:
         """
         Ensure value is a list, converting strings if necessary.
@@ -534,7 +512,7 @@ class EnhancedAnimalService:
         if animal_id is None:
             # Clear all caches
             self._detail_cache.clear()
-            self._bulk_cache.clear()
+            self._bulk_cache.invalidate()
             self._content_cache.clear()
             logger.info("Cleared all enhanced data caches")
         else:
@@ -547,15 +525,13 @@ class EnhancedAnimalService:
             if content_key in self._content_cache:
                 del self._content_cache[content_key]
 
-            # Clear bulk cache (we can't efficiently check which hashes contain this ID)
-            # This is a trade-off for memory efficiency
-            self._bulk_cache.clear()
+            self._bulk_cache.invalidate(animal_id)
 
             logger.info(f"Invalidated cache for animal {animal_id}")
 
     def invalidate_bulk_cache(self) -> None:
         """Clear only the bulk cache."""
-        self._bulk_cache.clear()
+        self._bulk_cache.invalidate()
         logger.info("Cleared bulk enhanced data cache")
 
     def _track_response_time(self, start_time: float) -> None:
@@ -94,6 +94,22 @@ CREATE TABLE IF NOT EXISTS animals (
     -- Blur placeholder for image loading
     blur_data_url TEXT,
 
+    -- Weekly shuffle position for random/diverse listings (services/weekly_shuffle.py)
+    shuffle_key INTEGER,
+
+    -- Fingerprint of the scraped fields last saved (services/animal_data_preparation.py).
+    -- Writers that change scraped columns outside the save path set it to NULL.
+    content_hash VARCHAR(64),
+
+    -- Hash of the listing card behind the last detail fetch, and when that was
+    -- (scrapers/filtering/filtering_service.py)
+    listing_hash VARCHAR(64),
+    detail_checked_at TIMESTAMP,
+
+    -- Another organization's listing of the same dog, matched by photo and name
+    -- (services/image_hash_index.py)
+    duplicate_of_id INTEGER REFERENCES animals(id) ON DELETE SET NULL,
+
     -- Unique constraint to prevent duplicates
     UNIQUE (external_id, organization_id),
 
@@ -114,7 +130,39 @@ CREATE TABLE IF NOT EXISTS scrape_logs (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     detailed_metrics JSONB,
     duration_seconds NUMERIC(10,2),
-    data_quality_score NUMERIC(3,2) CHECK (data_quality_score >= 0 AND data_quality_score <= 1)
+    data_quality_score NUMERIC(3,2) CHECK (data_quality_score >= 0 AND data_quality_score <= 1),
+    -- Hash of the listing cards on a successful full crawl (scrapers/listing_fingerprint.py)
+    listing_fingerprint VARCHAR(64)
+);
+
+-- Scrape Checkpoints: animals each scrape has persisted, so a rerun shortly
+-- after an interrupted scrape can resume it (scrapers/base_scraper.py)
+CREATE TABLE IF NOT EXISTS scrape_checkpoints (
+    scrape_log_id INTEGER NOT NULL REFERENCES scrape_logs(id) ON DELETE CASCADE,
+    external_id VARCHAR(255) NOT NULL,
+    saved_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (scrape_log_id, external_id)
+);
+
+-- Image Hashes: perceptual hash of each source image uploaded, for matching
+-- dogs cross-posted by several organizations (services/image_hash_index.py)
+CREATE TABLE IF NOT EXISTS image_hashes (
+    original_image_url TEXT PRIMARY KEY,
+    image_hash BIGINT NOT NULL,
+    hashed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Page Validators: ETag, Last-Modified and body hash of each detail page a
+-- successful scrape fetched, for conditional fetches (scrapers/response_cache.py)
+CREATE TABLE IF NOT EXISTS page_validators (
+    organization_id INTEGER NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    url TEXT NOT NULL,
+    content_hash VARCHAR(64) NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    parser_version VARCHAR(16),
+    fetched_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (organization_id, url)
 );
 
 -- Service Regions
@@ -130,6 +178,25 @@ CREATE TABLE IF NOT EXISTS service_regions (
     UNIQUE (organization_id, country)
 );
 
+-- Animal Statistics: per-organization counters kept in step by every animal
+-- write path (services/animal_statistics.py) and recounted after each scrape batch
+CREATE TABLE IF NOT EXISTS animal_statistics (
+    organization_id INTEGER PRIMARY KEY REFERENCES organizations(id) ON DELETE CASCADE,
+    available_count INTEGER NOT NULL DEFAULT 0,
+    new_this_week INTEGER NOT NULL DEFAULT 0,
+    active_dog_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    reconciled_at TIMESTAMP
+);
+
+-- Metadata Dictionary: single-row snapshot of the /meta filter domains,
+-- published on organization sync and scrape completion (utils/metadata_dictionary.py)
+CREATE TABLE IF NOT EXISTS metadata_dictionary (
+    id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    domains JSONB NOT NULL,
+    published_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
 -- ============================================================================
 -- INDEXES (synced with production 2026-02-16)
 -- ============================================================================
@@ -157,6 +224,12 @@ CREATE INDEX IF NOT EXISTS idx_animals_breed_group_status
 CREATE INDEX IF NOT EXISTS idx_animals_age_range_optimized
   ON animals (age_min_months, age_max_months)
   WHERE status = 'available' AND age_min_months IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_animals_shuffle
+  ON animals (status, shuffle_key, id)
+  WHERE animal_type = 'dog' AND active = true;
+CREATE INDEX IF NOT EXISTS idx_animals_org_shuffle
+  ON animals (organization_id, shuffle_key, id)
+  WHERE active = true;
 CREATE INDEX IF NOT EXISTS idx_animals_created_desc
   ON animals (created_at DESC)
   WHERE status = 'available';
@@ -180,6 +253,7 @@ CREATE INDEX IF NOT EXISTS idx_animals_availability_confidence ON animals(availa
 CREATE INDEX IF NOT EXISTS idx_animals_last_seen_at ON animals(last_seen_at);
 CREATE INDEX IF NOT EXISTS idx_animals_consecutive_missing ON animals(consecutive_scrapes_missing);
 CREATE INDEX IF NOT EXISTS idx_animals_original_image_url ON animals(original_image_url);
+CREATE INDEX IF NOT EXISTS idx_animals_duplicate_of ON animals(duplicate_of_id) WHERE duplicate_of_id IS NOT NULL;
 CREATE UNIQUE INDEX IF NOT EXISTS idx_animals_slug ON animals(slug);
 
 -- Organizations indexes
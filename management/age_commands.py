@@ -63,7 +63,7 @@ def apply_clears(clears: list[AgeClear]) -> int:
 
     with _connect() as conn, conn.cursor() as cursor:
         cursor.execute(
-            "UPDATE animals SET age_text = NULL WHERE id = ANY(%s)",
+            "UPDATE animals SET age_text = NULL, content_hash = NULL WHERE id = ANY(%s)",
             ([clear.animal_id for clear in clears],),
         )
         changed = cursor.rowcount
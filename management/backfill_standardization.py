@@ -239,6 +239,8 @@ class StandardizationBackfillService:
             if not set_clauses:
                 return True  # Nothing to update
 
+            # Clearing content_hash makes the next scrape compare this row column by column
+            set_clauses.append("content_hash = NULL")
             values.append(animal_id)
             query = f"""
                 UPDATE animals
@@ -81,7 +81,8 @@ def fetch_animal_breed_rows(available_only: bool) -> list[AnimalBreedRow]:
 def apply_updates(updates: list[BreedUpdate]) -> int:
     """Write the planned fields. Returns the number of rows changed."""
     assignments = ", ".join(f"{name} = %s" for name in DERIVED_FIELDS)
-    statement = f"UPDATE animals SET {assignments} WHERE id = %s"
+    # Clearing content_hash makes the next scrape compare these rows column by column
+    statement = f"UPDATE animals SET {assignments}, content_hash = NULL WHERE id = %s"
 
     with _connect() as conn, conn.cursor() as cursor:
         for update in updates:
@@ -211,7 +211,7 @@ class DataRecoveryService:
                 cursor.execute(
                     """
                     UPDATE animals
-                    SET name = CONCAT('Animal_', id)
+                    SET name = CONCAT('Animal_', id), content_hash = NULL
                     WHERE organization_id = %s
                     AND (name IS NULL OR name = '')
                 """,
@@ -27,7 +27,9 @@ import logging  # noqa: E402
 import os  # noqa: E402
 import signal  # noqa: E402
 import sys  # noqa: E402
+from collections.abc import Callable  # noqa: E402
 from datetime import UTC, datetime  # noqa: E402
+from typing import Any  # noqa: E402
 
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
@@ -37,8 +39,11 @@ from config import enable_world_class_scraper_logging, get_database_config  # no
 from management.breed_commands import fetch_breed_rows  # noqa: E402
 from management.breed_reconciliation import reconcile  # noqa: E402
 from scrapers.sentry_integration import add_scrape_breadcrumb, init_scraper_sentry  # noqa: E402
+from services.animal_statistics import reconcile_statistics  # noqa: E402
+from services.weekly_shuffle import refresh_shuffle_keys  # noqa: E402
 from utils.db_connection import (  # noqa: E402
     create_database_config_from_env,
+    get_db_connection,
     initialize_database_pool,
 )
 from utils.secure_config_scraper_runner import (  # noqa: E402
@@ -119,6 +124,44 @@ def report_breed_reconciliation() -> dict:
     }
 
 
+def report_statistics_reconciliation() -> dict:
+    """Recount the animal_statistics counters behind /statistics.
+
+    The write paths keep the counters current, but anything that bypasses them
+    (manual SQL, a Railway sync) drifts them, and new_this_week only ages out
+    here. Errors are captured for the same reason as breed reconciliation.
+    """
+    try:
+        corrected = _run_maintenance(reconcile_statistics)
+    except Exception as exc:
+        return {"error": str(exc)}
+
+    return {"organizations_corrected": corrected}
+
+
+def refresh_listing_order() -> dict:
+    """Fill shuffle keys for new dogs, and rotate them all on a new ISO week.
+
+    Random and diverse listings read this order; a dog without a key sorts
+    last until this runs. Errors are captured like the reports above.
+    """
+    try:
+        refreshed = _run_maintenance(refresh_shuffle_keys)
+    except Exception as exc:
+        return {"error": str(exc)}
+
+    return {"shuffle_keys_refreshed": refreshed}
+
+
+def _run_maintenance(work: Callable[[Any], int]) -> int:
+    """Run one post-batch maintenance statement in its own transaction."""
+    with get_db_connection() as conn:
+        with conn.cursor() as cursor:
+            result = work(cursor)
+        conn.commit()
+    return result
+
+
 def run_all_scrapers(runner: SecureConfigScraperRunner) -> BatchRunResult:
     """Run all enabled scrapers."""
     logger.info("Running all enabled scrapers")
@@ -147,6 +190,8 @@ def format_batch_summary(result: BatchRunResult, start_time: datetime) -> dict:
         "failed_orgs": failed_orgs,
         "overall_success": result.success and result.failed == 0,
         "breed_reconciliation": report_breed_reconciliation(),
+        "statistics_reconciliation": report_statistics_reconciliation(),
+        "listing_order": refresh_listing_order(),
     }
 
 
@@ -276,6 +321,18 @@ def main():
         else:
             logger.info(f"Breed registry resolved every breed string ({breeds['provisional_values']} provisional)")
 
+        statistics = summary["statistics_reconciliation"]
+        if statistics.get("error"):
+            logger.warning(f"Statistics reconciliation failed: {statistics['error']}")
+        else:
+            logger.info(f"Statistics counters reconciled ({statistics['organizations_corrected']} organizations corrected)")
+
+        listing_order = summary["listing_order"]
+        if listing_order.get("error"):
+            logger.warning(f"Listing order refresh failed: {listing_order['error']}")
+        else:
+            logger.info(f"Listing order refreshed ({listing_order['shuffle_keys_refreshed']} shuffle keys written)")
+
         print("\n" + json.dumps(summary, indent=2))
 
     add_scrape_breadcrumb(
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""Scraper throughput benchmarks, replayed from recorded pages.
+
+    uv run python management/scraper_benchmark.py record dogstrust
+    uv run python management/scraper_benchmark.py replay dogstrust --runs 3 --output bench.json
+    uv run python management/scraper_benchmark.py replay dogstrust --baseline main.json
+
+record runs the scraper's collect_data() against the live site and saves
+every response it receives (see utils/replay.py). replay runs collect_data()
+and _process_animals_data() again from those recordings, with the network
+off and the database at DB_CONFIG (a local Postgres), and reports pages/sec,
+dogs/sec, database round trips and peak memory.
+
+Both modes crawl in full: FORCE_RESCRAPE is set so no dog is skipped as
+already known and no page as unchanged. Recording keeps the scraper's
+politeness delays; replay zeroes rate_limit_delay, so only the scraper's own
+work is timed (fixed sleeps in a scraper's code still count). Image uploads and LLM enrichment are left out. With --baseline the
+command exits non-zero when dogs/sec falls, or round trips rise, by more than
+--tolerance, so it can gate a PR.
+"""
+
+import argparse
+import json
+import logging
+import os
+import resource
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import psycopg2  # noqa: E402
+import psycopg2.extensions  # noqa: E402
+
+from scrapers.animal_stream import is_animal_stream  # noqa: E402
+from utils.replay import FixtureStore, recording, replaying  # noqa: E402
+from utils.secure_config_scraper_runner import SecureConfigScraperRunner  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOLERANCE = 0.2
+
+
+class RoundTripCounter:
+    """Statements and commits/rollbacks sent over connections opened while counting."""
+
+    def __init__(self):
+        self.count = 0
+
+    def reset(self) -> None:
+        self.count = 0
+
+
+class CountingCursor:
+    """A cursor that counts the statements it sends; everything else is the cursor's own."""
+
+    def __init__(self, cursor, counter: RoundTripCounter):
+        self._cursor = cursor
+        self._counter = counter
+
+    def execute(self, *args, **kwargs):
+        self._counter.count += 1
+        return self._cursor.execute(*args, **kwargs)
+
+    def executemany(self, query, vars_list):
+        # psycopg2 runs executemany as one statement per parameter set
+        vars_list = list(vars_list)
+        self._counter.count += len(vars_list)
+        return self._cursor.executemany(query, vars_list)
+
+    def callproc(self, *args, **kwargs):
+        self._counter.count += 1
+        return self._cursor.callproc(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __enter__(self):
+        self._cursor.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        return self._cursor.__exit__(*exc_info)
+
+
+@contextmanager
+def counting_round_trips() -> Iterator[RoundTripCounter]:
+    """Count database round trips on every psycopg2 connection opened inside the block."""
+    counter = RoundTripCounter()
+
+    class CountingConnection(psycopg2.extensions.connection):
+        def cursor(self, *args, **kwargs):
+            return CountingCursor(super().cursor(*args, **kwargs), counter)
+
+        def commit(self):
+            counter.count += 1
+            return super().commit()
+
+        def rollback(self):
+            counter.count += 1
+            return super().rollback()
+
+    original_connect = psycopg2.connect
+
+    def connect(*args, **kwargs):
+        kwargs.setdefault("connection_factory", CountingConnection)
+        return original_connect(*args, **kwargs)
+
+    psycopg2.connect = connect
+    try:
+        yield counter
+    finally:
+        psycopg2.connect = original_connect
+
+
+def peak_rss_mb() -> float:
+    """The process's peak resident set size so far."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """One replayed scrape."""
+
+    config_id: str
+    pages: int
+    dogs: int
+    collect_seconds: float
+    process_seconds: float
+    db_round_trips: int
+    peak_rss_mb: float
+    missed_requests: int = 0
+
+    @property
+    def total_seconds(self) -> float:
+        return self.collect_seconds + self.process_seconds
+
+    @property
+    def pages_per_sec(self) -> float:
+        return self.pages / self.collect_seconds if self.collect_seconds else 0.0
+
+    @property
+    def dogs_per_sec(self) -> float:
+        return self.dogs / self.total_seconds if self.total_seconds else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            **asdict(self),
+            "pages_per_sec": round(self.pages_per_sec, 2),
+            "dogs_per_sec": round(self.dogs_per_sec, 2),
+        }
+
+    def summary(self) -> str:
+        return (
+            f"{self.config_id}: {self.pages} pages, {self.dogs} dogs in {self.total_seconds:.2f}s "
+            f"({self.pages_per_sec:.1f} pages/sec, {self.dogs_per_sec:.1f} dogs/sec), "
+            f"{self.db_round_trips} DB round trips, peak RSS {self.peak_rss_mb:.0f} MB"
+        )
+
+
+def best_of(results: list[BenchmarkResult]) -> BenchmarkResult:
+    """The fastest run; the others include warm-up and noise."""
+    return max(results, key=lambda result: result.dogs_per_sec)
+
+
+def regressions(result: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> list[str]:
+    """How result is worse than baseline by more than tolerance, if at all."""
+    found = []
+    if baseline.get("dogs_per_sec") and result["dogs_per_sec"] < baseline["dogs_per_sec"] * (1 - tolerance):
+        found.append(f"dogs/sec fell from {baseline['dogs_per_sec']} to {result['dogs_per_sec']}")
+    if baseline.get("db_round_trips") and result["db_round_trips"] > baseline["db_round_trips"] * (1 + tolerance):
+        found.append(f"DB round trips rose from {baseline['db_round_trips']} to {result['db_round_trips']}")
+    return found
+
+
+def load_for_benchmark(runner: SecureConfigScraperRunner, config_id: str):
+    """The scraper for config_id, set up to crawl every page and upload nothing."""
+    os.environ["FORCE_RESCRAPE"] = "true"
+    runner.ensure_organization_synced(config_id)
+    scraper = runner.load_scraper_safely(config_id)
+    scraper.image_processing_service = None
+    return scraper
+
+
+def collect(scraper) -> list:
+    animals = scraper.collect_data()
+    return list(animals) if is_animal_stream(animals) else animals
+
+
+def record(runner: SecureConfigScraperRunner, config_id: str, store: FixtureStore) -> int:
+    """Scrape config_id live, saving its responses to store; returns the dogs found."""
+    scraper = load_for_benchmark(runner, config_id)
+    with recording(store) as session, scraper:
+        animals = collect(scraper)
+    logger.info(f"Recorded {session.recorded} responses for {len(animals)} dogs to {store.directory}")
+    return len(animals)
+
+
+def replay(runner: SecureConfigScraperRunner, config_id: str, store: FixtureStore) -> BenchmarkResult:
+    """One scrape of config_id from store, timed and counted."""
+    with counting_round_trips() as round_trips:
+        # Organization sync may upload logos; it happens before the network goes off
+        scraper = load_for_benchmark(runner, config_id)
+        scraper.rate_limit_delay = 0.0
+        with replaying(store) as session, scraper:
+            if not scraper._setup_scrape():
+                raise RuntimeError(f"Could not start a scrape log for {config_id}")
+            round_trips.reset()
+
+            started = time.perf_counter()
+            animals = collect(scraper)
+            collected = time.perf_counter()
+            scraper.progress_tracker = scraper._create_progress_tracker(len(animals))
+            stats = scraper._process_animals_data(animals)
+            processed = time.perf_counter()
+
+            trips = round_trips.count
+            scraper.complete_scrape_log(
+                status="success",
+                animals_found=len(animals),
+                animals_added=stats["animals_added"],
+                animals_updated=stats["animals_updated"],
+            )
+
+    if session.missed:
+        logger.warning(f"{session.missed} requests had no recording; re-record {config_id} if the scraper changed what it fetches")
+    return BenchmarkResult(
+        config_id=config_id,
+        pages=session.served,
+        dogs=len(animals),
+        collect_seconds=collected - started,
+        process_seconds=processed - collected,
+        db_round_trips=trips,
+        peak_rss_mb=round(peak_rss_mb(), 1),
+        missed_requests=session.missed,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Scraper throughput benchmarks")
+    parser.add_argument("command", choices=["record", "replay"])
+    parser.add_argument("config_id", help="Organization config ID")
+    parser.add_argument("--fixtures", help="Recording directory (default: SCRAPER_REPLAY_DIR or tests/fixtures/replay, per organization)")
+    parser.add_argument("--runs", type=int, default=3, help="replay: scrapes to run; the fastest is reported")
+    parser.add_argument("--output", help="replay: write the result as JSON to this file")
+    parser.add_argument("--baseline", help="replay: JSON result to compare against; exits non-zero on a regression")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="replay: allowed slowdown before a regression (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    store = FixtureStore(args.fixtures) if args.fixtures else FixtureStore.for_organization(args.config_id)
+    runner = SecureConfigScraperRunner()
+
+    if args.command == "record":
+        record(runner, args.config_id, store)
+        return 0
+
+    if not len(store):
+        logger.error(f"No recordings in {store.directory}; run: management/scraper_benchmark.py record {args.config_id}")
+        return 1
+
+    results = []
+    for run in range(1, max(1, args.runs) + 1):
+        result = replay(runner, args.config_id, store)
+        logger.info(f"Run {run}: {result.summary()}")
+        results.append(result)
+
+    best = best_of(results).to_dict()
+    print(json.dumps(best, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(best, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            found = regressions(best, json.load(f), args.tolerance)
+        for regression in found:
+            logger.error(f"Regression: {regression}")
+        if found:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+"""Add image_hashes and animals.duplicate_of_id for cross-organization duplicates
+
+Partner rescues cross-post dogs, which were uploaded, profiled and listed
+once per organization. Each new image's perceptual hash is stored by source
+URL, and a dog whose photo and name match another organization's dog is
+saved with duplicate_of_id pointing at it, reusing its R2 image and profile.
+
+Revision ID: a3d7f5c9e182
+Revises: e9b3c7f1a248
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers
+revision = "a3d7f5c9e182"
+down_revision = "e9b3c7f1a248"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS image_hashes (
+            original_image_url TEXT PRIMARY KEY,
+            image_hash BIGINT NOT NULL,
+            hashed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    op.add_column("animals", sa.Column("duplicate_of_id", sa.Integer(), sa.ForeignKey("animals.id", ondelete="SET NULL"), nullable=True))
+    op.execute("CREATE INDEX IF NOT EXISTS idx_animals_duplicate_of ON animals(duplicate_of_id) WHERE duplicate_of_id IS NOT NULL")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_animals_duplicate_of")
+    op.drop_column("animals", "duplicate_of_id")
+    op.drop_table("image_hashes")
@@ -0,0 +1,30 @@
+"""Add animals.content_hash for change detection on save
+
+Every scrape read back and re-standardized each existing dog to decide
+between "updated" and "no_change". The save path now stores a fingerprint of
+the scraped fields and skips dogs whose fingerprint is unchanged. No
+backfill: existing rows are compared column by column once and get their
+fingerprint on the next scrape.
+
+Revision ID: a7e3f9c2d815
+Revises: f6c2d8b4e517
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers
+revision = "a7e3f9c2d815"
+down_revision = "f6c2d8b4e517"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("animals", sa.Column("content_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("animals", "content_hash")
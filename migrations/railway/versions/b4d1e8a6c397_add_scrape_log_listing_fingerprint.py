@@ -0,0 +1,28 @@
+"""Add scrape_logs.listing_fingerprint for skipping unchanged listings
+
+A scrape whose listing cards (external id, name, image, status) hash the
+same as the last full crawl's only refreshes last_seen_at; the fingerprint
+of each successful full crawl is stored on its scrape log.
+
+Revision ID: b4d1e8a6c397
+Revises: a7e3f9c2d815
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers
+revision = "b4d1e8a6c397"
+down_revision = "a7e3f9c2d815"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("scrape_logs", sa.Column("listing_fingerprint", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("scrape_logs", "listing_fingerprint")
@@ -0,0 +1,40 @@
+"""Add page_validators for conditional fetches of scraper detail pages
+
+The ETag, Last-Modified and body hash of each detail page were kept in a
+cache under the home directory, which every Railway deploy starts without,
+so the first scrape after a deploy fetched and re-saved every dog. Keeping
+them per organization and URL in the database lets them survive deploys.
+
+Revision ID: b4e8c2f6a913
+Revises: a3d7f5c9e182
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = "b4e8c2f6a913"
+down_revision = "a3d7f5c9e182"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS page_validators (
+            organization_id INTEGER NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+            url TEXT NOT NULL,
+            content_hash VARCHAR(64) NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (organization_id, url)
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("page_validators")
@@ -0,0 +1,31 @@
+"""Add animals.listing_hash and detail_checked_at for incremental detail crawls
+
+With skip_existing_animals, a dog's detail page is fetched again when its
+listing card (name, image, status) hashes differently from the one stored
+here, or when it is among the least recently checked in the run's refresh
+sample.
+
+Revision ID: c8f2a5d1e604
+Revises: b4d1e8a6c397
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers
+revision = "c8f2a5d1e604"
+down_revision = "b4d1e8a6c397"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("animals", sa.Column("listing_hash", sa.String(length=64), nullable=True))
+    op.add_column("animals", sa.Column("detail_checked_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("animals", "detail_checked_at")
+    op.drop_column("animals", "listing_hash")
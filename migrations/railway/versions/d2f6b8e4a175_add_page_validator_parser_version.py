@@ -0,0 +1,30 @@
+"""Add page_validators.parser_version
+
+A page stored as unchanged was never parsed again, so a fix to a scraper's
+parser never reached dogs whose pages had not changed. Each validator now
+records the version of the parser that read the page, and validators from
+another version are ignored. Existing rows have none and are parsed again
+on the next scrape.
+
+Revision ID: d2f6b8e4a175
+Revises: b4e8c2f6a913
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers
+revision = "d2f6b8e4a175"
+down_revision = "b4e8c2f6a913"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("page_validators", sa.Column("parser_version", sa.String(length=16), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("page_validators", "parser_version")
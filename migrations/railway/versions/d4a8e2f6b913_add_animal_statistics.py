@@ -0,0 +1,55 @@
+"""Add animal_statistics counters
+
+/statistics and /stats/by-country aggregated the whole animals table on every
+request. The counts now live in one row per organization, kept current by the
+animal write paths and recounted after each scrape batch. The backfill here is
+the same recount, so the endpoints are correct from the first request.
+
+Revision ID: d4a8e2f6b913
+Revises: c7d2e4f81a35
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = "d4a8e2f6b913"
+down_revision = "c7d2e4f81a35"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS animal_statistics (
+            organization_id INTEGER PRIMARY KEY REFERENCES organizations(id) ON DELETE CASCADE,
+            available_count INTEGER NOT NULL DEFAULT 0,
+            new_this_week INTEGER NOT NULL DEFAULT 0,
+            active_dog_count INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            reconciled_at TIMESTAMP
+        )
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO animal_statistics (organization_id, available_count, new_this_week, active_dog_count, updated_at, reconciled_at)
+        SELECT o.id,
+               COUNT(a.id) FILTER (WHERE a.status = 'available' AND a.active = true AND a.availability_confidence IN ('high', 'medium')),
+               COUNT(a.id) FILTER (WHERE a.status = 'available' AND a.active = true AND a.availability_confidence IN ('high', 'medium')
+                                     AND a.created_at >= NOW() - INTERVAL '7 days'),
+               COUNT(a.id) FILTER (WHERE a.active = true AND a.animal_type = 'dog'),
+               NOW(),
+               NOW()
+        FROM organizations o
+        LEFT JOIN animals a ON a.organization_id = o.id
+        GROUP BY o.id
+        ON CONFLICT (organization_id) DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("animal_statistics")
@@ -0,0 +1,45 @@
+"""Add animals.shuffle_key for random and diverse listings
+
+/random and curation_type=diverse sorted every eligible row by a hash of the
+ID and ISO week on each request. The hash is now stored and indexed so those
+listings are index reads. The backfill computes the current week's keys.
+
+Revision ID: e5b1c9a7d342
+Revises: d4a8e2f6b913
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers
+revision = "e5b1c9a7d342"
+down_revision = "d4a8e2f6b913"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("animals", sa.Column("shuffle_key", sa.Integer(), nullable=True))
+    op.execute("UPDATE animals SET shuffle_key = hashtext(id::text || to_char(NOW(), 'IYYY-IW'))")
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_animals_shuffle
+        ON animals (status, shuffle_key, id)
+        WHERE animal_type = 'dog' AND active = true
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_animals_org_shuffle
+        ON animals (organization_id, shuffle_key, id)
+        WHERE active = true
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_animals_org_shuffle", table_name="animals")
+    op.drop_index("idx_animals_shuffle", table_name="animals")
+    op.drop_column("animals", "shuffle_key")
@@ -0,0 +1,37 @@
+"""Add scrape_checkpoints for resuming interrupted scrapes
+
+A scrape that dies mid-crawl (Browserless disconnect, Railway restart)
+started over from nothing. Each animal persisted by a scrape is now
+recorded against its scrape log, and a rerun within the resume window
+skips the detail pages of those animals.
+
+Revision ID: e9b3c7f1a248
+Revises: c8f2a5d1e604
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = "e9b3c7f1a248"
+down_revision = "c8f2a5d1e604"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS scrape_checkpoints (
+            scrape_log_id INTEGER NOT NULL REFERENCES scrape_logs(id) ON DELETE CASCADE,
+            external_id VARCHAR(255) NOT NULL,
+            saved_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (scrape_log_id, external_id)
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("scrape_checkpoints")
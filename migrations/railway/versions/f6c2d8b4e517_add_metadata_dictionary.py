@@ -0,0 +1,37 @@
+"""Add metadata_dictionary snapshot table
+
+The /meta filter endpoints ran SELECT DISTINCT over animals, service_regions
+and organizations on every cache miss. Organization sync and scrape completion
+now publish those domains here as one row, and API processes serve them from
+memory. No backfill: until the first publish the API builds the domains from
+the live tables.
+
+Revision ID: f6c2d8b4e517
+Revises: e5b1c9a7d342
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = "f6c2d8b4e517"
+down_revision = "e5b1c9a7d342"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS metadata_dictionary (
+            id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+            domains JSONB NOT NULL,
+            published_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("metadata_dictionary")
@@ -0,0 +1,80 @@
+"""
+Streaming contract for collect_data().
+
+collect_data() may return a list, as every scraper always has, or yield
+animals as it discovers them from a generator or async generator. BaseScraper
+then saves them in batches while collection continues, instead of holding
+every dog until the last detail page is parsed. Only the counts the final
+phases need are kept: stale detection, failure heuristics and the scrape log
+read the totals from an AnimalStreamSummary.
+"""
+
+import asyncio
+import itertools
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+
+def is_animal_stream(collected: Any) -> bool:
+    """Whether collect_data() returned an iterator rather than a list."""
+    if isinstance(collected, list | tuple):
+        return False
+    return isinstance(collected, Iterator) or hasattr(collected, "__aiter__")
+
+
+def iter_batches(stream: Any, size: int) -> Iterator[list[dict[str, Any]]]:
+    """Yield lists of up to size animals from a sync or async animal stream.
+
+    An async stream is driven on a private event loop that only runs while a
+    batch is being filled, so the caller can process each batch with ordinary
+    blocking code (including code that calls asyncio.run()).
+    """
+    if not hasattr(stream, "__aiter__"):
+        iterator = iter(stream)
+        while batch := list(itertools.islice(iterator, size)):
+            yield batch
+        return
+
+    loop = asyncio.new_event_loop()
+    iterator = stream.__aiter__()
+    try:
+        while batch := loop.run_until_complete(_next_batch(iterator, size)):
+            yield batch
+    finally:
+        # Let an abandoned async generator run its cleanup (closing browsers)
+        if hasattr(iterator, "aclose"):
+            loop.run_until_complete(iterator.aclose())
+        loop.close()
+
+
+async def _next_batch(iterator: AsyncIterator[dict[str, Any]], size: int) -> list[dict[str, Any]]:
+    batch = []
+    async for animal in iterator:
+        batch.append(animal)
+        if len(batch) >= size:
+            break
+    return batch
+
+
+@dataclass
+class AnimalStreamSummary:
+    """What the post-processing phases need from a stream that has been consumed.
+
+    Stands in for the animals list: len() is the number of animals collected.
+    """
+
+    count: int = 0
+    quality_total: float = 0.0
+
+    def add_batch(self, batch_size: int, batch_quality: float) -> None:
+        self.count += batch_size
+        self.quality_total += batch_quality * batch_size
+
+    @property
+    def quality_score(self) -> float:
+        """Mean per-animal quality, as MetricsCollector.assess_data_quality computes it."""
+        return round(self.quality_total / self.count, 3) if self.count else 0.0
+
+    def __len__(self) -> int:
+        return self.count
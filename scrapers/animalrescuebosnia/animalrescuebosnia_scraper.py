@@ -31,6 +31,7 @@ class AnimalRescueBosniaScraper(BaseScraper):
         try:
             # Fetch listing page
             response = requests.get(self.listing_url, timeout=self.timeout)
+            self.record_response(response)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, "html.parser")
@@ -127,6 +128,7 @@ class AnimalRescueBosniaScraper(BaseScraper):
         try:
             # Fetch detail page
             response = requests.get(url, timeout=self.timeout)
+            self.record_response(response)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, "html.parser")
@@ -430,6 +432,9 @@ class AnimalRescueBosniaScraper(BaseScraper):
                     animal["external_id"] = f"arb-{slug}"
                     animal["adoption_url"] = animal["url"]
 
+            if self._listing_unchanged(animals_list):
+                return []
+
             # Filter existing animals if skip is enabled
             if self.skip_existing_animals:
                 filtered_animals = self.filtering_service.filter_existing_animals(animals_list)
@@ -479,8 +484,7 @@ class AnimalRescueBosniaScraper(BaseScraper):
 
             # Rate limiting between batches
             if batch_num < len(batches):
-                self.logger.debug(f"Rate limiting for {self.rate_limit_delay}s between batches")
-                self.respect_rate_limit()
+                self.respect_rate_limit(batch_urls[0])
 
         # World-class logging: Batch completion handled by centralized system
         return all_results
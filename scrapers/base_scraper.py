@@ -3,29 +3,38 @@
 import logging
 import os
 import sys
-import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import Future
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any
+from typing import Any, TypeVar
 
 import psycopg2
-from langdetect import detect
 
 # Import config
 from config import DB_CONFIG, enable_world_class_scraper_logging
 
 # Import services and utilities
+from scrapers.animal_stream import AnimalStreamSummary, is_animal_stream, iter_batches
 from scrapers.browser_manager import ScraperBrowserManager
 
 # Import centralized constants
 from scrapers.constants import (
+    CHECKPOINT_RESUME_WINDOW,
     CONCURRENT_UPLOAD_THRESHOLD,
     MAX_R2_FAILURE_RATE,
     SMALL_BATCH_THRESHOLD,
+    STREAM_BATCH_SIZE,
 )
 from scrapers.enrichment.llm_handler import LLMEnrichmentHandler
-from scrapers.filtering.filtering_service import FilteringService
+from scrapers.filtering.filtering_service import DEFAULT_DETAIL_REFRESH_FRACTION, FilteringService
+from scrapers.html_parsing import HTML_PARSER, parse_fast, parse_html
+from scrapers.http_fetcher import HttpFetchEngine
+from scrapers.listing_fingerprint import FULL_CRAWL_MAX_AGE, listing_fingerprint
+from scrapers.parse_pool import open_parse_pool
+from scrapers.rate_controller import RateController
+from scrapers.response_cache import ResponseCache, parser_version
 
 # Import Sentry integration for error tracking
 from scrapers.sentry_integration import (
@@ -38,9 +47,11 @@ from scrapers.sentry_integration import (
 )
 from scrapers.validation.animal_validator import AnimalValidator
 from services.null_objects import NullMetricsCollector
+from services.playwright_browser_service import RenderStats, settle
 from services.progress_tracker import ProgressTracker
 from utils.config_loader import ConfigLoader
 from utils.config_models import OrganizationConfig
+from utils.language_detection import get_language_detector
 from utils.organization_sync_service import create_default_sync_service
 from utils.r2_service import R2Service
 from utils.unified_standardization import UnifiedStandardizer
@@ -48,6 +59,10 @@ from utils.unified_standardization import UnifiedStandardizer
 # Set up module-level logger
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# fetch_pages() result for a page that hasn't changed since the last successful run
+UNCHANGED: Any = object()
 
 FORCE_RESCRAPE_VALUES = ("true", "1", "yes")
 
@@ -71,6 +86,32 @@ class BaseScraper(ABC):
     CONCURRENT_UPLOAD_THRESHOLD = CONCURRENT_UPLOAD_THRESHOLD
     MAX_R2_FAILURE_RATE = MAX_R2_FAILURE_RATE
 
+    # Backend for parse_html() and parse_fast(); scrapers opt into a faster one
+    html_parser = HTML_PARSER
+
+    # Run fetch_pages() parse callbacks in worker processes (scrapers/parse_pool.py)
+    parse_in_processes = False
+
+    # Left out of a pickled scraper: connections, clients and caches that
+    # belong to the scraping process, not to a parse worker
+    PROCESS_LOCAL_ATTRIBUTES = (
+        "conn",
+        "database_service",
+        "session_manager",
+        "metrics_collector",
+        "filtering_service",
+        "llm_handler",
+        "image_processing_service",
+        "browser_manager",
+        "r2_service",
+        "response_cache",
+        "_rate_controller",
+        "progress_tracker",
+        "standardizer",
+        "config_loader",
+        "animals_for_llm_enrichment",
+    )
+
     # Type annotations for instance variables
     org_config: OrganizationConfig | None
 
@@ -113,6 +154,8 @@ class BaseScraper(ABC):
             # Use config for scraper settings
             scraper_config = self.org_config.get_scraper_config_dict()
             self.rate_limit_delay = scraper_config.get("rate_limit_delay", 1.0)
+            self.rate_limit_min_delay = scraper_config.get("rate_limit_min_delay")
+            self.rate_limit_max_delay = scraper_config.get("rate_limit_max_delay")
             self.max_retries = scraper_config.get("max_retries", 3)
             self.timeout = scraper_config.get("timeout", 30)
 
@@ -120,17 +163,22 @@ class BaseScraper(ABC):
             self.retry_backoff_factor = scraper_config.get("retry_backoff_factor", 2.0)
             self.batch_size = scraper_config.get("batch_size", 6)
             self.skip_existing_animals = False if force_rescrape_enabled() else scraper_config.get("skip_existing_animals", False)
+            self.detail_refresh_fraction = scraper_config.get("detail_refresh_fraction", DEFAULT_DETAIL_REFRESH_FRACTION)
 
             # Set organization name from config
             self.organization_name = self.org_config.name
+            self.listing_language = self.org_config.metadata.language
 
         elif organization_id:
             # Legacy mode - direct database ID
             self.organization_id = organization_id
             self.org_config = None
+            self.listing_language = None
 
             # Default scraper settings
             self.rate_limit_delay = 1.0
+            self.rate_limit_min_delay = None
+            self.rate_limit_max_delay = None
             self.max_retries = 3
             self.timeout = 30
 
@@ -138,6 +186,7 @@ class BaseScraper(ABC):
             self.retry_backoff_factor = 2.0
             self.batch_size = 6
             self.skip_existing_animals = False
+            self.detail_refresh_fraction = DEFAULT_DETAIL_REFRESH_FRACTION
 
             # For legacy mode, use a default organization name
             self.organization_name = f"Organization ID {organization_id}"
@@ -164,6 +213,7 @@ class BaseScraper(ABC):
             session_manager=session_manager,
             organization_id=self.organization_id,
             skip_existing_animals=self.skip_existing_animals,
+            detail_refresh_fraction=self.detail_refresh_fraction,
             logger=self.logger,
         )
         self.llm_handler = llm_handler or LLMEnrichmentHandler(
@@ -186,9 +236,25 @@ class BaseScraper(ABC):
             animal_validator=self.animal_validator,
         )
 
+        # What light-render Playwright scrapes skipped downloading or waiting for
+        self.render_stats = RenderStats()
+
+        # Conditional-GET cache for detail pages, loaded by _setup_scrape once
+        # the organization is known; off when re-scraping everything
+        self.response_cache: ResponseCache | None = None
+
         # Track animals for filtering stats
         self.total_animals_before_filter = 0
         self.total_animals_skipped = 0
+        self.total_animals_unchanged = 0
+        self.total_animals_resumed = 0
+
+        # Fingerprint of this run's listing cards, and whether it let the run skip the full crawl
+        self.listing_fingerprint: str | None = None
+        self.listing_unchanged = False
+
+        # Animals whose detail page was saved or found unchanged this run, so their listing hash is current
+        self._detail_checked_external_ids: set[str] = set()
 
         # Track animals for LLM enrichment
         self.animals_for_llm_enrichment = []
@@ -311,6 +377,11 @@ class BaseScraper(ABC):
 
         self._completion_logged = True
         if status == "success":
+            self._commit_response_cache()
+            self._record_listing_fingerprint()
+            self._record_listing_hashes()
+            self._clear_checkpoints()
+            self._publish_metadata()
             self._invalidate_frontend_cache()
 
         # Use injected DatabaseService if available
@@ -346,6 +417,11 @@ class BaseScraper(ABC):
 
         self._completion_logged = True
         if status == "success":
+            self._commit_response_cache()
+            self._record_listing_fingerprint()
+            self._record_listing_hashes()
+            self._clear_checkpoints()
+            self._publish_metadata()
             self._invalidate_frontend_cache()
 
         # Use injected DatabaseService if available
@@ -395,6 +471,17 @@ class BaseScraper(ABC):
             self.logger.warning("Could not resolve changed slugs for cache invalidation: %s", e)
             return []
 
+    def _publish_metadata(self) -> None:
+        """Republish the /meta filter domains so new breeds and groups reach the API.
+
+        Runs before the frontend purge, so the pages it rebuilds read the new
+        filters. A failure only delays them until the next successful scrape.
+        """
+        if not self.database_service:
+            return
+        if not self.database_service.publish_metadata():
+            self.logger.warning("Metadata dictionary not republished; /meta filters keep the previous snapshot")
+
     def _invalidate_frontend_cache(self) -> None:
         """Fire cache invalidation for the Next.js frontend.
 
@@ -443,14 +530,23 @@ class BaseScraper(ABC):
         Returns:
             ISO 639-1 language code (e.g., 'en' for English, 'de' for German)
         """
-        try:
-            if not text or len(text.strip()) < 10:
-                return "en"  # Default to English for very short or empty text
+        # An organization whose listings are all in one language needs no detection
+        return getattr(self, "listing_language", None) or get_language_detector().detect(text)
 
-            return detect(text)
-        except Exception as e:
-            self.logger.warning(f"Language detection error: {e}. Defaulting to English.")
-            return "en"
+    def parse_html(self, markup, only=None):
+        """BeautifulSoup tree of markup, built with this scraper's html_parser."""
+        return parse_html(markup, self.html_parser, only)
+
+    def parse_fast(self, markup):
+        """Tree of markup for select()/get()/get_text() extraction; see scrapers.html_parsing."""
+        return parse_fast(markup, self.html_parser)
+
+    def _with_listing_language(self, animal_data):
+        """Stamp the organization's configured language on an animal that does not state one."""
+        listing_language = getattr(self, "listing_language", None)
+        if listing_language and not animal_data.get("language"):
+            animal_data = {**animal_data, "language": listing_language}
+        return animal_data
 
     def validate_external_id(self, external_id):
         """Validate that external_id follows organization prefix pattern.
@@ -524,7 +620,7 @@ class BaseScraper(ABC):
 
         try:
             # Process animal data through standardization if enabled
-            animal_data = self.process_animal(animal_data)
+            animal_data = self._with_listing_language(self.process_animal(animal_data))
 
             # Validate external_id pattern to prevent collisions
             if animal_data.get("external_id"):
@@ -557,6 +653,69 @@ class BaseScraper(ABC):
             self.logger.error(f"Error in save_animal: {e}")
             return None, "error"
 
+    def save_animals(self, animals_data: list[dict[str, Any]]) -> list[tuple[int | None, str]]:
+        """Save a batch of animals with one lookup and bulk writes.
+
+        The batch counterpart of save_animal: every animal gets the same
+        standardization, external_id check and primary image handling, then
+        DatabaseService.upsert_animals writes them in chunks instead of one
+        lookup, write and commit per animal.
+
+        Returns:
+            One (animal_id, action) per animal, in order
+        """
+        results: list[tuple[int | None, str]] = [(None, "error")] * len(animals_data)
+        if not animals_data:
+            return results
+        if not self.database_service:
+            self._log_service_unavailable("DatabaseService", "cannot save animals")
+            return results
+
+        prepared = []
+        for i, animal_data in enumerate(animals_data):
+            try:
+                # Process animal data through standardization if enabled
+                animal_data = self._with_listing_language(self.process_animal(animal_data))
+
+                # Validate external_id pattern to prevent collisions
+                if animal_data.get("external_id"):
+                    self.validate_external_id(animal_data["external_id"])
+                prepared.append((i, animal_data))
+            except Exception as e:
+                self.logger.error(f"Error preparing {animal_data.get('name', 'Unknown')} for saving: {e}")
+
+        existing_animals = self.database_service.get_existing_animals(self.organization_id, [animal_data.get("external_id") for _, animal_data in prepared])
+
+        ready = []
+        for i, animal_data in prepared:
+            # Skip if already processed (has original_image_url set from batch processing)
+            if animal_data.get("primary_image_url") and not animal_data.get("original_image_url"):
+                if self.image_processing_service:
+                    try:
+                        existing_animal = existing_animals.get(animal_data.get("external_id"))
+                        animal_data = self.image_processing_service.process_primary_image(animal_data, existing_animal, self.conn, self.organization_name)
+                    except Exception as e:
+                        self.logger.error(f"Error processing image for {animal_data.get('name', 'Unknown')}: {e}")
+                        continue
+                else:
+                    self._log_service_unavailable("ImageProcessingService", "using original image URL")
+                    animal_data["original_image_url"] = animal_data["primary_image_url"]
+            ready.append((i, animal_data))
+
+        saved = self.database_service.upsert_animals(self.organization_id, [animal_data for _, animal_data in ready])
+        duplicates = {}
+        for (i, animal_data), (animal_id, action) in zip(ready, saved):
+            results[i] = (animal_id, action)
+            if animal_id and animal_data.get("duplicate_of_id"):
+                duplicates[animal_id] = animal_data["duplicate_of_id"]
+            # New animals always get profiled; updates don't, as in save_animal.
+            # A likely duplicate of another organization's dog takes that dog's profile instead
+            elif animal_id and action == "added":
+                self.animals_for_llm_enrichment.append({"id": animal_id, "data": animal_data, "action": "create"})
+        if duplicates:
+            self.database_service.record_duplicates(duplicates)
+        return results
+
     def run(self):
         """Run the scraper to collect and save animal data."""
         try:
@@ -592,56 +751,11 @@ class BaseScraper(ABC):
                 animals_data = self._collect_and_time_data()
                 discovery_duration = (datetime.now() - discovery_start).total_seconds()
 
-                # Store count for scraper runner interface
-                # Use the same logic as database logging to ensure consistency
-                self.animals_found = self._get_correct_animals_found_count(animals_data)
-
-                # Alert if zero dogs found - likely indicates website change
-                if self.animals_found == 0:
-                    alert_zero_dogs_found(
-                        org_name=self.get_organization_name(),
-                        org_id=self.organization_id,
-                        scrape_log_id=getattr(self, "scrape_log_id", None),
-                    )
-
-                # Set transaction data for Sentry performance view
-                transaction.set_data("dogs_found", self.animals_found)
-
-                # Initialize comprehensive progress tracker for consistent logging
-                # Always create progress_tracker to ensure consistent terminal output across all scrapers
-                # Use discovery count (not filtered count) to ensure proper verbosity level for completion summary
-                self.progress_tracker = ProgressTracker(
-                    total_items=max(self.animals_found, 1),
-                    logger=logging.getLogger("scraper"),
-                    config=self._get_logging_config(),
-                )  # Use central scraper logger
-
-                # Track discovery phase stats
-                # Use correct animals found count to show actual discovery metrics
-                correct_animals_found = self._get_correct_animals_found_count(animals_data)
-                self.progress_tracker.track_discovery_stats(
-                    dogs_found=correct_animals_found,
-                    pages_processed=1,
-                    extraction_failures=0,
-                )  # Single page scrape
-
-                # Track filtering phase stats
-                # Note: animals_data contents depend on scraper implementation -
-                # may contain all dogs or only new dogs based on skip_existing_animals setting
-                self.progress_tracker.track_filtering_stats(
-                    dogs_skipped=self.total_animals_skipped,
-                    new_dogs=len(animals_data),
-                )
-
-                # Log discovery completion with actual timing
-                self.progress_tracker.log_phase_complete("Discovery", discovery_duration, f"{correct_animals_found} dogs found")
-
-                # Phase 3: Database Operations
-                add_scrape_breadcrumb(
-                    "Starting database operations phase",
-                    data={"animals_count": len(animals_data)},
-                )
-                processing_stats = self._process_animals_data(animals_data)
+                # Phases 2 and 3 overlap for a streaming collect_data()
+                if is_animal_stream(animals_data):
+                    animals_data, processing_stats = self._process_animal_stream(animals_data, transaction)
+                else:
+                    processing_stats = self._report_discovery_and_process(animals_data, discovery_duration, transaction)
 
                 # Phase 4: Stale Data Detection
                 add_scrape_breadcrumb("Starting stale data detection phase")
@@ -677,6 +791,123 @@ class BaseScraper(ABC):
                 self.handle_scraper_failure(str(e))
                 return False
 
+    def _report_discovery(self, animals_data, discovery_duration, transaction):
+        """Record discovery counts, alert on zero dogs and log the discovery summary."""
+        # Store count for scraper runner interface
+        # Use the same logic as database logging to ensure consistency
+        self.animals_found = self._get_correct_animals_found_count(animals_data)
+
+        # Alert if zero dogs found - likely indicates website change
+        if self.animals_found == 0:
+            alert_zero_dogs_found(
+                org_name=self.get_organization_name(),
+                org_id=self.organization_id,
+                scrape_log_id=getattr(self, "scrape_log_id", None),
+            )
+
+        # Set transaction data for Sentry performance view
+        transaction.set_data("dogs_found", self.animals_found)
+
+        # Initialize comprehensive progress tracker for consistent logging
+        # Always create progress_tracker to ensure consistent terminal output across all scrapers
+        # Use discovery count (not filtered count) to ensure proper verbosity level for completion summary
+        # A streamed scrape created its tracker before the first batch
+        if not self.progress_tracker:
+            self.progress_tracker = self._create_progress_tracker(self.animals_found)
+
+        # Track discovery phase stats
+        # Use correct animals found count to show actual discovery metrics
+        correct_animals_found = self._get_correct_animals_found_count(animals_data)
+        self.progress_tracker.track_discovery_stats(
+            dogs_found=correct_animals_found,
+            pages_processed=1,
+            extraction_failures=0,
+        )  # Single page scrape
+
+        # Track filtering phase stats
+        # Note: animals_data contents depend on scraper implementation -
+        # may contain all dogs or only new dogs based on skip_existing_animals setting
+        self.progress_tracker.track_filtering_stats(
+            dogs_skipped=self.total_animals_skipped,
+            new_dogs=len(animals_data),
+        )
+
+        # Log discovery completion with actual timing
+        self.progress_tracker.log_phase_complete("Discovery", discovery_duration, f"{correct_animals_found} dogs found")
+
+    def _report_discovery_and_process(self, animals_data, discovery_duration, transaction):
+        """Discovery summary followed by the database operations phase, for a collected list."""
+        self._report_discovery(animals_data, discovery_duration, transaction)
+
+        # Phase 3: Database Operations
+        add_scrape_breadcrumb(
+            "Starting database operations phase",
+            data={"animals_count": len(animals_data)},
+        )
+        return self._process_animals_data(animals_data)
+
+    def _create_progress_tracker(self, total_items: int) -> ProgressTracker:
+        """Progress tracker logging to the central scraper logger."""
+        return ProgressTracker(
+            total_items=max(total_items, 1),
+            logger=logging.getLogger("scraper"),
+            config=self._get_logging_config(),
+        )  # Use central scraper logger
+
+    def _process_animal_stream(self, stream, transaction) -> tuple[AnimalStreamSummary, dict[str, int]]:
+        """Collection and database operations phases, overlapped for a streaming collect_data().
+
+        Animals are taken from the stream in batches of STREAM_BATCH_SIZE. Each
+        batch is recorded for stale detection, saved (images, bulk upsert) and
+        handed to LLM enrichment before the next one is collected, so memory
+        holds one batch instead of every dog.
+
+        Returns:
+            Tuple of (summary standing in for the animals list, processing stats)
+        """
+        processing_stats = {
+            "animals_added": 0,
+            "animals_updated": 0,
+            "animals_unchanged": 0,
+            "images_uploaded": 0,
+            "images_failed": 0,
+        }
+        summary = AnimalStreamSummary()
+        self.progress_tracker = self._create_progress_tracker(0)
+        add_scrape_breadcrumb("Starting streamed database operations phase")
+
+        collection_seconds = 0.0
+        processing_seconds = 0.0
+        batches = iter_batches(stream, STREAM_BATCH_SIZE)
+        while True:
+            batch_start = datetime.now()
+            batch = next(batches, None)
+            collection_seconds += (datetime.now() - batch_start).total_seconds()
+            if batch is None:
+                break
+
+            processing_start = datetime.now()
+            self._record_all_found_external_ids(batch)
+            summary.add_batch(len(batch), self.metrics_collector.assess_data_quality(batch))
+            # The total is only known once the stream ends; progress tracks what has arrived
+            self.progress_tracker.total_items = max(self.progress_tracker.total_items, summary.count)
+
+            batch_stats = self._process_animals_data(batch)
+            for key in processing_stats:
+                processing_stats[key] += batch_stats.get(key, 0)
+
+            if self.animals_for_llm_enrichment:
+                self.llm_handler.enrich_animals(self.animals_for_llm_enrichment)
+                self.animals_for_llm_enrichment = []
+            processing_seconds += (datetime.now() - processing_start).total_seconds()
+
+        # Per-batch timings would overwrite each other; record the totals
+        self.metrics_collector.track_phase_timing("data_collection", collection_seconds)
+        self.metrics_collector.track_phase_timing("database_operations", processing_seconds)
+
+        self._report_discovery(summary, collection_seconds, transaction)
+        return summary, processing_stats
+
     def _setup_scrape(self):
         """Setup phase: Initialize scrape log, session, and timing with world-class logging."""
         # Use centralized logger for setup phase
@@ -687,6 +918,9 @@ class BaseScraper(ABC):
         if not self.start_scrape_log():
             central_logger.error("❌ Failed to create scrape log entry")
             return False
+        self._resume_from_checkpoint()
+        if not force_rescrape_enabled():
+            self.response_cache = ResponseCache.for_organization(self.organization_id, self.database_service, parser_version(type(self).__module__))
 
         # Start scrape session for stale data tracking
         session_started = False
@@ -720,6 +954,10 @@ class BaseScraper(ABC):
         central_logger.info(f"🔍 Discovering {self.animal_type}s on {self.get_organization_name()} website...")
 
         animals_data = self.collect_data()
+        if is_animal_stream(animals_data):
+            # Recorded, timed and counted batch by batch as the stream is consumed
+            central_logger.info(f"🔁 Streaming {self.animal_type}s from {self.get_organization_name()} as they are discovered")
+            return animals_data
 
         # Record all found external_ids for accurate stale detection
         # NOTE: Scrapers using _filter_existing_animals() already record external_ids
@@ -793,6 +1031,7 @@ class BaseScraper(ABC):
                         batch_size=batch_size,
                         use_concurrent=len(animals_data) > self.CONCURRENT_UPLOAD_THRESHOLD,
                         database_connection=self.conn,
+                        organization_id=self.organization_id,
                     )
                     # Count images uploaded
                     for animal in animals_data:
@@ -805,7 +1044,8 @@ class BaseScraper(ABC):
         if not self.session_manager:
             self._log_service_unavailable("SessionManager", "mark animal as seen disabled")
 
-        for i, animal_data in enumerate(animals_data):
+        valid_animals = []
+        for animal_data in animals_data:
             # Add organization_id and animal_type to the animal data
             animal_data["organization_id"] = self.organization_id
             if "animal_type" not in animal_data:
@@ -814,18 +1054,25 @@ class BaseScraper(ABC):
             # CRITICAL: Validate animal data before saving to prevent invalid data in database
             if not self._validate_animal_data(animal_data):
                 self.logger.warning(f"Skipping invalid animal: {animal_data.get('name', 'Unknown')} - validation failed")
+                self._forget_page(animal_data)
                 continue
+            valid_animals.append(animal_data)
+
+        saved = self.save_animals(valid_animals)
+        self._record_checkpoint([animal_data.get("external_id") for animal_data, (animal_id, _) in zip(valid_animals, saved) if animal_id])
+        seen_animal_ids = []
 
-            # Save animal
-            animal_id, action = self.save_animal(animal_data)
+        for i, (animal_data, (animal_id, action)) in enumerate(zip(valid_animals, saved)):
+            if not animal_id:
+                self._forget_page(animal_data)
 
             # Update progress tracking (only count animals toward progress percentage)
             self.progress_tracker.update(items_processed=1, operation_type="animal_save")
 
             if animal_id:
-                # Mark animal as seen in current session for confidence tracking
-                if self.session_manager:
-                    self.session_manager.mark_animal_as_seen(animal_id)
+                seen_animal_ids.append(animal_id)
+                if animal_data.get("external_id"):
+                    self._detail_checked_external_ids.add(animal_data["external_id"])
 
                 # Update counts
                 if action == "added":
@@ -848,6 +1095,10 @@ class BaseScraper(ABC):
                 # Mark progress as logged
                 self.progress_tracker.log_batch_progress()
 
+        # Mark saved animals as seen in current session for confidence tracking
+        if self.session_manager and seen_animal_ids:
+            self.session_manager.mark_animals_as_seen(seen_animal_ids)
+
         # Log final completion
         if len(animals_data) > 0:
             final_message = self.progress_tracker.get_progress_message()
@@ -911,7 +1162,7 @@ class BaseScraper(ABC):
             # Fix for skip_existing_animals bug: Mark skipped animals as seen
             # before running stale data detection to prevent them from being
             # incorrectly marked as unavailable
-            if self.skip_existing_animals:
+            if self.skip_existing_animals or self.total_animals_unchanged or self.total_animals_resumed:
                 if self.session_manager:
                     self.session_manager.mark_skipped_animals_as_seen()
                 else:
@@ -936,7 +1187,10 @@ class BaseScraper(ABC):
         # Calculate metrics for detailed logging
         scrape_end_time = datetime.now()
         duration = self.metrics_collector.calculate_scrape_duration(self.scrape_start_time, scrape_end_time)
-        quality_score = self.metrics_collector.assess_data_quality(animals_data)
+        if isinstance(animals_data, AnimalStreamSummary):
+            quality_score = animals_data.quality_score
+        else:
+            quality_score = self.metrics_collector.assess_data_quality(animals_data)
 
         # Log detailed metrics
         correct_animals_found = self._get_correct_animals_found_count(animals_data)
@@ -955,6 +1209,8 @@ class BaseScraper(ABC):
             rate_limit_delay=self.rate_limit_delay,
         )
         self.metrics_collector.log_detailed_metrics(detailed_metrics)
+        if self.render_stats.blocked_requests or self.render_stats.wait_seconds_saved:
+            self.logger.info(f"🪶 Light render: {self.render_stats.summary()}")
 
         # Update database with detailed metrics (only for successful scrapes)
         if not processing_stats.get("potential_failure_detected", False):
@@ -1003,6 +1259,10 @@ class BaseScraper(ABC):
 
         This method should be implemented by each organization-specific scraper.
 
+        It may instead be a generator or async generator yielding one animal
+        at a time; the animals are then saved in batches while collection
+        continues (see scrapers.animal_stream).
+
         Returns:
             List of dictionaries, each containing data for one animal
         """
@@ -1029,13 +1289,14 @@ class BaseScraper(ABC):
         """Sync filtering stats from FilteringService to base scraper attributes."""
         self.total_animals_before_filter = self.filtering_service.total_animals_before_filter
         self.total_animals_skipped = self.filtering_service.total_animals_skipped
+        self.total_animals_resumed = self.filtering_service.total_animals_resumed
 
     def _get_correct_animals_found_count(self, animals_data: list) -> int:
         """Return correct animals-found count, accounting for skip_existing_animals filtering."""
         self._sync_filtering_stats()
         if self.skip_existing_animals and self.total_animals_before_filter > 0:
             return self.total_animals_before_filter
-        return len(animals_data)
+        return len(animals_data) + self.total_animals_unchanged + self.total_animals_resumed
 
     @asynccontextmanager
     async def _with_browser_retry(self, options=None, max_retries=3, base_delay=2.0):
@@ -1047,6 +1308,16 @@ class BaseScraper(ABC):
         """Deprecated: delegates to self.browser_manager.navigate_with_retry()."""
         return await self.browser_manager.navigate_with_retry(page, url, max_retries, wait_until, timeout)
 
+    async def _settle(self, page, budget, selector=None):
+        """Wait up to budget seconds for a Playwright page to go quiet, instead of sleeping it out."""
+        return await settle(page, budget, selector, self.render_stats)
+
+    def _record_render_stats(self, browser_result) -> None:
+        """Add a browser lease's blocked requests and loaded bytes to this scrape's totals."""
+        stats = getattr(browser_result, "render_stats", None)
+        if isinstance(stats, RenderStats):
+            self.render_stats.merge(stats)
+
     def get_organization_name(self) -> str:
         """Get organization name for logging."""
         if self.org_config:
@@ -1059,11 +1330,239 @@ class BaseScraper(ABC):
         """Get rate limit delay from config or default."""
         return float(self.rate_limit_delay)
 
+    @property
+    def rate_controller(self) -> RateController:
+        """Per-host request pacing, starting from rate_limit_delay.
+
+        Rebuilt if rate_limit_delay is changed after construction.
+        """
+        controller = getattr(self, "_rate_controller", None)
+        delay = getattr(self, "rate_limit_delay", 1.0)
+        if controller is None or controller.initial_delay != delay:
+            controller = RateController(
+                delay,
+                min_delay=getattr(self, "rate_limit_min_delay", None),
+                max_delay=getattr(self, "rate_limit_max_delay", None),
+            )
+            self._rate_controller = controller
+        return controller
+
     # Add method to respect rate limiting
-    def respect_rate_limit(self):
-        """Sleep for the configured rate limit delay."""
-        if self.rate_limit_delay > 0:
-            time.sleep(self.rate_limit_delay)
+    def respect_rate_limit(self, url: str | None = None, jitter: tuple[float, float] | None = None, concurrency: int = 1) -> None:
+        """Wait until url's host may be sent the next request.
+
+        The wait adapts to how the host has been responding (see
+        RateController); it starts out as the configured rate_limit_delay.
+        Worker threads sharing a host pass their number as concurrency.
+        """
+        self.rate_controller.pause(url, jitter, concurrency)
+
+    def record_response(self, response) -> None:
+        """Let the rate controller adapt to a response's latency, status and Retry-After."""
+        self.rate_controller.observe_response(response)
+
+    def record_failure(self, url: str | None = None) -> None:
+        """Let the rate controller back off after a request that got no response."""
+        self.rate_controller.observe_failure(url)
+
+    def fetch_pages(
+        self,
+        urls: list[str],
+        parse: Callable[[str, str], T | None],
+        max_concurrency: int = 1,
+        headers: dict[str, str] | None = None,
+    ) -> list[T | None]:
+        """Fetch a batch of pages through the shared HTTP engine and parse each one.
+
+        Args:
+            urls: Pages to fetch
+            parse: Called as parse(url, html) for every page fetched successfully
+            max_concurrency: Requests in flight per host; the host also sees at
+                most this many requests per rate_controller delay
+            headers: Extra request headers (e.g. the scraper's User-Agent)
+
+        Returns:
+            One entry per URL, in order: the parsed result, UNCHANGED when the
+            page is the same as at the last successful run (see
+            _drop_unchanged), or None when it could not be fetched or parsed
+        """
+        engine = HttpFetchEngine(
+            logger=self.logger,
+            rate_limit_delay=self.rate_limit_delay,
+            max_retries=self.max_retries,
+            retry_backoff_factor=self.retry_backoff_factor,
+            timeout=self.timeout,
+            headers=headers,
+            cache=self.response_cache,
+            rate_controller=self.rate_controller,
+        )
+        pool = open_parse_pool(parse, len(urls)) if self.parse_in_processes else None
+        if pool:
+            self.logger.info(f"Parsing {len(urls)} pages in {pool.workers} worker processes")
+
+        parsed: list[Any] = []
+        fetched_urls = []
+        for result in engine.fetch_all(urls, max_concurrency):
+            fetched_urls.append(result.url)
+            if result.unchanged:
+                parsed.append(UNCHANGED)
+            elif not result.ok:
+                parsed.append(None)
+            elif pool:
+                # Parsed while the remaining pages are fetched; collected below
+                parsed.append((pool.submit(result.url, result.text), result.url, result.text))
+            else:
+                parsed.append(self._parse_page(parse, result.url, result.text))
+
+        if pool:
+            with pool:
+                parsed = [self._parse_result(entry, parse) if isinstance(entry, tuple) else entry for entry in parsed]
+
+        if self.response_cache:
+            # A page that parsed to nothing must be parsed again next run, not reported unchanged
+            for url, value in zip(fetched_urls, parsed):
+                if value is None:
+                    self.response_cache.forget(url)
+        return parsed
+
+    def _forget_page(self, animal_data: dict[str, Any]) -> None:
+        """Refetch an animal's page in full next run rather than trust a page whose dog was never stored."""
+        if self.response_cache and animal_data.get("adoption_url"):
+            self.response_cache.forget(animal_data["adoption_url"])
+
+    def _parse_page(self, parse: Callable[[str, str], T | None], url: str, html: str) -> T | None:
+        try:
+            return parse(url, html)
+        except Exception as e:
+            self.logger.error(f"Error parsing {url}: {e}")
+            return None
+
+    def _parse_result(self, entry: tuple[Future, str, str], parse: Callable[[str, str], T | None]) -> T | None:
+        """A page's result from the parse pool; parsed here instead if the pool broke."""
+        future, url, html = entry
+        try:
+            ok, value = future.result()
+        except Exception as e:
+            self.logger.warning(f"Parse worker failed for {url} ({e}); parsing in process")
+            return self._parse_page(parse, url, html)
+        if not ok:
+            self.logger.error(f"Error parsing {url}: {value}")
+            return None
+        return value
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickled state for a parse worker: everything but PROCESS_LOCAL_ATTRIBUTES, which become None."""
+        state = self.__dict__.copy()
+        for name in self.PROCESS_LOCAL_ATTRIBUTES:
+            if name in state:
+                state[name] = None
+        return state
+
+    def _drop_unchanged(self, animals: list[dict[str, Any]], details: list[Any]) -> tuple[list[dict[str, Any]], list[Any]]:
+        """Remove animals whose detail page fetch_pages() reported UNCHANGED.
+
+        Their rows are already up to date, so they're neither parsed nor
+        saved; they're recorded as found so they're still marked as seen.
+
+        Returns:
+            The remaining (animals, details), still paired by position
+        """
+        kept_animals, kept_details, unchanged = [], [], []
+        for animal, detail in zip(animals, details):
+            if detail is UNCHANGED:
+                unchanged.append(animal)
+            else:
+                kept_animals.append(animal)
+                kept_details.append(detail)
+
+        if unchanged:
+            self.total_animals_unchanged += len(unchanged)
+            for animal in unchanged:
+                if animal.get("external_id"):
+                    self._detail_checked_external_ids.add(animal["external_id"])
+                    if self.session_manager:
+                        self.session_manager.record_unchanged_animal(animal["external_id"])
+            self.logger.info(f"{len(unchanged)} animals unchanged since the last run - skipping parse and save")
+        return kept_animals, kept_details
+
+    def _listing_unchanged(self, cards: list[dict[str, Any]]) -> bool:
+        """Whether cards are the listing the last successful full crawl saw.
+
+        Scrapers call this with get_animal_list()'s cards before fetching any
+        detail page, and collect nothing when it returns True: every card is
+        then recorded as unchanged, so the run refreshes last_seen_at for all
+        of them in one statement and logs a normal scrape. See
+        scrapers/listing_fingerprint.py.
+        """
+        self.listing_fingerprint = listing_fingerprint(cards)
+        if not cards or force_rescrape_enabled() or not self.database_service:
+            return False
+        if not all(card.get("external_id") for card in cards):
+            # A card that can't be marked as seen would go stale
+            return False
+
+        previous = self.database_service.get_listing_fingerprint(self.organization_id, datetime.now() - FULL_CRAWL_MAX_AGE)
+        if previous != self.listing_fingerprint:
+            return False
+
+        self.listing_unchanged = True
+        self.total_animals_unchanged += len(cards)
+        if self.session_manager:
+            for card in cards:
+                self.session_manager.record_unchanged_animal(card["external_id"])
+        self.logger.info(f"Listing unchanged since the last full crawl ({len(cards)} animals) - skipping detail pages and saves")
+        return True
+
+    def _record_listing_fingerprint(self) -> None:
+        """Store this run's listing fingerprint, when it was a full crawl the next run can compare against."""
+        if self.listing_fingerprint and not self.listing_unchanged and self.database_service and self.scrape_log_id:
+            self.database_service.record_listing_fingerprint(self.scrape_log_id, self.listing_fingerprint)
+
+    def _record_listing_hashes(self) -> None:
+        """Store the listing hash of each card whose detail page this run saved or found unchanged.
+
+        A card whose detail fetch or save failed keeps its old hash, so the
+        next run fetches it again.
+        """
+        if not self.database_service:
+            return
+        checked = {external_id: listing_hash for external_id, listing_hash in self.filtering_service.listing_hashes.items() if external_id in self._detail_checked_external_ids}
+        if checked:
+            updated = self.database_service.record_listing_hashes(self.organization_id, checked, self.scrape_start_time or datetime.now())
+            self.logger.debug(f"Recorded listing hashes for {updated} animals")
+
+    def _resume_from_checkpoint(self) -> None:
+        """Resume this organization's previous scrape if it was interrupted within CHECKPOINT_RESUME_WINDOW.
+
+        The animals it persisted are recorded as found by the filtering
+        service without fetching their detail pages again. FORCE_RESCRAPE
+        always starts over.
+        """
+        if not self.database_service or not self.scrape_log_id or force_rescrape_enabled():
+            return
+        resumed = self.database_service.resume_checkpoint(self.organization_id, self.scrape_log_id, datetime.now() - CHECKPOINT_RESUME_WINDOW)
+        if resumed:
+            self.filtering_service.resume(resumed)
+            # Saved by the interrupted scrape, so their listing hashes are current
+            self._detail_checked_external_ids.update(resumed)
+            self.logger.info(f"Resuming an interrupted scrape: {len(resumed)} animals were already saved")
+
+    def _record_checkpoint(self, external_ids: list[str | None]) -> None:
+        """Record animals just persisted, so an interrupted run can be resumed after them."""
+        saved = [external_id for external_id in external_ids if external_id]
+        if saved and self.database_service and self.scrape_log_id:
+            self.database_service.record_checkpoint(self.scrape_log_id, saved)
+
+    def _clear_checkpoints(self) -> None:
+        """A completed scrape leaves nothing to resume."""
+        if self.database_service:
+            self.database_service.clear_checkpoints(self.organization_id)
+
+    def _commit_response_cache(self) -> None:
+        """Persist the pages fetched this run so the next run can skip unchanged ones."""
+        if self.response_cache:
+            written = self.response_cache.commit()
+            self.logger.debug(f"Committed {written} response cache entries")
 
     def _record_all_found_external_ids(self, animals_data):
         """Record all external_ids from discovered animals for accurate stale detection.
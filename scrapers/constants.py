@@ -4,6 +4,8 @@ This module consolidates batch processing and R2 upload constants
 that were previously scattered in BaseScraper.
 """
 
+from datetime import timedelta
+
 SMALL_BATCH_THRESHOLD = 3
 """Threshold below which smaller batch sizes are used for image processing.
 
@@ -24,3 +26,24 @@ MAX_R2_FAILURE_RATE = 50
 If the R2 service reports a failure rate above this threshold,
 batch image processing is skipped to avoid cascading failures.
 """
+
+DETAIL_FETCH_CONCURRENCY = 3
+"""Detail-page requests kept in flight per host by the shared HTTP engine.
+
+The engine also caps each host at this many requests per rate_limit_delay,
+matching the three rate-limited worker threads the HTTP scrapers used to run.
+"""
+
+STREAM_BATCH_SIZE = 25
+"""Animals taken from a streaming collect_data() before they are saved.
+
+Each batch goes through image upload, the bulk upsert and LLM enrichment
+while the scraper is still discovering the next ones.
+"""
+
+CHECKPOINT_RESUME_WINDOW = timedelta(hours=6)
+"""How soon after an interrupted scrape a rerun resumes it.
+
+Animals the interrupted scrape persisted are recorded as found without
+fetching their detail pages again. Past the window the rerun crawls in full.
+"""
@@ -1,4 +1,3 @@
-import asyncio
 import os
 import re
 from typing import TYPE_CHECKING, Any
@@ -90,7 +89,7 @@ class DaisyFamilyRescueDogDetailScraper:
     def extract_dog_details(self, dog_url: str, logger=None) -> dict[str, Any] | None:
         """Extract detailed information from a single dog's detail page (sync caller)."""
         if USE_PLAYWRIGHT:
-            return asyncio.run(self._extract_dog_details_playwright(dog_url, logger))
+            return get_playwright_service().run(self._extract_dog_details_playwright(dog_url, logger))
         return self._extract_dog_details_selenium(dog_url, logger)
 
     async def async_extract_dog_details(self, dog_url: str, logger=None) -> dict[str, Any] | None:
@@ -79,7 +79,7 @@ class DaisyFamilyRescueScraper(BaseScraper):
 
             # Step 1: Extract dogs using browser automation with section filtering
             if USE_PLAYWRIGHT:
-                all_dogs = asyncio.run(self._extract_with_playwright())
+                all_dogs = get_playwright_service().run(self._extract_with_playwright())
             else:
                 all_dogs = self._extract_with_selenium()
 
@@ -232,9 +232,6 @@ class DaisyFamilyRescueScraper(BaseScraper):
 
             # World-class logging: Processing results handled by centralized system
 
-            # Apply rate limiting using BaseScraper method
-            self.respect_rate_limit()
-
         except Exception as e:
             self.logger.error(f"Failed to extract dogs with Selenium: {e}")
             raise
@@ -322,8 +319,6 @@ class DaisyFamilyRescueScraper(BaseScraper):
                         self.logger.warning(f"Error processing dog {dog_data.get('name', 'unknown')}: {e}")
                         continue
 
-                self.respect_rate_limit()
-
             except Exception as e:
                 self.logger.error(f"Failed to extract dogs with Playwright: {e}")
                 raise
@@ -506,7 +501,7 @@ class DaisyFamilyRescueScraper(BaseScraper):
             detailed_data = await self.detail_scraper.async_extract_dog_details(adoption_url, self.logger)
 
             # Apply rate limiting between detail page requests
-            self.respect_rate_limit()
+            await self.rate_controller.pause_async(adoption_url)
 
             if detailed_data:
                 # Merge basic data with detailed data
@@ -3,7 +3,6 @@
 import asyncio
 import concurrent.futures
 import os
-import random
 import re
 import time
 from threading import Lock
@@ -13,6 +12,7 @@ import requests
 from bs4 import BeautifulSoup, Tag
 
 from scrapers.base_scraper import BaseScraper
+from scrapers.html_parsing import SELECTOLAX_PARSER, HtmlTree
 
 USE_PLAYWRIGHT = os.environ.get("USE_PLAYWRIGHT", "false").lower() == "true"
 
@@ -25,7 +25,7 @@ from selenium.webdriver.support import expected_conditions as EC  # noqa: E402
 from selenium.webdriver.support.wait import WebDriverWait  # noqa: E402
 
 from services.browser_service import BrowserOptions, get_browser_service  # noqa: E402
-from services.playwright_browser_service import PlaywrightOptions  # noqa: E402
+from services.playwright_browser_service import PlaywrightOptions, get_playwright_service  # noqa: E402
 
 # Browserless v2 sessions occasionally close mid-pagination — the remote browser
 # is torn down server-side, surfacing as a TargetClosedError partway through the
@@ -39,6 +39,10 @@ _BROWSER_CLOSED_SIGNATURES = (
 )
 
 
+# Listing card links: /rehoming/dogs/{breed-slug}/{id}, where the ID can be any length
+DOG_LINK_PATTERN = re.compile(r"/rehoming/dogs/[^/]+/\d+$")
+
+
 def _is_browser_closed_error(error: BaseException) -> bool:
     """True if the error is a Browserless session drop worth a full-scrape retry."""
     message = str(error).lower()
@@ -53,6 +57,9 @@ class DogsTrustScraper(BaseScraper):
     This hybrid approach follows the patterns established in the analysis phase.
     """
 
+    # Listing pages are large and read only for card links: parsed with selectolax
+    html_parser = SELECTOLAX_PARSER
+
     def __init__(
         self,
         config_id: str = "dogstrust",
@@ -106,6 +113,9 @@ class DogsTrustScraper(BaseScraper):
             self.logger.warning("No animals found to process")
             return []
 
+        if self._listing_unchanged(animals):
+            return []
+
         # Use filtering_service method that records external_ids BEFORE filtering
         # This is critical for mark_skipped_animals_as_seen() to work correctly
         result = self.filtering_service.filter_existing_animals(animals)
@@ -151,7 +161,7 @@ class DogsTrustScraper(BaseScraper):
 
                     try:
                         # Rate limiting with randomization for natural browsing pattern
-                        time.sleep(self.rate_limit_delay + random.uniform(-0.2, 0.3))
+                        self.respect_rate_limit(adoption_url, jitter=(-0.2, 0.3), concurrency=max_workers)
 
                         # Extract detailed data via HTTP requests (faster than Selenium)
                         detail_data = self._scrape_animal_details_http(adoption_url)
@@ -250,7 +260,7 @@ class DogsTrustScraper(BaseScraper):
         """
         for attempt in range(1, max_attempts + 1):
             try:
-                return asyncio.run(self._get_animal_list_playwright(max_pages_to_scrape))
+                return get_playwright_service().run(self._get_animal_list_playwright(max_pages_to_scrape))
             except PlaywrightError as error:
                 if not _is_browser_closed_error(error) or attempt == max_attempts:
                     raise
@@ -436,7 +446,7 @@ class DogsTrustScraper(BaseScraper):
 
             while True:
                 # Parse the current page content
-                soup = BeautifulSoup(driver.page_source, "html.parser")
+                soup = self.parse_fast(driver.page_source)
 
                 # Detect max pages from pagination indicator on first iteration
                 if max_pages is None:
@@ -498,7 +508,7 @@ class DogsTrustScraper(BaseScraper):
                         driver.execute_script("arguments[0].click();", next_button)
 
                         # Wait for the new page to load with randomized delay
-                        time.sleep(self.rate_limit_delay + random.uniform(0, 0.5))  # Randomized delay for natural pattern
+                        self.respect_rate_limit(self.base_url, jitter=(0, 0.5))  # Randomized delay for natural pattern
 
                         # Wait for new content to appear
                         try:
@@ -750,7 +760,7 @@ class DogsTrustScraper(BaseScraper):
 
                 while True:
                     html_content = await page.content()
-                    soup = BeautifulSoup(html_content, "html.parser")
+                    soup = self.parse_fast(html_content)
 
                     if max_pages is None:
                         max_pages = self._detect_max_pages(soup)
@@ -845,7 +855,7 @@ class DogsTrustScraper(BaseScraper):
                         self.logger.warning(f"Page {page_num + 1} did not render after clicking Next - stopping pagination")
                         break
 
-                    await asyncio.sleep(self.rate_limit_delay + random.uniform(0.3, 0.8))
+                    await self.rate_controller.pause_async(self.base_url, jitter=(0.3, 0.8))
                     page_num += 1
 
             except Exception as e:
@@ -884,14 +894,14 @@ class DogsTrustScraper(BaseScraper):
 
         return browser_result.driver
 
-    def _detect_max_pages(self, soup: BeautifulSoup) -> int:
+    def _detect_max_pages(self, soup: HtmlTree) -> int:
         """Detect maximum page count from pagination indicator.
 
         Looks for pagination text like "1 / 38" (or legacy "1 of 47") to
         determine total pages, falling back to a fixed bound if not found.
 
         Args:
-            soup: BeautifulSoup object of the listing page
+            soup: Parsed listing page
 
         Returns:
             Total page count from the indicator, or a fixed fallback bound if
@@ -901,11 +911,10 @@ class DogsTrustScraper(BaseScraper):
         """
         # Look for pagination indicator with pattern "X of Y" or "X / Y".
         # Dogs Trust switched the rendered separator from "of" to "/", so accept both.
-        indicator_pattern = re.compile(r"\d+\s*(?:of|/)\s*\d+")
-        elements = soup.find_all(string=indicator_pattern)
-        for element in elements:
-            element_text = str(element).strip()
-            match = re.search(r"(\d+)\s*(?:of|/)\s*(\d+)", element_text)
+        indicator_pattern = re.compile(r"(\d+)\s*(?:of|/)\s*(\d+)")
+        for element_text in soup.get_text("\n").splitlines():
+            element_text = element_text.strip()
+            match = indicator_pattern.search(element_text)
             if match:
                 total_pages = int(match.group(2))
                 self.logger.debug(f"Found pagination indicator: {element_text}")
@@ -915,7 +924,7 @@ class DogsTrustScraper(BaseScraper):
         self.logger.warning("Could not detect max pages, defaulting to 47")
         return 47
 
-    def _extract_dogs_from_page(self, soup: BeautifulSoup) -> list[dict[str, Any]]:
+    def _extract_dogs_from_page(self, soup: HtmlTree) -> list[dict[str, Any]]:
         """Extract dog information from a single listing page.
 
         Uses CSS selectors identified in analysis phase:
@@ -923,7 +932,7 @@ class DogsTrustScraper(BaseScraper):
         - Filters out reserved dogs since we're not using noReserved parameter
 
         Args:
-            soup: BeautifulSoup object of the listing page
+            soup: Parsed listing page
 
         Returns:
             List of dog data dictionaries with basic information (excluding reserved dogs)
@@ -932,8 +941,7 @@ class DogsTrustScraper(BaseScraper):
         seen_urls = set()  # Track URLs to avoid duplicates on same page
 
         # Find all dog card links - more flexible regex to handle variable ID lengths
-        # Pattern matches: /rehoming/dogs/{breed-slug}/{id} where ID can be any length
-        dog_links = soup.find_all("a", href=re.compile(r"/rehoming/dogs/[^/]+/\d+$"))
+        dog_links = [link for link in soup.select('a[href*="/rehoming/dogs/"]') if DOG_LINK_PATTERN.search(link.get("href", ""))]
 
         for link in dog_links:
             try:
@@ -964,7 +972,7 @@ class DogsTrustScraper(BaseScraper):
         """Extract data from a single dog card element.
 
         Args:
-            link_element: BeautifulSoup element representing a dog card link
+            link_element: Parsed dog card link
 
         Returns:
             Dictionary containing dog data with required fields
@@ -1027,7 +1035,6 @@ class DogsTrustScraper(BaseScraper):
         """
         # Implement retry logic for HTTP failures
         max_retries = getattr(self, "max_retries", 3)
-        retry_delay = 2.0
 
         for attempt in range(max_retries):
             try:
@@ -1048,6 +1055,7 @@ class DogsTrustScraper(BaseScraper):
                     timeout = 30
 
                 response = requests.get(adoption_url, headers=headers, timeout=timeout)
+                self.record_response(response)
                 response.raise_for_status()
 
                 # If successful, break out of retry loop
@@ -1059,9 +1067,10 @@ class DogsTrustScraper(BaseScraper):
             ) as e:
                 if attempt < max_retries - 1:
                     self.logger.warning(f"HTTP request failed for {adoption_url} (attempt {attempt + 1}/{max_retries}): {e}")
-                    self.logger.info(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                    retry_delay *= 1.5  # Exponential backoff
+                    # The controller has backed off from the error (or Retry-After)
+                    if getattr(e, "response", None) is None:
+                        self.record_failure(adoption_url)
+                    self.respect_rate_limit(adoption_url)
                     continue
                 else:
                     self.logger.error(f"All {max_retries} HTTP attempts failed for {adoption_url}: {e}")
@@ -1069,8 +1078,8 @@ class DogsTrustScraper(BaseScraper):
             except Exception as e:
                 self.logger.error(f"Unexpected error during HTTP request for {adoption_url}: {e}")
                 if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
-                    retry_delay *= 1.5
+                    self.record_failure(adoption_url)
+                    self.respect_rate_limit(adoption_url)
                     continue
                 else:
                     return {}
@@ -1192,7 +1201,7 @@ class DogsTrustScraper(BaseScraper):
         Handing BeautifulSoup the raw bytes lets it read the meta charset
         instead.
         """
-        return BeautifulSoup(response.content, "html.parser")
+        return self.parse_html(response.content)
 
     def _extract_description(self, soup: BeautifulSoup) -> str:
         """Extract description from the two per-dog sections.
@@ -1,14 +1,28 @@
 """Filtering service for managing existing animal detection and filtering."""
 
 import logging
+import math
+from datetime import datetime
 from typing import Any
 
+from scrapers.listing_fingerprint import card_hash
+
+DEFAULT_DETAIL_REFRESH_FRACTION = 0.1
+"""Share of a run's unchanged animals whose detail pages are fetched anyway, least recently checked first."""
+
 
 class FilteringService:
     """Handles filtering of existing animals and tracking of filtering stats.
 
     Encapsulates the skip_existing_animals logic and external ID recording
     for stale detection.
+
+    With skip_existing_animals, a listed animal's detail page is fetched
+    when it is new, when its card (name, image, status) hashes differently
+    from the one stored with its last detail fetch, or when it is among the
+    detail_refresh_fraction of unchanged animals checked longest ago. The
+    fraction is the detail freshness budget: 0.1 re-verifies every stored
+    animal about every ten runs, 1.0 fetches everything.
     """
 
     def __init__(
@@ -17,16 +31,21 @@ class FilteringService:
         session_manager=None,
         organization_id: int | None = None,
         skip_existing_animals: bool = False,
+        detail_refresh_fraction: float = DEFAULT_DETAIL_REFRESH_FRACTION,
         logger: logging.Logger | None = None,
     ):
         self.database_service = database_service
         self.session_manager = session_manager
         self.organization_id = organization_id
         self.skip_existing_animals = skip_existing_animals
+        self.detail_refresh_fraction = detail_refresh_fraction
         self.logger = logger or logging.getLogger(__name__)
 
         self._total_animals_before_filter = 0
         self._total_animals_skipped = 0
+        self._listing_hashes: dict[str, str] = {}
+        self._resumed_external_ids: set[str] = set()
+        self._total_animals_resumed = 0
 
     @property
     def total_animals_before_filter(self) -> int:
@@ -36,37 +55,55 @@ class FilteringService:
     def total_animals_skipped(self) -> int:
         return self._total_animals_skipped
 
-    def get_existing_animal_urls(self) -> set[str]:
-        """Get set of existing animal URLs for this organization."""
-        if self.database_service:
-            return self.database_service.get_existing_animal_urls(self.organization_id)
-
-        self.logger.warning("No DatabaseService available - cannot check existing animals")
-        return set()
-
-    def filter_existing_urls(self, all_urls: list[str]) -> list[str]:
-        """Filter out existing URLs if skip_existing_animals is enabled."""
-        if not self.skip_existing_animals:
-            self.logger.debug(f"skip_existing_animals is False, returning all {len(all_urls)} URLs")
-            return all_urls
+    @property
+    def total_animals_resumed(self) -> int:
+        return self._total_animals_resumed
 
-        self.logger.info("Checking database for existing animals...")
-        existing_urls = self.get_existing_animal_urls()
+    def resume(self, external_ids: set[str]) -> None:
+        """Skip the detail pages of animals an interrupted scrape already persisted.
 
-        if not existing_urls:
-            self.logger.info(f"No existing animals found in database, processing all {len(all_urls)} URLs")
-            return all_urls
+        They are still recorded as found, and as unchanged so they're marked
+        as seen, so stale detection and the partial-failure check see the
+        whole listing.
+        """
+        self._resumed_external_ids = set(external_ids)
 
-        filtered_urls = [url for url in all_urls if url not in existing_urls]
-        skipped_count = len(all_urls) - len(filtered_urls)
+    @property
+    def listing_hashes(self) -> dict[str, str]:
+        """card_hash() of every card passed on for a detail fetch, by external_id."""
+        return self._listing_hashes
 
-        self.logger.info(f"Found {len(existing_urls)} existing animals in database")
-        self.logger.info(f"Filtered results: Skipped {skipped_count} existing, will process {len(filtered_urls)} new animals")
+    def select_for_detail(self, animals: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """The listed animals whose detail pages need fetching, in listing order.
 
-        if skipped_count == 0 and len(existing_urls) > 0:
-            self.logger.warning("No URLs were filtered despite having existing animals - possible URL mismatch!")
+        New animals, animals whose card changed and the refresh sample of
+        unchanged ones; animals without an external_id can't be matched and
+        are always fetched, and so is everything when the lookup fails.
+        """
+        external_ids = [animal["external_id"] for animal in animals if animal.get("external_id")]
+        stored = self.database_service.get_listing_hashes(self.organization_id, external_ids) if self.database_service else None
+        if stored is None:
+            self.logger.warning("Could not load stored listing hashes - fetching every detail page")
+            return animals
 
-        return filtered_urls
+        new, changed, unchanged = set(), set(), []
+        for animal in animals:
+            external_id = animal.get("external_id")
+            if not external_id or external_id not in stored:
+                new.add(external_id)
+            elif stored[external_id][0] != card_hash(animal):
+                changed.add(external_id)
+            else:
+                unchanged.append(external_id)
+
+        # Never-checked first, then oldest check; ceil so any positive budget makes progress
+        budget = math.ceil(len(unchanged) * self.detail_refresh_fraction)
+        refresh = set(sorted(unchanged, key=lambda external_id: stored[external_id][1] or datetime.min)[:budget])
+
+        fetch = new | changed | refresh
+        selected = [animal for animal in animals if animal.get("external_id") in fetch]
+        self.logger.info(f"Detail pages: {len(new)} new, {len(changed)} changed, {len(refresh)} of {len(unchanged)} unchanged due for re-verification")
+        return selected
 
     def filter_existing_animals(self, animals: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Filter existing animals and record ALL found external_ids for stale detection.
@@ -77,8 +114,11 @@ class FilteringService:
         Args:
             animals: List of animal data dicts, each containing 'external_id' and 'adoption_url'
 
+        The filtering stats add up over calls, so a scraper may filter its
+        listing a page at a time.
+
         Returns:
-            Filtered list of animals (only new ones if skip_existing_animals is True)
+            Filtered list of animals (see select_for_detail() if skip_existing_animals is True)
         """
         if not animals:
             return []
@@ -93,23 +133,45 @@ class FilteringService:
         if recorded_count > 0:
             self.logger.info(f"Recorded {recorded_count} external IDs for stale detection")
 
+        listed = animals
+        if self._resumed_external_ids:
+            animals = self._drop_resumed(animals)
+
         if not self.skip_existing_animals:
+            self._record_listing_hashes(animals)
             self.logger.info(f"Processing all {len(animals)} animals")
             return animals
 
-        all_urls = [animal.get("adoption_url", "") for animal in animals]
-        filtered_urls = self.filter_existing_urls(all_urls)
+        filtered_animals = self.select_for_detail(animals) if animals else []
+        self._record_listing_hashes(filtered_animals)
 
-        skipped_count = len(all_urls) - len(filtered_urls)
-        self._set_filtering_stats(len(all_urls), skipped_count)
+        skipped_count = len(listed) - len(filtered_animals)
+        self._set_filtering_stats(self._total_animals_before_filter + len(listed), self._total_animals_skipped + skipped_count)
 
-        url_to_animal = {animal.get("adoption_url", ""): animal for animal in animals}
-        filtered_animals = [url_to_animal[url] for url in filtered_urls if url in url_to_animal]
-
-        self.logger.info(f"Filtering: {skipped_count} existing (skipped), {len(filtered_animals)} new ({skipped_count / len(all_urls) * 100:.1f}% skip rate)")
+        self.logger.info(f"Filtering: {skipped_count} unchanged or resumed (skipped), {len(filtered_animals)} to fetch ({skipped_count / len(listed) * 100:.1f}% skip rate)")
 
         return filtered_animals
 
+    def _drop_resumed(self, animals: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Remove the animals resume() was given, recording them as unchanged."""
+        remaining, resumed = [], []
+        for animal in animals:
+            (resumed if animal.get("external_id") in self._resumed_external_ids else remaining).append(animal)
+
+        self._total_animals_resumed += len(resumed)
+        self._record_listing_hashes(resumed)
+        if self.session_manager:
+            for animal in resumed:
+                self.session_manager.record_unchanged_animal(animal["external_id"])
+        self.logger.info(f"Resumed: {len(resumed)} animals already saved by the interrupted scrape, {len(remaining)} left")
+        return remaining
+
+    def _record_listing_hashes(self, animals: list[dict[str, Any]]) -> None:
+        """Remember the card hash of each animal passed on, for BaseScraper to store once its detail page is saved."""
+        for animal in animals:
+            if animal.get("external_id"):
+                self._listing_hashes[animal["external_id"]] = card_hash(animal)
+
     def _set_filtering_stats(self, total_before_filter: int, total_skipped: int):
         """Set statistics about skip_existing_animals filtering."""
         self._total_animals_before_filter = total_before_filter
@@ -1,7 +1,6 @@
 """Scraper implementation for Furry Rescue Italy organization."""
 
 import re
-import time
 from typing import Any
 from urllib.parse import urljoin
 
@@ -9,6 +8,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from scrapers.base_scraper import BaseScraper
+from scrapers.constants import DETAIL_FETCH_CONCURRENCY
 
 # Using unified standardization through base_scraper.process_animal()
 
@@ -93,11 +93,12 @@ class FurryRescueItalyScraper(BaseScraper):
 
                 # Rate limiting for respectful scraping (applies to all pages)
                 if current_page > 1 or all_dogs:  # Rate limit all pages except the very first request
-                    time.sleep(self.rate_limit_delay)
+                    self.respect_rate_limit(url)
 
                 # Fetch the page
                 try:
                     response = requests.get(url, headers=self.headers, timeout=self.timeout)
+                    self.record_response(response)
                     response.raise_for_status()
                 except Exception as e:
                     self.logger.error(f"Error fetching page {current_page}: {e}")
@@ -289,47 +290,60 @@ class FurryRescueItalyScraper(BaseScraper):
             self.logger.info(f"Scraping details from: {url}")
 
             # Rate limiting for respectful scraping
-            time.sleep(self.rate_limit_delay)
+            self.respect_rate_limit(url)
 
             response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            self.record_response(response)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            return self._parse_animal_details(url, response.text)
 
-            details = {}
+        except Exception as e:
+            self.logger.error(f"Error scraping details from {url}: {e}")
+            return {}
 
-            # Extract name
-            name = self._extract_name_from_detail(soup)
-            if name:
-                details["name"] = name
+    def _parse_animal_details(self, url: str, html: str) -> dict[str, Any]:
+        """Extract detailed information from an animal's detail page HTML.
 
-            # Extract hero image (first 600x600 image)
-            hero_image = self._extract_hero_image(soup)
-            if hero_image:
-                details["primary_image_url"] = hero_image
+        Args:
+            url: URL the page was fetched from
+            html: Page HTML
 
-            # Extract properties from bulleted list
-            properties = self._extract_properties(soup)
-            if properties:
-                details["properties"] = properties
+        Returns:
+            Dictionary containing detailed animal information
+        """
+        soup = BeautifulSoup(html, "html.parser")
 
-                # Extract weight from size/future_size if present
-                size_text = properties.get("size") or properties.get("future_size")
-                if size_text:
-                    weight = self._extract_weight_from_size(size_text)
-                    if weight:
-                        properties["weight"] = weight
+        details = {}
 
-            # Extract and clean description
-            description = self._extract_clean_description(soup)
-            if description:
-                details["description"] = description
+        # Extract name
+        name = self._extract_name_from_detail(soup)
+        if name:
+            details["name"] = name
 
-            return details
+        # Extract hero image (first 600x600 image)
+        hero_image = self._extract_hero_image(soup)
+        if hero_image:
+            details["primary_image_url"] = hero_image
 
-        except Exception as e:
-            self.logger.error(f"Error scraping details from {url}: {e}")
-            return {}
+        # Extract properties from bulleted list
+        properties = self._extract_properties(soup)
+        if properties:
+            details["properties"] = properties
+
+            # Extract weight from size/future_size if present
+            size_text = properties.get("size") or properties.get("future_size")
+            if size_text:
+                weight = self._extract_weight_from_size(size_text)
+                if weight:
+                    properties["weight"] = weight
+
+        # Extract and clean description
+        description = self._extract_clean_description(soup)
+        if description:
+            details["description"] = description
+
+        return details
 
     def _extract_name_from_detail(self, soup: BeautifulSoup) -> str | None:
         """Extract dog name from detail page."""
@@ -768,6 +782,9 @@ class FurryRescueItalyScraper(BaseScraper):
             self.logger.warning("No animals found to process")
             return []
 
+        if self._listing_unchanged(animals):
+            return []
+
         # Apply filtering if configured
         # Uses self.filtering_service.filter_existing_animals() which records ALL external_ids
         # BEFORE filtering to ensure mark_skipped_animals_as_seen() works correctly
@@ -778,95 +795,35 @@ class FurryRescueItalyScraper(BaseScraper):
             self.total_animals_before_filter = len(animals)
             self.total_animals_skipped = 0
 
-        # For small sites (<=10 animals), process sequentially
-        # For larger sites, use simple parallel processing
-        if len(animals) <= 10:
-            enriched_animals = self._process_animals_sequentially(animals)
-        else:
-            enriched_animals = self._process_animals_parallel(animals)
+        enriched_animals = self._process_animals_parallel(animals)
 
         self.logger.info(f"Successfully enriched {len(enriched_animals)} animals with detail data")
 
         return enriched_animals
 
-    def _process_animals_sequentially(self, animals: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Process animals sequentially - best for small datasets."""
-        enriched_animals = []
-
-        for i, animal in enumerate(animals, 1):
-            try:
-                self.logger.info(f"Processing {i}/{len(animals)}: {animal.get('name', 'Unknown')}")
-
-                # Scrape detail page
-                if "adoption_url" in animal:
-                    details = self.scrape_animal_details(animal["adoption_url"])
-
-                    # Merge detail data with listing data
-                    if details:
-                        self._merge_animal_details(animal, details)
-
-                # Validate required fields before adding
-                if self._validate_animal_data(animal):
-                    enriched_animals.append(animal)
-                else:
-                    self.logger.warning(f"Skipping animal {animal.get('name', 'Unknown')} due to missing required fields")
-
-            except Exception as e:
-                self.logger.error(f"Error processing animal {animal.get('name', 'Unknown')}: {e}")
-                # Still add the animal with whatever data we have if it's valid
-                if self._validate_animal_data(animal):
-                    enriched_animals.append(animal)
-
-        return enriched_animals
-
     def _process_animals_parallel(self, animals: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Process animals in parallel batches - for larger datasets."""
-        import concurrent.futures
-        from threading import Lock
-
+        """Fetch detail pages through the shared HTTP engine and merge them into the animals."""
         enriched_animals = []
-        results_lock = Lock()
-
-        # Use batch_size from config, default to 4 for this small site
-        batch_size = min(self.batch_size, 4)  # Don't overdo it for 50 dogs
-
-        self.logger.info(f"Processing {len(animals)} animals in parallel with batch_size={batch_size}")
 
-        def process_single_animal(animal: dict[str, Any]) -> dict[str, Any]:
-            """Process a single animal with detail enrichment."""
-            try:
-                # Rate limiting between requests
-                time.sleep(self.rate_limit_delay)
-
-                if "adoption_url" in animal:
-                    details = self.scrape_animal_details(animal["adoption_url"])
-                    if details:
-                        self._merge_animal_details(animal, details)
-
-                return animal
-            except Exception as e:
-                self.logger.error(f"Error processing {animal.get('name', 'Unknown')}: {e}")
-                return animal
-
-        # Process in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=batch_size) as executor:
-            future_to_animal = {executor.submit(process_single_animal, animal): animal for animal in animals}
-
-            for future in concurrent.futures.as_completed(future_to_animal):
-                try:
-                    result = future.result()
-                    if self._validate_animal_data(result):
-                        with results_lock:
-                            enriched_animals.append(result)
-                    else:
-                        self.logger.warning(f"Skipping animal {result.get('name', 'Unknown')} due to missing required fields")
-                except Exception as e:
-                    original_animal = future_to_animal[future]
-                    self.logger.error(f"Failed to process {original_animal.get('name', 'Unknown')}: {e}")
-                    # Add with original data if valid
-                    if self._validate_animal_data(original_animal):
-                        with results_lock:
-                            enriched_animals.append(original_animal)
+        with_urls = [animal for animal in animals if "adoption_url" in animal]
+        self.logger.info(f"Fetching detail pages for {len(with_urls)} animals")
+        details = self.fetch_pages(
+            [animal["adoption_url"] for animal in with_urls],
+            self._parse_animal_details,
+            max_concurrency=DETAIL_FETCH_CONCURRENCY,
+            headers=self.headers,
+        )
+        with_urls, details = self._drop_unchanged(with_urls, details)
+        for animal, animal_details in zip(with_urls, details):
+            if animal_details:
+                self._merge_animal_details(animal, animal_details)
+
+        for animal in [animal for animal in animals if "adoption_url" not in animal] + with_urls:
+            # Validate required fields before adding
+            if self._validate_animal_data(animal):
+                enriched_animals.append(animal)
+            else:
+                self.logger.warning(f"Skipping animal {animal.get('name', 'Unknown')} due to missing required fields")
 
         return enriched_animals
 
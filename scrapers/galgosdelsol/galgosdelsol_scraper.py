@@ -1,6 +1,5 @@
 """Scraper implementation for Galgos del Sol organization."""
 
-import time
 from typing import Any
 from urllib.parse import urljoin
 
@@ -8,8 +7,11 @@ import requests
 from bs4 import BeautifulSoup
 
 from scrapers.base_scraper import BaseScraper
+from scrapers.constants import DETAIL_FETCH_CONCURRENCY
 from utils.standardization import standardize_age
 
+DETAIL_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; RescueDogAggregator/1.0)"}
+
 
 class GalgosDelSolScraper(BaseScraper):
     """Scraper for Galgos del Sol rescue organization.
@@ -55,7 +57,7 @@ class GalgosDelSolScraper(BaseScraper):
 
         # Initialize persistent session for efficiency
         self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "Mozilla/5.0 (compatible; RescueDogAggregator/1.0)"})
+        self.session.headers.update(DETAIL_HEADERS)
 
     def _get_filtered_animals(self) -> list[dict[str, Any]]:
         """Get list of animals and apply skip_existing_animals filtering.
@@ -74,7 +76,7 @@ class GalgosDelSolScraper(BaseScraper):
         for listing_url in self.listing_urls:
             try:
                 # Respect rate limiting between requests
-                time.sleep(self.rate_limit_delay)
+                self.respect_rate_limit(listing_url)
 
                 animals = self._scrape_listing_page(listing_url)
 
@@ -99,6 +101,9 @@ class GalgosDelSolScraper(BaseScraper):
             self.logger.warning("No animals found to process")
             return []
 
+        if self._listing_unchanged(all_dogs_data):
+            return []
+
         # Use filtering_service method that records external_ids BEFORE filtering
         # This is critical for mark_skipped_animals_as_seen() to work correctly
         result = self.filtering_service.filter_existing_animals(all_dogs_data)
@@ -106,7 +111,7 @@ class GalgosDelSolScraper(BaseScraper):
         return result
 
     def _process_animals_in_batches(self, animals: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Process animals in batches respecting the configured batch_size.
+        """Fetch detail pages through the shared HTTP engine and merge them into the animals.
 
         Args:
             animals: List of animals to process
@@ -114,51 +119,21 @@ class GalgosDelSolScraper(BaseScraper):
         Returns:
             List of processed animals with detailed data
         """
-        all_processed_data = []
-
-        self.logger.info(f"Starting detail scraping for {len(animals)} animals using batch_size={self.batch_size}")
-
-        # Split animals into batches based on batch_size
-        batches = []
-        for i in range(0, len(animals), self.batch_size):
-            batch = animals[i : i + self.batch_size]
-            batches.append(batch)
-
-        self.logger.info(f"Split {len(animals)} animals into {len(batches)} batches of size {self.batch_size}")
-
-        # Process each batch
-        for batch_index, batch in enumerate(batches):
-            try:
-                self.logger.info(f"Processing batch {batch_index + 1}/{len(batches)}: {len(batch)} animals")
-
-                for animal in batch:
-                    try:
-                        # Respect rate limiting between requests
-                        time.sleep(self.rate_limit_delay)
-
-                        # Scrape detail page if method exists
-                        if hasattr(self, "_scrape_detail_page"):
-                            detail_data = self._scrape_detail_page(animal["adoption_url"])
-                            if detail_data:
-                                animal.update(detail_data)
-
-                        all_processed_data.append(animal)
-
-                    except Exception as e:
-                        self.logger.error(f"Error processing {animal.get('name', 'unknown')}: {e}")
-                        # Continue with basic data even if detail scraping fails
-                        all_processed_data.append(animal)
-                        continue
-
-                self.logger.info(f"Completed batch {batch_index + 1}/{len(batches)}: {len(batch)} animals processed")
+        self.logger.info(f"Starting detail scraping for {len(animals)} animals")
 
-            except Exception as e:
-                self.logger.error(f"Error in batch {batch_index + 1}: {e}")
-                # Add the batch animals with basic data to avoid losing them
-                all_processed_data.extend(batch)
-                continue
+        details = self.fetch_pages(
+            [animal["adoption_url"] for animal in animals],
+            self._parse_animal_details,
+            max_concurrency=DETAIL_FETCH_CONCURRENCY,
+            headers=DETAIL_HEADERS,
+        )
+        animals, details = self._drop_unchanged(animals, details)
+        for animal, detail_data in zip(animals, details):
+            # Animals without detail data keep their listing data
+            if detail_data:
+                animal.update(detail_data)
 
-        return all_processed_data
+        return animals
 
     def collect_data(self) -> list[dict[str, Any]]:
         """Collect all available dog data from all listing pages.
@@ -186,17 +161,6 @@ class GalgosDelSolScraper(BaseScraper):
             self.logger.error(f"Error collecting data from Galgos del Sol: {e}")
             return []
 
-    def _scrape_detail_page(self, url: str) -> dict[str, Any]:
-        """Scrape detailed information from a dog's detail page.
-
-        Args:
-            url: URL of the detail page to scrape
-
-        Returns:
-            Dictionary with detailed dog information, or empty dict if reserved/error
-        """
-        return self.scrape_animal_details(url)
-
     def scrape_animal_details(self, url: str) -> dict[str, Any]:
         """Scrape detailed information from a dog's detail page.
 
@@ -215,86 +179,99 @@ class GalgosDelSolScraper(BaseScraper):
 
             # Fetch the detail page using persistent session
             response = self.session.get(url, timeout=30)
+            self.record_response(response)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, "html.parser")
+            return self._parse_animal_details(url, response.text)
 
-            # Extract name from h2 heading
-            name = self._extract_name(soup)
-            if not name:
-                self.logger.warning(f"Could not extract name from {url}")
-                return {}
-
-            # Check if dog is reserved (based on name or page content)
-            if self._is_reserved_dog(soup, name):
-                self.logger.debug(f"Skipping reserved dog: {name}")
-                return {}
-
-            # Extract basic information
-            external_id = self._extract_external_id(url)
-
-            # Extract properties from the detail page
-            properties = self._extract_properties(soup)
-
-            # Extract description
-            description = self._extract_description(soup)
-
-            # Extract hero image
-            hero_image_url = self._extract_hero_image(soup)
-
-            # Session 4 compliance: Include description in properties for Spanish organizations
-            if description:
-                properties["description"] = description
-
-            # Build result dictionary with raw data (no normalization)
-            result = {
-                "name": name,
-                "external_id": external_id,
-                "adoption_url": url,
-                "primary_image_url": hero_image_url,
-                "original_image_url": hero_image_url,  # Same as primary for this site
-                "animal_type": "dog",
-                "status": "available",
-                "properties": properties,
-                "description": description,
-            }
-
-            # Add image_urls for R2 integration through BaseScraper template method
-            if hero_image_url:
-                result["image_urls"] = [hero_image_url]
-            else:
-                result["image_urls"] = []
+        except Exception as e:
+            self.logger.error(f"Error scraping detail page {url}: {e}")
+            return {}
 
-            # Extract individual fields from properties for compatibility with zero NULLs compliance
-            if properties:
-                if "breed" in properties:
-                    result["breed"] = properties["breed"] or "Mixed Breed"
-                if "sex" in properties:
-                    result["sex"] = properties["sex"] or "Unknown"
-                if "age_text" in properties:
-                    result["age_text"] = properties["age_text"]
+    def _parse_animal_details(self, url: str, html: str) -> dict[str, Any]:
+        """Extract a dog's details from its detail page HTML.
 
-            # Ensure zero NULLs compliance - set proper defaults for missing fields
-            if "breed" not in result:
-                result["breed"] = "Mixed Breed"
-            if "sex" not in result:
-                result["sex"] = "Unknown"
-            if "age_text" not in result:
-                result["age_text"] = None
+        Args:
+            url: URL the page was fetched from
+            html: Page HTML
 
-            # Use BaseScraper fallback for size (not available on this site)
-            result["size"] = "Medium"  # Default fallback as requested
+        Returns:
+            Dictionary with detailed dog information, or empty dict if reserved
+        """
+        soup = BeautifulSoup(html, "html.parser")
 
-            self.logger.debug(f"Successfully extracted data for {name}")
+        # Extract name from h2 heading
+        name = self._extract_name(soup)
+        if not name:
+            self.logger.warning(f"Could not extract name from {url}")
+            return {}
 
-            # Apply unified standardization
-            result = self.process_animal(result)
+        # Check if dog is reserved (based on name or page content)
+        if self._is_reserved_dog(soup, name):
+            self.logger.debug(f"Skipping reserved dog: {name}")
+            return {}
 
-            return result
+        # Extract basic information
+        external_id = self._extract_external_id(url)
+
+        # Extract properties from the detail page
+        properties = self._extract_properties(soup)
+
+        # Extract description
+        description = self._extract_description(soup)
+
+        # Extract hero image
+        hero_image_url = self._extract_hero_image(soup)
+
+        # Session 4 compliance: Include description in properties for Spanish organizations
+        if description:
+            properties["description"] = description
+
+        # Build result dictionary with raw data (no normalization)
+        result = {
+            "name": name,
+            "external_id": external_id,
+            "adoption_url": url,
+            "primary_image_url": hero_image_url,
+            "original_image_url": hero_image_url,  # Same as primary for this site
+            "animal_type": "dog",
+            "status": "available",
+            "properties": properties,
+            "description": description,
+        }
+
+        # Add image_urls for R2 integration through BaseScraper template method
+        if hero_image_url:
+            result["image_urls"] = [hero_image_url]
+        else:
+            result["image_urls"] = []
 
-        except Exception as e:
-            self.logger.error(f"Error scraping detail page {url}: {e}")
-            return {}
+        # Extract individual fields from properties for compatibility with zero NULLs compliance
+        if properties:
+            if "breed" in properties:
+                result["breed"] = properties["breed"] or "Mixed Breed"
+            if "sex" in properties:
+                result["sex"] = properties["sex"] or "Unknown"
+            if "age_text" in properties:
+                result["age_text"] = properties["age_text"]
+
+        # Ensure zero NULLs compliance - set proper defaults for missing fields
+        if "breed" not in result:
+            result["breed"] = "Mixed Breed"
+        if "sex" not in result:
+            result["sex"] = "Unknown"
+        if "age_text" not in result:
+            result["age_text"] = None
+
+        # Use BaseScraper fallback for size (not available on this site)
+        result["size"] = "Medium"  # Default fallback as requested
+
+        self.logger.debug(f"Successfully extracted data for {name}")
+
+        # Apply unified standardization
+        result = self.process_animal(result)
+
+        return result
 
     def _extract_name(self, soup: BeautifulSoup) -> str | None:
         """Extract dog name from detail page.
@@ -831,6 +808,7 @@ class GalgosDelSolScraper(BaseScraper):
         try:
             # Fetch the listing page using persistent session
             response = self.session.get(url, timeout=30)
+            self.record_response(response)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, "html.parser")
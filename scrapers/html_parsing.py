@@ -0,0 +1,98 @@
+"""
+HTML parsing backends for scrapers.
+
+Scrapers used to build every tree with BeautifulSoup(markup, "html.parser"),
+a pure-Python tree builder that dominates extraction time on large listing
+pages. A scraper picks its backend with the html_parser class attribute and
+parses through BaseScraper.parse_html() / parse_fast():
+
+- HTML_PARSER: BeautifulSoup on html.parser, the default
+- LXML_PARSER: BeautifulSoup on lxml's C tree builder; same Tag API, several
+  times faster to build
+- SELECTOLAX_PARSER: lxml for parse_html(), and a selectolax (lexbor) tree
+  for parse_fast()
+
+parse_fast() is for hot extraction paths. Its tree answers the part of the
+Tag API those paths use - select(), select_one(), get(), get_text() - so the
+same extraction code runs on it and on a BeautifulSoup tree. Code that walks
+the tree (find_all with callables, parents, siblings) keeps parse_html().
+
+lxml and selectolax are project dependencies, so every backend is always
+available.
+"""
+
+from typing import Union
+
+from bs4 import BeautifulSoup, SoupStrainer, UnicodeDammit
+from selectolax.lexbor import LexborHTMLParser
+
+HTML_PARSER = "html.parser"
+LXML_PARSER = "lxml"
+SELECTOLAX_PARSER = "selectolax"
+
+PARSERS = (HTML_PARSER, LXML_PARSER, SELECTOLAX_PARSER)
+
+
+class FastNode:
+    """A selectolax node behind the subset of bs4.Tag that extraction code uses."""
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node):
+        self._node = node
+
+    @property
+    def name(self) -> str:
+        return self._node.tag
+
+    def select(self, selector: str) -> list["FastNode"]:
+        return [FastNode(node) for node in self._node.css(selector)]
+
+    def select_one(self, selector: str) -> Union["FastNode", None]:
+        node = self._node.css_first(selector)
+        return FastNode(node) if node is not None else None
+
+    def get(self, key: str, default=None):
+        value = self._node.attributes.get(key)
+        return default if value is None else value
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        return self._node.text(deep=True, separator=separator, strip=strip)
+
+
+HtmlTree = BeautifulSoup | FastNode
+
+
+def soup_builder(parser: str = HTML_PARSER) -> str:
+    """The BeautifulSoup tree builder for parser; SELECTOLAX_PARSER builds soups with lxml."""
+    if parser not in PARSERS:
+        raise ValueError(f"Unknown HTML parser: {parser!r} (expected one of {', '.join(PARSERS)})")
+    return HTML_PARSER if parser == HTML_PARSER else LXML_PARSER
+
+
+def parse_html(markup: str | bytes, parser: str = HTML_PARSER, only: SoupStrainer | None = None) -> BeautifulSoup:
+    """A BeautifulSoup tree of markup built with parser's tree builder.
+
+    Args:
+        markup: Page HTML; bytes are decoded as the page declares
+        parser: One of PARSERS
+        only: Keep just the elements this SoupStrainer matches, for pages
+            where extraction reads a small part of a large document
+
+    Returns:
+        BeautifulSoup tree
+    """
+    return BeautifulSoup(markup, soup_builder(parser), parse_only=only)
+
+
+def parse_fast(markup: str | bytes, parser: str = SELECTOLAX_PARSER) -> HtmlTree:
+    """A tree of markup for select()/get()/get_text() extraction, as fast as parser allows.
+
+    Returns a FastNode over selectolax when parser is SELECTOLAX_PARSER,
+    otherwise parse_html(markup, parser).
+    """
+    if parser != SELECTOLAX_PARSER:
+        return parse_html(markup, parser)
+    if isinstance(markup, bytes):
+        markup = UnicodeDammit(markup, is_html=True).unicode_markup
+    return FastNode(LexborHTMLParser(markup).root)
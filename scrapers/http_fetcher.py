@@ -0,0 +1,197 @@
+"""
+Async HTTP fetch engine shared by the HTTP-based scrapers.
+
+Detail-page crawls used to be hand-rolled in each scraper: some ran a
+ThreadPoolExecutor(max_workers=3) where every thread slept rate_limit_delay
+before a fresh requests.get, others fetched one page after another. Either
+way a new connection was opened per page and the site's response time was
+paid on top of the politeness delay.
+
+HttpFetchEngine fetches a batch of URLs over one httpx.AsyncClient, so
+connections to a host are kept alive and reused, and limits each host with
+a token bucket instead of sleeps:
+
+- up to max_concurrency requests are in flight per host
+- a host is sent at most max_concurrency requests per rate_limit_delay, the
+  same ceiling the old N threads each sleeping rate_limit_delay had, without
+  their response time added on top
+- timeouts, connection errors, 429 and 5xx responses are retried
+  max_retries times, backing off rate_limit_delay * retry_backoff_factor**n
+  (or the server's Retry-After, when it gives one in seconds)
+
+Given the scraper's RateController, every response is reported to it and
+each host's bucket is re-paced to the controller's current delay, so a host
+that slows down or starts throttling is sent fewer requests per second.
+
+Given a ResponseCache, requests are made conditional and pages the site
+reports (304) or hashes as unchanged come back with unchanged=True.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+import httpx
+
+from scrapers.rate_controller import RateController, retry_after_seconds
+from scrapers.response_cache import CacheEntry, ResponseCache, content_hash
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class FetchResult:
+    """Outcome of fetching one URL."""
+
+    url: str
+    status_code: int | None = None
+    text: str = ""
+    error: str | None = None
+    attempts: int = 1
+    unchanged: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status_code is not None and 200 <= self.status_code < 300
+
+
+class TokenBucket:
+    """
+    Per-host request limiter: `rate` requests per second, bursts of up to
+    `capacity`.
+
+    Each acquire reserves the next free slot and sleeps once until it
+    arrives, so waiting callers are served in order without polling.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1, clock: Callable[[], float] = time.monotonic):
+        self._capacity = max(1, capacity)
+        self._clock = clock
+        self._next_slot = clock()
+        self.set_rate(rate)
+
+    def set_rate(self, rate: float) -> None:
+        """Change the rate for slots not yet reserved."""
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._tolerance = self._interval * (self._capacity - 1)
+
+    async def acquire(self) -> None:
+        if not self._interval:
+            return
+        now = self._clock()
+        slot = max(self._next_slot, now)
+        wait = slot - self._tolerance - now
+        self._next_slot = slot + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class HttpFetchEngine:
+    """Fetch batches of pages with pooled connections, per-host rate limits and retries."""
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        rate_limit_delay: float,
+        max_retries: int,
+        retry_backoff_factor: float,
+        timeout: float,
+        headers: dict[str, str] | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        cache: ResponseCache | None = None,
+        rate_controller: RateController | None = None,
+    ):
+        self.logger = logger
+        self.rate_limit_delay = rate_limit_delay
+        self.max_retries = max_retries
+        self.retry_backoff_factor = retry_backoff_factor
+        self.timeout = timeout
+        self.headers = {"User-Agent": DEFAULT_USER_AGENT, **(headers or {})}
+        self.transport = transport
+        self.cache = cache
+        self.rate_controller = rate_controller
+
+    def fetch_all(self, urls: list[str], max_concurrency: int = 1) -> list[FetchResult]:
+        """Fetch every URL and return the results in the order given."""
+        if not urls:
+            return []
+        return asyncio.run(self.fetch_all_async(urls, max_concurrency))
+
+    async def fetch_all_async(self, urls: list[str], max_concurrency: int = 1) -> list[FetchResult]:
+        max_concurrency = max(1, max_concurrency)
+        hosts = {urlparse(url).netloc: url for url in urls}
+        buckets = {host: TokenBucket(self._rate(url, max_concurrency), capacity=max_concurrency) for host, url in hosts.items()}
+        slots = {host: asyncio.Semaphore(max_concurrency) for host in hosts}
+
+        limits = httpx.Limits(max_connections=max_concurrency * len(hosts), max_keepalive_connections=max_concurrency * len(hosts))
+        started = time.perf_counter()
+        async with httpx.AsyncClient(headers=self.headers, timeout=self.timeout, limits=limits, follow_redirects=True, transport=self.transport) as client:
+
+            async def fetch(url: str) -> FetchResult:
+                host = urlparse(url).netloc
+                async with slots[host]:
+                    return await self._fetch_with_retry(client, buckets[host], url, max_concurrency)
+
+            results = await asyncio.gather(*(fetch(url) for url in urls))
+
+        failed = sum(1 for result in results if not result.ok and not result.unchanged)
+        unchanged = sum(1 for result in results if result.unchanged)
+        retried = sum(result.attempts - 1 for result in results)
+        self.logger.info(f"Fetched {len(results) - failed}/{len(results)} pages in {time.perf_counter() - started:.1f}s ({unchanged} unchanged, {retried} retries, {failed} failed)")
+        return list(results)
+
+    def _rate(self, url: str, max_concurrency: int) -> float:
+        """Requests per second for url's host: max_concurrency per current delay."""
+        delay = self.rate_controller.delay_for(url) if self.rate_controller else self.rate_limit_delay
+        return max_concurrency / delay if delay > 0 else 0.0
+
+    def _observe(self, bucket: TokenBucket, url: str, max_concurrency: int, response: httpx.Response | None, started: float) -> None:
+        if not self.rate_controller:
+            return
+        if response is None:
+            self.rate_controller.observe_failure(url)
+        else:
+            self.rate_controller.observe(url, time.perf_counter() - started, response.status_code, retry_after_seconds(response))
+        bucket.set_rate(self._rate(url, max_concurrency))
+
+    async def _fetch_with_retry(self, client: httpx.AsyncClient, bucket: TokenBucket, url: str, max_concurrency: int = 1) -> FetchResult:
+        cached = self.cache.get(url) if self.cache else None
+        headers = cached.conditional_headers() if cached else None
+        attempts = self.max_retries + 1
+        for attempt in range(attempts):
+            await bucket.acquire()
+            retry_after = None
+            started = time.perf_counter()
+            try:
+                response = await client.get(url, headers=headers)
+            except httpx.HTTPError as e:
+                self._observe(bucket, url, max_concurrency, None, started)
+                result = FetchResult(url, error=f"{type(e).__name__}: {e}", attempts=attempt + 1)
+            else:
+                self._observe(bucket, url, max_concurrency, response, started)
+                if response.status_code == 304 and cached:
+                    self.cache.stage(url, cached)
+                    return FetchResult(url, 304, attempts=attempt + 1, unchanged=True)
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    error = None if response.is_success else f"HTTP {response.status_code}"
+                    unchanged = False
+                    if self.cache and response.is_success:
+                        entry = CacheEntry(content_hash(response.text), response.headers.get("ETag"), response.headers.get("Last-Modified"))
+                        unchanged = cached is not None and cached.content_hash == entry.content_hash
+                        self.cache.stage(url, entry)
+                    return FetchResult(url, response.status_code, response.text, error, attempt + 1, unchanged)
+                result = FetchResult(url, response.status_code, error=f"HTTP {response.status_code}", attempts=attempt + 1)
+                retry_after = retry_after_seconds(response)
+
+            if attempt < attempts - 1:
+                delay = retry_after if retry_after is not None else self.rate_limit_delay * (self.retry_backoff_factor**attempt)
+                self.logger.warning(f"Fetch of {url} failed ({result.error}), attempt {attempt + 1}/{attempts}; retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+        self.logger.error(f"Giving up on {url} after {attempts} attempts: {result.error}")
+        return result
@@ -0,0 +1,48 @@
+"""
+Listing-level change detection for scrapers.
+
+Most organizations change a handful of dogs between runs, yet every run
+visited every detail page. A scraper's listing already shows which dogs
+are up, what they're called, their photo and whether they're reserved;
+listing_fingerprint() hashes exactly that card set. When it matches the
+fingerprint stored by the last successful full crawl, BaseScraper's
+_listing_unchanged() records every card as seen and the scraper returns
+no animals: no detail pages, image processing or upserts, just a bulk
+last_seen_at refresh and a normal scrape log.
+
+Edits that only show on detail pages (a new description) are picked up by
+the next full crawl, which runs once the stored fingerprint is older than
+FULL_CRAWL_MAX_AGE, when the listing changes, or with FORCE_RESCRAPE.
+
+card_hash() is the same comparison for a single card. FilteringService
+stores it on each animal to decide which detail pages a partly changed
+listing still needs.
+"""
+
+import hashlib
+import json
+from collections.abc import Iterable
+from datetime import timedelta
+from typing import Any
+
+FULL_CRAWL_MAX_AGE = timedelta(days=7)
+"""Longest a listing fingerprint may stand in for a full crawl."""
+
+IMAGE_KEYS = ("primary_image_url", "image_url", "thumbnail_url")
+
+
+def card_key(card: dict[str, Any]) -> tuple[str, str, str, str]:
+    """The listing-visible fields of one card: external id, name, image and status."""
+    image = next((card[key] for key in IMAGE_KEYS if card.get(key)), "")
+    return (str(card.get("external_id") or ""), str(card.get("name") or ""), str(image), str(card.get("status") or ""))
+
+
+def card_hash(card: dict[str, Any]) -> str:
+    """sha256 of one card's listing-visible fields, stored as animals.listing_hash."""
+    return hashlib.sha256(json.dumps(card_key(card), separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+def listing_fingerprint(cards: Iterable[dict[str, Any]]) -> str:
+    """sha256 of the card set, independent of the order the cards were listed in."""
+    keys = sorted(card_key(card) for card in cards)
+    return hashlib.sha256(json.dumps(keys, separators=(",", ":")).encode("utf-8")).hexdigest()
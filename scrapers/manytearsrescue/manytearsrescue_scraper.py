@@ -1,6 +1,5 @@
 """Scraper implementation for Many Tears Rescue organization."""
 
-import asyncio
 import os
 import random
 import re
@@ -10,6 +9,7 @@ from typing import Any
 from bs4 import BeautifulSoup, Tag
 
 from scrapers.base_scraper import BaseScraper
+from scrapers.html_parsing import LXML_PARSER
 
 USE_PLAYWRIGHT = os.environ.get("USE_PLAYWRIGHT", "false").lower() == "true"
 
@@ -36,6 +36,9 @@ class ManyTearsRescueScraper(BaseScraper):
     from listing pages with pagination support.
     """
 
+    # Listing and detail extraction walks the full tree, so lxml rather than selectolax
+    html_parser = LXML_PARSER
+
     # User agents for rotation
     USER_AGENTS = [
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -89,6 +92,9 @@ class ManyTearsRescueScraper(BaseScraper):
             self.logger.warning("No animals found to process")
             return []
 
+        if self._listing_unchanged(animals):
+            return []
+
         # Use filtering_service method that records external_ids BEFORE filtering
         # This is critical for mark_skipped_animals_as_seen() to work correctly
         result = self.filtering_service.filter_existing_animals(animals)
@@ -105,7 +111,7 @@ class ManyTearsRescueScraper(BaseScraper):
             List of processed animals with detailed data
         """
         if USE_PLAYWRIGHT:
-            return asyncio.run(self._process_animals_parallel_playwright(animals))
+            return get_playwright_service().run(self._process_animals_parallel_playwright(animals))
         return self._process_animals_parallel_selenium(animals)
 
     async def _process_animals_parallel_playwright(self, animals: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -126,7 +132,7 @@ class ManyTearsRescueScraper(BaseScraper):
             seen_urls.add(adoption_url)
 
             # Respectful delay between requests
-            await asyncio.sleep(random.uniform(self.rate_limit_delay + 1, self.rate_limit_delay + 3))
+            await self.rate_controller.pause_async(adoption_url, jitter=(1, 3))
 
             detail_data = await self._scrape_animal_details_playwright(adoption_url)
 
@@ -173,7 +179,7 @@ class ManyTearsRescueScraper(BaseScraper):
                         seen_urls.add(adoption_url)
 
                     # Random delay for respectful scraping
-                    time.sleep(random.uniform(self.rate_limit_delay + 1, self.rate_limit_delay + 3))
+                    self.respect_rate_limit(adoption_url, jitter=(1, 3), concurrency=max_workers)
 
                     # Use thread-local WebDriver (no locking needed)
                     detail_data = self._scrape_animal_details_selenium(adoption_url, driver=local_driver)
@@ -261,7 +267,7 @@ class ManyTearsRescueScraper(BaseScraper):
             List of dictionaries containing basic dog information from all pages
         """
         if USE_PLAYWRIGHT:
-            return asyncio.run(self._get_animal_list_playwright())
+            return get_playwright_service().run(self._get_animal_list_playwright())
         return self._get_animal_list_selenium()
 
     def _get_animal_list_selenium(self) -> list[dict[str, Any]]:
@@ -304,7 +310,8 @@ class ManyTearsRescueScraper(BaseScraper):
                         except TimeoutException:
                             self.logger.warning(f"Timeout on page {page_num}, retry {retry + 1}/3")
                             if retry < 2:
-                                time.sleep(2 ** (retry + 1))  # Exponential backoff
+                                self.record_failure(url)
+                                self.respect_rate_limit(url)
                             continue
 
                     if not page_loaded:
@@ -319,7 +326,7 @@ class ManyTearsRescueScraper(BaseScraper):
                     driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
 
                     # Parse the page content
-                    soup = BeautifulSoup(driver.page_source, "html.parser")
+                    soup = self.parse_html(driver.page_source)
 
                     # Detect max pages from pagination links on first page
                     if max_pages is None:
@@ -350,9 +357,7 @@ class ManyTearsRescueScraper(BaseScraper):
 
                     # Rate limiting between page requests with random delay
                     if page_num <= max_pages:
-                        delay = random.uniform(self.rate_limit_delay + 2, self.rate_limit_delay + 5)
-                        self.logger.debug(f"Waiting {delay:.1f}s before next page...")
-                        time.sleep(delay)
+                        self.respect_rate_limit(self.listing_url, jitter=(2, 5))
 
                 except Exception as e:
                     self.logger.error(f"Error processing page {page_num}: {e}")
@@ -409,7 +414,7 @@ class ManyTearsRescueScraper(BaseScraper):
                         page_num += 1
                         continue
 
-                    soup = BeautifulSoup(result.content, "html.parser")
+                    soup = self.parse_html(result.content)
 
                     # Detect max pages on first page
                     if max_pages is None:
@@ -436,8 +441,7 @@ class ManyTearsRescueScraper(BaseScraper):
                     page_num += 1
 
                     # Rate limiting
-                    delay = random.uniform(self.rate_limit_delay + 2, self.rate_limit_delay + 5)
-                    await asyncio.sleep(delay)
+                    await self.rate_controller.pause_async(self.listing_url, jitter=(2, 5))
 
                 except Exception as e:
                     self.logger.error(f"Error processing page {page_num}: {e}")
@@ -676,7 +680,7 @@ class ManyTearsRescueScraper(BaseScraper):
             Dictionary with detailed dog information following BaseScraper format
         """
         if USE_PLAYWRIGHT:
-            return asyncio.run(self._scrape_animal_details_playwright(adoption_url))
+            return get_playwright_service().run(self._scrape_animal_details_playwright(adoption_url))
         return self._scrape_animal_details_selenium(adoption_url, driver)
 
     def _scrape_animal_details_selenium(self, adoption_url: str, driver=None) -> dict[str, Any]:
@@ -698,7 +702,7 @@ class ManyTearsRescueScraper(BaseScraper):
                 time.sleep(2)
 
             # Parse HTML with BeautifulSoup
-            soup = BeautifulSoup(driver.page_source, "html.parser")
+            soup = self.parse_html(driver.page_source)
 
             # Extract core fields
             name = self._extract_name(soup)
@@ -792,7 +796,7 @@ class ManyTearsRescueScraper(BaseScraper):
                 self.logger.error(f"Failed to get page content from {adoption_url}: {result.error}")
                 return {}
 
-            soup = BeautifulSoup(result.content, "html.parser")
+            soup = self.parse_html(result.content)
 
             # Extract core fields
             name = self._extract_name(soup)
@@ -1279,7 +1283,7 @@ class ManyTearsRescueScraper(BaseScraper):
             self.logger.warning(f"Error during WebDriver diary extraction: {e}")
             # Fallback to basic extraction without clicking - re-parse with BeautifulSoup
             if driver:
-                soup_fallback = BeautifulSoup(driver.page_source, "html.parser")
+                soup_fallback = self.parse_html(driver.page_source)
                 diary_heading_fallback = None
                 for h2 in soup_fallback.find_all("h2"):
                     if "diary" in h2.get_text(strip=True).lower():
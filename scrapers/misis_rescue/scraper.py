@@ -8,6 +8,7 @@ Reserved section detection, and data collection.
 import asyncio
 import os
 import time
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urljoin, urlparse
 
@@ -15,6 +16,7 @@ import requests
 from bs4 import BeautifulSoup, Tag
 
 from scrapers.base_scraper import BaseScraper
+from scrapers.html_parsing import LXML_PARSER
 
 from .detail_parser import MisisRescueDetailParser
 
@@ -26,6 +28,7 @@ if TYPE_CHECKING:
 if USE_PLAYWRIGHT:
     from services.playwright_browser_service import (
         PlaywrightOptions,
+        get_playwright_service,
     )
 else:
     from selenium.common.exceptions import NoSuchElementException, TimeoutException
@@ -45,6 +48,9 @@ class MisisRescueScraper(BaseScraper):
     metrics logging, and image uploading functionality.
     """
 
+    # The reserved-section check walks the full tree, so lxml rather than selectolax
+    html_parser = LXML_PARSER
+
     def __init__(self, config_id: str = "misisrescue", organization_id=None):
         """Initialize with configuration."""
         if organization_id is not None:
@@ -75,19 +81,20 @@ class MisisRescueScraper(BaseScraper):
         except Exception:
             return False
 
-    def collect_data(self) -> list[dict[str, Any]]:
-        """Main entry point - collect all dog data.
+    def collect_data(self) -> Iterator[dict[str, Any]]:
+        """Main entry point - yield each dog's data as its detail page is scraped.
 
         CRITICAL: Must skip Reserved section shown in screenshots!
 
         This method is called by BaseScraper which handles:
-        - Database operations
+        - Database operations, batch by batch while the remaining detail
+          pages are still being fetched (see scrapers/animal_stream.py)
         - Error handling
         - Metrics logging
         - Image uploading
 
-        Returns:
-            List of dog data dictionaries for BaseScraper processing
+        Yields:
+            Dog data dictionaries for BaseScraper processing
         """
         # Get all dog URLs from all pages (handles pagination).
         # Exceptions propagate to BaseScraper so real failures surface in
@@ -98,18 +105,12 @@ class MisisRescueScraper(BaseScraper):
 
         animals = [{"adoption_url": url, "external_id": self._generate_external_id(url)} for url in all_urls]
 
-        if self.skip_existing_animals:
-            filtered_animals = self.filtering_service.filter_existing_animals(animals)
-            self._sync_filtering_stats()
-            urls_to_process = [a["adoption_url"] for a in filtered_animals]
-        else:
-            self.total_animals_before_filter = len(all_urls)
-            self.total_animals_skipped = 0
-            urls_to_process = all_urls
+        # Also drops dogs an interrupted run already saved, with or without skip_existing_animals
+        filtered_animals = self.filtering_service.filter_existing_animals(animals)
+        self._sync_filtering_stats()
+        urls_to_process = [a["adoption_url"] for a in filtered_animals]
 
-        if urls_to_process:
-            return self._process_dogs_in_batches(urls_to_process)
-        return []
+        yield from self._process_dogs_in_batches(urls_to_process)
 
     def _get_all_dogs_from_listing(self) -> list[dict[str, str]]:
         """Get all dog data from listing page.
@@ -121,7 +122,7 @@ class MisisRescueScraper(BaseScraper):
             List of dog dictionaries with url, name, and image_url
         """
         if USE_PLAYWRIGHT:
-            return asyncio.run(self._get_all_dogs_from_listing_playwright())
+            return get_playwright_service().run(self._get_all_dogs_from_listing_playwright())
         return self._get_all_dogs_from_listing_selenium()
 
     def _get_all_dogs_from_listing_selenium(self) -> list[dict[str, str]]:
@@ -145,7 +146,7 @@ class MisisRescueScraper(BaseScraper):
             self._scroll_to_load_all_content(driver)
 
             # Extract dogs from page 1
-            soup = BeautifulSoup(driver.page_source, "html.parser")
+            soup = self.parse_html(driver.page_source)
             page_dogs = self._extract_dogs_before_reserved(soup)
             self._assign_images_to_dogs(page_dogs, soup)
 
@@ -168,7 +169,7 @@ class MisisRescueScraper(BaseScraper):
                     self._scroll_to_load_all_content(driver)
 
                     # Extract dogs from this page
-                    soup = BeautifulSoup(driver.page_source, "html.parser")
+                    soup = self.parse_html(driver.page_source)
                     page_dogs = self._extract_dogs_before_reserved(soup)
                     self._assign_images_to_dogs(page_dogs, soup)
 
@@ -207,6 +208,7 @@ class MisisRescueScraper(BaseScraper):
             headless=True,
             viewport_width=1920,
             viewport_height=1080,
+            render_profile="light",
         )
 
         # Use retry wrapper for resilient browser connection. Browser-level
@@ -221,12 +223,12 @@ class MisisRescueScraper(BaseScraper):
             if not await self.browser_manager.navigate_with_retry(page, self.listing_url):
                 raise RuntimeError(f"Navigation to {self.listing_url} failed after retries")
 
-            await asyncio.sleep(5)  # Give Wix time to load dynamic content
+            await self._settle(page, 5, selector='a[href*="/post/"]')  # Give Wix time to load dynamic content
 
             await self._scroll_to_load_all_content_playwright(page)
 
             content = await page.content()
-            soup = BeautifulSoup(content, "html.parser")
+            soup = self.parse_html(content)
             page_dogs = self._extract_dogs_before_reserved(soup)
             self._assign_images_to_dogs(page_dogs, soup)
             all_dogs.extend(page_dogs)
@@ -240,11 +242,11 @@ class MisisRescueScraper(BaseScraper):
                     if not await self._click_pagination_button_playwright(page, page_num):
                         break
 
-                    await asyncio.sleep(5)
+                    await self._settle(page, 5)
                     await self._scroll_to_load_all_content_playwright(page)
 
                     content = await page.content()
-                    soup = BeautifulSoup(content, "html.parser")
+                    soup = self.parse_html(content)
                     page_dogs = self._extract_dogs_before_reserved(soup)
                     self._assign_images_to_dogs(page_dogs, soup)
 
@@ -258,6 +260,8 @@ class MisisRescueScraper(BaseScraper):
                     self.logger.error(f"Error processing page {page_num}", exc_info=True)
                     break
 
+            self._record_render_stats(browser_result)
+
         unique_dogs = []
         seen_urls = set()
         for dog in all_dogs:
@@ -277,7 +281,7 @@ class MisisRescueScraper(BaseScraper):
 
         while scroll_attempts < max_scrolls:
             await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(2)
+            await self._settle(page, 2)
 
             current_dogs = await page.locator('a[href*="/post/"]').count()
 
@@ -386,7 +390,7 @@ class MisisRescueScraper(BaseScraper):
             time.sleep(5)
 
             # Parse page with BeautifulSoup
-            soup = BeautifulSoup(driver.page_source, "html.parser")
+            soup = self.parse_html(driver.page_source)
 
             # Extract dogs with images from available section
             available_dogs = self._extract_dogs_before_reserved(soup)
@@ -432,7 +436,7 @@ class MisisRescueScraper(BaseScraper):
             WebDriverWait(driver, self.timeout).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
 
             # Parse page with BeautifulSoup
-            soup = BeautifulSoup(driver.page_source, "html.parser")
+            soup = self.parse_html(driver.page_source)
 
             # Extract dogs only from available section (before Reserved)
             available_dogs = self._extract_dogs_before_reserved(soup)
@@ -665,7 +669,7 @@ class MisisRescueScraper(BaseScraper):
             Dog data dictionary or None if error
         """
         if USE_PLAYWRIGHT:
-            return asyncio.run(self._scrape_dog_detail_playwright(url))
+            return get_playwright_service().run(self._scrape_dog_detail_playwright(url))
         return self._scrape_dog_detail_selenium(url)
 
     def _scrape_dog_detail_selenium(self, url: str) -> dict[str, Any] | None:
@@ -737,7 +741,7 @@ class MisisRescueScraper(BaseScraper):
                         return None
 
             # Parse with BeautifulSoup and detail parser
-            soup = BeautifulSoup(driver.page_source, "html.parser")
+            soup = self.parse_html(driver.page_source)
 
             # Double-check the parsed content for error indicators
             h1_text = soup.find("h1").get_text(strip=True).lower() if soup.find("h1") else ""
@@ -817,7 +821,7 @@ class MisisRescueScraper(BaseScraper):
                     return None
 
             # Parse with BeautifulSoup
-            soup = BeautifulSoup(content, "html.parser")
+            soup = self.parse_html(content)
 
             # Check h1 for errors
             h1_text = soup.find("h1").get_text(strip=True).lower() if soup.find("h1") else ""
@@ -909,6 +913,7 @@ class MisisRescueScraper(BaseScraper):
 
             self.logger.debug(f"Fast-loading detail page: {url}")
             response = requests.get(url, headers=headers, timeout=10)
+            self.record_response(response)
 
             # Check for HTTP errors
             if response.status_code != 200:
@@ -933,7 +938,7 @@ class MisisRescueScraper(BaseScraper):
                     return None
 
             # Parse with BeautifulSoup
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = self.parse_html(response.text)
 
             # Check h1 for error indicators
             h1_text = soup.find("h1").get_text(strip=True).lower() if soup.find("h1") else ""
@@ -1609,36 +1614,28 @@ class MisisRescueScraper(BaseScraper):
         self.logger.warning("No hero image found on detail page")
         return None
 
-    def _process_dogs_in_batches(self, urls: list[str]) -> list[dict[str, Any]]:
+    def _process_dogs_in_batches(self, urls: list[str]) -> Iterator[dict[str, Any]]:
         """Process dog URLs in batches using concurrent processing (MisisRescue-specific).
 
         Args:
             urls: List of URLs to process
 
-        Returns:
-            List of valid dog data dictionaries
+        Yields:
+            Valid dog data dictionaries, a batch at a time
         """
-        if not urls:
-            return []
-
         # Split URLs into batches
         batches = [urls[i : i + self.batch_size] for i in range(0, len(urls), self.batch_size)]
-        all_results = []
 
         # World-class logging: Batch processing handled by centralized system
 
         for batch_num, batch_urls in enumerate(batches, 1):
             # World-class logging: Batch progress handled by centralized system
 
-            batch_results = self._process_single_batch(batch_urls)
-            all_results.extend(batch_results)
+            yield from self._process_single_batch(batch_urls)
 
             # Rate limiting between batches
             if batch_num < len(batches):
-                time.sleep(self.rate_limit_delay)
-
-        # World-class logging: Batch completion handled by centralized system
-        return all_results
+                self.respect_rate_limit(batch_urls[0])
 
     def _process_single_batch(self, urls: list[str]) -> list[dict[str, Any]]:
         """Process a single batch of URLs concurrently.
@@ -0,0 +1,119 @@
+"""
+Process-pool stage for parsing fetched pages.
+
+BaseScraper.fetch_pages() parses each page on the thread that collects
+the HTTP engine's results, so BeautifulSoup tree building and a scraper's
+regex normalizers all run under one GIL: a scrape uses one core however
+many the instance has. A scraper that sets parse_in_processes = True has
+its parse callback run in a pool of worker processes instead. Pages go out
+as (url, html) while the rest are still being fetched, and come back as
+the plain dicts the callback returns, in listing order.
+
+The callback is pickled once per worker rather than once per page. For a
+bound method that pickles the scraper, less the services
+BaseScraper.__getstate__ leaves behind (database, R2, caches, browser), so
+a parser may use the scraper's own helpers and settings but not those.
+
+The pool runs when parse_workers() is above one and a batch has at least
+MIN_POOL_PAGES pages. The scheduler runs up to SCRAPER_MAX_CONCURRENCY
+scrapes at once in one process, each of which may open a pool, so by
+default each pool gets an equal share of the cores rather than all of them.
+Otherwise, or when the callback can't be pickled, pages are parsed in
+process exactly as before.
+"""
+
+import logging
+import multiprocessing
+import os
+import pickle
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any
+
+from utils.scrape_scheduler import SchedulerLimits
+
+logger = logging.getLogger(__name__)
+
+MIN_POOL_PAGES = 20
+"""Smallest batch worth starting worker processes for."""
+
+# The worker's parse callback, installed once by _install()
+_parse: Callable[[str, str], Any] | None = None
+
+
+def parse_workers(env: Mapping[str, str] = os.environ) -> int:
+    """Worker processes for a parse pool (0 or 1 disables it).
+
+    SCRAPER_PARSE_WORKERS if set, else the core count divided among the
+    SCRAPER_MAX_CONCURRENCY scrapes that may be parsing at the same time.
+    """
+    value = env.get("SCRAPER_PARSE_WORKERS")
+    if value:
+        try:
+            return max(int(value), 0)
+        except ValueError:
+            logger.warning(f"Ignoring SCRAPER_PARSE_WORKERS={value!r}: not an integer")
+    return max(1, (os.cpu_count() or 1) // _concurrent_scrapes(env))
+
+
+def _concurrent_scrapes(env: Mapping[str, str]) -> int:
+    try:
+        return max(1, int(env.get("SCRAPER_MAX_CONCURRENCY", SchedulerLimits.max_concurrency)))
+    except ValueError:
+        return SchedulerLimits.max_concurrency
+
+
+def _context() -> multiprocessing.context.BaseContext:
+    # Not fork: the scraper process has HTTP and browser threads running
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+def _install(payload: bytes) -> None:
+    global _parse
+    _parse = pickle.loads(payload)
+
+
+def _run(url: str, html: str) -> tuple[bool, Any]:
+    try:
+        return True, _parse(url, html)
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+
+class ParsePool:
+    """Worker processes running one parse callback.
+
+    submit() returns a Future of (ok, result): the callback's return value,
+    or the error it raised as text, since exceptions from a scraper's
+    parser need not pickle.
+    """
+
+    def __init__(self, parse: Callable[[str, str], Any], workers: int):
+        payload = pickle.dumps(parse)
+        self.workers = workers
+        self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=_context(), initializer=_install, initargs=(payload,))
+
+    def submit(self, url: str, html: str) -> Future:
+        return self._executor.submit(_run, url, html)
+
+    def close(self) -> None:
+        self._executor.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> "ParsePool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def open_parse_pool(parse: Callable[[str, str], Any], pages: int) -> ParsePool | None:
+    """A ParsePool for a batch of pages, or None when it should be parsed in process."""
+    workers = min(parse_workers(), pages)
+    if workers < 2 or pages < MIN_POOL_PAGES:
+        return None
+    try:
+        return ParsePool(parse, workers)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        logger.warning(f"Parsing in process: the parse callback can't be sent to worker processes ({e})")
+        return None
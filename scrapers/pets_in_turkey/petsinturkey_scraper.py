@@ -1,7 +1,6 @@
 """Modernized scraper implementation for Pets in Turkey organization."""
 
 import re
-import time
 from typing import Any
 from urllib.parse import urljoin
 
@@ -66,6 +65,7 @@ class PetsInTurkeyScraper(BaseScraper):
 
             self.logger.info(f"Fetching dogs from {self.listing_url}")
             response = requests.get(self.listing_url, headers=headers, timeout=30)
+            self.record_response(response)
             response.raise_for_status()
 
             # Parse with BeautifulSoup
@@ -104,10 +104,6 @@ class PetsInTurkeyScraper(BaseScraper):
             # Process each dog section
             for idx, section in enumerate(dog_sections):
                 try:
-                    # Apply rate limiting
-                    if idx > 0:
-                        time.sleep(self.rate_limit_delay)
-
                     dog_data = self._extract_dog_data(section)
                     if dog_data and dog_data.get("name"):
                         # Apply standardization
@@ -0,0 +1,164 @@
+"""
+Adaptive per-host politeness delay for scrapers.
+
+Scrapers used to pause between requests with time.sleep(rate_limit_delay),
+waiting the same amount whether the site answered in 50ms or was shedding
+load. RateController keeps one delay per host and moves it with what the
+host does, within [min_delay, max_delay]:
+
+- each response's latency feeds a smoothed average; the delay follows
+  LATENCY_MULTIPLE times that average, rising at once when the site slows
+  down and easing back gradually when it is quick again
+- 429 and 503 multiply the delay by THROTTLE_BACKOFF, connection errors and
+  other 5xx by ERROR_BACKOFF; either way the host is left alone for a full
+  delay, or for the Retry-After the server asked for if that is longer
+
+Requests to a host are given slots one delay apart (delay / concurrency for
+callers running that many workers against it), so threads sharing a host
+queue up instead of firing together, and time spent waiting on a response
+counts towards the gap. The first request to a host waits the full delay,
+as the fixed sleep did.
+
+Scrapers call pause(url) before a request and observe_response(response)
+(or observe_failure(url)) after it; BaseScraper.respect_rate_limit() wraps
+pause() for the scraper's own controller.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+LATENCY_MULTIPLE = 2.0
+"""Delay kept per unit of observed response time (a 0.8s page earns 1.6s)."""
+
+LATENCY_SMOOTHING = 0.3
+"""Weight of the newest latency in the running average."""
+
+RECOVERY_RATE = 0.2
+"""Fraction of the gap to a lower target closed per healthy response."""
+
+THROTTLE_BACKOFF = 2.0
+ERROR_BACKOFF = 1.5
+
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+DEFAULT_MIN_DELAY_FRACTION = 0.25
+"""Default floor as a fraction of the configured rate_limit_delay."""
+
+DEFAULT_MAX_DELAY = 30.0
+
+
+@dataclass
+class HostState:
+    """What the controller knows about one host."""
+
+    delay: float
+    latency: float | None = None
+    next_slot: float | None = None
+
+
+class RateController:
+    """Per-host request spacing that adapts to latency, throttling and errors."""
+
+    def __init__(
+        self,
+        delay: float,
+        min_delay: float | None = None,
+        max_delay: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.initial_delay = max(0.0, delay)
+        self.min_delay = self.initial_delay * DEFAULT_MIN_DELAY_FRACTION if min_delay is None else max(0.0, min_delay)
+        self.max_delay = max(self.initial_delay, DEFAULT_MAX_DELAY if max_delay is None else max_delay)
+        self._clock = clock
+        self._hosts: dict[str, HostState] = {}
+        self._lock = threading.Lock()
+
+    def delay_for(self, url: str | None = None) -> float:
+        """Current delay for url's host."""
+        with self._lock:
+            return self._state(url).delay
+
+    def pause(self, url: str | None = None, jitter: tuple[float, float] | None = None, concurrency: int = 1) -> float:
+        """Sleep until url's host may be sent the next request; returns the seconds slept.
+
+        jitter adds a random extra wait in that range, for sites that need a
+        less regular request pattern. concurrency is the number of workers
+        sharing the host, which may together send that many requests per delay.
+        """
+        wait = self._reserve(url, jitter, concurrency)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def pause_async(self, url: str | None = None, jitter: tuple[float, float] | None = None, concurrency: int = 1) -> float:
+        """pause() for coroutines."""
+        wait = self._reserve(url, jitter, concurrency)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def observe(self, url: str | None, latency: float | None = None, status_code: int | None = None, retry_after: float | None = None) -> None:
+        """Adjust url's host from one response (or failure, with status_code=None and no latency)."""
+        with self._lock:
+            state = self._state(url)
+            now = self._clock()
+            if status_code in THROTTLE_STATUS_CODES:
+                state.delay = self._bounded(max(state.delay * THROTTLE_BACKOFF, retry_after or 0.0))
+            elif latency is None or (status_code is not None and status_code >= 500):
+                state.delay = self._bounded(state.delay * ERROR_BACKOFF)
+            else:
+                state.latency = latency if state.latency is None else LATENCY_SMOOTHING * latency + (1 - LATENCY_SMOOTHING) * state.latency
+                target = self._bounded(LATENCY_MULTIPLE * state.latency)
+                state.delay = target if target > state.delay else state.delay + (target - state.delay) * RECOVERY_RATE
+                return
+
+            earliest = now + max(state.delay, retry_after or 0.0)
+            state.next_slot = earliest if state.next_slot is None else max(state.next_slot, earliest)
+
+    def observe_response(self, response) -> None:
+        """observe() a requests response: its URL, elapsed time, status and Retry-After."""
+        elapsed = getattr(response, "elapsed", None)
+        latency = elapsed.total_seconds() if hasattr(elapsed, "total_seconds") else None
+        status_code = getattr(response, "status_code", None)
+        if not isinstance(latency, (int, float)) or not isinstance(status_code, int):
+            return
+        self.observe(str(response.url), latency, status_code, retry_after_seconds(response))
+
+    def observe_failure(self, url: str | None) -> None:
+        """observe() a request that got no response (timeout, connection error)."""
+        self.observe(url)
+
+    def _reserve(self, url: str | None, jitter: tuple[float, float] | None, concurrency: int) -> float:
+        with self._lock:
+            state = self._state(url)
+            now = self._clock()
+            spacing = state.delay / max(1, concurrency)
+            slot = max(now, state.next_slot) if state.next_slot is not None else now + spacing
+            if jitter:
+                slot = max(now, slot + random.uniform(*jitter))
+            state.next_slot = slot + spacing
+            return slot - now
+
+    def _state(self, url: str | None) -> HostState:
+        host = urlparse(url).netloc if url else ""
+        if host not in self._hosts:
+            self._hosts[host] = HostState(delay=self.initial_delay)
+        return self._hosts[host]
+
+    def _bounded(self, delay: float) -> float:
+        return min(self.max_delay, max(self.min_delay, delay))
+
+
+def retry_after_seconds(response) -> float | None:
+    """A response's Retry-After header in seconds, when it gives one as a number."""
+    headers = getattr(response, "headers", None)
+    value = headers.get("Retry-After") if hasattr(headers, "get") else None
+    try:
+        return max(0.0, float(value)) if isinstance(value, (str, int, float)) and value != "" else None
+    except ValueError:
+        return None
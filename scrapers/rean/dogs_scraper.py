@@ -3,6 +3,7 @@ import hashlib
 import os
 import re
 import time
+from collections.abc import Iterator
 from typing import Any
 
 import requests
@@ -275,7 +276,7 @@ class REANScraper(BaseScraper):
             List of actual image URLs from REAN's CDN (wsimg.com)
         """
         if USE_PLAYWRIGHT:
-            return asyncio.run(self._extract_images_with_browser_playwright(url))
+            return get_playwright_service().run(self._extract_images_with_browser_playwright(url))
         return self._extract_images_with_browser_selenium(url)
 
     def _extract_images_with_browser_selenium(self, url: str) -> list[str]:
@@ -355,6 +356,7 @@ class REANScraper(BaseScraper):
                 headless=True,
                 viewport_width=1920,
                 viewport_height=1080,
+                render_profile="light",
             )
 
             async with playwright_service.get_browser(options) as browser_result:
@@ -362,13 +364,14 @@ class REANScraper(BaseScraper):
 
                 await page.goto(url, wait_until="domcontentloaded", timeout=60000)
 
-                await asyncio.sleep(2)
+                await self._settle(page, 2)
 
                 await self._trigger_lazy_loading_playwright(page)
 
-                await asyncio.sleep(2)
+                await self._settle(page, 2)
 
                 content = await page.content()
+                self._record_render_stats(browser_result)
 
             soup = BeautifulSoup(content, "html.parser")
 
@@ -639,7 +642,7 @@ class REANScraper(BaseScraper):
             List of dog data dictionaries with correctly associated images
         """
         if USE_PLAYWRIGHT:
-            return asyncio.run(self._extract_dogs_with_images_unified_playwright(url, page_type))
+            return get_playwright_service().run(self._extract_dogs_with_images_unified_playwright(url, page_type))
         return self._extract_dogs_with_images_unified_selenium(url, page_type)
 
     def _extract_dogs_with_images_unified_selenium(self, url: str, page_type: str) -> list[dict[str, Any]]:
@@ -692,6 +695,7 @@ class REANScraper(BaseScraper):
                 headless=True,
                 viewport_width=1920,
                 viewport_height=1080,
+                render_profile="light",
             )
 
             async with playwright_service.get_browser(options) as browser_result:
@@ -699,13 +703,14 @@ class REANScraper(BaseScraper):
 
                 await page.goto(url, wait_until="domcontentloaded", timeout=60000)
 
-                await asyncio.sleep(2)
+                await self._settle(page, 2)
 
                 await self._trigger_lazy_loading_playwright(page)
 
-                await asyncio.sleep(2)
+                await self._settle(page, 2)
 
                 content = await page.content()
+                self._record_render_stats(browser_result)
 
             soup = BeautifulSoup(content, "html.parser")
 
@@ -721,7 +726,7 @@ class REANScraper(BaseScraper):
         """Trigger lazy loading for images using Playwright page scrolling."""
         try:
             await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(2)
+            await self._settle(page, 2)
 
             await page.evaluate("window.scrollTo(0, 0)")
             await asyncio.sleep(1)
@@ -736,7 +741,7 @@ class REANScraper(BaseScraper):
                 current += scroll_increment
 
             await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(2)
+            await self._settle(page, 2)
             await page.evaluate("window.scrollTo(0, 0)")
             await asyncio.sleep(1)
 
@@ -1166,28 +1171,8 @@ class REANScraper(BaseScraper):
         all_animals = []
 
         try:
-            for page_type, page_path in self.pages.items():
-                # World-class logging: Page scraping handled by centralized system
-
-                # Use unified extraction to get dogs with correctly associated
-                # images
-                page_url = f"{self.base_url}{page_path}"
-                enriched_dog_data_list = self.extract_dogs_with_images_unified(page_url, page_type)
-                # World-class logging: Page results handled by centralized system
-
-                # Convert to standardized format and add to results
-                for dog_data in enriched_dog_data_list:
-                    try:
-                        standardized_data = self.standardize_animal_data(dog_data, page_type)
-                        all_animals.append(standardized_data)
-                    except Exception as e:
-                        self.logger.error(f"Error processing dog entry: {e}")
-                        continue
-
-                # Rate limiting between pages
-                # Not the last page
-                if page_type != list(self.pages.keys())[-1]:
-                    time.sleep(self.rate_limit_delay)
+            for page_animals in self.scrape_pages():
+                all_animals.extend(page_animals)
 
             # World-class logging: Total results handled by centralized system
             return all_animals
@@ -1198,6 +1183,38 @@ class REANScraper(BaseScraper):
             return []
         # Stale detection handled by BaseScraper._finalize_scrape() with proper safety guards
 
+    def scrape_pages(self) -> Iterator[list[dict[str, Any]]]:
+        """
+        Scrape the Romania and UK pages in turn.
+
+        Yields:
+            Each page's standardized animal data dictionaries, as soon as that
+            page has been scraped
+        """
+        for page_type, page_path in self.pages.items():
+            # World-class logging: Page scraping handled by centralized system
+
+            # Use unified extraction to get dogs with correctly associated
+            # images
+            page_url = f"{self.base_url}{page_path}"
+            enriched_dog_data_list = self.extract_dogs_with_images_unified(page_url, page_type)
+            # World-class logging: Page results handled by centralized system
+
+            # Convert to standardized format
+            page_animals = []
+            for dog_data in enriched_dog_data_list:
+                try:
+                    page_animals.append(self.standardize_animal_data(dog_data, page_type))
+                except Exception as e:
+                    self.logger.error(f"Error processing dog entry: {e}")
+                    continue
+            yield page_animals
+
+            # Rate limiting between pages
+            # Not the last page
+            if page_type != list(self.pages.keys())[-1]:
+                self.respect_rate_limit(page_url)
+
     def scrape_page(self, url: str) -> str | None:
         """
         Scrape a single page with error handling and retries.
@@ -1217,6 +1234,7 @@ class REANScraper(BaseScraper):
                     timeout=self.timeout,
                     headers={"User-Agent": "Mozilla/5.0 (compatible; RescueDogAggregator/1.0)"},
                 )
+                self.record_response(response)
                 response.raise_for_status()
 
                 return response.text
@@ -1224,7 +1242,10 @@ class REANScraper(BaseScraper):
             except Exception as e:
                 self.logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
                 if attempt < self.max_retries:
-                    time.sleep(2**attempt)  # Exponential backoff
+                    # The controller has backed off from the error (or Retry-After)
+                    if getattr(e, "response", None) is None:
+                        self.record_failure(url)
+                    self.respect_rate_limit(url)
                 else:
                     self.logger.error(f"All attempts failed for {url}")
 
@@ -1998,7 +2019,7 @@ class REANScraper(BaseScraper):
 
         return None
 
-    def collect_data(self) -> list[dict[str, Any]]:
+    def collect_data(self) -> Iterator[dict[str, Any]]:
         """
         Collect animal data from REAN website.
 
@@ -2006,20 +2027,17 @@ class REANScraper(BaseScraper):
         Uses self.filtering_service.filter_existing_animals() which records ALL external_ids
         before filtering, ensuring accurate stale detection.
 
-        Returns:
-            List of dictionaries, each containing data for one animal
-        """
-        animals = self.scrape_animals()
+        Each page's dogs are yielded once that page is scraped, so BaseScraper
+        saves and checkpoints the Romania dogs before the UK page is loaded
+        (see scrapers/animal_stream.py). A failure propagates to BaseScraper
+        rather than ending the stream early, which would look like a smaller
+        listing, and the rerun resumes after the dogs already saved.
 
-        if self.skip_existing_animals:
-            result = self.filtering_service.filter_existing_animals(animals)
+        Yields:
+            Dictionaries, each containing data for one animal
+        """
+        for animals in self.scrape_pages():
+            # Also drops dogs an interrupted run already saved, with or without skip_existing_animals
+            animals = self.filtering_service.filter_existing_animals(animals)
             self._sync_filtering_stats()
-            return result
-
-        # Not filtering - record external IDs for stale detection
-        for animal in animals:
-            if animal.get("external_id") and self.session_manager:
-                self.session_manager.record_found_animal(animal["external_id"])
-        self.total_animals_before_filter = len(animals)
-        self.total_animals_skipped = 0
-        return animals
+            yield from animals
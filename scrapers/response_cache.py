@@ -0,0 +1,115 @@
+"""
+Validator cache for scraper detail pages, kept in the page_validators table.
+
+Every run used to re-download and re-parse every dog's detail page, then
+rewrite the row, even when the page hadn't changed. skip_existing_animals
+avoids that but also misses genuine updates to existing dogs.
+
+The cache keeps, per URL, the ETag and Last-Modified the site sent and a
+hash of the body. The fetch engine sends them back as If-None-Match /
+If-Modified-Since; a 304, or a 200 whose body hashes the same, marks the
+page unchanged and the scraper skips parsing and saving that dog.
+
+The validators live in the database rather than on local disk, which a
+redeploy wipes. An organization's entries are loaded in one query when the
+scrape starts. Entries fetched during a run are only staged; they're
+written when the run completes successfully, so a run that fails part-way,
+or a page that failed to parse or a dog that failed validation or saving,
+is fetched in full next time.
+
+Each validator records the parser_version() of the scraper that stored it.
+An entry from a different version is ignored, so a deploy that changes how
+a scraper parses its pages sends every page through a full parse once.
+
+Disabled when TESTING=true, and by BaseScraper when FORCE_RESCRAPE is set.
+"""
+
+import functools
+import hashlib
+import importlib
+import os
+from dataclasses import astuple, dataclass, replace
+from pathlib import Path
+from typing import Any
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@functools.cache
+def parser_version(module_name: str) -> str:
+    """Fingerprint of the source a scraper module parses its pages with.
+
+    Covers every module in the scraper's package, since detail parsers and
+    normalizers live beside the scraper. A scraper module directly under
+    scrapers/ is hashed on its own.
+    """
+    path = Path(importlib.import_module(module_name).__file__)
+    files = [path] if path.parent == Path(__file__).parent else sorted(path.parent.glob("*.py"))
+    digest = hashlib.sha256()
+    for file in files:
+        digest.update(file.name.encode("utf-8"))
+        digest.update(file.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """What the last successful run saw at a URL."""
+
+    content_hash: str
+    etag: str | None = None
+    last_modified: str | None = None
+    parser_version: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Per-organization cache of page validators, loaded from and written to the database."""
+
+    def __init__(self, organization_id: int, database_service: Any, entries: dict[str, CacheEntry] | None = None, parser_version: str | None = None):
+        self.organization_id = organization_id
+        self.database_service = database_service
+        self.parser_version = parser_version
+        self._entries: dict[str, CacheEntry] = entries or {}
+        self._staged: dict[str, CacheEntry] = {}
+
+    @classmethod
+    def for_organization(cls, organization_id: int | None, database_service: Any, parser_version: str | None = None, env: dict[str, str] | None = None) -> "ResponseCache | None":
+        """Load the cache for an organization, or None when caching is disabled."""
+        env = os.environ if env is None else env
+        if env.get("TESTING") == "true" or not organization_id or not database_service:
+            return None
+        stored = database_service.get_page_validators(organization_id)
+        return cls(organization_id, database_service, {url: CacheEntry(*validator) for url, validator in stored.items()}, parser_version)
+
+    def get(self, url: str) -> CacheEntry | None:
+        """The committed entry for url, if any was stored by the current parser version."""
+        entry = self._entries.get(url)
+        return entry if entry and entry.parser_version == self.parser_version else None
+
+    def stage(self, url: str, entry: CacheEntry) -> None:
+        """Remember what was fetched, stamped with the parser version; written by commit()."""
+        self._staged[url] = replace(entry, parser_version=self.parser_version)
+
+    def forget(self, url: str) -> None:
+        """Drop a staged entry, because its page failed to parse or its dog failed validation or saving."""
+        self._staged.pop(url, None)
+
+    def commit(self) -> int:
+        """Write staged entries to the database and return how many were written."""
+        if not self._staged:
+            return 0
+        written = self.database_service.record_page_validators(self.organization_id, {url: astuple(entry) for url, entry in self._staged.items()})
+        if written:
+            self._entries.update(self._staged)
+        self._staged.clear()
+        return written
@@ -1,6 +1,5 @@
 """Scraper implementation for Santer Paws Bulgarian Rescue organization."""
 
-import time
 from typing import Any
 from urllib.parse import urljoin
 
@@ -8,11 +7,14 @@ import requests
 from bs4 import BeautifulSoup
 
 from scrapers.base_scraper import BaseScraper
+from scrapers.constants import DETAIL_FETCH_CONCURRENCY
 
 # Migrated to unified standardization - using BaseScraper.process_animal()
 # Legacy standardize_age kept for date-of-birth calculations
 from utils.standardization import standardize_age
 
+DETAIL_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; RescueDogAggregator/1.0)"}
+
 
 class SanterPawsBulgarianRescueScraper(BaseScraper):
     """Scraper for Santer Paws Bulgarian Rescue organization.
@@ -70,6 +72,9 @@ class SanterPawsBulgarianRescueScraper(BaseScraper):
             self.logger.warning("No animals found to process")
             return []
 
+        if self._listing_unchanged(animals):
+            return []
+
         # Use filtering_service method that records external_ids BEFORE filtering
         # This is critical for mark_skipped_animals_as_seen() to work correctly
         result = self.filtering_service.filter_existing_animals(animals)
@@ -77,10 +82,10 @@ class SanterPawsBulgarianRescueScraper(BaseScraper):
         return result
 
     def _process_animals_parallel(self, animals: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Process animals in parallel batches for efficient detail scraping.
+        """Fetch detail pages through the shared HTTP engine and merge them into the animals.
 
-        Uses ThreadPoolExecutor to process animals in batches based on batch_size config.
-        Each batch runs concurrently to improve performance while respecting rate limits.
+        Pages are fetched over pooled keep-alive connections, rate limited per
+        host by BaseScraper.fetch_pages.
 
         Args:
             animals: List of animals to process
@@ -88,111 +93,34 @@ class SanterPawsBulgarianRescueScraper(BaseScraper):
         Returns:
             List of processed animals with detailed data
         """
-        all_dogs_data = []
+        unique_animals = []
         seen_urls = set()  # Track URLs to prevent duplicates
+        for animal in animals:
+            adoption_url = animal["adoption_url"]
+            if adoption_url in seen_urls:
+                self.logger.debug(f"Skipping duplicate dog: {animal['name']} ({adoption_url})")
+                continue
+            seen_urls.add(adoption_url)
+            unique_animals.append(animal)
+
+        self.logger.info(f"Fetching detail pages for {len(unique_animals)} animals")
+        details = self.fetch_pages(
+            [animal["adoption_url"] for animal in unique_animals],
+            self._parse_animal_details,
+            max_concurrency=DETAIL_FETCH_CONCURRENCY,
+            headers=DETAIL_HEADERS,
+        )
 
-        # Single-threaded fallback for small batches or when batch_size=1
-        if len(animals) <= self.batch_size or self.batch_size == 1:
-            self.logger.info(f"Using single-threaded processing for {len(animals)} animals")
-
-            for animal in animals:
-                adoption_url = animal["adoption_url"]
-
-                # Skip duplicates (shouldn't happen but safety check)
-                if adoption_url in seen_urls:
-                    self.logger.debug(f"Skipping duplicate dog: {animal['name']} ({adoption_url})")
-                    continue
-                seen_urls.add(adoption_url)
-
-                # Rate limiting for respectful scraping
-                time.sleep(self.rate_limit_delay)
-
-                # Scrape detail page for additional information
-                try:
-                    detail_data = self._scrape_animal_details(adoption_url)
-                    if detail_data:
-                        animal.update(detail_data)
-                except Exception as e:
-                    self.logger.error(f"Error scraping details for {animal['name']}: {e}")
-                    # Continue processing even if detail scraping fails
-
-                all_dogs_data.append(animal)
-
-            return all_dogs_data
-
-        # Parallel processing for larger batches
-        import concurrent.futures
-        from threading import Lock
-
-        self.logger.info(f"Starting parallel detail scraping for {len(animals)} animals using batch_size={self.batch_size}")
-
-        # Thread-safe collections
-        results_lock = Lock()
-
-        def process_animal_batch(animal_batch):
-            """Process a batch of animals in parallel"""
-            batch_results = []
-
-            try:
-                for animal in animal_batch:
-                    adoption_url = animal["adoption_url"]
-
-                    # Skip duplicates (thread-safe check)
-                    with results_lock:
-                        if adoption_url in seen_urls:
-                            self.logger.debug(f"Skipping duplicate dog: {animal['name']} ({adoption_url})")
-                            continue
-                        seen_urls.add(adoption_url)
-
-                    # Rate limiting for respectful scraping
-                    time.sleep(self.rate_limit_delay)
-
-                    # Scrape detail page for additional information
-                    try:
-                        detail_data = self._scrape_animal_details(adoption_url)
-                        if detail_data:
-                            # Merge detail data with listing data (detail data takes precedence)
-                            animal.update(detail_data)
-                    except Exception as e:
-                        # Log error but continue processing (animal will be added without detail data)
-                        self.logger.error(f"Error scraping details for {animal.get('name', 'unknown')}: {e}")
-                        # Continue processing - animal will be added with listing data only
-
-                    batch_results.append(animal)
-
-            except Exception as e:
-                self.logger.error(f"Error in batch processing: {e}")
-
-            return batch_results
-
-        # Split animals into batches based on batch_size
-        batches = []
-        for i in range(0, len(animals), self.batch_size):
-            batch = animals[i : i + self.batch_size]
-            batches.append(batch)
-
-        self.logger.info(f"Split {len(animals)} animals into {len(batches)} batches of size {self.batch_size}")
-
-        # Process batches with controlled concurrency
-        # Limit concurrent threads to prevent overwhelming the target server
-        max_workers = min(3, len(batches))  # Max 3 concurrent batches
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all batches
-            future_to_batch = {executor.submit(process_animal_batch, batch): i for i, batch in enumerate(batches)}
-
-            # Collect results as they complete
-            for future in concurrent.futures.as_completed(future_to_batch):
-                batch_index = future_to_batch[future]
-                try:
-                    batch_results = future.result(timeout=300)  # 5 minute timeout per batch
-                    all_dogs_data.extend(batch_results)
-                    self.logger.info(f"Completed batch {batch_index + 1}/{len(batches)}: {len(batch_results)} animals processed")
-                except Exception as e:
-                    self.logger.error(f"Batch {batch_index + 1} failed: {e}")
-                    continue
+        unique_animals, details = self._drop_unchanged(unique_animals, details)
+        for animal, detail_data in zip(unique_animals, details):
+            if detail_data:
+                # Merge detail data with listing data (detail data takes precedence)
+                animal.update(detail_data)
+            else:
+                # Animal is kept with listing data only
+                self.logger.error(f"Error scraping details for {animal.get('name', 'unknown')}")
 
-        return all_dogs_data
+        return unique_animals
 
     def collect_data(self) -> list[dict[str, Any]]:
         """Collect all available dog data from the listing page.
@@ -254,6 +182,7 @@ class SanterPawsBulgarianRescueScraper(BaseScraper):
                     headers=headers,
                     timeout=30,
                 )
+                self.record_response(response)
                 response.raise_for_status()
 
                 # Parse HTML response
@@ -330,9 +259,9 @@ class SanterPawsBulgarianRescueScraper(BaseScraper):
                 # Move to next page
                 page_num += 1
 
-                # Small delay between pages to be respectful
+                # Delay between pages to be respectful
                 if page_num <= max_pages:
-                    time.sleep(0.5)
+                    self.respect_rate_limit(page_url)
 
             self.logger.info(f"Successfully extracted {len(all_animals)} available dogs from {page_num - 1} pages")
             return all_animals
@@ -578,84 +507,13 @@ class SanterPawsBulgarianRescueScraper(BaseScraper):
             # Make request with timeout for slow site
             response = requests.get(
                 adoption_url,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (compatible; RescueDogAggregator/1.0)",
-                },
+                headers=DETAIL_HEADERS,
                 timeout=45,  # Longer timeout for slow site
             )
+            self.record_response(response)
             response.raise_for_status()
 
-            # Parse HTML
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Extract name from URL for standardization
-            name = self._extract_dog_name_from_url(adoption_url)
-            if not name:
-                self.logger.warning(f"Could not extract name from {adoption_url}")
-                return {}
-
-            # Extract external ID from URL
-            external_id = self._extract_external_id(adoption_url)
-
-            # Extract properties from the detail page
-            properties = self._extract_properties(soup)
-
-            # Extract description
-            description = self._extract_description(soup)
-
-            # Extract hero image
-            hero_image_url = self._extract_hero_image(soup)
-
-            # Session 4 compliance: Include description in properties for consistency
-            if description:
-                properties["description"] = description
-
-            # Build result dictionary following galgosdelsol pattern
-            result = {
-                "name": self._clean_dog_name(name),
-                "external_id": external_id,
-                "adoption_url": adoption_url,
-                "primary_image_url": hero_image_url,
-                "original_image_url": hero_image_url,  # Same as primary for this site
-                "animal_type": "dog",
-                "status": "available",
-                "properties": properties,
-                "description": description,
-            }
-
-            # Add image_urls for R2 integration through BaseScraper template method
-            if hero_image_url:
-                result["image_urls"] = [hero_image_url]
-            else:
-                result["image_urls"] = []
-
-            # Extract individual fields from properties for compatibility with zero NULLs compliance
-            if properties:
-                if "breed" in properties:
-                    result["breed"] = properties["breed"] or "Mixed Breed"
-                # Use gender field for consistency with unified standardization
-                if "sex" in properties:
-                    result["gender"] = (properties["sex"] or "Unknown").lower()
-                # Rename age_text to age for unified standardization API
-                if "age_text" in properties:
-                    result["age"] = properties["age_text"]
-                if "size" in properties:
-                    result["size"] = properties["size"] or "Medium"
-                if "status" in properties:
-                    result["status"] = properties["status"]  # Override default with extracted status
-
-            # Apply unified standardization via process_animal from BaseScraper
-            # This handles breed standardization, age parsing, size normalization, etc.
-            result = self.process_animal(result)
-
-            # Zero NULLs compliance - set defaults only if unified standardization didn't provide them
-            if "breed" not in result or not result["breed"]:
-                result["breed"] = "Mixed Breed"
-            if "standardized_size" not in result or not result["standardized_size"]:
-                result["standardized_size"] = "Medium"
-
-            self.logger.debug(f"Successfully extracted data for {name}")
-            return result
+            return self._parse_animal_details(adoption_url, response.text)
 
         except requests.RequestException as e:
             self.logger.error(f"Network error scraping details from {adoption_url}: {e}")
@@ -663,3 +521,85 @@ class SanterPawsBulgarianRescueScraper(BaseScraper):
         except Exception as e:
             self.logger.error(f"Error scraping details from {adoption_url}: {e}")
             return {}
+
+    def _parse_animal_details(self, adoption_url: str, html: str) -> dict[str, Any]:
+        """Extract and standardize a dog's details from its page HTML.
+
+        Args:
+            adoption_url: URL the page was fetched from
+            html: Page HTML
+
+        Returns:
+            Dictionary with detailed dog information following BaseScraper format
+        """
+        # Parse HTML
+        soup = BeautifulSoup(html, "html.parser")
+
+        # Extract name from URL for standardization
+        name = self._extract_dog_name_from_url(adoption_url)
+        if not name:
+            self.logger.warning(f"Could not extract name from {adoption_url}")
+            return {}
+
+        # Extract external ID from URL
+        external_id = self._extract_external_id(adoption_url)
+
+        # Extract properties from the detail page
+        properties = self._extract_properties(soup)
+
+        # Extract description
+        description = self._extract_description(soup)
+
+        # Extract hero image
+        hero_image_url = self._extract_hero_image(soup)
+
+        # Session 4 compliance: Include description in properties for consistency
+        if description:
+            properties["description"] = description
+
+        # Build result dictionary following galgosdelsol pattern
+        result = {
+            "name": self._clean_dog_name(name),
+            "external_id": external_id,
+            "adoption_url": adoption_url,
+            "primary_image_url": hero_image_url,
+            "original_image_url": hero_image_url,  # Same as primary for this site
+            "animal_type": "dog",
+            "status": "available",
+            "properties": properties,
+            "description": description,
+        }
+
+        # Add image_urls for R2 integration through BaseScraper template method
+        if hero_image_url:
+            result["image_urls"] = [hero_image_url]
+        else:
+            result["image_urls"] = []
+
+        # Extract individual fields from properties for compatibility with zero NULLs compliance
+        if properties:
+            if "breed" in properties:
+                result["breed"] = properties["breed"] or "Mixed Breed"
+            # Use gender field for consistency with unified standardization
+            if "sex" in properties:
+                result["gender"] = (properties["sex"] or "Unknown").lower()
+            # Rename age_text to age for unified standardization API
+            if "age_text" in properties:
+                result["age"] = properties["age_text"]
+            if "size" in properties:
+                result["size"] = properties["size"] or "Medium"
+            if "status" in properties:
+                result["status"] = properties["status"]  # Override default with extracted status
+
+        # Apply unified standardization via process_animal from BaseScraper
+        # This handles breed standardization, age parsing, size normalization, etc.
+        result = self.process_animal(result)
+
+        # Zero NULLs compliance - set defaults only if unified standardization didn't provide them
+        if "breed" not in result or not result["breed"]:
+            result["breed"] = "Mixed Breed"
+        if "standardized_size" not in result or not result["standardized_size"]:
+            result["standardized_size"] = "Medium"
+
+        self.logger.debug(f"Successfully extracted data for {name}")
+        return result
@@ -8,9 +8,12 @@ import requests
 from bs4 import BeautifulSoup
 
 from scrapers.base_scraper import BaseScraper
+from scrapers.constants import DETAIL_FETCH_CONCURRENCY
 
 from .normalizer import extract_qa_data, extract_size_and_weight_from_qa
 
+DETAIL_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; RescueDogAggregator/1.0)"}
+
 
 class TheUnderdogScraper(BaseScraper):
     """Scraper for The Underdog rescue organization.
@@ -20,6 +23,9 @@ class TheUnderdogScraper(BaseScraper):
     only available dogs (those without ADOPTED/RESERVED badges) are scraped.
     """
 
+    # Detail pages go through the regex-heavy Q&A normalizer: parsed across cores
+    parse_in_processes = True
+
     def __init__(self, config_id: str = "theunderdog", organization_id=None):
         """Initialize The Underdog scraper.
 
@@ -67,6 +73,9 @@ class TheUnderdogScraper(BaseScraper):
                 dog["external_id"] = self._generate_external_id(dog["url"])
                 dog["adoption_url"] = dog["url"]
 
+        if self._listing_unchanged(available_dogs):
+            return []
+
         # Apply skip_existing_animals filtering
         if self.skip_existing_animals and available_dogs:
             dogs_to_process = self.filtering_service.filter_existing_animals(available_dogs)
@@ -77,23 +86,14 @@ class TheUnderdogScraper(BaseScraper):
             dogs_to_process = available_dogs
 
         # Collect detailed data for each dog
-        all_dogs_data = []
-
-        for dog_info in dogs_to_process:
-            try:
-                # Respect rate limiting
-                self.respect_rate_limit()
-
-                # Scrape detail page
-                dog_data = self.scrape_animal_details(dog_info["url"])
-
-                if dog_data:
-                    all_dogs_data.append(dog_data)
-                    self.logger.debug(f"Collected data for {dog_data['name']}")
-
-            except Exception as e:
-                self.logger.error(f"Error collecting data for {dog_info.get('url', 'unknown')}: {e}")
-                continue
+        details = self.fetch_pages(
+            [dog_info["url"] for dog_info in dogs_to_process],
+            self._parse_animal_details,
+            max_concurrency=DETAIL_FETCH_CONCURRENCY,
+            headers=DETAIL_HEADERS,
+        )
+        _, details = self._drop_unchanged(dogs_to_process, details)
+        all_dogs_data = [dog_data for dog_data in details if dog_data]
 
         # World-class logging: Collection results handled by centralized system
         return all_dogs_data
@@ -154,7 +154,7 @@ class TheUnderdogScraper(BaseScraper):
             response = requests.get(
                 self.listing_url,
                 timeout=self.timeout,
-                headers={"User-Agent": "Mozilla/5.0 (compatible; RescueDogAggregator/1.0)"},
+                headers=DETAIL_HEADERS,
             )
             response.raise_for_status()
 
@@ -248,128 +248,144 @@ class TheUnderdogScraper(BaseScraper):
             if not soup:
                 return None
 
-            # Extract basic info - get raw name first for country extraction
-            raw_name = self._extract_raw_name(soup)
-            if not raw_name:
-                self.logger.warning(f"Could not extract name from {url}")
-                return None
+            return self._extract_animal_from_soup(url, soup)
 
-            # Check if dog is adopted/reserved on detail page (use raw name before cleaning)
-            if not self._is_available_dog(raw_name):
-                # World-class logging: Status filtering handled by centralized system
-                return None
+        except Exception as e:
+            self.logger.error(f"Error scraping detail page {url}: {e}")
+            return None
 
-            # Extract country from raw name (with flag emoji)
-            country = self._extract_country_from_name(raw_name)
-
-            # Clean the name for final result
-            name = self._clean_name(raw_name)
-
-            # Extract all data
-            external_id = self._generate_external_id(url)
-            hero_image_url = self._extract_hero_image(soup)
-            properties, description = self._extract_properties_and_description_from_soup(soup)
-
-            # Ensure properties is never None or completely empty
-            if not properties:
-                properties = {}
-            if not description:
-                description = f"Rescue dog {name} from The Underdog organization."
-
-            # Build result dictionary with enhanced properties
-            result = {
-                "name": name,
-                "external_id": external_id,
-                "adoption_url": url,
-                "primary_image_url": hero_image_url,
-                "description": description,
-                "properties": {
-                    "raw_qa_data": properties,  # Store Q&A pairs
-                    "raw_name": name,
-                    "raw_description": description,
-                    "page_url": url,
-                },
-                "animal_type": "dog",
-                "status": "available",  # All scraped dogs are available
-            }
-
-            # Add country if found
-            if country:
-                result["country"] = country["name"]
-                result["country_code"] = country["iso_code"]
-
-            # Extract Q&A data for size/weight information
-            qa_data = extract_qa_data(result.get("properties", {}))
-
-            # Extract age from Q&A data if available
-            if qa_data.get("How old?"):
-                # Keep the original text for age_text field
-                result["age"] = qa_data["How old?"]
-
-            # Extract sex from Q&A data if available
-            if qa_data.get("Male or female?"):
-                sex_value = qa_data["Male or female?"].strip().lower()
-                if sex_value in ["male", "m"]:
-                    result["sex"] = "Male"
-                elif sex_value in ["female", "f"]:
-                    result["sex"] = "Female"
-
-            # Ensure ALL critical fields are present for BaseScraper
-            # BaseScraper will handle standardization automatically
-
-            # Required fields - these MUST have values
-            if not result.get("breed"):
-                # Try to extract from description
-                # Let BaseScraper's UnifiedStandardizer handle the actual standardization
-                result["breed"] = "Mixed Breed"  # Default if extraction failed
-
-            if not result.get("age"):
-                # Try to extract from description as fallback
-                result["age"] = self._extract_age_fallback(description)
-
-            if not result.get("sex"):
-                # Try to extract from description as fallback
-                result["sex"] = self._extract_sex_fallback(description)
+    def _parse_animal_details(self, url: str, html: str) -> dict[str, Any] | None:
+        """Parse a fetched detail page; see _extract_animal_from_soup."""
+        return self._extract_animal_from_soup(url, BeautifulSoup(html, "html.parser"))
 
-            if not result.get("size"):
-                # Extract size and weight from Q&A data
-                size, weight_kg = extract_size_and_weight_from_qa(qa_data)
-                if size:
-                    result["size"] = size
-                if weight_kg:
-                    result["weight_kg"] = weight_kg
-
-                # If still no size, try to estimate from weight if available
-                if not result.get("size") and result.get("weight_kg"):
-                    try:
-                        weight = float(result["weight_kg"])
-                        result["size"] = self._estimate_size_from_weight(weight)
-                    except (ValueError, TypeError):
-                        result["size"] = "Medium"  # Fallback if conversion fails
-
-                # Final fallback
-                if not result.get("size"):
-                    result["size"] = "Medium"
-
-            # Ensure description is not empty
-            if not result.get("description"):
-                result["description"] = f"Rescue dog from {result.get('country', 'unknown location')}"
-
-            # Add location standardization
-            if not result.get("location"):
-                # Use country as primary location
-                if result.get("country"):
-                    result["location"] = result["country"]
-                else:
-                    result["location"] = "Unknown"
+    def _extract_animal_from_soup(self, url: str, soup: BeautifulSoup) -> dict[str, Any] | None:
+        """Extract a dog's data from its parsed detail page.
 
-            # Apply unified standardization
-            return self.process_animal(result)
+        Args:
+            url: URL of the dog detail page
+            soup: Parsed detail page
 
-        except Exception as e:
-            self.logger.error(f"Error scraping detail page {url}: {e}")
+        Returns:
+            Dictionary with dog data or None if dog should be skipped
+        """
+        # Extract basic info - get raw name first for country extraction
+        raw_name = self._extract_raw_name(soup)
+        if not raw_name:
+            self.logger.warning(f"Could not extract name from {url}")
             return None
 
+        # Check if dog is adopted/reserved on detail page (use raw name before cleaning)
+        if not self._is_available_dog(raw_name):
+            # World-class logging: Status filtering handled by centralized system
+            return None
+
+        # Extract country from raw name (with flag emoji)
+        country = self._extract_country_from_name(raw_name)
+
+        # Clean the name for final result
+        name = self._clean_name(raw_name)
+
+        # Extract all data
+        external_id = self._generate_external_id(url)
+        hero_image_url = self._extract_hero_image(soup)
+        properties, description = self._extract_properties_and_description_from_soup(soup)
+
+        # Ensure properties is never None or completely empty
+        if not properties:
+            properties = {}
+        if not description:
+            description = f"Rescue dog {name} from The Underdog organization."
+
+        # Build result dictionary with enhanced properties
+        result = {
+            "name": name,
+            "external_id": external_id,
+            "adoption_url": url,
+            "primary_image_url": hero_image_url,
+            "description": description,
+            "properties": {
+                "raw_qa_data": properties,  # Store Q&A pairs
+                "raw_name": name,
+                "raw_description": description,
+                "page_url": url,
+            },
+            "animal_type": "dog",
+            "status": "available",  # All scraped dogs are available
+        }
+
+        # Add country if found
+        if country:
+            result["country"] = country["name"]
+            result["country_code"] = country["iso_code"]
+
+        # Extract Q&A data for size/weight information
+        qa_data = extract_qa_data(result.get("properties", {}))
+
+        # Extract age from Q&A data if available
+        if qa_data.get("How old?"):
+            # Keep the original text for age_text field
+            result["age"] = qa_data["How old?"]
+
+        # Extract sex from Q&A data if available
+        if qa_data.get("Male or female?"):
+            sex_value = qa_data["Male or female?"].strip().lower()
+            if sex_value in ["male", "m"]:
+                result["sex"] = "Male"
+            elif sex_value in ["female", "f"]:
+                result["sex"] = "Female"
+
+        # Ensure ALL critical fields are present for BaseScraper
+        # BaseScraper will handle standardization automatically
+
+        # Required fields - these MUST have values
+        if not result.get("breed"):
+            # Try to extract from description
+            # Let BaseScraper's UnifiedStandardizer handle the actual standardization
+            result["breed"] = "Mixed Breed"  # Default if extraction failed
+
+        if not result.get("age"):
+            # Try to extract from description as fallback
+            result["age"] = self._extract_age_fallback(description)
+
+        if not result.get("sex"):
+            # Try to extract from description as fallback
+            result["sex"] = self._extract_sex_fallback(description)
+
+        if not result.get("size"):
+            # Extract size and weight from Q&A data
+            size, weight_kg = extract_size_and_weight_from_qa(qa_data)
+            if size:
+                result["size"] = size
+            if weight_kg:
+                result["weight_kg"] = weight_kg
+
+            # If still no size, try to estimate from weight if available
+            if not result.get("size") and result.get("weight_kg"):
+                try:
+                    weight = float(result["weight_kg"])
+                    result["size"] = self._estimate_size_from_weight(weight)
+                except (ValueError, TypeError):
+                    result["size"] = "Medium"  # Fallback if conversion fails
+
+            # Final fallback
+            if not result.get("size"):
+                result["size"] = "Medium"
+
+        # Ensure description is not empty
+        if not result.get("description"):
+            result["description"] = f"Rescue dog from {result.get('country', 'unknown location')}"
+
+        # Add location standardization
+        if not result.get("location"):
+            # Use country as primary location
+            if result.get("country"):
+                result["location"] = result["country"]
+            else:
+                result["location"] = "Unknown"
+
+        # Apply unified standardization
+        return self.process_animal(result)
+
     def _fetch_detail_page(self, url: str) -> BeautifulSoup | None:
         """Fetch and parse a detail page.
 
@@ -383,7 +399,7 @@ class TheUnderdogScraper(BaseScraper):
             response = requests.get(
                 url,
                 timeout=self.timeout,
-                headers={"User-Agent": "Mozilla/5.0 (compatible; RescueDogAggregator/1.0)"},
+                headers=DETAIL_HEADERS,
             )
             response.raise_for_status()
 
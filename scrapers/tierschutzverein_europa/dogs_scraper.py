@@ -1,7 +1,4 @@
-import concurrent.futures
 import re
-import time
-from threading import Lock
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
@@ -9,6 +6,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from scrapers.base_scraper import BaseScraper
+from scrapers.constants import DETAIL_FETCH_CONCURRENCY
 from scrapers.tierschutzverein_europa.translations import (
     normalize_name,
     translate_age,
@@ -16,10 +14,15 @@ from scrapers.tierschutzverein_europa.translations import (
     translate_gender,
 )
 
+DETAIL_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; rescue-dog-aggregator)"}
+
 
 class TierschutzvereinEuropaScraper(BaseScraper):
     """Tierschutzverein Europa e.V. scraper with two-phase parallel architecture."""
 
+    # Hundreds of German detail pages per run: parsed across cores
+    parse_in_processes = True
+
     def __init__(self, config_id="tierschutzverein-europa", organization_id=None):
         """Initialize Tierschutzverein Europa scraper with configuration."""
         if organization_id is not None:
@@ -45,6 +48,9 @@ class TierschutzvereinEuropaScraper(BaseScraper):
 
             self.logger.info(f"Found {len(animals)} animals on listing pages")
 
+            if self._listing_unchanged(animals):
+                return []
+
             # Filter based on skip_existing_animals if enabled
             # Uses self.filtering_service.filter_existing_animals() which records ALL external_ids
             # BEFORE filtering to ensure mark_skipped_animals_as_seen() works correctly
@@ -90,6 +96,7 @@ class TierschutzvereinEuropaScraper(BaseScraper):
                     headers={"User-Agent": "Mozilla/5.0 (compatible; rescue-dog-aggregator)"},
                     timeout=30,
                 )
+                self.record_response(response)
                 response.raise_for_status()
 
                 # Parse HTML and extract animals
@@ -114,7 +121,7 @@ class TierschutzvereinEuropaScraper(BaseScraper):
                     break
 
                 # Rate limiting
-                time.sleep(self.rate_limit_delay)
+                self.respect_rate_limit(page_url)
                 page += 1
 
             except Exception as e:
@@ -181,45 +188,50 @@ class TierschutzvereinEuropaScraper(BaseScraper):
 
             response = requests.get(
                 adoption_url,
-                headers={"User-Agent": "Mozilla/5.0 (compatible; rescue-dog-aggregator)"},
+                headers=DETAIL_HEADERS,
                 timeout=45,
             )  # Longer timeout for slow site
+            self.record_response(response)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            return self._parse_animal_details(adoption_url, response.text)
 
-            # Extract German properties
-            properties = self._extract_properties_from_soup(soup)
+        except Exception as e:
+            self.logger.error(f"Error scraping details from {adoption_url}: {e}")
+            return {}
 
-            # Extract hero/primary image
-            hero_image_url = self._extract_hero_image(soup)
+    def _parse_animal_details(self, adoption_url: str, html: str) -> dict[str, Any]:
+        """Extract detail fields from a dog's page HTML."""
+        soup = BeautifulSoup(html, "html.parser")
 
-            # Build result
-            result = {
-                "properties": properties,
-                "primary_image_url": hero_image_url,
-                "original_image_url": hero_image_url,
-                "image_urls": [hero_image_url] if hero_image_url else [],
-            }
+        # Extract German properties
+        properties = self._extract_properties_from_soup(soup)
 
-            # Extract key fields for BaseScraper standardization
-            if "Rasse" in properties:
-                result["breed"] = properties["Rasse"]
-            if "Geschlecht" in properties:
-                result["sex"] = properties["Geschlecht"]
-            if "Geburtstag" in properties:
-                result["age_text"] = properties["Geburtstag"]
-                result["age"] = properties["Geburtstag"]  # Unified standardization expects 'age' field
+        # Extract hero/primary image
+        hero_image_url = self._extract_hero_image(soup)
 
-            # Add description as separate field for BaseScraper
-            if "Beschreibung" in properties:
-                result["description"] = properties["Beschreibung"]
+        # Build result
+        result = {
+            "properties": properties,
+            "primary_image_url": hero_image_url,
+            "original_image_url": hero_image_url,
+            "image_urls": [hero_image_url] if hero_image_url else [],
+        }
 
-            return result
+        # Extract key fields for BaseScraper standardization
+        if "Rasse" in properties:
+            result["breed"] = properties["Rasse"]
+        if "Geschlecht" in properties:
+            result["sex"] = properties["Geschlecht"]
+        if "Geburtstag" in properties:
+            result["age_text"] = properties["Geburtstag"]
+            result["age"] = properties["Geburtstag"]  # Unified standardization expects 'age' field
 
-        except Exception as e:
-            self.logger.error(f"Error scraping details from {adoption_url}: {e}")
-            return {}
+        # Add description as separate field for BaseScraper
+        if "Beschreibung" in properties:
+            result["description"] = properties["Beschreibung"]
+
+        return result
 
     def _extract_properties_from_soup(self, soup: BeautifulSoup) -> dict[str, str]:
         """Extract German properties from detail page."""
@@ -296,88 +308,30 @@ class TierschutzvereinEuropaScraper(BaseScraper):
         return None
 
     def _process_animals_parallel(self, animals: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Process animals in parallel batches for efficient detail scraping."""
-        all_dogs_data = []
+        """Fetch detail pages through the shared HTTP engine and merge them into the animals."""
+        unique_animals = []
         seen_urls = set()
+        for animal in animals:
+            if animal["adoption_url"] not in seen_urls:
+                seen_urls.add(animal["adoption_url"])
+                unique_animals.append(animal)
+
+        self.logger.info(f"Fetching detail pages for {len(unique_animals)} animals")
+        details = self.fetch_pages(
+            [animal["adoption_url"] for animal in unique_animals],
+            self._parse_animal_details,
+            max_concurrency=DETAIL_FETCH_CONCURRENCY,
+            headers=DETAIL_HEADERS,
+        )
+
+        unique_animals, details = self._drop_unchanged(unique_animals, details)
+        for animal, detail_data in zip(unique_animals, details):
+            if detail_data:
+                animal.update(detail_data)
+            else:
+                self.logger.error(f"Error scraping details for {animal.get('name', 'unknown')}")
 
-        # Single-threaded for small batches
-        if len(animals) <= self.batch_size or self.batch_size == 1:
-            self.logger.info(f"Using single-threaded processing for {len(animals)} animals")
-
-            for animal in animals:
-                adoption_url = animal["adoption_url"]
-
-                if adoption_url in seen_urls:
-                    continue
-                seen_urls.add(adoption_url)
-
-                time.sleep(self.rate_limit_delay)
-
-                try:
-                    detail_data = self._scrape_animal_details(adoption_url)
-                    if detail_data:
-                        animal.update(detail_data)
-                except Exception as e:
-                    self.logger.error(f"Error scraping details for {animal['name']}: {e}")
-
-                all_dogs_data.append(animal)
-
-            return all_dogs_data
-
-        # Parallel processing for larger batches
-        self.logger.info(f"Starting parallel detail scraping for {len(animals)} animals")
-
-        results_lock = Lock()
-
-        def process_animal_batch(animal_batch):
-            """Process a batch of animals in parallel."""
-            batch_results = []
-
-            for animal in animal_batch:
-                adoption_url = animal["adoption_url"]
-
-                with results_lock:
-                    if adoption_url in seen_urls:
-                        continue
-                    seen_urls.add(adoption_url)
-
-                time.sleep(self.rate_limit_delay)
-
-                try:
-                    detail_data = self._scrape_animal_details(adoption_url)
-                    if detail_data:
-                        animal.update(detail_data)
-                except Exception as e:
-                    self.logger.error(f"Error scraping details for {animal.get('name', 'unknown')}: {e}")
-
-                batch_results.append(animal)
-
-            return batch_results
-
-        # Split into batches
-        batches = []
-        for i in range(0, len(animals), self.batch_size):
-            batch = animals[i : i + self.batch_size]
-            batches.append(batch)
-
-        self.logger.info(f"Split {len(animals)} animals into {len(batches)} batches")
-
-        # Process with limited concurrency
-        max_workers = min(3, len(batches))  # Max 3 concurrent workers
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_batch = {executor.submit(process_animal_batch, batch): i for i, batch in enumerate(batches)}
-
-            for future in concurrent.futures.as_completed(future_to_batch):
-                batch_index = future_to_batch[future]
-                try:
-                    batch_results = future.result(timeout=300)
-                    all_dogs_data.extend(batch_results)
-                    self.logger.info(f"Completed batch {batch_index + 1}/{len(batches)}")
-                except Exception as e:
-                    self.logger.error(f"Batch {batch_index + 1} failed: {e}")
-
-        return all_dogs_data
+        return unique_animals
 
     def _translate_and_normalize_dogs(self, dogs: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Translate German data to English for BaseScraper processing."""
@@ -460,13 +414,3 @@ class TierschutzvereinEuropaScraper(BaseScraper):
             return name.capitalize()
 
         return None
-
-    def _get_existing_animal_urls(self) -> set:
-        """Get URLs of existing animals from database."""
-        try:
-            # This would normally query the database
-            # For now, returning empty set to avoid database dependency in tests
-            return set()
-        except Exception as e:
-            self.logger.error(f"Error getting existing animal URLs: {e}")
-            return set()
@@ -67,6 +67,9 @@ class WoofProjectScraper(BaseScraper):
                 dog["external_id"] = self._generate_external_id(dog["url"])
                 dog["adoption_url"] = dog["url"]
 
+        if self._listing_unchanged(available_dogs):
+            return []
+
         # Apply skip_existing_animals filtering
         if self.skip_existing_animals and available_dogs:
             dogs_to_process = self.filtering_service.filter_existing_animals(available_dogs)
@@ -82,7 +85,7 @@ class WoofProjectScraper(BaseScraper):
         for dog_info in dogs_to_process:
             try:
                 # Respect rate limiting
-                self.respect_rate_limit()
+                self.respect_rate_limit(dog_info["url"])
 
                 # Scrape detail page
                 dog_data = self.scrape_animal_details(dog_info["url"])
@@ -260,7 +263,7 @@ class WoofProjectScraper(BaseScraper):
         for page_url in pagination_urls:
             try:
                 # Respect rate limiting
-                self.respect_rate_limit()
+                self.respect_rate_limit(page_url)
 
                 # Fetch this page
                 soup = self._fetch_listing_page(page_url)
@@ -358,7 +361,7 @@ class WoofProjectScraper(BaseScraper):
             # Try browser automation for lazy loading first
             try:
                 if USE_PLAYWRIGHT:
-                    result = asyncio.run(self._fetch_with_browser_playwright(url))
+                    result = get_playwright_service().run(self._fetch_with_browser_playwright(url))
                     if result is not None:
                         return result
                     self.logger.warning("Playwright returned None, falling back to requests")
@@ -380,6 +383,7 @@ class WoofProjectScraper(BaseScraper):
             }
 
             response = requests.get(url, timeout=self.timeout, headers=headers)
+            self.record_response(response)
             response.raise_for_status()
 
             return BeautifulSoup(response.text, "html.parser")
@@ -532,6 +536,7 @@ class WoofProjectScraper(BaseScraper):
                 viewport_height=1080,
                 timeout=60000,
                 stealth_mode=False,
+                render_profile="light",
             )
 
             async with playwright_service.get_browser(options) as browser_result:
@@ -546,6 +551,7 @@ class WoofProjectScraper(BaseScraper):
                 await self._wait_for_essential_elements_playwright(page)
 
                 page_source = await page.content()
+                self._record_render_stats(browser_result)
                 self.logger.debug(f"Retrieved page source ({len(page_source)} characters)")
                 return BeautifulSoup(page_source, "html.parser")
 
@@ -560,11 +566,11 @@ class WoofProjectScraper(BaseScraper):
             page: Playwright Page instance
         """
         try:
-            await asyncio.sleep(2)
+            await self._settle(page, 2)
 
             self.logger.debug("Scrolling to bottom to trigger initial lazy loading")
             await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(2)
+            await self._settle(page, 2)
 
             self.logger.debug("Scrolling back to top")
             await page.evaluate("window.scrollTo(0, 0)")
@@ -578,7 +584,7 @@ class WoofProjectScraper(BaseScraper):
                 await asyncio.sleep(0.5)
 
             await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(2)
+            await self._settle(page, 2)
 
             await page.evaluate("window.scrollTo(0, 0)")
             await asyncio.sleep(1)
@@ -989,6 +995,7 @@ class WoofProjectScraper(BaseScraper):
                 timeout=self.timeout,
                 headers={"User-Agent": "Mozilla/5.0 (compatible; RescueDogAggregator/1.0)"},
             )
+            self.record_response(response)
             response.raise_for_status()
 
             return BeautifulSoup(response.text, "html.parser")
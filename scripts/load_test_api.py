@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Load test for the main animal endpoints.
+
+Drives each endpoint with a fixed number of concurrent keep-alive clients for
+a fixed duration and reports throughput per worker, so launch profiles with
+different worker counts can be compared directly.
+
+Usage:
+    # Against a local `python -m api.server`
+    uv run python scripts/load_test_api.py --base-url http://localhost:8080
+
+    # Compare worker counts: restart the server with WEB_CONCURRENCY=N and
+    # pass the same N here
+    uv run python scripts/load_test_api.py --workers 4 --duration 30
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.server import load_profile  # noqa: E402
+
+ENDPOINTS = [
+    "/api/animals/?limit=20",
+    "/api/animals/?curation_type=diverse&limit=20",
+    "/api/animals/random?limit=5",
+    "/api/animals/statistics",
+    "/api/animals/meta/breeds",
+    "/api/animals/meta/filter_counts",
+    "/api/organizations/",
+]
+
+
+@dataclass
+class EndpointResult:
+    path: str
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    elapsed: float = 0.0
+
+    def requests_per_second(self) -> float:
+        return len(self.latencies) / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, pct: int) -> float:
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
+        return statistics.quantiles(self.latencies, n=100)[pct - 1]
+
+
+async def _client_loop(client: httpx.AsyncClient, result: EndpointResult, deadline: float) -> None:
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = await client.get(result.path)
+            if response.status_code >= 400:
+                result.errors += 1
+                continue
+        except httpx.HTTPError:
+            result.errors += 1
+            continue
+        result.latencies.append(time.perf_counter() - started)
+
+
+async def run_endpoint(base_url: str, path: str, concurrency: int, duration: float) -> EndpointResult:
+    result = EndpointResult(path)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        # One warm-up request so connection setup and first-hit caches don't skew the run
+        await client.get(path)
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*(_client_loop(client, result, deadline) for _ in range(concurrency)))
+        result.elapsed = time.perf_counter() - started
+    return result
+
+
+def print_report(results: list[EndpointResult], workers: int) -> None:
+    print(f"\n{'endpoint':<45} {'req/s':>9} {'req/s/worker':>13} {'p50 ms':>8} {'p95 ms':>8} {'errors':>7}")
+    print("-" * 95)
+    for result in results:
+        rps = result.requests_per_second()
+        print(f"{result.path:<45} {rps:>9.1f} {rps / workers:>13.1f} {result.percentile(50) * 1000:>8.1f} {result.percentile(95) * 1000:>8.1f} {result.errors:>7}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the animal endpoints")
+    parser.add_argument("--base-url", default="http://localhost:8080")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent keep-alive clients per endpoint")
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds to drive each endpoint")
+    parser.add_argument("--workers", type=int, default=None, help="Worker count of the server under test (default: this machine's launch profile)")
+    parser.add_argument("--endpoint", action="append", dest="endpoints", help="Endpoint path to test (repeatable; default: the main animal endpoints)")
+    args = parser.parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    workers = args.workers or load_profile().workers
+    print(f"Load testing {args.base_url}: {args.concurrency} clients x {args.duration:.0f}s per endpoint, {workers} worker(s)")
+
+    results = []
+    for path in args.endpoints or ENDPOINTS:
+        results.append(await run_endpoint(args.base_url, path, args.concurrency, args.duration))
+        print(f"  {path}: {results[-1].requests_per_second():.1f} req/s")
+
+    print_report(results, workers)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
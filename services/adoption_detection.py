@@ -20,6 +20,8 @@ from typing import Any
 
 from firecrawl import FirecrawlApp
 
+from services.animal_statistics import tracked_update
+
 
 @dataclass
 class AdoptionCheckResult:
@@ -304,14 +306,6 @@ Be very careful: death, deletion, or disappearance is NOT adoption!""",
 
             if not dry_run and not result.error:
                 # Update the database with results
-                update_query = """
-                    UPDATE animals
-                    SET status = %s,
-                        adoption_checked_at = %s,
-                        adoption_check_data = %s
-                    WHERE id = %s
-                """
-
                 adoption_data = {
                     "evidence": result.evidence,
                     "confidence": result.confidence,
@@ -320,14 +314,11 @@ Be very careful: death, deletion, or disappearance is NOT adoption!""",
                     "error": result.error if result.error else None,
                 }
 
-                cursor.execute(
-                    update_query,
-                    (
-                        result.detected_status,
-                        result.checked_at,
-                        json.dumps(adoption_data),
-                        dog.id,
-                    ),
+                tracked_update(
+                    cursor,
+                    dog.id,
+                    "status = %s, adoption_checked_at = %s, adoption_check_data = %s",
+                    (result.detected_status, result.checked_at, json.dumps(adoption_data)),
                 )
 
                 self.logger.info(f"Updated {dog.name}: {result.previous_status} → {result.detected_status} (confidence: {result.confidence:.2f})")
@@ -4,16 +4,72 @@ Extracted from DatabaseService._create_animal_with_connection to enable
 independent testing and separation of concerns.
 """
 
+import hashlib
 import json
-import logging
-import time
 from dataclasses import dataclass
 from typing import Any
 
-from utils.slug_generator import generate_unique_animal_slug
+from utils.language_detection import detect_language
+from utils.slug_generator import ensure_unique_slugs, generate_animal_slug
 from utils.standardization import parse_age_text, standardize_breed, standardize_size_value
 
-logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class StandardizedFields:
+    """Breed, age and size columns as standardized for one animal."""
+
+    standardized_breed: str | None
+    breed_group: str | None
+    age_min_months: int | None
+    age_max_months: int | None
+    standardized_size: str | None
+
+
+# Keys BaseScraper.process_animal always sets from
+# UnifiedStandardizer.apply_full_standardization. A record carrying all of
+# them has been standardized and is saved as it is.
+PIPELINE_STANDARDIZED_KEYS = ("standardized_breed", "breed_category", "age_min_months", "age_max_months", "standardized_size")
+
+
+def standardized_fields(animal_data: dict[str, Any]) -> StandardizedFields:
+    """Standardized breed, age and size of an animal, standardizing at most once.
+
+    Records from the scraper pipeline already hold these values and are read
+    as they are. Anything else (a scraper with unified standardization
+    switched off, a record whose standardization failed, management code
+    writing directly) goes through the utils.standardization wrappers, with
+    any value the record does carry taking precedence.
+
+    Args:
+        animal_data: Animal data as it is passed to the save path
+
+    Returns:
+        StandardizedFields for the INSERT or UPDATE
+    """
+    if all(key in animal_data for key in PIPELINE_STANDARDIZED_KEYS):
+        return StandardizedFields(
+            standardized_breed=animal_data["standardized_breed"],
+            breed_group=animal_data["breed_category"],
+            age_min_months=animal_data["age_min_months"],
+            age_max_months=animal_data["age_max_months"],
+            standardized_size=animal_data["standardized_size"],
+        )
+
+    standardized_breed, breed_group, size_estimate = standardize_breed(animal_data.get("breed") or "")
+
+    if "age_min_months" in animal_data and "age_max_months" in animal_data:
+        age_months_min = animal_data.get("age_min_months")
+        age_months_max = animal_data.get("age_max_months")
+    else:
+        _, age_months_min, age_months_max = parse_age_text(animal_data.get("age_text", ""))
+
+    return StandardizedFields(
+        standardized_breed=animal_data.get("standardized_breed") or standardized_breed,
+        breed_group=animal_data.get("breed_category") or breed_group,
+        age_min_months=age_months_min,
+        age_max_months=age_months_max,
+        standardized_size=animal_data.get("standardized_size") or size_estimate or standardize_size_value(animal_data.get("size")),
+    )
 
 
 @dataclass(frozen=True)
@@ -35,43 +91,37 @@ class PreparedAnimalData:
     breed_confidence: float | None
 
 
-def prepare_animal_data(animal_data: dict[str, Any]) -> PreparedAnimalData:
-    """Standardize breed, age, size, and language from raw animal data.
+def language_text(animal_data: dict[str, Any]) -> str:
+    """The text an animal's language is detected from."""
+    # `or ''` throughout: a NULL column arrives present-and-None, so a get()
+    # default never fires and the literal "None" would be fed to the detector.
+    return f"{animal_data.get('name') or ''} {animal_data.get('breed') or ''} {animal_data.get('age_text') or ''}"
+
+
+def prepare_animal_data(animal_data: dict[str, Any], detected_language: str | None = None) -> PreparedAnimalData:
+    """Settle the language of raw animal data and collect its standardized fields.
 
     Args:
         animal_data: Raw animal data dictionary from scraper
+        detected_language: Language already detected from language_text(), for callers detecting a batch at once
 
     Returns:
         PreparedAnimalData with all fields ready for INSERT
     """
-    # `or ''` throughout: a NULL column arrives present-and-None, so a get()
-    # default never fires and the literal "None" would be fed to langdetect.
-    description_text = f"{animal_data.get('name') or ''} {animal_data.get('breed') or ''} {animal_data.get('age_text') or ''}"
-    language = _detect_language(description_text)
+    # A language the scraper or the organization's config states is never second-guessed
+    language = animal_data.get("language") or detected_language or detect_language(language_text(animal_data))
 
-    standardized_breed, breed_group, size_estimate = standardize_breed(animal_data.get("breed") or "")
-
-    if "age_min_months" in animal_data and "age_max_months" in animal_data:
-        age_months_min = animal_data.get("age_min_months")
-        age_months_max = animal_data.get("age_max_months")
-    else:
-        _, age_months_min, age_months_max = parse_age_text(animal_data.get("age_text", ""))
-
-    final_size = animal_data.get("size") or animal_data.get("standardized_size")
-    final_standardized_size = animal_data.get("standardized_size") or size_estimate or standardize_size_value(animal_data.get("size"))
-
-    final_standardized_breed = animal_data.get("standardized_breed") or standardized_breed
-    final_breed_group = animal_data.get("breed_category") or breed_group
+    standardized = standardized_fields(animal_data)
 
     return PreparedAnimalData(
         language=language,
         breed_raw=animal_data.get("breed_raw") or animal_data.get("breed"),
-        standardized_breed=final_standardized_breed,
-        breed_group=final_breed_group,
-        final_size=final_size,
-        final_standardized_size=final_standardized_size,
-        age_months_min=age_months_min,
-        age_months_max=age_months_max,
+        standardized_breed=standardized.standardized_breed,
+        breed_group=standardized.breed_group,
+        final_size=animal_data.get("size") or animal_data.get("standardized_size"),
+        final_standardized_size=standardized.standardized_size,
+        age_months_min=standardized.age_min_months,
+        age_months_max=standardized.age_max_months,
         breed_type=animal_data.get("breed_type"),
         primary_breed=animal_data.get("primary_breed"),
         secondary_breed=animal_data.get("secondary_breed"),
@@ -80,62 +130,221 @@ def prepare_animal_data(animal_data: dict[str, Any]) -> PreparedAnimalData:
     )
 
 
-def generate_temp_slug(animal_data: dict[str, Any], standardized_breed: str, conn: Any) -> str:
-    """Generate temporary slug before animal ID is available.
+# Stored columns an update is compared against, in the order
+# prepare_animal_update expects the current row.
+CURRENT_ROW_COLUMNS = (
+    "name",
+    "breed",
+    "age_text",
+    "sex",
+    "primary_image_url",
+    "status",
+    "standardized_breed",
+    "age_min_months",
+    "age_max_months",
+    "standardized_size",
+    "properties",
+    "breed_type",
+    "primary_breed",
+    "secondary_breed",
+    "breed_slug",
+    "breed_confidence",
+    "breed_raw",
+)
+
+
+# Scraped fields that decide whether a stored animal needs updating: the
+# inputs of every column prepare_animal_update compares.
+FINGERPRINT_FIELDS = (
+    "name",
+    "breed",
+    "breed_raw",
+    "standardized_breed",
+    "breed_category",
+    "age_text",
+    "age_min_months",
+    "age_max_months",
+    "sex",
+    "primary_image_url",
+    "status",
+    "size",
+    "standardized_size",
+    "properties",
+    "breed_type",
+    "primary_breed",
+    "secondary_breed",
+    "breed_slug",
+    "breed_confidence",
+)
+
+# Part of every fingerprint. Bump it when standardization starts deriving
+# different columns from the same scraped fields, so each stored animal is
+# compared column by column once more.
+FINGERPRINT_VERSION = 1
+
+
+def content_fingerprint(animal_data: dict[str, Any]) -> str:
+    """Hash of the scraped fields an update depends on, stored as animals.content_hash.
+
+    Two scrapes of a dog with the same fingerprint produce the same row, so
+    the save path can report "no_change" without reading the row or running
+    standardization.
 
     Args:
-        animal_data: Raw animal data
-        standardized_breed: Standardized breed name
-        conn: Database connection for uniqueness check
+        animal_data: Animal data as it is passed to the save path
 
     Returns:
-        Temporary slug ending with '-temp'
+        Hex SHA-256 digest
     """
+    fields = {field: animal_data.get(field) for field in FINGERPRINT_FIELDS}
+    fields["properties"] = sanitize_for_postgres(fields["properties"]) if fields["properties"] else None
+    payload = json.dumps([FINGERPRINT_VERSION, fields], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+# Columns an update writes, in the order of prepare_animal_update's values.
+UPDATE_COLUMNS = (
+    "name",
+    "breed",
+    "breed_raw",
+    "standardized_breed",
+    "breed_group",
+    "age_text",
+    "age_min_months",
+    "age_max_months",
+    "sex",
+    "primary_image_url",
+    "original_image_url",
+    "status",
+    "size",
+    "standardized_size",
+    "properties",
+    "active",
+    "breed_type",
+    "primary_breed",
+    "secondary_breed",
+    "breed_slug",
+    "breed_confidence",
+    "content_hash",
+)
+
+
+def _as_float(value: object) -> float | None:
+    """Compare confidences numerically; the column used to hold text."""
+    if value is None:
+        return None
     try:
-        temp_slug = generate_unique_animal_slug(
-            name=animal_data.get("name"),
-            breed=animal_data.get("breed"),
-            standardized_breed=standardized_breed,
-            animal_id=None,
-            connection=conn,
-        )
-        return f"{temp_slug}-temp"
-    except Exception as e:
-        logger.error(f"Failed to generate temp slug for animal: {e}")
-        fallback_slug = f"animal-{animal_data.get('external_id', str(int(time.time())))}-temp"
-        return fallback_slug[:250]
-
-
-def update_to_final_slug(
-    cursor: Any,
-    animal_id: int,
-    animal_data: dict[str, Any],
-    standardized_breed: str,
-    conn: Any,
-    log: logging.Logger,
-) -> None:
-    """Update animal with final slug containing ID.
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def prepare_animal_update(animal_data: dict[str, Any], current_row: tuple) -> tuple[bool, dict[str, Any]]:
+    """Compute the column values an update writes and whether any differs from the stored row.
+
+    Args:
+        animal_data: Raw animal data from the scraper
+        current_row: Stored values in CURRENT_ROW_COLUMNS order
+
+    Returns:
+        Tuple of (has_changes, values) where values maps column name to new value
+    """
+    current = dict(zip(CURRENT_ROW_COLUMNS, current_row))
+
+    # Process the properties (sanitize to remove null bytes that PostgreSQL rejects)
+    current_properties_json = json.dumps(sanitize_for_postgres(current["properties"]), sort_keys=True) if current["properties"] else None
+    new_properties_json = json.dumps(sanitize_for_postgres(animal_data.get("properties")), sort_keys=True) if animal_data.get("properties") else None
+
+    standardized = standardized_fields(animal_data)
+
+    incoming_status = animal_data.get("status", "available")
+    values = {
+        "name": animal_data.get("name"),
+        "breed": animal_data.get("breed"),
+        "breed_raw": animal_data.get("breed_raw") or animal_data.get("breed"),
+        "standardized_breed": standardized.standardized_breed,
+        "breed_group": standardized.breed_group,
+        "age_text": animal_data.get("age_text"),
+        "age_min_months": standardized.age_min_months,
+        "age_max_months": standardized.age_max_months,
+        "sex": animal_data.get("sex"),
+        "primary_image_url": animal_data.get("primary_image_url"),
+        "original_image_url": animal_data.get("original_image_url"),
+        "status": incoming_status,
+        # Use size estimate if no size provided
+        "size": animal_data.get("size") or animal_data.get("standardized_size"),
+        "standardized_size": standardized.standardized_size,
+        "properties": new_properties_json,
+        "active": incoming_status == "available",
+        # Breed enhancement fields from UnifiedStandardizer
+        "breed_type": animal_data.get("breed_type"),
+        "primary_breed": animal_data.get("primary_breed"),
+        "secondary_breed": animal_data.get("secondary_breed"),
+        "breed_slug": animal_data.get("breed_slug"),
+        "breed_confidence": animal_data.get("breed_confidence"),
+        "content_hash": content_fingerprint(animal_data),
+    }
+
+    # The status comparison uses the raw value: a missing status counts as a change
+    has_changes = (
+        values["name"] != current["name"]
+        or values["breed"] != current["breed"]
+        or values["age_text"] != current["age_text"]
+        or values["sex"] != current["sex"]
+        or values["primary_image_url"] != current["primary_image_url"]
+        or animal_data.get("status") != current["status"]
+        or new_properties_json != current_properties_json
+        or values["standardized_breed"] != current["standardized_breed"]
+        or values["age_min_months"] != current["age_min_months"]
+        or values["age_max_months"] != current["age_max_months"]
+        or values["standardized_size"] != current["standardized_size"]
+        or values["breed_type"] != current["breed_type"]
+        or values["primary_breed"] != current["primary_breed"]
+        or values["secondary_breed"] != current["secondary_breed"]
+        or values["breed_slug"] != current["breed_slug"]
+        or _as_float(values["breed_confidence"]) != _as_float(current["breed_confidence"])
+        or values["breed_raw"] != current["breed_raw"]
+    )
+    return has_changes, values
+
+
+def reserve_animal_ids(cursor: Any, count: int) -> list[int]:
+    """Draw IDs for new animals from the animals.id sequence in one query.
+
+    Knowing the ID before the INSERT lets the final name-breed-id slug be
+    written with the row, rather than a temporary slug rewritten afterwards.
 
     Args:
         cursor: Database cursor
-        animal_id: Newly created animal ID
-        animal_data: Raw animal data
-        standardized_breed: Standardized breed name
-        conn: Database connection for uniqueness check
-        log: Logger instance
+        count: Number of IDs to reserve
+
+    Returns:
+        Reserved IDs, in sequence order
     """
-    try:
-        final_slug = generate_unique_animal_slug(
+    cursor.execute("SELECT nextval(pg_get_serial_sequence('animals', 'id')) FROM generate_series(1, %s)", (count,))
+    return [row[0] for row in cursor.fetchall()]
+
+
+def generate_final_slugs(animals: list[tuple[int, dict[str, Any], str]], conn: Any) -> list[str]:
+    """Generate unique name-breed-id slugs for animals with reserved IDs.
+
+    Args:
+        animals: (animal_id, raw animal data, standardized breed) per animal
+        conn: Database connection for the uniqueness check
+
+    Returns:
+        One slug per animal, in order
+    """
+    base_slugs = [
+        generate_animal_slug(
             name=animal_data.get("name"),
             breed=animal_data.get("breed"),
             standardized_breed=standardized_breed,
             animal_id=animal_id,
-            connection=conn,
         )
-        cursor.execute("UPDATE animals SET slug = %s WHERE id = %s", (final_slug, animal_id))
-        log.debug(f"Updated animal {animal_id} slug from temp to final: {final_slug}")
-    except Exception as e:
-        log.error(f"Failed to update final slug for animal {animal_id}: {e}")
+        for animal_id, animal_data, standardized_breed in animals
+    ]
+    return ensure_unique_slugs(base_slugs, conn)
 
 
 def sanitize_properties(properties: dict | None) -> str | None:
@@ -161,17 +370,3 @@ def sanitize_for_postgres(value: Any) -> Any:
     if isinstance(value, list):
         return [sanitize_for_postgres(item) for item in value]
     return value
-
-
-def _detect_language(text: str) -> str:
-    """Detect language of text, defaulting to English."""
-    try:
-        from langdetect import DetectorFactory, detect
-
-        DetectorFactory.seed = 0
-        if not text or len(text.strip()) < 10:
-            return "en"
-        return detect(text)
-    except Exception as e:
-        logger.warning(f"Language detection failed, defaulting to English: {e}")
-        return "en"
@@ -0,0 +1,165 @@
+"""
+Per-organization animal counters behind /statistics and /stats/by-country.
+
+Both endpoints used to aggregate the whole animals table on every request.
+The counts only move when an animal row is written, so each write path keeps
+the animal_statistics row of its organization current instead, and the
+endpoints read one small row per organization.
+
+A set-based write is tracked by subtracting the contribution of the rows it
+touches, running the write, then adding their contribution back. A single-row
+update instead runs as one statement that compares the row before and after
+and touches the counters only when its contribution changed, which most
+updates (a dog seen again, a changed description) leave alone. Either way the
+counters move in the caller's transaction, so a rolled-back write leaves them
+untouched.
+Writes that bypass these helpers (manual SQL, Railway sync, emergency
+operations) drift the counters until reconcile_statistics recounts them; the
+scraper cron does that after every batch. new_this_week also ages out only at
+reconciliation, since nothing is written when a dog turns eight days old.
+"""
+
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+# An animal counts towards the public totals under the same rule the listing uses.
+AVAILABLE = "status = 'available' AND active = true AND availability_confidence IN ('high', 'medium')"
+NEW_THIS_WEEK = f"{AVAILABLE} AND created_at >= NOW() - INTERVAL '7 days'"
+ACTIVE_DOG = "active = true AND animal_type = 'dog'"
+
+_APPLY_DELTA_SQL = """
+    INSERT INTO animal_statistics (organization_id, available_count, new_this_week, active_dog_count, updated_at)
+    SELECT organization_id,
+           {sign} * COUNT(*) FILTER (WHERE {available}),
+           {sign} * COUNT(*) FILTER (WHERE {new_this_week}),
+           {sign} * COUNT(*) FILTER (WHERE {active_dog}),
+           NOW()
+    FROM animals
+    WHERE {where}
+    GROUP BY organization_id
+    ON CONFLICT (organization_id) DO UPDATE SET
+        available_count = animal_statistics.available_count + EXCLUDED.available_count,
+        new_this_week = animal_statistics.new_this_week + EXCLUDED.new_this_week,
+        active_dog_count = animal_statistics.active_dog_count + EXCLUDED.active_dog_count,
+        updated_at = EXCLUDED.updated_at
+"""
+
+# The FROM subquery reads the row as it was before the SET, so RETURNING can
+# compare the old contribution with the new one.
+_TRACKED_UPDATE_SQL = """
+    WITH changed AS (
+        UPDATE animals
+        SET {assignments}
+        FROM (
+            SELECT id AS old_id,
+                   ({available})::int AS old_available,
+                   ({new_this_week})::int AS old_new_this_week,
+                   ({active_dog})::int AS old_active_dog
+            FROM animals
+            WHERE id = %s
+            FOR UPDATE
+        ) old
+        WHERE animals.id = old.old_id
+        RETURNING animals.organization_id,
+                  ({available})::int - old.old_available AS available_count,
+                  ({new_this_week})::int - old.old_new_this_week AS new_this_week,
+                  ({active_dog})::int - old.old_active_dog AS active_dog_count
+    )
+    INSERT INTO animal_statistics (organization_id, available_count, new_this_week, active_dog_count, updated_at)
+    SELECT organization_id, available_count, new_this_week, active_dog_count, NOW()
+    FROM changed
+    WHERE (available_count, new_this_week, active_dog_count) <> (0, 0, 0)
+    ON CONFLICT (organization_id) DO UPDATE SET
+        available_count = animal_statistics.available_count + EXCLUDED.available_count,
+        new_this_week = animal_statistics.new_this_week + EXCLUDED.new_this_week,
+        active_dog_count = animal_statistics.active_dog_count + EXCLUDED.active_dog_count,
+        updated_at = EXCLUDED.updated_at
+"""
+
+# Only organizations whose stored counters differ from a fresh count are
+# written, so the row count of this statement is the drift it corrected.
+RECONCILE_SQL = f"""
+    WITH counted AS (
+        SELECT organization_id,
+               COUNT(*) FILTER (WHERE {AVAILABLE}) AS available_count,
+               COUNT(*) FILTER (WHERE {NEW_THIS_WEEK}) AS new_this_week,
+               COUNT(*) FILTER (WHERE {ACTIVE_DOG}) AS active_dog_count
+        FROM animals
+        GROUP BY organization_id
+    ),
+    fresh AS (
+        SELECT o.id AS organization_id,
+               COALESCE(c.available_count, 0) AS available_count,
+               COALESCE(c.new_this_week, 0) AS new_this_week,
+               COALESCE(c.active_dog_count, 0) AS active_dog_count
+        FROM organizations o
+        LEFT JOIN counted c ON c.organization_id = o.id
+    )
+    INSERT INTO animal_statistics (organization_id, available_count, new_this_week, active_dog_count, updated_at, reconciled_at)
+    SELECT f.organization_id, f.available_count, f.new_this_week, f.active_dog_count, NOW(), NOW()
+    FROM fresh f
+    LEFT JOIN animal_statistics s ON s.organization_id = f.organization_id
+    WHERE s.organization_id IS NULL
+       OR (s.available_count, s.new_this_week, s.active_dog_count) IS DISTINCT FROM (f.available_count, f.new_this_week, f.active_dog_count)
+    ON CONFLICT (organization_id) DO UPDATE SET
+        available_count = EXCLUDED.available_count,
+        new_this_week = EXCLUDED.new_this_week,
+        active_dog_count = EXCLUDED.active_dog_count,
+        updated_at = EXCLUDED.updated_at,
+        reconciled_at = EXCLUDED.reconciled_at
+"""
+
+
+def _apply_delta(cursor: Any, where: str, params: Sequence[Any], sign: int) -> None:
+    sql = _APPLY_DELTA_SQL.format(sign=int(sign), available=AVAILABLE, new_this_week=NEW_THIS_WEEK, active_dog=ACTIVE_DOG, where=where)
+    cursor.execute(sql, tuple(params))
+
+
+def record_created(cursor: Any, animal_id: int) -> None:
+    """Add a freshly inserted animal to its organization's counters."""
+    _apply_delta(cursor, "id = %s", (animal_id,), 1)
+
+
+def tracked_update(cursor: Any, animal_id: int, assignments: str, params: Sequence[Any]) -> None:
+    """
+    Run ``UPDATE animals SET <assignments> WHERE id = animal_id`` and keep the
+    counters in step, in a single statement.
+
+    ``params`` fill the placeholders in ``assignments``. The organization's
+    counters are only written when the update moves the animal in or out of a
+    count, so a write that leaves status, active, availability_confidence and
+    animal_type alone costs no more than the bare UPDATE.
+    """
+    sql = _TRACKED_UPDATE_SQL.format(assignments=assignments, available=AVAILABLE, new_this_week=NEW_THIS_WEEK, active_dog=ACTIVE_DOG)
+    cursor.execute(sql, (*params, animal_id))
+
+
+@contextmanager
+def tracked_write(cursor: Any, where: str, params: Sequence[Any]) -> Iterator[None]:
+    """
+    Keep the counters in step with a set-based write to the rows matching ``where``.
+
+    ``where`` must select the same rows before and after the write. A superset
+    is fine - untouched rows are subtracted and added back unchanged - but a
+    predicate the write itself falsifies (e.g. ``status <> 'unknown'`` around
+    an update to 'unknown') would drop those rows from the counts.
+
+    If the write raises, nothing is added back; the caller's rollback discards
+    the subtraction along with the write.
+    """
+    _apply_delta(cursor, where, params, -1)
+    yield
+    _apply_delta(cursor, where, params, 1)
+
+
+def reconcile_statistics(cursor: Any) -> int:
+    """
+    Recount every organization and overwrite counters that have drifted.
+
+    Returns:
+        Number of organizations whose counters were corrected or created.
+        The caller commits.
+    """
+    cursor.execute(RECONCILE_SQL)
+    return cursor.rowcount
@@ -9,6 +9,7 @@ Provides thread-safe connection pool management following CLAUDE.md principles:
 """
 
 import logging
+import threading
 from contextlib import contextmanager
 from dataclasses import dataclass
 
@@ -16,6 +17,10 @@ import psycopg2
 import psycopg2.extensions
 import psycopg2.pool
 
+# Connections one running scrape can hold at once: its DatabaseService and
+# SessionManager each check out one per operation, plus one spare
+CONNECTIONS_PER_SCRAPE = 3
+
 
 @dataclass(frozen=True)
 class PoolConfig:
@@ -170,3 +175,26 @@ class ConnectionPoolService:
         except Exception as e:
             self.logger.error(f"Failed to close pool connections: {e}")
             raise
+
+
+_scrape_pool: ConnectionPoolService | None = None
+_scrape_pool_lock = threading.Lock()
+
+
+def scrape_pool_size(max_concurrency: int) -> int:
+    """Connections the shared scrape pool may open for this many concurrent scrapes."""
+    return CONNECTIONS_PER_SCRAPE * max(1, max_concurrency)
+
+
+def get_scrape_connection_pool(db_config: dict[str, str], max_concurrency: int) -> ConnectionPoolService:
+    """The process's connection pool shared by every scrape it runs.
+
+    Created on first use and sized for max_concurrency scrapes, so a batch
+    of concurrent scrapes holds a bounded number of connections however many
+    organizations it works through.
+    """
+    global _scrape_pool
+    with _scrape_pool_lock:
+        if _scrape_pool is None:
+            _scrape_pool = ConnectionPoolService(db_config, min_connections=2, max_connections=max(2, scrape_pool_size(max_concurrency)))
+        return _scrape_pool
@@ -16,30 +16,173 @@ Following CLAUDE.md principles:
 
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 
 import psycopg2
+from psycopg2.extras import execute_values
 
 from services.animal_data_preparation import (
-    generate_temp_slug,
+    CURRENT_ROW_COLUMNS,
+    UPDATE_COLUMNS,
+    PreparedAnimalData,
+    content_fingerprint,
+    generate_final_slugs,
+    language_text,
     prepare_animal_data,
-    sanitize_for_postgres,
+    prepare_animal_update,
+    reserve_animal_ids,
     sanitize_properties,
-    update_to_final_slug,
 )
+from services.animal_statistics import record_created, tracked_update, tracked_write
+from utils.language_detection import get_language_detector
+from utils.metadata_dictionary import publish_metadata
 from utils.slug_generator import fetch_slugs_by_ids
-from utils.standardization import parse_age_text, standardize_breed, standardize_size_value
 
+# Columns a new animal is inserted with, in the order of _insert_values.
+INSERT_COLUMNS = (
+    "id",
+    "name",
+    "organization_id",
+    "animal_type",
+    "external_id",
+    "primary_image_url",
+    "original_image_url",
+    "adoption_url",
+    "status",
+    "breed",
+    "breed_raw",
+    "standardized_breed",
+    "breed_group",
+    "age_text",
+    "age_min_months",
+    "age_max_months",
+    "sex",
+    "size",
+    "standardized_size",
+    "language",
+    "properties",
+    "slug",
+    "created_at",
+    "updated_at",
+    "last_scraped_at",
+    "last_seen_at",
+    "consecutive_scrapes_missing",
+    "availability_confidence",
+    "active",
+    "breed_type",
+    "primary_breed",
+    "secondary_breed",
+    "breed_slug",
+    "breed_confidence",
+    "content_hash",
+)
+
+# Animals written per transaction by upsert_animals
+UPSERT_CHUNK_SIZE = 100
+
+# New animals of a chunk. A row that appeared since the chunk's lookup is
+# updated instead, as update_animal would have.
+_BULK_INSERT_SQL = f"""
+    INSERT INTO animals ({", ".join(INSERT_COLUMNS)}) VALUES %s
+    ON CONFLICT (external_id, organization_id) DO UPDATE SET
+        {", ".join(f"{column} = EXCLUDED.{column}" for column in UPDATE_COLUMNS if column != "active")},
+        active = EXCLUDED.status = 'available',
+        updated_at = EXCLUDED.updated_at, last_scraped_at = EXCLUDED.last_scraped_at, last_seen_at = EXCLUDED.last_seen_at,
+        consecutive_scrapes_missing = 0, availability_confidence = 'high'
+    RETURNING id, external_id, (xmax = 0) AS inserted
+"""
+
+# VALUES rows carry no column types, so everything that isn't text is cast.
+_UPDATE_COLUMN_TYPES = {"age_min_months": "integer", "age_max_months": "integer", "properties": "jsonb", "active": "boolean", "breed_confidence": "numeric"}
+
+# Changed existing animals of a chunk, one row per animal: id, UPDATE_COLUMNS, scraped-at time.
+_BULK_UPDATE_SQL = f"""
+    UPDATE animals AS a SET
+        {", ".join(f"{column} = v.{column}" for column in UPDATE_COLUMNS)},
+        updated_at = v.scraped_at, last_scraped_at = v.scraped_at, last_seen_at = v.scraped_at,
+        consecutive_scrapes_missing = 0, availability_confidence = 'high'
+    FROM (VALUES %s) AS v(id, {", ".join(UPDATE_COLUMNS)}, scraped_at)
+    WHERE a.id = v.id
+"""
+_BULK_UPDATE_CASTS = ", ".join("%s::" + _UPDATE_COLUMN_TYPES.get(column, "text") for column in UPDATE_COLUMNS)
+_BULK_UPDATE_TEMPLATE = f"(%s::integer, {_BULK_UPDATE_CASTS}, %s::timestamp)"
+
+# Unchanged animals stored before content_hash existed (or after another
+# writer cleared it) get their fingerprint without touching updated_at.
+_BULK_REHASH_SQL = """
+    UPDATE animals AS a SET content_hash = v.content_hash
+    FROM (VALUES %s) AS v(id, content_hash)
+    WHERE a.id = v.id
+"""
 
-def _as_float(value: object) -> float | None:
-    """Compare confidences numerically; the column used to hold text."""
-    if value is None:
-        return None
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return None
+# Listing hash each animal's detail page was last fetched for, and when (FilteringService)
+_LISTING_HASH_SQL = """
+    UPDATE animals AS a SET listing_hash = v.listing_hash, detail_checked_at = v.checked_at
+    FROM (VALUES %s) AS v(organization_id, external_id, listing_hash, checked_at)
+    WHERE a.organization_id = v.organization_id AND a.external_id = v.external_id
+"""
+
+# Likely cross-organization duplicates: id, id of the dog they duplicate. A
+# duplicate isn't profiled, so it takes the original's profile if it has one.
+_DUPLICATE_OF_SQL = """
+    UPDATE animals AS a SET duplicate_of_id = v.duplicate_of_id, dog_profiler_data = COALESCE(a.dog_profiler_data, o.dog_profiler_data)
+    FROM (VALUES %s) AS v(id, duplicate_of_id)
+    JOIN animals o ON o.id = v.duplicate_of_id
+    WHERE a.id = v.id
+"""
+
+# Validators of the detail pages a successful scrape fetched (scrapers/response_cache.py)
+_PAGE_VALIDATOR_SQL = """
+    INSERT INTO page_validators (organization_id, url, content_hash, etag, last_modified, parser_version, fetched_at) VALUES %s
+    ON CONFLICT (organization_id, url) DO UPDATE SET
+        content_hash = EXCLUDED.content_hash, etag = EXCLUDED.etag, last_modified = EXCLUDED.last_modified,
+        parser_version = EXCLUDED.parser_version, fetched_at = EXCLUDED.fetched_at
+"""
+
+# Validators of pages no scrape has fetched for this long belong to dogs that are gone
+PAGE_VALIDATOR_MAX_AGE = timedelta(days=30)
+
+
+def _insert_values(animal_data: dict[str, Any], prepared: PreparedAnimalData, animal_id: int, slug: str, current_time: datetime) -> tuple:
+    """Parameters for INSERT_COLUMNS."""
+    return (
+        animal_id,
+        animal_data.get("name"),
+        animal_data.get("organization_id"),
+        animal_data.get("animal_type", "dog"),
+        animal_data.get("external_id"),
+        animal_data.get("primary_image_url"),
+        animal_data.get("original_image_url"),
+        animal_data.get("adoption_url"),
+        animal_data.get("status", "available"),
+        animal_data.get("breed"),
+        prepared.breed_raw,
+        prepared.standardized_breed,
+        prepared.breed_group,
+        animal_data.get("age_text"),
+        prepared.age_months_min,
+        prepared.age_months_max,
+        animal_data.get("sex"),
+        prepared.final_size,
+        prepared.final_standardized_size,
+        prepared.language,
+        sanitize_properties(animal_data.get("properties")),
+        slug,
+        current_time,
+        current_time,
+        current_time,
+        current_time,
+        0,
+        "high",
+        True,
+        prepared.breed_type,
+        prepared.primary_breed,
+        prepared.secondary_breed,
+        prepared.breed_slug,
+        prepared.breed_confidence,
+        content_fingerprint(animal_data),
+    )
 
 
 class DatabaseService:
@@ -62,6 +205,9 @@ class DatabaseService:
         self.logger = logger or logging.getLogger(__name__)
         self.connection_pool = connection_pool
         self.conn = None
+        # organization_id -> {external_id: (id, content_hash, status)}, loaded
+        # once per scrape by upsert_animals
+        self._fingerprints: dict[int, dict[str, tuple[int, str, str | None]]] = {}
 
     def connect(self) -> bool:
         """Establish database connection.
@@ -188,66 +334,18 @@ class DatabaseService:
             Tuple of (animal_id, "added") if successful, (None, "error") if failed
         """
         prepared = prepare_animal_data(animal_data)
-        animal_slug = generate_temp_slug(animal_data, prepared.standardized_breed, conn)
 
         cursor = conn.cursor()
-        current_time = datetime.now()
-
+        # The ID comes first so the row is written with its final slug
+        [animal_id] = reserve_animal_ids(cursor, 1)
+        [animal_slug] = generate_final_slugs([(animal_id, animal_data, prepared.standardized_breed)], conn)
         cursor.execute(
-            """
-            INSERT INTO animals (
-                name, organization_id, animal_type, external_id,
-                primary_image_url, original_image_url, adoption_url, status,
-                breed, breed_raw, standardized_breed, breed_group, age_text, age_min_months, age_max_months,
-                sex, size, standardized_size, language, properties, slug,
-                created_at, updated_at, last_scraped_at, last_seen_at,
-                consecutive_scrapes_missing, availability_confidence, active,
-                breed_type, primary_breed, secondary_breed, breed_slug, breed_confidence
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-            )
-            RETURNING id
-            """,
-            (
-                animal_data.get("name"),
-                animal_data.get("organization_id"),
-                animal_data.get("animal_type", "dog"),
-                animal_data.get("external_id"),
-                animal_data.get("primary_image_url"),
-                animal_data.get("original_image_url"),
-                animal_data.get("adoption_url"),
-                animal_data.get("status", "available"),
-                animal_data.get("breed"),
-                prepared.breed_raw,
-                prepared.standardized_breed,
-                prepared.breed_group,
-                animal_data.get("age_text"),
-                prepared.age_months_min,
-                prepared.age_months_max,
-                animal_data.get("sex"),
-                prepared.final_size,
-                prepared.final_standardized_size,
-                prepared.language,
-                sanitize_properties(animal_data.get("properties")),
-                animal_slug,
-                current_time,
-                current_time,
-                current_time,
-                current_time,
-                0,
-                "high",
-                True,
-                prepared.breed_type,
-                prepared.primary_breed,
-                prepared.secondary_breed,
-                prepared.breed_slug,
-                prepared.breed_confidence,
-            ),
+            f"INSERT INTO animals ({', '.join(INSERT_COLUMNS)}) VALUES ({', '.join(['%s'] * len(INSERT_COLUMNS))}) RETURNING id",
+            _insert_values(animal_data, prepared, animal_id, animal_slug, datetime.now()),
         )
 
         animal_id = cursor.fetchone()[0]
-        update_to_final_slug(cursor, animal_id, animal_data, prepared.standardized_breed, conn, self.logger)
+        record_created(cursor, animal_id)
 
         conn.commit()
         cursor.close()
@@ -275,142 +373,27 @@ class DatabaseService:
             cursor = self.conn.cursor()
 
             # Get current animal data to check for changes
-            cursor.execute(
-                """
-                SELECT name, breed, age_text, sex, primary_image_url, status,
-                       standardized_breed, age_min_months, age_max_months, standardized_size, properties,
-                       breed_type, primary_breed, secondary_breed, breed_slug, breed_confidence,
-                       breed_raw
-                FROM animals WHERE id = %s
-                """,
-                (animal_id,),
-            )
+            cursor.execute(f"SELECT {', '.join(CURRENT_ROW_COLUMNS)} FROM animals WHERE id = %s", (animal_id,))
             current_data = cursor.fetchone()
 
             if not current_data:
                 cursor.close()
                 return None, "error"
 
-            (
-                current_name,
-                current_breed,
-                current_age,
-                current_sex,
-                current_image,
-                current_status,
-                current_standardized_breed,
-                current_age_min_months,
-                current_age_max_months,
-                current_standardized_size,
-                current_properties,
-                current_breed_type,
-                current_primary_breed,
-                current_secondary_breed,
-                current_breed_slug,
-                current_breed_confidence,
-                current_breed_raw,
-            ) = current_data
-
-            # Process the properties (sanitize to remove null bytes that PostgreSQL rejects)
-            current_properties_json = json.dumps(sanitize_for_postgres(current_properties), sort_keys=True) if current_properties else None
-            new_properties_json = json.dumps(sanitize_for_postgres(animal_data.get("properties")), sort_keys=True) if animal_data.get("properties") else None
-
-            # Apply standardization for new values - KEEP OLD LOGIC FOR BACKWARDS COMPATIBILITY
-            new_standardized_breed, new_breed_group, size_estimate = standardize_breed(animal_data.get("breed") or "")
-
-            # Use pre-calculated age values if available
-            if "age_min_months" in animal_data and "age_max_months" in animal_data:
-                new_age_min_months = animal_data.get("age_min_months")
-                new_age_max_months = animal_data.get("age_max_months")
-            else:
-                _, new_age_min_months, new_age_max_months = parse_age_text(animal_data.get("age_text", ""))
-
-            # Use size estimate if no size provided
-            new_final_size = animal_data.get("size") or animal_data.get("standardized_size")
-            new_final_standardized_size = animal_data.get("standardized_size") or size_estimate or standardize_size_value(animal_data.get("size"))
-
-            # NEW: Use unified standardization fields if available, fall back to old logic
-            final_standardized_breed = animal_data.get("standardized_breed") or new_standardized_breed
-            final_breed_group = animal_data.get("breed_category") or new_breed_group
-
-            # NEW breed enhancement fields from UnifiedStandardizer
-            new_breed_type = animal_data.get("breed_type")
-            new_primary_breed = animal_data.get("primary_breed")
-            new_secondary_breed = animal_data.get("secondary_breed")
-            new_breed_slug = animal_data.get("breed_slug")
-            new_breed_confidence = animal_data.get("breed_confidence")
-            new_breed_raw = animal_data.get("breed_raw") or animal_data.get("breed")
-
-            # Check if there are actual changes
-            has_changes = (
-                animal_data.get("name") != current_name
-                or animal_data.get("breed") != current_breed
-                or animal_data.get("age_text") != current_age
-                or animal_data.get("sex") != current_sex
-                or animal_data.get("primary_image_url") != current_image
-                or animal_data.get("status") != current_status
-                or new_properties_json != current_properties_json
-                or final_standardized_breed != current_standardized_breed
-                or new_age_min_months != current_age_min_months
-                or new_age_max_months != current_age_max_months
-                or new_final_standardized_size != current_standardized_size
-                or new_breed_type != current_breed_type
-                or new_primary_breed != current_primary_breed
-                or new_secondary_breed != current_secondary_breed
-                or new_breed_slug != current_breed_slug
-                or _as_float(new_breed_confidence) != _as_float(current_breed_confidence)
-                or new_breed_raw != current_breed_raw
-            )
-
+            has_changes, values = prepare_animal_update(animal_data, current_data)
             if not has_changes:
                 cursor.close()
                 return animal_id, "no_change"
 
             # Update the animal
             current_time = datetime.now()
-            incoming_status = animal_data.get("status", "available")
-            should_activate = incoming_status == "available"
-            cursor.execute(
-                """
-                UPDATE animals
-                SET name = %s, breed = %s, breed_raw = %s, standardized_breed = %s, breed_group = %s,
-                    age_text = %s, age_min_months = %s, age_max_months = %s, sex = %s,
-                    primary_image_url = %s, original_image_url = %s, status = %s,
-                    size = %s, standardized_size = %s, properties = %s,
+            tracked_update(
+                cursor,
+                animal_id,
+                f"""{", ".join(f"{column} = %s" for column in UPDATE_COLUMNS)},
                     updated_at = %s, last_scraped_at = %s, last_seen_at = %s,
-                    consecutive_scrapes_missing = 0, availability_confidence = 'high',
-                    active = %s,
-                    breed_type = %s, primary_breed = %s, secondary_breed = %s,
-                    breed_slug = %s, breed_confidence = %s
-                WHERE id = %s
-                """,
-                (
-                    animal_data.get("name"),
-                    animal_data.get("breed"),
-                    new_breed_raw,
-                    final_standardized_breed,
-                    final_breed_group,
-                    animal_data.get("age_text"),
-                    new_age_min_months,
-                    new_age_max_months,
-                    animal_data.get("sex"),
-                    animal_data.get("primary_image_url"),
-                    animal_data.get("original_image_url"),
-                    incoming_status,
-                    new_final_size,
-                    new_final_standardized_size,
-                    new_properties_json,
-                    current_time,
-                    current_time,
-                    current_time,
-                    should_activate,
-                    new_breed_type,
-                    new_primary_breed,
-                    new_secondary_breed,
-                    new_breed_slug,
-                    new_breed_confidence,
-                    animal_id,
-                ),
+                    consecutive_scrapes_missing = 0, availability_confidence = 'high'""",
+                (*(values[column] for column in UPDATE_COLUMNS), current_time, current_time, current_time),
             )
 
             self.conn.commit()
@@ -425,6 +408,207 @@ class DatabaseService:
                 self.conn.rollback()
             return None, "error"
 
+    def get_existing_animals(self, organization_id: int, external_ids: list[str]) -> dict[str, tuple]:
+        """Look up which of an organization's animals are already stored, in one query.
+
+        Args:
+            organization_id: Organization ID
+            external_ids: External IDs to look up
+
+        Returns:
+            Mapping of external_id to the (id, name, updated_at) tuple
+            get_existing_animal returns; empty on failure
+        """
+        if not external_ids:
+            return {}
+
+        if not self.conn:
+            if not self.connect():
+                self.logger.error("No database connection available")
+                return {}
+
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "SELECT external_id, id, name, updated_at FROM animals WHERE organization_id = %s AND external_id = ANY(%s)",
+                (organization_id, list(external_ids)),
+            )
+            rows = cursor.fetchall()
+            cursor.close()
+            return {row[0]: tuple(row[1:]) for row in rows}
+        except Exception as e:
+            self.logger.error(f"Error checking existing animals: {e}")
+            self.conn.rollback()
+            return {}
+
+    def get_content_fingerprints(self, organization_id: int) -> dict[str, tuple[int, str, str | None]]:
+        """Stored content fingerprints of an organization's animals, in one query.
+
+        Args:
+            organization_id: Organization ID
+
+        Returns:
+            Mapping of external_id to (id, content_hash, status) for every
+            animal that has a fingerprint; empty on failure
+        """
+        if not self.conn:
+            if not self.connect():
+                self.logger.error("No database connection available")
+                return {}
+
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "SELECT external_id, id, content_hash, status FROM animals WHERE organization_id = %s AND content_hash IS NOT NULL",
+                (organization_id,),
+            )
+            rows = cursor.fetchall()
+            cursor.close()
+            return {row[0]: tuple(row[1:]) for row in rows}
+        except Exception as e:
+            self.logger.error(f"Error loading content fingerprints: {e}")
+            self.conn.rollback()
+            return {}
+
+    def upsert_animals(self, organization_id: int, animals: list[dict[str, Any]]) -> list[tuple[int | None, str]]:
+        """Create or update a batch of an organization's animals.
+
+        Animals whose content fingerprint and status match what is stored are
+        "no_change" without being read or standardized; the organization's
+        fingerprints are loaded once per scrape. For the rest, each chunk of
+        UPSERT_CHUNK_SIZE animals is one transaction: one SELECT of the
+        stored rows, one UPDATE for those that changed and one INSERT for new
+        ones, instead of a lookup, a write and a commit per animal. A chunk
+        that fails is rolled back and saved one animal at a time, so one bad
+        row costs only itself.
+
+        Args:
+            organization_id: Organization all the animals belong to
+            animals: Animal data dictionaries, ready to save
+
+        Returns:
+            One (animal_id, action) per animal, in order, with the actions of
+            create_animal and update_animal: "added", "updated", "no_change"
+            or (None, "error")
+        """
+        results: list[tuple[int | None, str]] = [(None, "error")] * len(animals)
+        if not animals:
+            return results
+
+        if not self.conn:
+            if not self.connect():
+                self.logger.error("No database connection available")
+                return results
+
+        if organization_id not in self._fingerprints:
+            self._fingerprints[organization_id] = self.get_content_fingerprints(organization_id)
+
+        for start in range(0, len(animals), UPSERT_CHUNK_SIZE):
+            chunk = animals[start : start + UPSERT_CHUNK_SIZE]
+            try:
+                results[start : start + len(chunk)] = self._upsert_chunk(organization_id, chunk)
+                self.conn.commit()
+            except Exception as e:
+                self.logger.warning(f"Bulk save of animals {start + 1}-{start + len(chunk)} failed, saving them one at a time: {e}")
+                self.conn.rollback()
+                results[start : start + len(chunk)] = [self._save_one(organization_id, animal_data) for animal_data in chunk]
+
+        return results
+
+    def _upsert_chunk(self, organization_id: int, animals: list[dict[str, Any]]) -> list[tuple[int | None, str]]:
+        """Write one chunk in the current transaction; the caller commits."""
+        cursor = self.conn.cursor()
+        external_ids = [animal_data.get("external_id") for animal_data in animals]
+        # A dog listed twice is written once, with its last copy
+        last_index = {external_id: i for i, external_id in enumerate(external_ids)}
+        results: list[tuple[int | None, str] | None] = [None] * len(animals)
+
+        # Unchanged since the last save: nothing to read, standardize or write
+        fingerprints = self._fingerprints.setdefault(organization_id, {})
+        to_compare, unchanged_by_fingerprint = [], 0
+        for i, animal_data in enumerate(animals):
+            external_id = external_ids[i]
+            if last_index[external_id] != i:
+                continue
+            known = fingerprints.get(external_id)
+            if known and known[1] == content_fingerprint(animal_data) and known[2] == animal_data.get("status"):
+                results[i] = (known[0], "no_change")
+                unchanged_by_fingerprint += 1
+            else:
+                to_compare.append(i)
+
+        stored = {}
+        if to_compare:
+            cursor.execute(
+                f"SELECT id, external_id, content_hash, {', '.join(CURRENT_ROW_COLUMNS)} FROM animals WHERE organization_id = %s AND external_id = ANY(%s)",
+                (organization_id, [external_ids[i] for i in to_compare]),
+            )
+            stored = {row[1]: row for row in cursor.fetchall()}
+
+        current_time = datetime.now()
+        updates, rehashes, new_indices, saved_fingerprints = [], [], {}, {}
+        for i in to_compare:
+            animal_data, external_id = animals[i], external_ids[i]
+            row = stored.get(external_id)
+            if row:
+                has_changes, values = prepare_animal_update(animal_data, row[3:])
+                results[i] = (row[0], "updated" if has_changes else "no_change")
+                if has_changes:
+                    updates.append((row[0], *(values[column] for column in UPDATE_COLUMNS), current_time))
+                elif row[2] != values["content_hash"]:
+                    rehashes.append((row[0], values["content_hash"]))
+                saved_fingerprints[external_id] = (row[0], values["content_hash"], animal_data.get("status"))
+            else:
+                new_indices[external_id] = i
+
+        # One detection pass for the chunk; animals that state a language skip it
+        languages = get_language_detector().detect_many(None if animals[i].get("language") else language_text(animals[i]) for i in new_indices.values())
+        new_animals = {external_id: (i, prepare_animal_data(animals[i], language)) for (external_id, i), language in zip(new_indices.items(), languages)}
+
+        # New rows get their IDs up front, so each is inserted with its final slug
+        inserts = []
+        if new_animals:
+            animal_ids = reserve_animal_ids(cursor, len(new_animals))
+            entries = [(animal_id, animals[i], prepared.standardized_breed) for animal_id, (i, prepared) in zip(animal_ids, new_animals.values())]
+            slugs = generate_final_slugs(entries, self.conn)
+            for animal_id, slug, (i, prepared) in zip(animal_ids, slugs, new_animals.values()):
+                inserts.append(_insert_values(animals[i], prepared, animal_id, slug, current_time))
+
+        inserted_rows = []
+        if updates or inserts:
+            with tracked_write(cursor, "organization_id = %s AND external_id = ANY(%s)", (organization_id, external_ids)):
+                if updates:
+                    execute_values(cursor, _BULK_UPDATE_SQL, updates, template=_BULK_UPDATE_TEMPLATE, page_size=len(updates))
+                if inserts:
+                    inserted_rows = execute_values(cursor, _BULK_INSERT_SQL, inserts, page_size=len(inserts), fetch=True)
+        if rehashes:
+            execute_values(cursor, _BULK_REHASH_SQL, rehashes, template="(%s::integer, %s::text)", page_size=len(rehashes))
+
+        for animal_id, external_id, inserted in inserted_rows:
+            i, _ = new_animals[external_id]
+            results[i] = (animal_id, "added" if inserted else "updated")
+            saved_fingerprints[external_id] = (animal_id, content_fingerprint(animals[i]), animals[i].get("status"))
+        cursor.close()
+        # Not before the writes: a chunk that fails leaves the map as it was
+        fingerprints.update(saved_fingerprints)
+
+        for i, external_id in enumerate(external_ids):
+            if results[i] is None:
+                results[i] = (results[last_index[external_id]][0], "no_change")
+
+        self.logger.info(
+            f"Saved {len(animals)} animals: {len(inserted_rows)} inserted or upserted, {len(updates)} updated, "
+            f"{len(animals) - len(inserted_rows) - len(updates)} unchanged ({unchanged_by_fingerprint} by fingerprint)"
+        )
+        return results
+
+    def _save_one(self, organization_id: int, animal_data: dict[str, Any]) -> tuple[int | None, str]:
+        """Save one animal the way upsert_animals did before batching, in its own transaction."""
+        existing = self.get_existing_animal(animal_data.get("external_id"), organization_id)
+        if existing:
+            return self.update_animal(existing[0], animal_data)
+        return self.create_animal(animal_data)
+
     def create_scrape_log(self, organization_id: int) -> int | None:
         """Create a new entry in the scrape_logs table.
 
@@ -434,6 +618,9 @@ class DatabaseService:
         Returns:
             Scrape log ID if successful, None if failed
         """
+        # A new scrape reloads fingerprints, picking up changes made since the last one
+        self._fingerprints.pop(organization_id, None)
+
         # Use connection pool if available
         if self.connection_pool:
             try:
@@ -554,17 +741,121 @@ class DatabaseService:
                 self.conn.rollback()
             return False
 
-    def get_existing_animal_urls(self, organization_id: int) -> set:
-        """Get set of existing animal URLs for this organization.
+    def record_listing_fingerprint(self, scrape_log_id: int, fingerprint: str) -> bool:
+        """Store the listing fingerprint of a successful full crawl on its scrape log.
+
+        Args:
+            scrape_log_id: ID of the scrape log
+            fingerprint: scrapers.listing_fingerprint.listing_fingerprint() of its cards
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.conn:
+            if not self.connect():
+                self.logger.error("No database connection available")
+                return False
+
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("UPDATE scrape_logs SET listing_fingerprint = %s WHERE id = %s", (fingerprint, scrape_log_id))
+            self.conn.commit()
+            cursor.close()
+            return True
+        except Exception as e:
+            self.logger.error(f"Error recording listing fingerprint: {e}")
+            if self.conn:
+                self.conn.rollback()
+            return False
+
+    def get_listing_fingerprint(self, organization_id: int, since: datetime) -> str | None:
+        """Listing fingerprint of the organization's latest successful full crawl started after since.
 
         Args:
             organization_id: Organization ID
+            since: Ignore crawls that started before this
 
         Returns:
-            Set of existing animal URLs
+            The fingerprint, or None when there is no such crawl
+        """
+        if not self.conn:
+            if not self.connect():
+                self.logger.error("No database connection available")
+                return None
+
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                """
+                SELECT listing_fingerprint FROM scrape_logs
+                WHERE organization_id = %s AND status = 'success'
+                  AND listing_fingerprint IS NOT NULL AND started_at >= %s
+                ORDER BY started_at DESC
+                LIMIT 1
+                """,
+                (organization_id, since),
+            )
+            row = cursor.fetchone()
+            cursor.close()
+            return row[0] if row else None
+        except Exception as e:
+            self.logger.error(f"Error getting listing fingerprint: {e}")
+            return None
+
+    def record_checkpoint(self, scrape_log_id: int, external_ids: list[str]) -> int:
+        """Record animals a scrape has persisted, so a rerun can resume it if it is interrupted.
+
+        Args:
+            scrape_log_id: ID of the running scrape's log
+            external_ids: External IDs of the animals just saved
+
+        Returns:
+            Number of animals newly recorded
+        """
+        if not external_ids:
+            return 0
+
+        if not self.conn:
+            if not self.connect():
+                self.logger.error("No database connection available")
+                return 0
+
+        try:
+            cursor = self.conn.cursor()
+            execute_values(
+                cursor,
+                "INSERT INTO scrape_checkpoints (scrape_log_id, external_id) VALUES %s ON CONFLICT DO NOTHING",
+                [(scrape_log_id, external_id) for external_id in external_ids],
+                page_size=len(external_ids),
+            )
+            recorded = cursor.rowcount
+            self.conn.commit()
+            cursor.close()
+            return recorded
+        except Exception as e:
+            self.logger.error(f"Error recording scrape checkpoint: {e}")
+            if self.conn:
+                self.conn.rollback()
+            return 0
+
+    def resume_checkpoint(self, organization_id: int, scrape_log_id: int, since: datetime) -> set[str]:
+        """Carry an interrupted scrape's checkpoint over to a new scrape.
+
+        The organization's previous scrape is resumed when it failed or never
+        finished ("running" after a restart) and started after since. Its
+        checkpoint is copied to scrape_log_id in the same statement, so a
+        rerun that is interrupted too hands on both.
+
+        Args:
+            organization_id: Organization ID
+            scrape_log_id: ID of the new scrape's log
+            since: Ignore scrapes that started before this
+
+        Returns:
+            External IDs the interrupted scrape persisted; empty when there is
+            nothing to resume or on failure
         """
         if not self.conn:
-            # Try to establish connection before failing
             if not self.connect():
                 self.logger.error("No database connection available")
                 return set()
@@ -572,16 +863,241 @@ class DatabaseService:
         try:
             cursor = self.conn.cursor()
             cursor.execute(
-                "SELECT adoption_url FROM animals WHERE organization_id = %s AND status = 'available'",
+                """
+                WITH previous AS (
+                    SELECT id, status, started_at FROM scrape_logs
+                    WHERE organization_id = %s AND id <> %s
+                    ORDER BY started_at DESC
+                    LIMIT 1
+                )
+                INSERT INTO scrape_checkpoints (scrape_log_id, external_id, saved_at)
+                SELECT %s, c.external_id, c.saved_at
+                FROM scrape_checkpoints c JOIN previous p ON c.scrape_log_id = p.id
+                WHERE p.status IN ('error', 'running') AND p.started_at >= %s
+                ON CONFLICT DO NOTHING
+                RETURNING external_id
+                """,
+                (organization_id, scrape_log_id, scrape_log_id, since),
+            )
+            resumed = {row[0] for row in cursor.fetchall()}
+            self.conn.commit()
+            cursor.close()
+            return resumed
+        except Exception as e:
+            self.logger.error(f"Error resuming scrape checkpoint: {e}")
+            if self.conn:
+                self.conn.rollback()
+            return set()
+
+    def clear_checkpoints(self, organization_id: int) -> int:
+        """Drop every scrape checkpoint of the organization, once a scrape has completed.
+
+        Args:
+            organization_id: Organization ID
+
+        Returns:
+            Number of checkpoint rows deleted
+        """
+        if not self.conn:
+            if not self.connect():
+                self.logger.error("No database connection available")
+                return 0
+
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "DELETE FROM scrape_checkpoints WHERE scrape_log_id IN (SELECT id FROM scrape_logs WHERE organization_id = %s)",
                 (organization_id,),
             )
-            results = cursor.fetchall()
+            deleted = cursor.rowcount
+            self.conn.commit()
             cursor.close()
+            return deleted
+        except Exception as e:
+            self.logger.error(f"Error clearing scrape checkpoints: {e}")
+            if self.conn:
+                self.conn.rollback()
+            return 0
+
+    def publish_metadata(self) -> bool:
+        """Republish the /meta filter domains from the current tables.
 
-            return {url[0] for url in results if url[0]}
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.conn:
+            if not self.connect():
+                self.logger.error("No database connection available")
+                return False
+
+        try:
+            cursor = self.conn.cursor()
+            publish_metadata(cursor)
+            self.conn.commit()
+            cursor.close()
+            return True
         except Exception as e:
-            self.logger.error(f"Error getting existing animal URLs: {e}")
-            return set()
+            self.logger.error(f"Error publishing metadata dictionary: {e}")
+            if self.conn:
+                self.conn.rollback()
+            return False
+
+    def get_listing_hashes(self, organization_id: int, external_ids: list[str]) -> dict[str, tuple[str | None, datetime | None]] | None:
+        """Stored listing hashes of the listed animals that are available, in one query.
+
+        Args:
+            organization_id: Organization ID
+            external_ids: External IDs on the current listing
+
+        Returns:
+            Mapping of external_id to (listing_hash, detail_checked_at); animals
+            that aren't stored or aren't available are absent. None on failure,
+            so callers can tell "nothing stored" from "couldn't look"
+        """
+        if not self.conn:
+            if not self.connect():
+                self.logger.error("No database connection available")
+                return None
+
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "SELECT external_id, listing_hash, detail_checked_at FROM animals WHERE organization_id = %s AND status = 'available' AND external_id = ANY(%s)",
+                (organization_id, list(external_ids)),
+            )
+            rows = cursor.fetchall()
+            cursor.close()
+            return {row[0]: (row[1], row[2]) for row in rows}
+        except Exception as e:
+            self.logger.error(f"Error getting listing hashes: {e}")
+            self.conn.rollback()
+            return None
+
+    def record_listing_hashes(self, organization_id: int, listing_hashes: dict[str, str], checked_at: datetime) -> int:
+        """Store the listing hash each animal's detail page was fetched for, in one statement.
+
+        Args:
+            organization_id: Organization ID
+            listing_hashes: external_id -> scrapers.listing_fingerprint.card_hash() of its card
+            checked_at: When the detail pages were fetched
+
+        Returns:
+            Number of animals updated
+        """
+        if not listing_hashes:
+            return 0
+
+        if not self.conn:
+            if not self.connect():
+                self.logger.error("No database connection available")
+                return 0
+
+        try:
+            cursor = self.conn.cursor()
+            rows = [(organization_id, external_id, listing_hash, checked_at) for external_id, listing_hash in listing_hashes.items()]
+            execute_values(cursor, _LISTING_HASH_SQL, rows, template="(%s::integer, %s::text, %s::text, %s::timestamp)", page_size=len(rows))
+            updated = cursor.rowcount
+            self.conn.commit()
+            cursor.close()
+            return updated
+        except Exception as e:
+            self.logger.error(f"Error recording listing hashes: {e}")
+            if self.conn:
+                self.conn.rollback()
+            return 0
+
+    def record_duplicates(self, duplicates: dict[int, int]) -> int:
+        """Mark animals as likely duplicates of another organization's dogs, in one statement.
+
+        Args:
+            duplicates: animal ID -> ID of the dog it duplicates, from
+                ImageProcessingService.batch_process_images
+
+        Returns:
+            Number of animals updated
+        """
+        if not duplicates:
+            return 0
+
+        if not self.conn:
+            if not self.connect():
+                self.logger.error("No database connection available")
+                return 0
+
+        try:
+            cursor = self.conn.cursor()
+            execute_values(cursor, _DUPLICATE_OF_SQL, list(duplicates.items()), template="(%s::integer, %s::integer)", page_size=len(duplicates))
+            updated = cursor.rowcount
+            self.conn.commit()
+            cursor.close()
+            return updated
+        except Exception as e:
+            self.logger.error(f"Error recording duplicates: {e}")
+            if self.conn:
+                self.conn.rollback()
+            return 0
+
+    def get_page_validators(self, organization_id: int) -> dict[str, tuple[str, str | None, str | None, str | None]]:
+        """The stored validators of an organization's detail pages, in one query.
+
+        Args:
+            organization_id: Organization ID
+
+        Returns:
+            Mapping of URL to (content_hash, etag, last_modified, parser_version); empty on failure,
+            so every page is fetched in full
+        """
+        if not self.conn:
+            if not self.connect():
+                self.logger.error("No database connection available")
+                return {}
+
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT url, content_hash, etag, last_modified, parser_version FROM page_validators WHERE organization_id = %s", (organization_id,))
+            rows = cursor.fetchall()
+            cursor.close()
+            return {row[0]: (row[1], row[2], row[3], row[4]) for row in rows}
+        except Exception as e:
+            self.logger.error(f"Error getting page validators: {e}")
+            self.conn.rollback()
+            return {}
+
+    def record_page_validators(self, organization_id: int, validators: dict[str, tuple[str, str | None, str | None, str | None]]) -> int:
+        """Store the validators of the detail pages a successful scrape fetched, in one statement.
+
+        Validators not refreshed within PAGE_VALIDATOR_MAX_AGE are dropped in
+        the same transaction.
+
+        Args:
+            organization_id: Organization ID
+            validators: URL -> (content_hash, etag, last_modified, parser_version)
+
+        Returns:
+            Number of validators written; 0 on failure
+        """
+        if not validators:
+            return 0
+
+        if not self.conn:
+            if not self.connect():
+                self.logger.error("No database connection available")
+                return 0
+
+        try:
+            cursor = self.conn.cursor()
+            fetched_at = datetime.now()
+            rows = [(organization_id, url, *validator, fetched_at) for url, validator in validators.items()]
+            execute_values(cursor, _PAGE_VALIDATOR_SQL, rows, page_size=len(rows))
+            cursor.execute("DELETE FROM page_validators WHERE organization_id = %s AND fetched_at < %s", (organization_id, fetched_at - PAGE_VALIDATOR_MAX_AGE))
+            self.conn.commit()
+            cursor.close()
+            return len(rows)
+        except Exception as e:
+            self.logger.error(f"Error recording page validators: {e}")
+            if self.conn:
+                self.conn.rollback()
+            return 0
 
     def get_slugs_for_animals(self, animal_ids: list[int]) -> list[str]:
         """Resolve animal IDs to their detail-page slugs in one round trip.
@@ -0,0 +1,172 @@
+"""
+Perceptual hashes of dog photos, for spotting one dog listed by two organizations.
+
+Partner rescues cross-post dogs, usually with the same photo re-encoded,
+resized or lightly cropped, so the source URLs and bytes differ while the
+picture does not. A 64-bit difference hash (dHash) of the photo survives
+those edits: two copies of a picture land a few bits apart, two different
+dogs around half the bits apart.
+
+ImageHashIndex keeps the hashes of other organizations' dogs in a BK-tree,
+so looking up a new photo compares it against a handful of hashes rather
+than every dog on the site. ImageProcessingService.batch_process_images
+looks up each photo it is about to upload and, for a likely duplicate,
+reuses the existing dog's R2 image instead.
+
+Usage:
+    index = ImageHashIndex(entries)
+    match = index.find_duplicate(dhash(content), "Luna")
+"""
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from io import BytesIO
+
+import requests
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+HASH_SIZE = 8
+"""Rows and columns of the gradient grid: an 8x8 grid gives a 64-bit hash."""
+
+DUPLICATE_MAX_DISTANCE = 6
+"""Most differing bits for two photos to count as the same picture."""
+
+DOWNLOAD_TIMEOUT = (10, 20)  # (connect, read) seconds, as R2Service uses
+DOWNLOAD_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; RescueDogAggregator/1.0)"}
+
+_SIGN_BIT = 1 << 63
+
+
+def dhash(content: bytes) -> int | None:
+    """64-bit difference hash of an image, or None when it can't be decoded.
+
+    The image is shrunk to a 9x8 greyscale grid and each bit records whether
+    a cell is brighter than its right-hand neighbour. A blank image hashes
+    to 0 and is treated as having no hash, since every placeholder would
+    match every other.
+    """
+    try:
+        with Image.open(BytesIO(content)) as image:
+            # Lets the JPEG decoder downscale while decoding instead of after
+            image.draft("L", (HASH_SIZE * 8, HASH_SIZE * 8))
+            pixels = image.convert("L").resize((HASH_SIZE + 1, HASH_SIZE), Image.Resampling.LANCZOS).tobytes()
+    except Exception as e:
+        logger.debug(f"Could not hash image: {e}")
+        return None
+
+    value = 0
+    for row in range(HASH_SIZE):
+        for column in range(HASH_SIZE):
+            left = pixels[row * (HASH_SIZE + 1) + column]
+            value = (value << 1) | (left > pixels[row * (HASH_SIZE + 1) + column + 1])
+    return value or None
+
+
+def fetch_image_hash(image_url: str) -> int | None:
+    """Download an image and return its dhash(), or None if either step fails."""
+    try:
+        response = requests.get(image_url, timeout=DOWNLOAD_TIMEOUT, headers=DOWNLOAD_HEADERS)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        logger.debug(f"Could not download {image_url} for hashing: {e}")
+        return None
+    return dhash(response.content)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of bits two hashes differ in."""
+    return (a ^ b).bit_count()
+
+
+def to_bigint(value: int) -> int:
+    """An unsigned 64-bit hash as the signed value a BIGINT column holds."""
+    return value - (1 << 64) if value & _SIGN_BIT else value
+
+
+def from_bigint(value: int) -> int:
+    """The unsigned 64-bit hash stored as a signed BIGINT."""
+    return value & ((1 << 64) - 1)
+
+
+@dataclass(frozen=True)
+class HashedAnimal:
+    """An indexed dog: its photo's hash and what a duplicate of it reuses."""
+
+    animal_id: int
+    organization_id: int
+    name: str
+    image_hash: int
+    primary_image_url: str
+
+
+class _Node:
+    __slots__ = ("entry", "children")
+
+    def __init__(self, entry: HashedAnimal):
+        self.entry = entry
+        self.children: dict[int, _Node] = {}
+
+
+class ImageHashIndex:
+    """BK-tree of HashedAnimals keyed by Hamming distance between photo hashes.
+
+    Every child of a node sits at a known distance from it, so by the
+    triangle inequality a search within DUPLICATE_MAX_DISTANCE only descends
+    into children whose distance is within that much of the query's.
+    """
+
+    def __init__(self, entries: Iterable[HashedAnimal] = ()):
+        self._root: _Node | None = None
+        self._size = 0
+        for entry in entries:
+            self.add(entry)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, entry: HashedAnimal) -> None:
+        self._size += 1
+        if self._root is None:
+            self._root = _Node(entry)
+            return
+        node = self._root
+        while True:
+            distance = hamming_distance(entry.image_hash, node.entry.image_hash)
+            child = node.children.get(distance)
+            if child is None:
+                node.children[distance] = _Node(entry)
+                return
+            node = child
+
+    def search(self, image_hash: int, max_distance: int = DUPLICATE_MAX_DISTANCE) -> list[tuple[int, HashedAnimal]]:
+        """Entries within max_distance bits of a hash, as (distance, entry), nearest first."""
+        matches = []
+        pending = [self._root] if self._root else []
+        while pending:
+            node = pending.pop()
+            distance = hamming_distance(image_hash, node.entry.image_hash)
+            if distance <= max_distance:
+                matches.append((distance, node.entry))
+            pending.extend(child for edge, child in node.children.items() if distance - max_distance <= edge <= distance + max_distance)
+        return sorted(matches, key=lambda match: (match[0], match[1].animal_id))
+
+    def find_duplicate(self, image_hash: int, name: str | None) -> HashedAnimal | None:
+        """The nearest indexed dog with the same name and a near-identical photo, if any.
+
+        The name has to agree too: stock photos and "photo coming soon"
+        images are shared by dogs that are not the same dog.
+        """
+        wanted = _normalize_name(name)
+        if not wanted:
+            return None
+        for _, entry in self.search(image_hash):
+            if _normalize_name(entry.name) == wanted:
+                return entry
+        return None
+
+
+def _normalize_name(name: str | None) -> str:
+    return " ".join((name or "").split()).casefold()
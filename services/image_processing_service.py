@@ -5,6 +5,7 @@ Handles primary image processing operations including:
 - Primary image processing and validation
 - R2 integration and error handling
 - Image URL validation and processing
+- Cross-organization duplicate detection by perceptual image hash
 
 Following CLAUDE.md principles:
 - Pure functions, no mutations
@@ -14,10 +15,17 @@ Following CLAUDE.md principles:
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from psycopg2.extras import execute_values
+
+from services.image_hash_index import HashedAnimal, ImageHashIndex, fetch_image_hash, from_bigint, to_bigint
 from utils.r2_service import R2Service
 
+# Concurrent downloads when hashing a batch's new images
+HASH_WORKERS = 4
+
 
 class ImageProcessingService:
     """Service for all image processing operations extracted from BaseScraper."""
@@ -35,6 +43,8 @@ class ImageProcessingService:
         """
         self.r2_service = r2_service or R2Service()
         self.logger = logger or logging.getLogger(__name__)
+        # Other organizations' hashed dogs, loaded once per scraping organization
+        self._hash_indexes: dict[int, ImageHashIndex] = {}
 
     def process_primary_image(
         self,
@@ -294,15 +304,22 @@ class ImageProcessingService:
         batch_size: int = 5,
         use_concurrent: bool = True,
         database_connection=None,
+        organization_id: int | None = None,
     ) -> list[dict[str, Any]]:
         """Process multiple animal images in batches with deduplication for better performance.
 
+        With organization_id as well as a database connection, each new image
+        is hashed before upload, and an animal whose photo and name match a
+        dog of another organization reuses that dog's R2 image and gets its
+        id as duplicate_of_id.
+
         Args:
             animals_data: List of animal data dictionaries with primary_image_url
             organization_name: Organization name for R2 path
             batch_size: Number of images to upload per batch
             use_concurrent: Whether to use concurrent uploads
             database_connection: Optional database connection for deduplication
+            organization_id: Organization the animals belong to, for cross-organization duplicates
 
         Returns:
             Updated list of animal data with uploaded image URLs
@@ -350,6 +367,9 @@ class ImageProcessingService:
                 animal_name = animals_data[first_animal_idx].get("name", "unknown")
                 images_to_upload.append((original_url, animal_name, organization_name))
 
+        if images_to_upload and database_connection and organization_id is not None:
+            images_to_upload = self._reuse_duplicate_images(images_to_upload, animals_data, animal_url_indices, organization_id, database_connection)
+
         # Log deduplication stats
         total_images = len(all_original_urls)
         unique_images = len(set(all_original_urls))
@@ -390,3 +410,100 @@ class ImageProcessingService:
             self.logger.info("✨ All images already exist in R2, no uploads needed!")
 
         return animals_data
+
+    def _reuse_duplicate_images(
+        self,
+        images_to_upload: list[tuple[str, str, str]],
+        animals_data: list[dict[str, Any]],
+        animal_url_indices: dict[str, list[int]],
+        organization_id: int,
+        database_connection,
+    ) -> list[tuple[str, str, str]]:
+        """Hash new images and point likely cross-organization duplicates at the existing dog's R2 image.
+
+        Every hash is stored, so the dogs uploaded here can be matched by
+        other organizations' scrapes.
+
+        Returns:
+            The images that still need uploading
+        """
+        urls = [image[0] for image in images_to_upload]
+        with ThreadPoolExecutor(max_workers=min(HASH_WORKERS, len(urls))) as executor:
+            hashes = {url: image_hash for url, image_hash in zip(urls, executor.map(fetch_image_hash, urls)) if image_hash is not None}
+        if not hashes:
+            return images_to_upload
+        self._store_image_hashes(hashes, database_connection)
+
+        index = self._get_hash_index(organization_id, database_connection)
+        remaining = []
+        for image in images_to_upload:
+            original_url = image[0]
+            indices = animal_url_indices[original_url]
+            matches = [index.find_duplicate(hashes[original_url], animals_data[i].get("name")) for i in indices] if original_url in hashes else [None]
+            # An image shared with a dog that isn't a duplicate is still uploaded for it
+            if not all(matches):
+                remaining.append(image)
+                continue
+            for animal_idx, match in zip(indices, matches):
+                animals_data[animal_idx]["primary_image_url"] = match.primary_image_url
+                animals_data[animal_idx]["original_image_url"] = original_url
+                animals_data[animal_idx]["duplicate_of_id"] = match.animal_id
+                self.logger.info(f"👯 {animals_data[animal_idx].get('name', 'unknown')} looks like animal {match.animal_id} of organization {match.organization_id}; reusing its image")
+
+        if len(remaining) < len(images_to_upload):
+            self.logger.info(f"👯 {len(images_to_upload) - len(remaining)} images are likely duplicates of other organizations' dogs, skipping their upload")
+        return remaining
+
+    def _get_hash_index(self, organization_id: int, database_connection) -> ImageHashIndex:
+        """Hash index of other organizations' active dogs with R2 images, loaded once per organization."""
+        if organization_id in self._hash_indexes:
+            return self._hash_indexes[organization_id]
+
+        entries = []
+        cursor = None
+        try:
+            cursor = database_connection.cursor()
+            cursor.execute(
+                """
+                SELECT a.id, a.organization_id, a.name, h.image_hash, a.primary_image_url
+                FROM image_hashes h
+                JOIN animals a ON a.original_image_url = h.original_image_url
+                WHERE a.organization_id <> %s
+                AND a.active = true
+                AND a.duplicate_of_id IS NULL
+                AND a.primary_image_url LIKE '%%images.rescuedogs.me%%'
+                """,
+                (organization_id,),
+            )
+            entries = [HashedAnimal(row[0], row[1], row[2], from_bigint(row[3]), row[4]) for row in cursor.fetchall()]
+        except Exception as e:
+            self.logger.error(f"Error loading image hashes: {e}")
+            database_connection.rollback()
+        finally:
+            if cursor:
+                cursor.close()
+
+        self._hash_indexes[organization_id] = ImageHashIndex(entries)
+        self.logger.info(f"Indexed {len(entries)} image hashes from other organizations")
+        return self._hash_indexes[organization_id]
+
+    def _store_image_hashes(self, hashes: dict[str, int], database_connection) -> None:
+        """Upsert the hash of each source image URL into image_hashes."""
+        cursor = None
+        try:
+            cursor = database_connection.cursor()
+            execute_values(
+                cursor,
+                """
+                INSERT INTO image_hashes (original_image_url, image_hash) VALUES %s
+                ON CONFLICT (original_image_url) DO UPDATE SET image_hash = EXCLUDED.image_hash, hashed_at = CURRENT_TIMESTAMP
+                """,
+                [(url, to_bigint(image_hash)) for url, image_hash in hashes.items()],
+            )
+            database_connection.commit()
+        except Exception as e:
+            self.logger.error(f"Error storing image hashes: {e}")
+            database_connection.rollback()
+        finally:
+            if cursor:
+                cursor.close()
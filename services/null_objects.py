@@ -187,13 +187,21 @@ class NullFilteringService:
     def total_animals_skipped(self) -> int:
         return self._total_animals_skipped
 
-    def get_existing_animal_urls(self) -> set:
-        """Get existing URLs - returns empty set."""
-        return set()
+    @property
+    def total_animals_resumed(self) -> int:
+        return 0
+
+    def resume(self, external_ids: set[str]) -> None:
+        """Resume an interrupted scrape - no-op."""
+        pass
 
-    def filter_existing_urls(self, all_urls: list[str]) -> list[str]:
-        """Filter URLs - returns all unchanged."""
-        return all_urls
+    @property
+    def listing_hashes(self) -> dict[str, str]:
+        return {}
+
+    def select_for_detail(self, animals: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Select animals for detail fetching - returns all unchanged."""
+        return animals
 
     def filter_existing_animals(self, animals: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Filter animals - returns all unchanged."""
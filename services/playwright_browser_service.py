@@ -6,16 +6,28 @@ Provides unified browser creation that auto-detects environment:
 
 This service replaces browser_service.py (Selenium) for Browserless v2 compatibility.
 Browserless v2 removed Selenium/WebDriver support, only Playwright/Puppeteer work.
+
+Scrapers submit their Playwright coroutines through ``run()``, which executes
+them on one long-lived browser loop. There, ``get_browser()`` leases a page
+from a shared pool instead of starting a browser per call: the browser stays
+up for the whole process, contexts and pages are reused between leases, and
+PLAYWRIGHT_MAX_PAGES caps how many pages all scrapers hold at once.
 """
 
 import asyncio
+import atexit
 import logging
 import os
 import random
+import threading
+import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from typing import Any
+from urllib.parse import urlparse
+
+from utils.replay import route_browser_context
 
 try:
     from playwright.async_api import (
@@ -44,6 +56,127 @@ DEFAULT_USER_AGENTS = [
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
 ]
 
+DEFAULT_MAX_PAGES = 4
+"""Pooled pages open at once across every scraper in the process.
+
+One pooled browser is one Browserless session; its pages are what the
+Browserless concurrency limit has to absorb. Override with PLAYWRIGHT_MAX_PAGES.
+"""
+
+TRACKER_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "hotjar.com",
+    "clarity.ms",
+)
+"""Analytics and ad hosts aborted when PlaywrightOptions.block_trackers is set."""
+
+LIGHT_RENDER_BLOCKED_TYPES = ("image", "media", "font")
+"""Resource types the "light" render profile never downloads.
+
+Blocking an image request leaves the <img> element and its src attribute in
+the DOM, which is all the scrapers read.
+"""
+
+ESTIMATED_BYTES_BY_TYPE = {"image": 150_000, "media": 1_000_000, "font": 40_000}
+"""Typical transfer size per blocked request, for reporting bytes saved.
+
+An aborted request never reports its size, so savings are estimated; other
+types (tracker scripts) count as DEFAULT_BLOCKED_REQUEST_BYTES.
+"""
+
+DEFAULT_BLOCKED_REQUEST_BYTES = 30_000
+
+SETTLE_POLL_SECONDS = 0.3
+"""Gap between network-activity checks while settle() waits for a quiet page."""
+
+
+def is_tracker_url(url: str) -> bool:
+    """True if url points at one of TRACKER_HOSTS (or a subdomain of one)."""
+    host = urlparse(url).hostname or ""
+    return any(host == tracker or host.endswith(f".{tracker}") for tracker in TRACKER_HOSTS)
+
+
+@dataclass
+class RenderStats:
+    """What resource blocking and settle() saved during a scrape."""
+
+    blocked_by_type: dict[str, int] = field(default_factory=dict)
+    bytes_loaded: int = 0
+    wait_seconds_saved: float = 0.0
+
+    @property
+    def blocked_requests(self) -> int:
+        return sum(self.blocked_by_type.values())
+
+    @property
+    def estimated_bytes_saved(self) -> int:
+        return sum(ESTIMATED_BYTES_BY_TYPE.get(kind, DEFAULT_BLOCKED_REQUEST_BYTES) * count for kind, count in self.blocked_by_type.items())
+
+    def record_blocked(self, resource_type: str) -> None:
+        self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+
+    def record_response(self, response) -> None:
+        """Count a response's Content-Length towards bytes_loaded (page event handler)."""
+        try:
+            self.bytes_loaded += int(response.headers.get("content-length", 0))
+        except (TypeError, ValueError):
+            pass
+
+    def record_wait(self, budget: float, elapsed: float) -> None:
+        self.wait_seconds_saved += max(0.0, budget - elapsed)
+
+    def merge(self, other: "RenderStats") -> None:
+        for kind, count in other.blocked_by_type.items():
+            self.blocked_by_type[kind] = self.blocked_by_type.get(kind, 0) + count
+        self.bytes_loaded += other.bytes_loaded
+        self.wait_seconds_saved += other.wait_seconds_saved
+
+    def reset(self) -> None:
+        self.blocked_by_type.clear()
+        self.bytes_loaded = 0
+        self.wait_seconds_saved = 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.blocked_requests} requests blocked (~{self.estimated_bytes_saved / 1_000_000:.1f} MB saved), "
+            f"{self.bytes_loaded / 1_000_000:.1f} MB loaded, {self.wait_seconds_saved:.1f}s of waits saved"
+        )
+
+
+async def settle(page: Page, budget: float, selector: str | None = None, stats: RenderStats | None = None) -> float:
+    """Wait for a page to go quiet, for at most budget seconds.
+
+    Replaces a fixed asyncio.sleep(budget) after navigation or scrolling:
+    waits for selector (if given), then until no new resources have been
+    requested for one SETTLE_POLL_SECONDS interval. Never raises; a page that
+    never settles just uses the whole budget.
+
+    Returns:
+        Seconds actually waited.
+    """
+    started = time.monotonic()
+    deadline = started + budget
+    try:
+        if selector:
+            await page.wait_for_selector(selector, timeout=budget * 1000)
+        seen = None
+        while time.monotonic() < deadline:
+            requested = await page.evaluate("performance.getEntriesByType('resource').length")
+            if requested == seen:
+                break
+            seen = requested
+            await asyncio.sleep(min(SETTLE_POLL_SECONDS, max(0.0, deadline - time.monotonic())))
+    except Exception as e:
+        logger.debug(f"Page did not settle cleanly: {e}")
+
+    elapsed = time.monotonic() - started
+    if stats is not None:
+        stats.record_wait(budget, elapsed)
+    return elapsed
+
 
 @dataclass
 class PlaywrightOptions:
@@ -59,6 +192,21 @@ class PlaywrightOptions:
     disable_images: bool = False
     extra_args: list[str] = field(default_factory=list)
     wait_until: str = "domcontentloaded"  # networkidle, load, domcontentloaded, commit
+    blocked_resource_types: tuple[str, ...] = ()  # e.g. ("image", "font", "media")
+    block_trackers: bool = False
+    render_profile: str = "full"  # "light": DOM and attributes only, see LIGHT_RENDER_BLOCKED_TYPES
+
+    def resource_types_to_block(self) -> frozenset[str]:
+        """Request resource types aborted in this browser context."""
+        blocked = set(self.blocked_resource_types)
+        if self.disable_images:
+            blocked.add("image")
+        if self.render_profile == "light":
+            blocked.update(LIGHT_RENDER_BLOCKED_TYPES)
+        return frozenset(blocked)
+
+    def blocks_trackers(self) -> bool:
+        return self.block_trackers or self.render_profile == "light"
 
 
 @dataclass
@@ -71,13 +219,16 @@ class PlaywrightResult:
     is_remote: bool
     _playwright: Playwright | None = field(default=None, repr=False)
     _owns_playwright: bool = field(default=False, repr=False)  # Track if we should stop playwright
+    _pooled: bool = field(default=False, repr=False)  # Browser is shared - close only page and context
+    render_stats: RenderStats = field(default_factory=RenderStats)
 
     async def close(self) -> None:
         """Safely close browser resources including playwright instance if owned."""
         try:
             await self.page.close()
             await self.context.close()
-            await self.browser.close()
+            if not self._pooled:
+                await self.browser.close()
         except Exception:
             pass
         finally:
@@ -110,6 +261,7 @@ class PlaywrightBrowserService:
     - BROWSERLESS_WS_ENDPOINT: WebSocket URL for Browserless (e.g., wss://host:3000)
     - BROWSERLESS_TOKEN: Authentication token for Browserless
     - USE_PLAYWRIGHT: Set to 'true' to enable Playwright (default: false for safety)
+    - PLAYWRIGHT_MAX_PAGES: Pooled pages open at once (default: DEFAULT_MAX_PAGES)
     """
 
     def __init__(self):
@@ -119,6 +271,15 @@ class PlaywrightBrowserService:
         # Singleton Playwright instance to prevent pthread_create exhaustion
         self._playwright: Playwright | None = None
         self._playwright_lock = asyncio.Lock()
+        # Browser pool, owned by the browser loop thread started on first run()
+        self._max_pages = max(1, int(os.environ.get("PLAYWRIGHT_MAX_PAGES", DEFAULT_MAX_PAGES)))
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._loop_lock = threading.Lock()
+        self._browsers: dict[tuple, Browser] = {}
+        self._idle_pages: dict[tuple, list[PlaywrightResult]] = {}
+        self._page_slots: asyncio.Semaphore | None = None
+        self._pool_lock: asyncio.Lock | None = None
 
     async def _get_or_start_playwright(self) -> Playwright:
         """Get shared Playwright instance, starting if needed.
@@ -133,8 +294,70 @@ class PlaywrightBrowserService:
                     logger.info("Started shared Playwright instance")
         return self._playwright
 
+    def run(self, coro):
+        """Run a Playwright coroutine on the browser loop and wait for its result.
+
+        Scrapers call this instead of asyncio.run(): every coroutine then runs
+        on the same loop, where get_browser() leases from the shared pool.
+        Safe to call from any number of scraper threads at once.
+        """
+        if threading.current_thread() is self._loop_thread:
+            coro.close()
+            raise RuntimeError("run() called from the browser loop; await the coroutine instead")
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the browser loop thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="playwright-loop", daemon=True)
+                thread.start()
+                self._loop, self._loop_thread = loop, thread
+                atexit.register(self.close)
+            return self._loop
+
+    def _in_pool_loop(self) -> bool:
+        try:
+            return self._loop is not None and asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def close(self) -> None:
+        """Close the pooled browsers and stop the browser loop.
+
+        Registered with atexit when the loop starts, so a cron run tears the
+        pool down once at the end rather than after every scrape.
+        """
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.shutdown(), loop).result(timeout=30)
+        except Exception as e:
+            logger.warning(f"Error shutting down browser pool: {e}")
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            if not thread.is_alive():
+                loop.close()
+
     async def shutdown(self) -> None:
-        """Stop shared Playwright instance on service shutdown."""
+        """Close pooled pages and browsers, then stop the shared Playwright instance."""
+        for idle in self._idle_pages.values():
+            for result in idle:
+                await result.close()
+        self._idle_pages.clear()
+        for browser in self._browsers.values():
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        self._browsers.clear()
+        self._page_slots = self._pool_lock = None
+
         if self._playwright:
             try:
                 await self._playwright.stop()
@@ -187,24 +410,28 @@ class PlaywrightBrowserService:
             return await self._create_remote_browser(opts)
         return await self._create_local_browser(opts)
 
+    async def _launch_local(self, playwright: Playwright, opts: PlaywrightOptions) -> Browser:
+        """Launch a local Chromium browser."""
+        launch_args = [
+            "--no-sandbox",
+            "--disable-dev-shm-usage",
+            "--disable-gpu",
+        ]
+        launch_args.extend(opts.extra_args)
+
+        return await playwright.chromium.launch(
+            headless=opts.headless,
+            args=launch_args,
+        )
+
     async def _create_local_browser(self, opts: PlaywrightOptions) -> PlaywrightResult:
         """Create a local Chromium browser instance using shared Playwright."""
         try:
             playwright = await self._get_or_start_playwright()
+            browser = await self._launch_local(playwright, opts)
 
-            launch_args = [
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-gpu",
-            ]
-            launch_args.extend(opts.extra_args)
-
-            browser = await playwright.chromium.launch(
-                headless=opts.headless,
-                args=launch_args,
-            )
-
-            context = await self._create_context(browser, opts)
+            stats = RenderStats()
+            context = await self._create_context(browser, opts, stats)
             page = await context.new_page()
 
             if opts.stealth_mode:
@@ -219,18 +446,18 @@ class PlaywrightBrowserService:
                 is_remote=False,
                 _playwright=playwright,
                 _owns_playwright=False,  # Shared instance - don't stop on close
+                render_stats=stats,
             )
         except Exception as e:
             logger.error(f"Failed to create local Playwright browser: {e}")
             raise
 
-    async def _create_remote_browser(self, opts: PlaywrightOptions) -> PlaywrightResult:
-        """Create a remote Browserless browser instance via CDP with retry logic.
+    async def _connect_remote(self, playwright: Playwright) -> Browser:
+        """Connect to Browserless via CDP with retry logic.
 
         Implements exponential backoff to handle transient connection failures
         and resource exhaustion on the Browserless service.
 
-        Uses shared Playwright instance to prevent pthread_create exhaustion.
         Note: Uses 2 retries to limit nested retry explosion since
         get_page_content() has its own 2-retry loop (total max: 2 × 2 = 4 attempts).
         """
@@ -238,28 +465,15 @@ class PlaywrightBrowserService:
         base_delay = 2.0
         ws_url = self._build_ws_url()
 
-        playwright = await self._get_or_start_playwright()
-
         for attempt in range(max_retries):
             try:
                 browser = await playwright.chromium.connect_over_cdp(ws_url)
 
-                context = await self._create_context(browser, opts)
-                page = await context.new_page()
-
                 if attempt > 0:
-                    logger.info(f"Created remote Playwright browser via Browserless (succeeded on attempt {attempt + 1})")
+                    logger.info(f"Connected to Browserless (succeeded on attempt {attempt + 1})")
                 else:
-                    logger.info(f"Created remote Playwright browser via Browserless: {self._endpoint}")
-
-                return PlaywrightResult(
-                    browser=browser,
-                    context=context,
-                    page=page,
-                    is_remote=True,
-                    _playwright=playwright,
-                    _owns_playwright=False,  # Shared instance - don't stop on close
-                )
+                    logger.info(f"Connected to Browserless: {self._endpoint}")
+                return browser
 
             except Exception as e:
                 if attempt < max_retries - 1:
@@ -270,7 +484,29 @@ class PlaywrightBrowserService:
                     logger.error(f"Browserless connection failed after {max_retries} attempts: {e}")
                     raise
 
-    async def _create_context(self, browser: Browser, opts: PlaywrightOptions) -> BrowserContext:
+    async def _create_remote_browser(self, opts: PlaywrightOptions) -> PlaywrightResult:
+        """Create a remote Browserless browser instance via CDP.
+
+        Uses shared Playwright instance to prevent pthread_create exhaustion.
+        """
+        playwright = await self._get_or_start_playwright()
+        browser = await self._connect_remote(playwright)
+
+        stats = RenderStats()
+        context = await self._create_context(browser, opts, stats)
+        page = await context.new_page()
+
+        return PlaywrightResult(
+            browser=browser,
+            context=context,
+            page=page,
+            is_remote=True,
+            _playwright=playwright,
+            _owns_playwright=False,  # Shared instance - don't stop on close
+            render_stats=stats,
+        )
+
+    async def _create_context(self, browser: Browser, opts: PlaywrightOptions, stats: RenderStats | None = None) -> BrowserContext:
         """Create browser context with configured options."""
         user_agent = opts.user_agent
         if not user_agent and opts.random_user_agent:
@@ -283,7 +519,28 @@ class PlaywrightBrowserService:
         if user_agent:
             context_options["user_agent"] = user_agent
 
-        return await browser.new_context(**context_options)
+        context = await browser.new_context(**context_options)
+        await self._apply_resource_blocking(context, opts, stats if stats is not None else RenderStats())
+        await route_browser_context(context)
+        return context
+
+    async def _apply_resource_blocking(self, context: BrowserContext, opts: PlaywrightOptions, stats: RenderStats) -> None:
+        """Abort requests for blocked resource types and tracker hosts, counting them in stats."""
+        blocked_types = opts.resource_types_to_block()
+        block_trackers = opts.blocks_trackers()
+        if not blocked_types and not block_trackers:
+            return
+
+        async def handle(route):
+            request = route.request
+            if request.resource_type in blocked_types or (block_trackers and is_tracker_url(request.url)):
+                stats.record_blocked(request.resource_type)
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route("**/*", handle)
+        context.on("response", stats.record_response)
 
     async def _apply_stealth_mode(self, page: Page) -> None:
         """Apply stealth JavaScript to bypass bot detection."""
@@ -326,12 +583,21 @@ class PlaywrightBrowserService:
                 await browser.page.goto("https://example.com")
                 content = await browser.page.content()
 
+        On the browser loop (inside run()) the result is a page leased from
+        the pool and returned to it on exit; elsewhere a browser is created
+        for this use and closed afterwards.
+
         Args:
             options: Browser configuration options.
 
         Yields:
             PlaywrightResult with browser, context, page, and metadata.
         """
+        if self._in_pool_loop():
+            async with self._lease(options or PlaywrightOptions()) as leased:
+                yield leased
+            return
+
         browser_result = None
         try:
             browser_result = await self.create_browser(options)
@@ -340,6 +606,101 @@ class PlaywrightBrowserService:
             if browser_result:
                 await browser_result.close()
 
+    def _launch_key(self, opts: PlaywrightOptions) -> tuple:
+        """Options that need a browser of their own rather than a new context."""
+        if self.is_remote_mode:
+            return ("remote",)
+        return ("local", opts.headless, tuple(opts.extra_args))
+
+    def _context_key(self, opts: PlaywrightOptions) -> tuple:
+        """Options baked into a context, so only matching leases may reuse it.
+
+        Viewport size is left out: it is set per lease on the page.
+        """
+        return (
+            self._launch_key(opts),
+            opts.user_agent,
+            opts.random_user_agent,
+            opts.stealth_mode,
+            opts.resource_types_to_block(),
+            opts.blocks_trackers(),
+        )
+
+    @asynccontextmanager
+    async def _lease(self, opts: PlaywrightOptions) -> AsyncIterator[PlaywrightResult]:
+        """Hold one pooled page for the duration of the block."""
+        if self._page_slots is None:
+            self._page_slots = asyncio.Semaphore(self._max_pages)
+            self._pool_lock = asyncio.Lock()
+
+        async with self._page_slots:
+            key = self._context_key(opts)
+            result = await self._checkout(key, opts)
+            reusable = False
+            try:
+                yield result
+                reusable = True
+            finally:
+                await self._checkin(key, result, reusable)
+
+    async def _checkout(self, key: tuple, opts: PlaywrightOptions) -> PlaywrightResult:
+        """Reuse an idle page for key, or open one in a new context."""
+        idle = self._idle_pages.get(key, [])
+        while idle:
+            result = idle.pop()
+            if result.page.is_closed() or not result.browser.is_connected():
+                await result.close()
+                continue
+            await result.page.set_viewport_size({"width": opts.viewport_width, "height": opts.viewport_height})
+            result.render_stats.reset()
+            return result
+
+        browser = await self._pooled_browser(opts)
+        stats = RenderStats()
+        context = await self._create_context(browser, opts, stats)
+        page = await context.new_page()
+        if opts.stealth_mode:
+            await self._apply_stealth_mode(page)
+
+        return PlaywrightResult(
+            browser=browser,
+            context=context,
+            page=page,
+            is_remote=self.is_remote_mode,
+            _playwright=self._playwright,
+            _pooled=True,
+            render_stats=stats,
+        )
+
+    async def _checkin(self, key: tuple, result: PlaywrightResult, reusable: bool) -> None:
+        """Park a page for the next lease, or close it if it failed or the pool is full."""
+        idle = self._idle_pages.setdefault(key, [])
+        if reusable and not result.page.is_closed() and len(idle) < self._max_pages:
+            try:
+                await result.page.goto("about:blank")
+                idle.append(result)
+                return
+            except Exception as e:
+                logger.debug(f"Discarding pooled page that failed to reset: {e}")
+        await result.close()
+
+    async def _pooled_browser(self, opts: PlaywrightOptions) -> Browser:
+        """The shared browser for opts, (re)started if missing or disconnected."""
+        launch_key = self._launch_key(opts)
+        async with self._pool_lock:
+            browser = self._browsers.get(launch_key)
+            if browser is None or not browser.is_connected():
+                if not PLAYWRIGHT_AVAILABLE:
+                    raise ImportError("playwright is not installed. Install it with: pip install playwright && playwright install chromium")
+                playwright = await self._get_or_start_playwright()
+                if self.is_remote_mode:
+                    browser = await self._connect_remote(playwright)
+                else:
+                    browser = await self._launch_local(playwright, opts)
+                self._browsers[launch_key] = browser
+                logger.info(f"Started pooled Playwright browser ({'remote' if self.is_remote_mode else 'local'})")
+        return browser
+
     async def get_page_content(self, url: str, options: PlaywrightOptions | None = None) -> PageContentResult:
         """Convenience method to fetch page content with automatic browser lifecycle.
 
@@ -396,6 +757,9 @@ class PlaywrightBrowserService:
             "mode": "remote" if self.is_remote_mode else "local",
             "endpoint": self._endpoint if self.is_remote_mode else None,
             "token_configured": bool(self._token),
+            "pooled_browsers": len(self._browsers),
+            "idle_pages": sum(len(idle) for idle in self._idle_pages.values()),
+            "max_pages": self._max_pages,
         }
 
 
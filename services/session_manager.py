@@ -19,6 +19,14 @@ from datetime import datetime
 
 import psycopg2
 
+from services.animal_statistics import tracked_update, tracked_write
+
+# Rows touched by the set-based updates below, as tracked_write predicates.
+# Neither update changes a column its predicate reads.
+STALE_WHERE = "organization_id = %s AND (last_seen_at IS NULL OR last_seen_at < %s) AND status NOT IN ('adopted', 'reserved')"
+SKIPPED_SEEN_WHERE = "organization_id = %s AND external_id = ANY(%s)"
+SEEN_WHERE = "id = ANY(%s)"
+
 
 class SessionManager:
     """Service for session management and stale data detection extracted from BaseScraper."""
@@ -48,6 +56,7 @@ class SessionManager:
         self.conn = None
         self.current_scrape_session: datetime | None = None
         self.found_external_ids: set[str] = set()
+        self.unchanged_external_ids: set[str] = set()
 
     def connect(self) -> bool:
         """Establish database connection.
@@ -90,6 +99,7 @@ class SessionManager:
         try:
             self.current_scrape_session = datetime.now()
             self.found_external_ids = set()
+            self.unchanged_external_ids = set()
             self.logger.info(f"Started scrape session at {self.current_scrape_session}")
             return True
         except Exception as e:
@@ -116,6 +126,19 @@ class SessionManager:
         if external_id:
             self.found_external_ids.add(external_id)
 
+    def record_unchanged_animal(self, external_id: str) -> None:
+        """Record an animal that was found but not saved because its page hadn't changed.
+
+        mark_skipped_animals_as_seen() marks these as seen even when
+        skip_existing_animals is off.
+
+        Args:
+            external_id: The external_id of the unchanged animal
+        """
+        if external_id:
+            self.found_external_ids.add(external_id)
+            self.unchanged_external_ids.add(external_id)
+
     def get_found_external_ids_count(self) -> int:
         """Get the count of external IDs recorded as found in this session.
 
@@ -142,16 +165,11 @@ class SessionManager:
             try:
                 with self.connection_pool.get_connection_context() as conn:
                     cursor = conn.cursor()
-                    cursor.execute(
-                        """
-                        UPDATE animals
-                        SET last_seen_at = %s,
-                            consecutive_scrapes_missing = 0,
-                            availability_confidence = 'high',
-                            active = true
-                        WHERE id = %s
-                        """,
-                        (self.current_scrape_session, animal_id),
+                    tracked_update(
+                        cursor,
+                        animal_id,
+                        "last_seen_at = %s, consecutive_scrapes_missing = 0, availability_confidence = 'high', active = true",
+                        (self.current_scrape_session,),
                     )
                     conn.commit()
                     cursor.close()
@@ -169,16 +187,11 @@ class SessionManager:
 
         try:
             cursor = self.conn.cursor()
-            cursor.execute(
-                """
-                UPDATE animals
-                SET last_seen_at = %s,
-                    consecutive_scrapes_missing = 0,
-                    availability_confidence = 'high',
-                    active = true
-                WHERE id = %s
-                """,
-                (self.current_scrape_session, animal_id),
+            tracked_update(
+                cursor,
+                animal_id,
+                "last_seen_at = %s, consecutive_scrapes_missing = 0, availability_confidence = 'high', active = true",
+                (self.current_scrape_session,),
             )
             self.conn.commit()
             cursor.close()
@@ -189,6 +202,82 @@ class SessionManager:
                 self.conn.rollback()
             return False
 
+    def mark_animals_as_seen(self, animal_ids: list[int]) -> int:
+        """Mark a batch of animals as seen in the current scrape session, in one statement.
+
+        The set-based counterpart of mark_animal_as_seen(), so a scrape marks
+        its saved animals with one UPDATE instead of one per animal.
+
+        Args:
+            animal_ids: IDs of the animals to mark as seen
+
+        Returns:
+            Number of animals marked as seen
+        """
+        if not self.current_scrape_session:
+            self.logger.warning("No active scrape session when marking animals as seen")
+            return 0
+
+        seen_ids = sorted(set(animal_ids))
+        if not seen_ids:
+            return 0
+
+        # Use connection pool if available
+        if self.connection_pool:
+            try:
+                with self.connection_pool.get_connection_context() as conn:
+                    cursor = conn.cursor()
+                    with tracked_write(cursor, SEEN_WHERE, (seen_ids,)):
+                        cursor.execute(
+                            """
+                            UPDATE animals
+                            SET last_seen_at = %s,
+                                consecutive_scrapes_missing = 0,
+                                availability_confidence = 'high',
+                                active = true
+                            WHERE id = ANY(%s)
+                            """,
+                            (self.current_scrape_session, seen_ids),
+                        )
+                        rows_affected = cursor.rowcount
+                    conn.commit()
+                    cursor.close()
+                    return rows_affected
+            except Exception as e:
+                self.logger.error(f"Error marking animals as seen: {e}")
+                return 0
+
+        # Fallback to direct connection
+        if not self.conn:
+            # Try to establish connection before failing
+            if not self.connect():
+                self.logger.error("No database connection available for marking animals as seen")
+                return 0
+
+        try:
+            cursor = self.conn.cursor()
+            with tracked_write(cursor, SEEN_WHERE, (seen_ids,)):
+                cursor.execute(
+                    """
+                    UPDATE animals
+                    SET last_seen_at = %s,
+                        consecutive_scrapes_missing = 0,
+                        availability_confidence = 'high',
+                        active = true
+                    WHERE id = ANY(%s)
+                    """,
+                    (self.current_scrape_session, seen_ids),
+                )
+                rows_affected = cursor.rowcount
+            self.conn.commit()
+            cursor.close()
+            return rows_affected
+        except Exception as e:
+            self.logger.error(f"Error marking animals as seen: {e}")
+            if self.conn:
+                self.conn.rollback()
+            return 0
+
     def update_stale_data_detection(self) -> bool:
         """Update stale data detection for animals not seen in current scrape.
 
@@ -208,30 +297,31 @@ class SessionManager:
                     # Update animals not seen in current scrape
                     # FIXED: Use >= 2 because CASE evaluates BEFORE increment
                     # So after 3 misses: pre-increment value is 2, >= 2 triggers active=false
-                    cursor.execute(
-                        """
-                        UPDATE animals
-                        SET consecutive_scrapes_missing = consecutive_scrapes_missing + 1,
-                            availability_confidence = CASE
-                                WHEN consecutive_scrapes_missing = 0 THEN 'medium'
-                                ELSE 'low'
-                            END,
-                            status = CASE
-                                WHEN consecutive_scrapes_missing >= 2 THEN 'unknown'
-                                ELSE status
-                            END,
-                            active = CASE
-                                WHEN consecutive_scrapes_missing >= 2 THEN false
-                                ELSE active
-                            END
-                        WHERE organization_id = %s
-                        AND (last_seen_at IS NULL OR last_seen_at < %s)
-                        AND status NOT IN ('adopted', 'reserved')
-                        """,
-                        (self.organization_id, self.current_scrape_session),
-                    )
+                    with tracked_write(cursor, STALE_WHERE, (self.organization_id, self.current_scrape_session)):
+                        cursor.execute(
+                            """
+                            UPDATE animals
+                            SET consecutive_scrapes_missing = consecutive_scrapes_missing + 1,
+                                availability_confidence = CASE
+                                    WHEN consecutive_scrapes_missing = 0 THEN 'medium'
+                                    ELSE 'low'
+                                END,
+                                status = CASE
+                                    WHEN consecutive_scrapes_missing >= 2 THEN 'unknown'
+                                    ELSE status
+                                END,
+                                active = CASE
+                                    WHEN consecutive_scrapes_missing >= 2 THEN false
+                                    ELSE active
+                                END
+                            WHERE organization_id = %s
+                            AND (last_seen_at IS NULL OR last_seen_at < %s)
+                            AND status NOT IN ('adopted', 'reserved')
+                            """,
+                            (self.organization_id, self.current_scrape_session),
+                        )
+                        rows_affected = cursor.rowcount
 
-                    rows_affected = cursor.rowcount
                     conn.commit()
                     cursor.close()
 
@@ -254,30 +344,31 @@ class SessionManager:
             # Update animals not seen in current scrape
             # FIXED: Use >= 2 because CASE evaluates BEFORE increment
             # So after 3 misses: pre-increment value is 2, >= 2 triggers active=false
-            cursor.execute(
-                """
-                UPDATE animals
-                SET consecutive_scrapes_missing = consecutive_scrapes_missing + 1,
-                    availability_confidence = CASE
-                        WHEN consecutive_scrapes_missing = 0 THEN 'medium'
-                        ELSE 'low'
-                    END,
-                    status = CASE
-                        WHEN consecutive_scrapes_missing >= 2 THEN 'unknown'
-                        ELSE status
-                    END,
-                    active = CASE
-                        WHEN consecutive_scrapes_missing >= 2 THEN false
-                        ELSE active
-                    END
-                WHERE organization_id = %s
-                AND (last_seen_at IS NULL OR last_seen_at < %s)
-                AND status NOT IN ('adopted', 'reserved')
-                """,
-                (self.organization_id, self.current_scrape_session),
-            )
+            with tracked_write(cursor, STALE_WHERE, (self.organization_id, self.current_scrape_session)):
+                cursor.execute(
+                    """
+                    UPDATE animals
+                    SET consecutive_scrapes_missing = consecutive_scrapes_missing + 1,
+                        availability_confidence = CASE
+                            WHEN consecutive_scrapes_missing = 0 THEN 'medium'
+                            ELSE 'low'
+                        END,
+                        status = CASE
+                            WHEN consecutive_scrapes_missing >= 2 THEN 'unknown'
+                            ELSE status
+                        END,
+                        active = CASE
+                            WHEN consecutive_scrapes_missing >= 2 THEN false
+                            ELSE active
+                        END
+                    WHERE organization_id = %s
+                    AND (last_seen_at IS NULL OR last_seen_at < %s)
+                    AND status NOT IN ('adopted', 'reserved')
+                    """,
+                    (self.organization_id, self.current_scrape_session),
+                )
+                rows_affected = cursor.rowcount
 
-            rows_affected = cursor.rowcount
             self.conn.commit()
             cursor.close()
 
@@ -309,19 +400,20 @@ class SessionManager:
             cursor = self.conn.cursor()
 
             # Mark animals as unavailable after threshold missed scrapes
-            cursor.execute(
-                """
-                UPDATE animals
-                SET status = 'unknown',
-                    active = false
-                WHERE organization_id = %s
-                AND consecutive_scrapes_missing >= %s
-                AND status NOT IN ('unknown', 'adopted', 'reserved')
-                """,
-                (self.organization_id, threshold),
-            )
+            with tracked_write(cursor, "organization_id = %s AND consecutive_scrapes_missing >= %s", (self.organization_id, threshold)):
+                cursor.execute(
+                    """
+                    UPDATE animals
+                    SET status = 'unknown',
+                        active = false
+                    WHERE organization_id = %s
+                    AND consecutive_scrapes_missing >= %s
+                    AND status NOT IN ('unknown', 'adopted', 'reserved')
+                    """,
+                    (self.organization_id, threshold),
+                )
+                rows_affected = cursor.rowcount
 
-            rows_affected = cursor.rowcount
             self.conn.commit()
             cursor.close()
 
@@ -353,22 +445,16 @@ class SessionManager:
             cursor = self.conn.cursor()
 
             # Restore animal to available status with high confidence
-            cursor.execute(
-                """
-                UPDATE animals
-                SET status = 'available',
+            tracked_update(
+                cursor,
+                animal_id,
+                """status = 'available',
                     active = true,
                     consecutive_scrapes_missing = 0,
                     availability_confidence = 'high',
                     last_seen_at = %s,
-                    updated_at = %s
-                WHERE id = %s
-                """,
-                (
-                    self.current_scrape_session or datetime.now(),
-                    datetime.now(),
-                    animal_id,
-                ),
+                    updated_at = %s""",
+                (self.current_scrape_session or datetime.now(), datetime.now()),
             )
 
             self.conn.commit()
@@ -384,7 +470,14 @@ class SessionManager:
             return False
 
     def mark_skipped_animals_as_seen(self) -> int:
-        """Mark animals that were found but skipped due to skip_existing_animals as seen.
+        """Mark animals that were found but skipped as seen.
+
+        Animals are skipped by skip_existing_animals, or because their detail
+        page was unchanged since the last run (record_unchanged_animal()).
+
+        A skipped dog is never re-saved, so one that stale detection had set to
+        'unknown' while it was missing from the site is restored to available
+        here. Adopted and reserved dogs keep their status.
 
         IMPORTANT: Only marks animals whose external_id was recorded via record_found_animal().
         This prevents marking ALL available animals as seen, which was causing the stale
@@ -393,14 +486,16 @@ class SessionManager:
         Returns:
             Number of animals marked as seen
         """
-        if not self.skip_existing_animals or not self.current_scrape_session:
+        if not (self.skip_existing_animals or self.unchanged_external_ids) or not self.current_scrape_session:
             return 0
 
-        if not self.found_external_ids:
+        # Without skip_existing_animals, every other found animal was saved and marked seen already
+        skipped_ids = self.found_external_ids if self.skip_existing_animals else self.unchanged_external_ids
+        if not skipped_ids:
             self.logger.info("No external IDs recorded as found - skipping mark_skipped_animals_as_seen")
             return 0
 
-        found_ids_tuple = tuple(self.found_external_ids)
+        found_ids_tuple = tuple(skipped_ids)
 
         # Use connection pool if available
         if self.connection_pool:
@@ -409,30 +504,32 @@ class SessionManager:
                     cursor = conn.cursor()
 
                     # Only mark animals that were ACTUALLY FOUND by the scraper
-                    cursor.execute(
-                        """
-                        UPDATE animals
-                        SET last_seen_at = %s,
-                            consecutive_scrapes_missing = 0,
-                            availability_confidence = 'high',
-                            active = true
-                        WHERE organization_id = %s
-                        AND status = 'available'
-                        AND external_id = ANY(%s)
-                        """,
-                        (
-                            self.current_scrape_session,
-                            self.organization_id,
-                            list(found_ids_tuple),
-                        ),
-                    )
+                    with tracked_write(cursor, SKIPPED_SEEN_WHERE, (self.organization_id, list(found_ids_tuple))):
+                        cursor.execute(
+                            """
+                            UPDATE animals
+                            SET status = 'available',
+                                last_seen_at = %s,
+                                consecutive_scrapes_missing = 0,
+                                availability_confidence = 'high',
+                                active = true
+                            WHERE organization_id = %s
+                            AND status IN ('available', 'unknown')
+                            AND external_id = ANY(%s)
+                            """,
+                            (
+                                self.current_scrape_session,
+                                self.organization_id,
+                                list(found_ids_tuple),
+                            ),
+                        )
+                        rows_affected = cursor.rowcount
 
-                    rows_affected = cursor.rowcount
                     conn.commit()
                     cursor.close()
 
                     if rows_affected > 0:
-                        self.logger.info(f"Marked {rows_affected} actually-found animals as seen (from {len(self.found_external_ids)} found external IDs)")
+                        self.logger.info(f"Marked {rows_affected} actually-found animals as seen (from {len(found_ids_tuple)} found external IDs)")
 
                     return rows_affected
             except Exception as e:
@@ -449,30 +546,32 @@ class SessionManager:
             cursor = self.conn.cursor()
 
             # Only mark animals that were ACTUALLY FOUND by the scraper
-            cursor.execute(
-                """
-                UPDATE animals
-                SET last_seen_at = %s,
-                    consecutive_scrapes_missing = 0,
-                    availability_confidence = 'high',
-                    active = true
-                WHERE organization_id = %s
-                AND status = 'available'
-                AND external_id = ANY(%s)
-                """,
-                (
-                    self.current_scrape_session,
-                    self.organization_id,
-                    list(found_ids_tuple),
-                ),
-            )
+            with tracked_write(cursor, SKIPPED_SEEN_WHERE, (self.organization_id, list(found_ids_tuple))):
+                cursor.execute(
+                    """
+                    UPDATE animals
+                    SET status = 'available',
+                        last_seen_at = %s,
+                        consecutive_scrapes_missing = 0,
+                        availability_confidence = 'high',
+                        active = true
+                    WHERE organization_id = %s
+                    AND status IN ('available', 'unknown')
+                    AND external_id = ANY(%s)
+                    """,
+                    (
+                        self.current_scrape_session,
+                        self.organization_id,
+                        list(found_ids_tuple),
+                    ),
+                )
+                rows_affected = cursor.rowcount
 
-            rows_affected = cursor.rowcount
             self.conn.commit()
             cursor.close()
 
             if rows_affected > 0:
-                self.logger.info(f"Marked {rows_affected} actually-found animals as seen (from {len(self.found_external_ids)} found external IDs)")
+                self.logger.info(f"Marked {rows_affected} actually-found animals as seen (from {len(found_ids_tuple)} found external IDs)")
 
             return rows_affected
 
@@ -0,0 +1,36 @@
+"""
+Weekly shuffle order for the random and diverse animal listings.
+
+Both listings used to order every eligible row by a hash of its ID and the ISO
+week, which meant a full sort on each request. The same hash is now stored in
+animals.shuffle_key, so the listings read an index in (shuffle_key, id) order
+and stop as soon as they have enough rows.
+
+The key is a pure function of (id, week): recomputing it mid-week changes
+nothing for existing rows and only fills rows that have none, so the order is
+stable for the whole week. The scraper cron refreshes after each batch, which
+also picks up the week rollover. Rows without a key (new since the last
+refresh) sort last.
+"""
+
+from typing import Any
+
+SHUFFLE_KEY = "hashtext(id::text || to_char(NOW(), 'IYYY-IW'))"
+
+REFRESH_SQL = f"""
+    UPDATE animals
+    SET shuffle_key = {SHUFFLE_KEY}
+    WHERE shuffle_key IS DISTINCT FROM {SHUFFLE_KEY}
+"""
+
+
+def refresh_shuffle_keys(cursor: Any) -> int:
+    """
+    Bring every animal's shuffle_key to the current week.
+
+    Returns:
+        Number of rows rewritten - every row on the first refresh of a week,
+        only new animals after that. The caller commits.
+    """
+    cursor.execute(REFRESH_SQL)
+    return cursor.rowcount
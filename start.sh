@@ -6,5 +6,6 @@ if [ "$SERVICE_TYPE" = "cron" ]; then
     exec uv run python management/railway_scraper_cron.py
 else
     echo "Starting API service..."
-    exec uv run uvicorn api.main:app --host 0.0.0.0 --port ${PORT:-8080} --forwarded-allow-ips='*'
+    # Worker count, keep-alive and pre-fork are configured in api/server.py
+    exec uv run python -m api.server
 fi
@@ -0,0 +1,80 @@
+"""Tests for the per-ID multi-get cache behind the batch endpoints."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from api.services.animal_id_cache import AnimalIdCache
+
+
+@pytest.mark.unit
+class TestAnimalIdCache:
+    @pytest.fixture
+    def cache(self):
+        return AnimalIdCache(maxsize=100, ttl=60)
+
+    def test_get_many_splits_hits_and_misses(self, cache):
+        cache.set_many({1: "a", 3: "c"})
+
+        found, missing = cache.get_many([1, 2, 3, 4])
+
+        assert found == {1: "a", 3: "c"}
+        assert missing == [2, 4]
+
+    def test_get_many_collapses_duplicate_ids(self, cache):
+        found, missing = cache.get_many([2, 2, 5, 2])
+
+        assert found == {}
+        assert missing == [2, 5]
+
+    def test_fetch_many_loads_only_misses(self, cache):
+        cache.set_many({1: "a"})
+        loader = MagicMock(return_value={2: "b"})
+
+        values, hits = cache.fetch_many([2, 1], loader)
+
+        loader.assert_called_once_with([2])
+        assert values == ["b", "a"]
+        assert hits == 1
+
+    def test_fetch_many_skips_loader_when_all_cached(self, cache):
+        cache.set_many({1: "a", 2: "b"})
+        loader = MagicMock()
+
+        values, hits = cache.fetch_many([2, 1], loader)
+
+        loader.assert_not_called()
+        assert values == ["b", "a"]
+        assert hits == 2
+
+    def test_fetch_many_does_not_cache_unresolved_ids(self, cache):
+        values, _ = cache.fetch_many([7, 8], lambda ids: {7: "g"})
+
+        assert values == ["g"]
+        assert 8 not in cache
+
+    def test_invalidate_single_and_all(self, cache):
+        cache.set_many({1: "a", 2: "b"})
+
+        cache.invalidate(1)
+        assert 1 not in cache and 2 in cache
+
+        cache.invalidate()
+        assert len(cache) == 0
+
+    def test_callers_get_copies(self, cache):
+        values, _ = cache.fetch_many([1], lambda ids: {1: {"cached": False}})
+        values[0]["cached"] = True
+
+        again, _ = cache.fetch_many([1], MagicMock())
+        again[0]["name"] = "changed"
+
+        assert cache.get_many([1])[0] == {1: {"cached": False}}
+
+    def test_on_hit_sees_only_cached_values(self, cache):
+        cache.set_many({1: {"cached": False}})
+
+        values, _ = cache.fetch_many([1, 2], lambda ids: {2: {"cached": False}}, on_hit=lambda value: value.update(cached=True))
+
+        assert values == [{"cached": True}, {"cached": False}]
+        assert cache.get_many([1])[0] == {1: {"cached": False}}
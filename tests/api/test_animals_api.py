@@ -354,6 +354,21 @@ class TestAnimalsAPI:
         assert data["total_dogs"] >= 0
         assert data["total_organizations"] >= 0
 
+    def test_statistics_read_the_seeded_counters(self, client: TestClient):
+        """The counters are reconciled after seeding, so they carry the 12 test dogs."""
+        data = client.get("/api/animals/statistics").json()
+
+        org = next(o for o in data["organizations"] if o["id"] == 901)
+        assert org["dog_count"] == 12
+        assert org["new_this_week"] == 12
+        assert data["total_dogs"] >= 12
+
+    def test_stats_by_country_reads_the_seeded_counters(self, client: TestClient):
+        data = client.get("/api/animals/stats/by-country").json()
+
+        assert data["total"] == sum(c["count"] for c in data["countries"])
+        assert any(c["count"] >= 12 and c["organizations"] >= 1 for c in data["countries"])
+
     def test_get_animals_with_curation_type_recent_with_fallback_normal_case(self, client: TestClient):
         """Test recent_with_fallback when recent dogs exist - should return recent dogs."""
         response = client.get("/api/animals?curation_type=recent_with_fallback&limit=4")
@@ -67,3 +67,19 @@ class TestBatchEndpointIntegration:
         assert response.status_code == 200
         data = response.json()
         assert "dog_profiler_data" in data[0]
+
+    def test_results_follow_requested_order(self, client: TestClient):
+        response = client.get("/api/animals/batch?ids=9003&ids=9001&ids=9002")
+        assert response.status_code == 200
+        assert [animal["id"] for animal in response.json()] == [9003, 9001, 9002]
+
+    def test_overlapping_batch_served_from_per_id_cache(self, client: TestClient):
+        from api.services.animal_id_cache import animal_batch_cache
+
+        client.get("/api/animals/batch?ids=9001&ids=9002")
+        assert 9001 in animal_batch_cache and 9002 in animal_batch_cache
+
+        response = client.get("/api/animals/batch?ids=9002&ids=9003&ids=9001")
+        assert response.status_code == 200
+        assert [animal["id"] for animal in response.json()] == [9002, 9003, 9001]
+        assert 9003 in animal_batch_cache
@@ -5,7 +5,7 @@ Specifically tests:
 - Cache invalidation methods
 - Retry logic for database operations
 - Monitoring metrics endpoint
-- SHA256 cache key optimization
+- Per-ID bulk caching
 - Error handling with custom exceptions
 - Observability logging
 """
@@ -17,6 +17,7 @@ from psycopg2 import OperationalError
 from psycopg2.extras import RealDictCursor
 
 from api.exceptions import DatabaseRetryExhaustedError
+from api.services.animal_id_cache import AnimalIdCache
 from api.services.enhanced_animal_service import EnhancedAnimalService
 
 
@@ -36,7 +37,7 @@ class TestCacheInvalidation:
         # Add some data to caches
         service._detail_cache[123] = {"test": "data"}
         service._content_cache["content_123"] = {"content": "data"}
-        service._bulk_cache["hash123"] = [{"bulk": "data"}]
+        service._bulk_cache.set_many({123: {"bulk": "data"}, 124: {"bulk": "other"}})
 
         # Invalidate specific animal
         service.invalidate_cache(animal_id=123)
@@ -44,8 +45,9 @@ class TestCacheInvalidation:
         # Verify detail and content caches cleared for this animal
         assert 123 not in service._detail_cache
         assert "content_123" not in service._content_cache
-        # Bulk cache should be cleared (we can't efficiently check specific IDs)
-        assert len(service._bulk_cache) == 0
+        # Bulk cache is keyed per ID, so only this animal is dropped
+        assert 123 not in service._bulk_cache
+        assert 124 in service._bulk_cache
 
     @pytest.mark.unit
     def test_invalidate_all_caches(self, service):
@@ -54,7 +56,7 @@ class TestCacheInvalidation:
         service._detail_cache[123] = {"test": "data"}
         service._detail_cache[124] = {"test": "data2"}
         service._content_cache["content_123"] = {"content": "data"}
-        service._bulk_cache["hash123"] = [{"bulk": "data"}]
+        service._bulk_cache.set_many({123: {"bulk": "data"}})
 
         # Invalidate all
         service.invalidate_cache()
@@ -69,7 +71,7 @@ class TestCacheInvalidation:
         """Test invalidating only bulk cache."""
         # Add data to caches
         service._detail_cache[123] = {"test": "data"}
-        service._bulk_cache["hash123"] = [{"bulk": "data"}]
+        service._bulk_cache.set_many({123: {"bulk": "data"}})
 
         # Invalidate only bulk cache
         service.invalidate_bulk_cache()
@@ -135,41 +137,59 @@ class TestRetryLogic:
 
 
 @pytest.mark.unit
-class TestCacheKeyOptimization:
-    """Test SHA256 cache key generation for memory efficiency."""
+class TestBulkPerIdCaching:
+    """Test per-ID multi-get caching for bulk enhanced lookups."""
 
     @pytest.fixture
-    def service(self):
-        """Create service with mock cursor."""
+    def cursor(self):
         cursor = MagicMock(spec=RealDictCursor)
-        return EnhancedAnimalService(cursor)
+        cursor.fetchall.side_effect = lambda: [{"id": aid, "name": f"Dog {aid}", "slug": f"dog-{aid}", "dog_profiler_data": {}, "has_data": False} for aid in cursor.execute.call_args[0][1][0]]
+        return cursor
+
+    @pytest.fixture
+    def service(self, cursor):
+        return EnhancedAnimalService(cursor, bulk_cache=AnimalIdCache(maxsize=100, ttl=60))
+
+    @pytest.mark.unit
+    def test_overlapping_request_queries_only_uncached_ids(self, service, cursor):
+        """A second request sharing IDs with the first only queries the new ones."""
+        service.get_bulk_enhanced([1, 2, 3])
+        service.get_bulk_enhanced([2, 3, 4])
+
+        assert cursor.execute.call_count == 2
+        assert cursor.execute.call_args[0][1] == ([4],)
+
+    @pytest.mark.unit
+    def test_fully_cached_request_skips_database(self, service, cursor):
+        service.get_bulk_enhanced([1, 2])
+        results = service.get_bulk_enhanced([2, 1])
+
+        assert cursor.execute.call_count == 1
+        assert all(r.metadata["cached"] for r in results)
 
     @pytest.mark.unit
-    def test_bulk_cache_key_generation(self, service):
-        """Test SHA256 hash generation for bulk cache keys."""
-        # Test with unsorted IDs
-        animal_ids = [456, 123, 789]
-        key = service._generate_bulk_cache_key(animal_ids)
+    def test_results_follow_caller_order(self, service):
+        service.get_bulk_enhanced([5, 1])
+        results = service.get_bulk_enhanced([3, 1, 5, 2, 1])
 
-        # Verify key is a 16-character hex string
-        assert len(key) == 16
-        assert all(c in "0123456789abcdef" for c in key)
+        assert [r.id for r in results] == [3, 1, 5, 2]
 
-        # Verify same IDs in different order produce same key
-        key2 = service._generate_bulk_cache_key([789, 123, 456])
-        assert key == key2
+    @pytest.mark.unit
+    def test_missing_ids_are_omitted_and_not_cached(self, service, cursor):
+        cursor.fetchall.side_effect = lambda: [{"id": 1, "name": "Max", "slug": "max-1", "dog_profiler_data": {}, "has_data": False}]
+
+        results = service.get_bulk_enhanced([1, 999])
+
+        assert [r.id for r in results] == [1]
+        assert 999 not in service._bulk_cache
 
     @pytest.mark.unit
-    def test_bulk_cache_key_uniqueness(self, service):
-        """Test that different ID sets produce different keys."""
-        key1 = service._generate_bulk_cache_key([1, 2, 3])
-        key2 = service._generate_bulk_cache_key([1, 2, 4])
-        key3 = service._generate_bulk_cache_key([1, 2, 3, 4])
-
-        # All keys should be different
-        assert key1 != key2
-        assert key1 != key3
-        assert key2 != key3
+    def test_hit_and_miss_metrics_count_ids(self, service):
+        service.get_bulk_enhanced([1, 2])
+        service.get_bulk_enhanced([2, 3])
+
+        assert service._metrics["cache_hits"]["bulk"] == 1
+        assert service._metrics["cache_misses"]["bulk"] == 3
 
 
 @pytest.mark.unit
@@ -0,0 +1,69 @@
+"""The launch profile must never size more workers than the database can hold.
+
+Each worker opens its own connection pool, so a CPU-only sizing on a large
+host would exhaust max_connections and lock the scraper cron out.
+"""
+
+import os
+from dataclasses import replace
+from unittest.mock import Mock
+
+import pytest
+
+from api import server
+from api.server import DEFAULT_DB_MAX_CONNECTIONS, DEFAULT_DB_RESERVED_CONNECTIONS, PREFORK_POOL_MAX_CONN, ServerProfile, autosize_workers, build_config, load_profile
+
+
+@pytest.mark.unit
+class TestAutosizeWorkers:
+    def test_cpu_bound_when_the_pool_budget_is_large(self):
+        assert autosize_workers(cpus=2, pool_max_conn=10, db_max_connections=200, reserved_connections=20) == (5, "cpu")
+
+    def test_pool_bound_when_workers_would_exhaust_connections(self):
+        assert autosize_workers(cpus=8, pool_max_conn=20, db_max_connections=100, reserved_connections=20) == (4, "pool")
+
+    def test_never_below_one_worker(self):
+        assert autosize_workers(cpus=4, pool_max_conn=50, db_max_connections=40, reserved_connections=20) == (1, "pool")
+
+
+@pytest.mark.unit
+class TestLoadProfile:
+    def test_default_pool_fits_several_workers_in_the_default_budget(self):
+        profile = load_profile({})
+
+        assert profile.pool_max_conn == PREFORK_POOL_MAX_CONN
+        assert profile.workers > 1
+        assert profile.workers * profile.pool_max_conn <= DEFAULT_DB_MAX_CONNECTIONS - DEFAULT_DB_RESERVED_CONNECTIONS
+
+    def test_serving_hands_the_pool_size_to_the_workers(self, monkeypatch):
+        monkeypatch.delenv("DB_POOL_MAX_CONN", raising=False)
+        monkeypatch.setattr(server.uvicorn, "Server", Mock())
+
+        server.serve(replace(load_profile({}), workers=1))
+
+        assert os.environ["DB_POOL_MAX_CONN"] == str(PREFORK_POOL_MAX_CONN)
+
+    def test_web_concurrency_overrides_autosizing(self):
+        profile = load_profile({"WEB_CONCURRENCY": "3", "DB_POOL_MAX_CONN": "50"})
+
+        assert (profile.workers, profile.sizing) == (3, "WEB_CONCURRENCY")
+
+    def test_smaller_pools_allow_more_workers(self):
+        profile = load_profile({"DB_POOL_MAX_CONN": "10", "DB_MAX_CONNECTIONS": "100", "DB_RESERVED_CONNECTIONS": "20"})
+
+        assert profile.workers > 1
+        assert profile.workers * 10 <= 80
+
+    def test_keep_alive_outlasts_the_proxy_idle_timeout(self):
+        config = build_config(load_profile({"PORT": "9000"}))
+
+        assert config.port == 9000
+        assert config.timeout_keep_alive >= 60, "uvicorn's 5s default closes connections the edge proxy is about to reuse"
+        assert config.proxy_headers is True
+
+    def test_profile_is_immutable(self):
+        profile = load_profile({})
+
+        with pytest.raises(AttributeError):
+            profile.workers = 4
+        assert isinstance(profile, ServerProfile)
@@ -26,6 +26,8 @@ from api.dependencies import (  # noqa: E402
     get_pooled_db_cursor,
 )
 from api.main import app  # noqa: E402
+from services.animal_statistics import reconcile_statistics  # noqa: E402
+from services.weekly_shuffle import refresh_shuffle_keys  # noqa: E402
 
 # Import database pool to initialize it
 from utils.db_connection import DatabaseConfig  # noqa: E402
@@ -207,8 +209,13 @@ def _clear_test_tables_robust(cursor, conn, max_retries=3):
     deletion_order = [
         # "animal_images",  # Table removed in migration 005
         "animals",  # References organizations(id)
+        "scrape_checkpoints",  # References scrape_logs(id)
+        "image_hashes",  # Keyed by source URL; no foreign keys
+        "page_validators",  # References organizations(id)
         "scrape_logs",  # References organizations(id)
         "service_regions",  # References organizations(id)
+        "animal_statistics",  # References organizations(id)
+        "metadata_dictionary",  # Snapshot of the seeded rows; rebuilt live when absent
         "organizations",  # Parent table - delete last
     ]
 
@@ -347,6 +354,11 @@ def manage_test_data(request):
         cursor.execute(animals_sql)
         print("[conftest.manage_test_data] Comprehensive test animals inserted (12 dogs with various breeds).")
 
+        # Seeded with raw SQL, so the statistics counters need a recount
+        # and the shuffle keys a refresh
+        reconcile_statistics(cursor)
+        refresh_shuffle_keys(cursor)
+
         # --- IMPORTANT: Commit the setup data using the connection from the override ---
         conn.commit()
         print("[conftest.manage_test_data] Data setup complete and committed.")
@@ -512,6 +524,18 @@ def disable_cloudinary_in_tests():
         yield
 
 
+@pytest.fixture(autouse=True)
+def reset_animal_id_caches():
+    """Clear the process-wide caches so no test sees another's rows."""
+    from api.services.animal_id_cache import animal_batch_cache, enhanced_bulk_cache
+    from utils.metadata_dictionary import metadata_dictionary
+
+    animal_batch_cache.invalidate()
+    enhanced_bulk_cache.invalidate()
+    metadata_dictionary.invalidate()
+    yield
+
+
 @pytest.fixture(autouse=True)
 def stub_clock(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> RecordedSleeps:
     """Replace sleeps with recordings so the suite runs at CPU speed.
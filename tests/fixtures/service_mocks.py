@@ -42,7 +42,8 @@ def create_mock_database_service(success_mode: bool = True) -> Mock:
         mock_service.update_animal.return_value = (1, "updated")
         mock_service.create_scrape_log.return_value = 123
         mock_service.complete_scrape_log.return_value = True
-        mock_service.get_existing_animal_urls.return_value = set()
+        mock_service.get_listing_hashes.return_value = {}
+        mock_service.resume_checkpoint.return_value = set()
     else:
         # Configure error scenarios
         mock_service.connect.return_value = False
@@ -52,7 +53,8 @@ def create_mock_database_service(success_mode: bool = True) -> Mock:
         mock_service.update_animal.return_value = (None, "error")
         mock_service.create_scrape_log.return_value = None
         mock_service.complete_scrape_log.return_value = False
-        mock_service.get_existing_animal_urls.return_value = set()
+        mock_service.get_listing_hashes.return_value = {}
+        mock_service.resume_checkpoint.return_value = set()
 
     return mock_service
 
@@ -104,6 +106,7 @@ def create_mock_session_manager(success_mode: bool = True) -> Mock:
         mock_service.start_scrape_session.return_value = True
         mock_service.get_current_session.return_value = datetime.now()
         mock_service.mark_animal_as_seen.return_value = True
+        mock_service.mark_animals_as_seen.return_value = 5
         mock_service.update_stale_data_detection.return_value = True
         mock_service.mark_animals_unavailable.return_value = 2
         mock_service.restore_available_animal.return_value = True
@@ -121,6 +124,7 @@ def create_mock_session_manager(success_mode: bool = True) -> Mock:
         mock_service.start_scrape_session.return_value = False
         mock_service.get_current_session.return_value = None
         mock_service.mark_animal_as_seen.return_value = False
+        mock_service.mark_animals_as_seen.return_value = 0
         mock_service.update_stale_data_detection.return_value = False
         mock_service.mark_animals_unavailable.return_value = 0
         mock_service.restore_available_animal.return_value = False
@@ -29,8 +29,12 @@ def batch(results: list[ScraperRunResult], success: bool = True) -> BatchRunResu
 
 @pytest.fixture
 def no_breed_report():
-    """format_batch_summary reaches the database through this; pin it."""
-    with patch.object(cron, "report_breed_reconciliation", return_value={"unmatched_rows": 0, "provisional_values": 0, "top_unmatched": []}):
+    """format_batch_summary reaches the database through these; pin them."""
+    with (
+        patch.object(cron, "report_breed_reconciliation", return_value={"unmatched_rows": 0, "provisional_values": 0, "top_unmatched": []}),
+        patch.object(cron, "report_statistics_reconciliation", return_value={"organizations_corrected": 0}),
+        patch.object(cron, "refresh_listing_order", return_value={"shuffle_keys_refreshed": 0}),
+    ):
         yield
 
 
@@ -113,6 +117,44 @@ class TestBreedReconciliationNeverFailsTheScrape:
             assert len(cron.report_breed_reconciliation()["top_unmatched"]) == 5
 
 
+@pytest.mark.unit
+class TestStatisticsReconciliation:
+    """The recount that corrects counter drift after each batch."""
+
+    def test_reports_how_many_organisations_were_corrected(self):
+        conn = Mock()
+        conn.cursor.return_value.__enter__ = Mock(return_value=Mock(rowcount=2))
+        conn.cursor.return_value.__exit__ = Mock(return_value=False)
+        connection = patch.object(cron, "get_db_connection", return_value=Mock(__enter__=Mock(return_value=conn), __exit__=Mock(return_value=False)))
+
+        with connection:
+            assert cron.report_statistics_reconciliation() == {"organizations_corrected": 2}
+        conn.commit.assert_called_once()
+
+    def test_a_database_error_is_captured_rather_than_raised(self):
+        with patch.object(cron, "get_db_connection", side_effect=RuntimeError("pool not initialized")):
+            assert cron.report_statistics_reconciliation() == {"error": "pool not initialized"}
+
+    def test_a_captured_error_does_not_make_the_batch_fail(self, no_breed_report):
+        with patch.object(cron, "report_statistics_reconciliation", return_value={"error": "timeout"}):
+            summary = cron.format_batch_summary(batch([ScraperRunResult(config_id="a", success=True, animals_found=3)]), FIXED_START)
+
+        assert summary["overall_success"] is True
+        assert summary["statistics_reconciliation"] == {"error": "timeout"}
+
+
+@pytest.mark.unit
+class TestListingOrderRefresh:
+    def test_reports_how_many_keys_were_written(self):
+        with patch.object(cron, "_run_maintenance", return_value=40) as run:
+            assert cron.refresh_listing_order() == {"shuffle_keys_refreshed": 40}
+        run.assert_called_once_with(cron.refresh_shuffle_keys)
+
+    def test_a_database_error_is_captured_rather_than_raised(self):
+        with patch.object(cron, "get_db_connection", side_effect=RuntimeError("pool not initialized")):
+            assert cron.refresh_listing_order() == {"error": "pool not initialized"}
+
+
 @pytest.mark.unit
 class TestValidateEnvironment:
     def test_rejects_a_config_with_no_host(self):
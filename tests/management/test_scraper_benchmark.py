@@ -0,0 +1,84 @@
+"""The benchmark's numbers, and the verdict it gives a PR.
+
+Round trips are what a query batching change moves, so they must count
+every statement and transaction end on connections opened during the run,
+whatever cursor class the caller asks for. A baseline comparison has to fail
+on a real slowdown and not on noise within the tolerance.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+import pytest
+
+from management.scraper_benchmark import BenchmarkResult, CountingCursor, RoundTripCounter, best_of, counting_round_trips, regressions
+
+
+def result(dogs=100, collect=4.0, process=1.0, round_trips=50):
+    return BenchmarkResult(
+        config_id="dogstrust",
+        pages=20,
+        dogs=dogs,
+        collect_seconds=collect,
+        process_seconds=process,
+        db_round_trips=round_trips,
+        peak_rss_mb=120.0,
+    )
+
+
+@pytest.mark.unit
+class TestRoundTrips:
+    def test_each_statement_and_parameter_set_is_a_round_trip(self):
+        counter = RoundTripCounter()
+        cursor = CountingCursor(MagicMock(), counter)
+
+        cursor.execute("SELECT 1")
+        cursor.executemany("INSERT INTO t VALUES (%s)", ((n,) for n in range(3)))
+        cursor.callproc("refresh")
+
+        assert counter.count == 5
+
+    def test_the_cursor_is_otherwise_the_callers(self):
+        real = MagicMock()
+        real.fetchall.return_value = [(1,)]
+        real.__iter__.return_value = iter([(1,)])
+        real.__enter__.return_value = real
+        cursor = CountingCursor(real, RoundTripCounter())
+
+        with cursor as entered:
+            assert entered is cursor
+            assert entered.fetchall() == [(1,)]
+            assert list(entered) == [(1,)]
+        real.__exit__.assert_called_once()
+
+    def test_connections_opened_while_counting_use_the_counting_class(self):
+        with patch.object(psycopg2, "connect") as connect:
+            with counting_round_trips():
+                psycopg2.connect(host="localhost")
+            psycopg2.connect(host="localhost")
+
+        counted, uncounted = connect.call_args_list
+        assert issubclass(counted.kwargs["connection_factory"], psycopg2.extensions.connection)
+        assert "connection_factory" not in uncounted.kwargs
+
+
+@pytest.mark.unit
+class TestResults:
+    def test_rates(self):
+        assert result().pages_per_sec == 5.0
+        assert result().dogs_per_sec == 20.0
+        assert result(collect=0.0, process=0.0).dogs_per_sec == 0.0
+
+    def test_the_fastest_run_is_reported(self):
+        assert best_of([result(process=3.0), result(), result(process=2.0)]) == result()
+
+    def test_a_slowdown_beyond_tolerance_is_a_regression(self):
+        baseline = result().to_dict()
+
+        assert regressions(result(process=1.2).to_dict(), baseline) == []
+        assert regressions(result(process=3.0).to_dict(), baseline) == ["dogs/sec fell from 20.0 to 14.29"]
+
+    def test_more_round_trips_is_a_regression(self):
+        [found] = regressions(result(round_trips=100).to_dict(), result().to_dict())
+
+        assert found == "DB round trips rose from 50 to 100"
@@ -1,67 +1,93 @@
 """Tests for FilteringService."""
 
+from datetime import datetime
 from unittest.mock import Mock
 
 import pytest
 
 from scrapers.filtering.filtering_service import FilteringService
+from scrapers.listing_fingerprint import card_hash
+
+
+def card(external_id, name="Dog", status="available"):
+    return {"external_id": external_id, "name": name, "status": status, "adoption_url": f"https://x/{external_id}"}
 
 
 @pytest.mark.unit
-@pytest.mark.unit
-class TestFilteringServiceUrlFiltering:
-    """Test URL filtering logic."""
+class TestDetailSelection:
+    """Which listed animals get their detail page fetched."""
 
     @pytest.fixture
     def mock_database_service(self):
-        service = Mock()
-        service.get_existing_animal_urls.return_value = set()
-        return service
-
-    @pytest.fixture
-    def mock_session_manager(self):
         return Mock()
 
-    def test_filter_existing_urls_returns_all_when_skip_disabled(self, mock_database_service):
-        service = FilteringService(
-            database_service=mock_database_service,
-            organization_id=1,
-            skip_existing_animals=False,
-        )
+    def service(self, database_service, fraction=0.0):
+        return FilteringService(database_service=database_service, organization_id=1, skip_existing_animals=True, detail_refresh_fraction=fraction)
 
-        all_urls = ["url1", "url2", "url3"]
-        result = service.filter_existing_urls(all_urls)
+    def test_new_and_changed_cards_are_fetched_and_unchanged_ones_are_not(self, mock_database_service):
+        mock_database_service.get_listing_hashes.return_value = {
+            "same": (card_hash(card("same")), datetime(2026, 10, 1)),
+            "renamed": (card_hash(card("renamed")), datetime(2026, 10, 1)),
+        }
+        cards = [card("same"), card("renamed", name="Rex"), card("new")]
 
-        assert result == all_urls
-        mock_database_service.get_existing_animal_urls.assert_not_called()
+        result = self.service(mock_database_service).select_for_detail(cards)
 
-    def test_filter_existing_urls_filters_when_skip_enabled(self, mock_database_service):
-        mock_database_service.get_existing_animal_urls.return_value = {"url1", "url3"}
+        assert [c["external_id"] for c in result] == ["renamed", "new"]
+        mock_database_service.get_listing_hashes.assert_called_once_with(1, ["same", "renamed", "new"])
 
-        service = FilteringService(
-            database_service=mock_database_service,
-            organization_id=1,
-            skip_existing_animals=True,
-        )
+    def test_rows_stored_without_a_hash_are_fetched(self, mock_database_service):
+        mock_database_service.get_listing_hashes.return_value = {"old": (None, None)}
 
-        all_urls = ["url1", "url2", "url3"]
-        result = service.filter_existing_urls(all_urls)
+        assert self.service(mock_database_service).select_for_detail([card("old")]) == [card("old")]
 
-        assert result == ["url2"]
+    def test_the_refresh_budget_re_verifies_the_least_recently_checked(self, mock_database_service):
+        checked = {"a": datetime(2026, 10, 3), "b": None, "c": datetime(2026, 10, 1), "d": datetime(2026, 10, 2)}
+        mock_database_service.get_listing_hashes.return_value = {external_id: (card_hash(card(external_id)), at) for external_id, at in checked.items()}
+        cards = [card(external_id) for external_id in checked]
 
-    def test_filter_existing_urls_returns_all_when_no_existing(self, mock_database_service):
-        mock_database_service.get_existing_animal_urls.return_value = set()
+        result = self.service(mock_database_service, fraction=0.5).select_for_detail(cards)
 
-        service = FilteringService(
-            database_service=mock_database_service,
-            organization_id=1,
-            skip_existing_animals=True,
-        )
+        assert [c["external_id"] for c in result] == ["b", "c"]
+
+    def test_any_positive_budget_re_verifies_at_least_one(self, mock_database_service):
+        mock_database_service.get_listing_hashes.return_value = {"a": (card_hash(card("a")), None)}
+
+        assert self.service(mock_database_service, fraction=0.01).select_for_detail([card("a")]) == [card("a")]
+
+    def test_a_full_budget_fetches_everything(self, mock_database_service):
+        mock_database_service.get_listing_hashes.return_value = {external_id: (card_hash(card(external_id)), None) for external_id in "abc"}
+        cards = [card(external_id) for external_id in "abc"]
+
+        assert self.service(mock_database_service, fraction=1.0).select_for_detail(cards) == cards
+
+    def test_cards_without_an_external_id_are_always_fetched(self, mock_database_service):
+        mock_database_service.get_listing_hashes.return_value = {}
+        cards = [{"name": "Anon", "adoption_url": "https://x/anon"}]
+
+        assert self.service(mock_database_service).select_for_detail(cards) == cards
+
+    def test_a_failed_lookup_fetches_everything(self, mock_database_service):
+        mock_database_service.get_listing_hashes.return_value = None
+        cards = [card("a"), card("b")]
+
+        assert self.service(mock_database_service).select_for_detail(cards) == cards
+
+    def test_fetched_cards_hashes_are_kept_for_recording(self, mock_database_service):
+        mock_database_service.get_listing_hashes.return_value = {"same": (card_hash(card("same")), None)}
+        service = self.service(mock_database_service)
+
+        service.filter_existing_animals([card("same"), card("new")])
+
+        assert service.listing_hashes == {"new": card_hash(card("new"))}
+
+    def test_without_skipping_every_cards_hash_is_kept(self, mock_database_service):
+        service = FilteringService(database_service=mock_database_service, organization_id=1, skip_existing_animals=False)
 
-        all_urls = ["url1", "url2"]
-        result = service.filter_existing_urls(all_urls)
+        service.filter_existing_animals([card("a"), card("b")])
 
-        assert result == all_urls
+        assert set(service.listing_hashes) == {"a", "b"}
+        mock_database_service.get_listing_hashes.assert_not_called()
 
 
 @pytest.mark.unit
@@ -72,7 +98,7 @@ class TestFilteringServiceAnimalFiltering:
     @pytest.fixture
     def mock_database_service(self):
         service = Mock()
-        service.get_existing_animal_urls.return_value = set()
+        service.get_listing_hashes.return_value = {}
         return service
 
     @pytest.fixture
@@ -118,13 +144,14 @@ class TestFilteringServiceAnimalFiltering:
         assert result == animals
 
     def test_filter_existing_animals_filters_when_skip_enabled(self, mock_database_service, mock_session_manager):
-        mock_database_service.get_existing_animal_urls.return_value = {"url1"}
+        mock_database_service.get_listing_hashes.return_value = {"id1": (card_hash({"external_id": "id1"}), None)}
 
         service = FilteringService(
             database_service=mock_database_service,
             session_manager=mock_session_manager,
             organization_id=1,
             skip_existing_animals=True,
+            detail_refresh_fraction=0.0,
         )
 
         animals = [
@@ -157,12 +184,13 @@ class TestFilteringServiceStats:
 
     def test_filtering_stats_updated_after_filtering(self):
         mock_db = Mock()
-        mock_db.get_existing_animal_urls.return_value = {"url1", "url2"}
+        mock_db.get_listing_hashes.return_value = {external_id: (card_hash({"external_id": external_id}), None) for external_id in ("id1", "id2")}
 
         service = FilteringService(
             database_service=mock_db,
             organization_id=1,
             skip_existing_animals=True,
+            detail_refresh_fraction=0.0,
         )
 
         animals = [
@@ -178,12 +206,13 @@ class TestFilteringServiceStats:
 
     def test_get_correct_animals_found_count_returns_before_filter_when_skip_enabled(self):
         mock_db = Mock()
-        mock_db.get_existing_animal_urls.return_value = {"url1", "url2"}
+        mock_db.get_listing_hashes.return_value = {external_id: (card_hash({"external_id": external_id}), None) for external_id in ("id1", "id2")}
 
         service = FilteringService(
             database_service=mock_db,
             organization_id=1,
             skip_existing_animals=True,
+            detail_refresh_fraction=0.0,
         )
 
         animals = [
@@ -5,6 +5,7 @@ import pytest
 import requests
 from selenium.common.exceptions import WebDriverException
 
+from scrapers.animal_stream import is_animal_stream
 from scrapers.rean.dogs_scraper import REANScraper
 
 
@@ -1014,6 +1015,55 @@ class TestREANIntegration:
             assert mock_sleep.called
 
 
+@pytest.mark.unit
+class TestREANStreaming:
+    @pytest.fixture
+    def scraped_pages(self, scraper):
+        pages = []
+
+        def extract(page_url, page_type):
+            pages.append(page_type)
+            return [{"name": f"{page_type}-dog"}]
+
+        scraper.extract_dogs_with_images_unified = Mock(side_effect=extract)
+        scraper.standardize_animal_data = Mock(side_effect=lambda dog_data, page_type: {"external_id": dog_data["name"]})
+        scraper.respect_rate_limit = Mock()
+        scraper.session_manager = scraper.filtering_service.session_manager = Mock()
+        return pages
+
+    def test_each_page_is_yielded_before_the_next_is_scraped(self, scraper, scraped_pages):
+        stream = scraper.collect_data()
+
+        assert is_animal_stream(stream)
+        assert next(stream) == {"external_id": "romania-dog"}
+        assert scraped_pages == ["romania"]
+        assert list(stream) == [{"external_id": "uk_foster-dog"}]
+        assert scraped_pages == ["romania", "uk_foster"]
+
+    def test_a_failing_page_ends_the_stream_with_the_error(self, scraper, scraped_pages):
+        scraper.extract_dogs_with_images_unified.side_effect = [[{"name": "romania-dog"}], RuntimeError("browser crashed")]
+        stream = scraper.collect_data()
+
+        assert next(stream) == {"external_id": "romania-dog"}
+        with pytest.raises(RuntimeError, match="browser crashed"):
+            next(stream)
+
+    def test_dogs_an_interrupted_run_saved_are_not_saved_again(self, scraper, scraped_pages):
+        scraper.filtering_service.resume({"romania-dog"})
+
+        assert list(scraper.collect_data()) == [{"external_id": "uk_foster-dog"}]
+        scraper.session_manager.record_unchanged_animal.assert_called_once_with("romania-dog")
+        assert scraper._get_correct_animals_found_count([{"external_id": "uk_foster-dog"}]) == 2
+
+    def test_skip_existing_filtering_adds_up_over_pages(self, scraper, scraped_pages):
+        scraper.skip_existing_animals = True
+        scraper.filtering_service.skip_existing_animals = True
+        scraper.filtering_service.select_for_detail = Mock(side_effect=lambda animals: [])
+
+        assert list(scraper.collect_data()) == []
+        assert (scraper.total_animals_before_filter, scraper.total_animals_skipped) == (2, 2)
+
+
 @pytest.mark.unit
 class TestExtractNameFromLiveLayout:
     """Names as the REAN site actually renders them.
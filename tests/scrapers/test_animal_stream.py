@@ -0,0 +1,118 @@
+"""A streaming collect_data() is saved batch by batch while collection continues.
+
+The point of streaming is that the first dogs reach the database before the
+last ones are discovered. What has to hold is that the end of the scrape
+looks the same as for a list: every dog counted as found, stale detection
+run once on the totals, and the scrape log given the full count.
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from scrapers.animal_stream import AnimalStreamSummary, is_animal_stream, iter_batches
+from scrapers.base_scraper import BaseScraper
+from scrapers.constants import STREAM_BATCH_SIZE
+
+
+def dogs(count: int) -> list[dict]:
+    return [{"name": f"Dog {i}", "external_id": f"dog-{i}", "adoption_url": f"https://rescue.example/{i}"} for i in range(count)]
+
+
+@pytest.mark.unit
+class TestIterBatches:
+    def test_lists_are_not_streams(self):
+        assert not is_animal_stream([])
+        assert is_animal_stream(iter([]))
+        assert is_animal_stream(animal for animal in [])
+
+    def test_sync_stream_is_cut_into_batches(self):
+        assert [len(batch) for batch in iter_batches(iter(dogs(7)), 3)] == [3, 3, 1]
+
+    def test_async_stream_is_cut_into_batches_and_closed(self):
+        closed = []
+
+        async def collect():
+            try:
+                for dog in dogs(5):
+                    await asyncio.sleep(0)
+                    yield dog
+            finally:
+                closed.append(True)
+
+        batches = iter_batches(collect(), 2)
+        assert len(next(batches)) == 2
+        # A batch can be processed with blocking code that runs its own event loop
+        assert asyncio.run(asyncio.sleep(0, result="ok")) == "ok"
+        batches.close()
+
+        assert closed == [True]
+
+    def test_summary_counts_and_averages_quality(self):
+        summary = AnimalStreamSummary()
+        summary.add_batch(3, 1.0)
+        summary.add_batch(1, 0.6)
+
+        assert len(summary) == 4
+        assert summary.quality_score == 0.9
+
+
+class _StreamingScraper(BaseScraper):
+    def __init__(self, events, **kwargs):
+        super().__init__(**kwargs)
+        self.events = events
+
+    def collect_data(self):
+        for dog in dogs(STREAM_BATCH_SIZE + 5):
+            self.events.append(("found", dog["external_id"]))
+            yield dog
+
+
+@pytest.mark.unit
+class TestStreamedRun:
+    def _scraper(self):
+        events = []
+        database_service = Mock()
+        database_service.create_scrape_log.return_value = 1
+        database_service.resume_checkpoint.return_value = set()
+        session_manager = Mock()
+        session_manager.start_scrape_session.return_value = True
+        session_manager.detect_partial_failure.return_value = False
+        metrics_collector = Mock()
+        metrics_collector.assess_data_quality.return_value = 1.0
+        metrics_collector.calculate_scrape_duration.return_value = 1.0
+        scraper = _StreamingScraper(
+            events,
+            organization_id=1,
+            database_service=database_service,
+            session_manager=session_manager,
+            metrics_collector=metrics_collector,
+        )
+        scraper.image_processing_service = None
+        scraper.llm_handler = Mock()
+        scraper._validate_animal_data = Mock(return_value=True)
+        scraper._invalidate_frontend_cache = Mock()
+        scraper.save_animals = Mock(side_effect=lambda animals: events.append(("saved", len(animals))) or [(i, "added") for i, _ in enumerate(animals, 1)])
+        return scraper, events
+
+    def test_first_batch_is_saved_before_collection_finishes(self):
+        scraper, events = self._scraper()
+
+        assert scraper._run_with_connection() is True
+
+        first_save = events.index(("saved", STREAM_BATCH_SIZE))
+        assert ("found", f"dog-{STREAM_BATCH_SIZE}") in events[first_save:]
+        assert events[-1] == ("saved", 5)
+
+    def test_final_phases_see_the_full_count(self):
+        scraper, _ = self._scraper()
+
+        scraper._run_with_connection()
+
+        assert scraper.animals_found == STREAM_BATCH_SIZE + 5
+        assert scraper.session_manager.record_found_animal.call_count == STREAM_BATCH_SIZE + 5
+        scraper.session_manager.update_stale_data_detection.assert_called_once()
+        assert scraper.session_manager.detect_partial_failure.call_args[0][0] == STREAM_BATCH_SIZE + 5
+        _, status, found, added, *_ = scraper.database_service.complete_scrape_log.call_args[0]
+        assert (status, found, added) == ("success", STREAM_BATCH_SIZE + 5, STREAM_BATCH_SIZE + 5)
@@ -88,7 +88,7 @@ class TestBaseScraperBatchUploads:
 
         # Mock database connection
         with patch.object(scraper, "connect_to_database"):
-            with patch.object(scraper, "save_animal", return_value=(1, "created")):
+            with patch.object(scraper, "save_animals", side_effect=lambda animals: [(1, "created")] * len(animals)):
                 scraper._process_animals_data(scraper.collect_data())
 
         # Verify batch_process_images was called even for 1 animal
@@ -126,7 +126,7 @@ class TestBaseScraperBatchUploads:
         scraper.progress_tracker = mock_services["progress_tracker"]
 
         with patch.object(scraper, "connect_to_database"):
-            with patch.object(scraper, "save_animal", return_value=(1, "created")):
+            with patch.object(scraper, "save_animals", side_effect=lambda animals: [(1, "created")] * len(animals)):
                 scraper._process_animals_data(scraper.collect_data())
 
         # Verify batch_process_images was called for 3 animals
@@ -156,7 +156,7 @@ class TestBaseScraperBatchUploads:
         scraper.progress_tracker = mock_services["progress_tracker"]
 
         with patch.object(scraper, "connect_to_database"):
-            with patch.object(scraper, "save_animal", return_value=(1, "created")):
+            with patch.object(scraper, "save_animals", side_effect=lambda animals: [(1, "created")] * len(animals)):
                 scraper._process_animals_data(scraper.collect_data())
 
         # Verify batch_process_images was called for 15 animals
@@ -188,7 +188,7 @@ class TestBaseScraperBatchUploads:
         scraper.progress_tracker = mock_services["progress_tracker"]
 
         with patch.object(scraper, "connect_to_database"):
-            with patch.object(scraper, "save_animal", return_value=(1, "created")):
+            with patch.object(scraper, "save_animals", side_effect=lambda animals: [(1, "created")] * len(animals)):
                 scraper._process_animals_data(scraper.collect_data())
 
         # Verify batch_process_images was NOT called due to high failure rate
@@ -214,7 +214,7 @@ class TestBaseScraperBatchUploads:
         scraper.progress_tracker = mock_services["progress_tracker"]
 
         with patch.object(scraper, "connect_to_database"):
-            with patch.object(scraper, "save_animal", return_value=(1, "created")):
+            with patch.object(scraper, "save_animals", side_effect=lambda animals: [(1, "created")] * len(animals)):
                 scraper._process_animals_data(scraper.collect_data())
 
         # Verify batch_process_images was still called
@@ -172,3 +172,29 @@ class TestInvalidationIsScopedToChangedDogs:
         scraper.complete_scrape_log(status="success", animals_found=1)
 
         mock_db.get_slugs_for_animals.assert_not_called()
+
+
+@pytest.mark.unit
+class TestMetadataPublishOnCompletion:
+    """A successful scrape republishes the /meta filter domains before the purge."""
+
+    def test_success_publishes_before_invalidating(self, scraper, mock_db, mock_invalidate_sync):
+        calls = []
+        mock_db.publish_metadata.side_effect = lambda: calls.append("publish") or True
+        mock_invalidate_sync.side_effect = lambda **kwargs: calls.append("invalidate")
+
+        scraper.complete_scrape_log_with_metrics(status="success", animals_found=3)
+
+        assert calls == ["publish", "invalidate"]
+
+    @pytest.mark.parametrize("status", ["error", "partial_failure"])
+    def test_unsuccessful_scrapes_keep_the_previous_snapshot(self, scraper, mock_db, mock_invalidate_sync, status):
+        scraper.complete_scrape_log(status=status)
+
+        mock_db.publish_metadata.assert_not_called()
+
+    def test_failed_publish_still_invalidates(self, scraper, mock_db, mock_invalidate_sync):
+        mock_db.publish_metadata.return_value = False
+
+        assert scraper.complete_scrape_log(status="success", animals_found=1) is True
+        mock_invalidate_sync.assert_called_once()
@@ -0,0 +1,132 @@
+"""A scraper's html_parser choice must change how fast pages parse, never what is extracted.
+
+Extraction code written against select()/get()/get_text() has to give the
+same dogs on a BeautifulSoup tree and on the selectolax one. The replay
+benchmark at the end parses and extracts saved Dogs Trust pages with every
+backend.
+"""
+
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup, SoupStrainer
+
+from scrapers.dogstrust.dogstrust_scraper import DogsTrustScraper
+from scrapers.html_parsing import HTML_PARSER, LXML_PARSER, PARSERS, SELECTOLAX_PARSER, FastNode, parse_fast, parse_html, soup_builder
+
+FIXTURES = Path(__file__).parents[1] / "fixtures" / "html"
+LISTING = (FIXTURES / "dogstrust_listing.html").read_text()
+DETAIL = (FIXTURES / "dogstrust_detail.html").read_bytes()
+
+
+@pytest.fixture
+def scraper():
+    return DogsTrustScraper()
+
+
+@pytest.mark.unit
+class TestBackendChoice:
+    def test_both_fast_backends_build_soups_with_lxml(self):
+        assert soup_builder(HTML_PARSER) == HTML_PARSER
+        assert soup_builder(LXML_PARSER) == LXML_PARSER
+        assert soup_builder(SELECTOLAX_PARSER) == LXML_PARSER
+        assert parse_html(LISTING, SELECTOLAX_PARSER).builder.NAME == LXML_PARSER
+
+    def test_an_unknown_parser_is_a_configuration_error(self):
+        with pytest.raises(ValueError):
+            soup_builder("html5")
+
+    def test_fast_parsing_is_a_selectolax_tree_only_when_asked_for(self):
+        assert isinstance(parse_fast(LISTING), FastNode)
+        assert isinstance(parse_fast(LISTING, LXML_PARSER), BeautifulSoup)
+
+    def test_a_strainer_keeps_only_what_extraction_reads(self):
+        soup = parse_html(LISTING, only=SoupStrainer("a", href=True))
+
+        assert soup.find("h1") is None
+        assert len(soup.select('a[href*="/rehoming/dogs/"]')) == 24
+
+
+@pytest.mark.unit
+class TestFastNode:
+    def test_answers_the_tag_api_subset(self):
+        root = parse_fast('<html><body><a href="/rehoming/dogs/lurcher/1" data-x> Kevin </a><p>Good <b>boy</b></p></body></html>')
+
+        [found] = root.select("a")
+        assert root.select_one("a").name == "a"
+        assert root.select_one("img") is None
+        assert found.get("href") == "/rehoming/dogs/lurcher/1"
+        assert found.get("data-x", "") == ""
+        assert found.get("title") is None
+        assert found.get_text(strip=True) == "Kevin"
+        assert root.select_one("p").get_text(" ", strip=True) == "Good boy"
+
+    def test_bytes_are_decoded_as_the_page_declares(self):
+        markup = '<html><head><meta charset="iso-8859-1"></head><body><h1>Zoë</h1></body></html>'.encode("iso-8859-1")
+
+        assert parse_fast(markup).select_one("h1").get_text() == "Zoë"
+
+
+@pytest.mark.unit
+class TestSameDogsOnEveryBackend:
+    @pytest.mark.parametrize("parser", PARSERS)
+    def test_listing_extraction(self, scraper, parser):
+        tree = parse_fast(LISTING, parser)
+
+        dogs = scraper._extract_dogs_from_page(tree)
+
+        assert scraper._detect_max_pages(tree) == 38
+        assert len(dogs) == 21  # 24 cards, 3 reserved
+        assert dogs[0]["adoption_url"].startswith("https://www.dogstrust.org.uk/rehoming/dogs/")
+
+    @pytest.mark.parametrize("parser", [parser for parser in PARSERS if parser != SELECTOLAX_PARSER])
+    def test_detail_extraction(self, scraper, parser):
+        soup = parse_html(DETAIL, parser)
+
+        assert scraper._extract_name(soup) == "Kevin"
+        assert scraper._extract_breed(soup) == "Lurcher"
+        assert scraper._extract_primary_image(soup, "3592421").endswith("/dogs/3592421/1.jpg")
+        assert scraper._extract_description(soup).startswith("Kevin is a gentle lurcher")
+
+
+def extract_listing(scraper, parser):
+    tree = parse_fast(LISTING, parser)
+    return scraper._detect_max_pages(tree), scraper._extract_dogs_from_page(tree)
+
+
+def extract_detail(scraper, parser):
+    soup = parse_html(DETAIL, parser)
+    return (
+        scraper._extract_name(soup),
+        scraper._extract_breed(soup),
+        scraper._extract_age(soup),
+        scraper._extract_sex(soup),
+        scraper._extract_size(soup),
+        scraper._extract_location(soup),
+        scraper._extract_description(soup),
+        scraper._extract_primary_image(soup, "3592421"),
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.benchmark
+class TestReplayBenchmark:
+    """Parse plus extract time per saved page, per installed backend."""
+
+    @pytest.mark.parametrize("parser", PARSERS)
+    def test_listing_page(self, benchmark, scraper, parser):
+        benchmark.group = "replay: dogstrust listing page"
+        benchmark.extra_info["page_bytes"] = len(LISTING)
+
+        _, dogs = benchmark(extract_listing, scraper, parser)
+
+        assert len(dogs) == 21
+
+    @pytest.mark.parametrize("parser", [parser for parser in PARSERS if parser != SELECTOLAX_PARSER])
+    def test_detail_page(self, benchmark, scraper, parser):
+        benchmark.group = "replay: dogstrust detail page"
+        benchmark.extra_info["page_bytes"] = len(DETAIL)
+
+        fields = benchmark(extract_detail, scraper, parser)
+
+        assert fields[0] == "Kevin"
@@ -0,0 +1,165 @@
+"""The shared fetch engine must be faster than the loops it replaced without being ruder.
+
+HTTP scrapers used to fetch detail pages from threads that each slept
+rate_limit_delay and opened a fresh connection per page. The engine overlaps
+requests instead, so what has to hold is that a host never sees more than
+the old ceiling of requests, transient failures are retried with backoff,
+and results come back in the order the URLs were submitted.
+"""
+
+import asyncio
+import logging
+
+import httpx
+import pytest
+
+from scrapers.base_scraper import BaseScraper
+from scrapers.http_fetcher import FetchResult, HttpFetchEngine, TokenBucket
+from scrapers.rate_controller import RateController
+
+
+def make_engine(handler, **overrides) -> HttpFetchEngine:
+    settings = {"rate_limit_delay": 2.5, "max_retries": 2, "retry_backoff_factor": 2.0, "timeout": 30}
+    settings.update(overrides)
+    return HttpFetchEngine(logger=logging.getLogger("test"), transport=httpx.MockTransport(handler), **settings)
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    def test_bursts_up_to_capacity_then_spaces_requests(self, stub_clock):
+        bucket = TokenBucket(rate=3 / 2.5, capacity=3, clock=lambda: 0.0)
+
+        async def acquire_six():
+            for _ in range(6):
+                await bucket.acquire()
+
+        asyncio.run(acquire_six())
+
+        # Three go straight away; the rest wait for the next slot of the window
+        assert stub_clock.calls == pytest.approx([2.5 / 3, 2 * 2.5 / 3, 2.5])
+
+    def test_zero_rate_never_waits(self, stub_clock):
+        asyncio.run(TokenBucket(rate=0).acquire())
+
+        assert stub_clock.calls == []
+
+
+@pytest.mark.unit
+class TestHttpFetchEngine:
+    def test_results_come_back_in_url_order_with_headers_applied(self):
+        seen_agents = []
+
+        def handler(request):
+            seen_agents.append(request.headers["User-Agent"])
+            return httpx.Response(200, text=f"page {request.url.path}")
+
+        urls = [f"https://rescue.example/dog/{i}" for i in range(5)]
+        results = make_engine(handler, headers={"User-Agent": "test-agent"}).fetch_all(urls, max_concurrency=3)
+
+        assert [result.url for result in results] == urls
+        assert [result.text for result in results] == [f"page /dog/{i}" for i in range(5)]
+        assert all(result.ok for result in results)
+        assert set(seen_agents) == {"test-agent"}
+
+    def test_in_flight_requests_per_host_stay_within_the_limit(self):
+        in_flight = {"rescue.example": 0, "other.example": 0}
+        peak = dict(in_flight)
+
+        async def handler(request):
+            host = request.url.host
+            in_flight[host] += 1
+            peak[host] = max(peak[host], in_flight[host])
+            # Yield so every request that is allowed to start does
+            await asyncio.get_running_loop().run_in_executor(None, int)
+            in_flight[host] -= 1
+            return httpx.Response(200)
+
+        urls = [f"https://rescue.example/{i}" for i in range(8)] + [f"https://other.example/{i}" for i in range(8)]
+        make_engine(handler).fetch_all(urls, max_concurrency=2)
+
+        assert peak == {"rescue.example": 2, "other.example": 2}
+
+    def test_retries_server_errors_with_backoff(self, stub_clock):
+        responses = iter([httpx.Response(503), httpx.Response(502), httpx.Response(200, text="ok")])
+
+        [result] = make_engine(lambda request: next(responses)).fetch_all(["https://rescue.example/dog"])
+
+        assert result.ok
+        assert result.attempts == 3
+        # Each backoff is followed by the host's rate-limit slot for the retry;
+        # the stubbed clock doesn't advance, so those slots queue up too
+        assert stub_clock.calls == pytest.approx([2.5, 2.5, 5.0, 5.0], abs=0.5)
+
+    def test_retry_after_overrides_the_backoff(self, stub_clock):
+        responses = iter([httpx.Response(429, headers={"Retry-After": "7"}), httpx.Response(200)])
+
+        [result] = make_engine(lambda request: next(responses)).fetch_all(["https://rescue.example/dog"])
+
+        assert result.ok
+        assert stub_clock.calls == pytest.approx([7.0, 2.5], abs=0.5)
+
+    def test_throttling_is_reported_to_the_rate_controller(self, stub_clock):
+        controller = RateController(2.5)
+        responses = iter([httpx.Response(429), httpx.Response(200)])
+
+        make_engine(lambda request: next(responses), rate_controller=controller).fetch_all(["https://rescue.example/dog"])
+
+        # The 429 doubled the host's delay; the quick 200 only eased it back a little
+        assert 2.5 < controller.delay_for("https://rescue.example/dog") < 5.0
+
+    def test_connection_errors_are_retried_then_reported(self, stub_clock):
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        [result] = make_engine(handler).fetch_all(["https://rescue.example/dog"])
+
+        assert not result.ok
+        assert result.attempts == 3
+        assert "ConnectError" in result.error
+
+    def test_client_errors_are_not_retried(self, stub_clock):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(404)
+
+        [result] = make_engine(handler).fetch_all(["https://rescue.example/gone"])
+
+        assert len(calls) == 1
+        assert (result.status_code, result.error) == (404, "HTTP 404")
+        assert stub_clock.calls == []
+
+
+class _StubScraper(BaseScraper):
+    def collect_data(self):
+        return []
+
+
+@pytest.mark.unit
+class TestFetchPages:
+    def test_parses_fetched_pages_and_reports_failures_as_none(self, monkeypatch):
+        def fetch_all(engine, urls, max_concurrency=1):
+            return [FetchResult("https://a/1", 200, "one"), FetchResult("https://a/2", 500, error="HTTP 500"), FetchResult("https://a/3", 200, "boom")]
+
+        def parse(url, html):
+            if html == "boom":
+                raise ValueError("unparseable")
+            return {"url": url, "html": html}
+
+        monkeypatch.setattr(HttpFetchEngine, "fetch_all", fetch_all)
+        scraper = _StubScraper(organization_id=1)
+
+        assert scraper.fetch_pages(["https://a/1", "https://a/2", "https://a/3"], parse) == [{"url": "https://a/1", "html": "one"}, None, None]
+
+    def test_engine_uses_the_scraper_settings(self, monkeypatch):
+        engines = []
+        monkeypatch.setattr(HttpFetchEngine, "fetch_all", lambda engine, urls, max_concurrency=1: engines.append(engine) or [])
+        scraper = _StubScraper(organization_id=1)
+        scraper.rate_limit_delay = 4.0
+
+        scraper.fetch_pages(["https://a/1"], lambda url, html: html, headers={"User-Agent": "org-agent"})
+
+        [engine] = engines
+        assert (engine.rate_limit_delay, engine.max_retries, engine.timeout) == (4.0, 3, 30)
+        assert engine.headers["User-Agent"] == "org-agent"
@@ -0,0 +1,144 @@
+"""An unchanged listing must cost a hash, one lookup and one UPDATE, and nothing else.
+
+The shortcut is only safe if every dog on the listing is still marked as
+seen, if it compares against a recent full crawl rather than against another
+shortcut, and if FORCE_RESCRAPE still forces the full crawl.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from scrapers.base_scraper import BaseScraper
+from scrapers.dogstrust.dogstrust_scraper import DogsTrustScraper
+from scrapers.listing_fingerprint import FULL_CRAWL_MAX_AGE, card_hash, listing_fingerprint
+from services.database_service import DatabaseService
+from services.session_manager import SessionManager
+
+CARDS = [
+    {"external_id": "dt-1", "name": "Kevin", "primary_image_url": "https://img/1.jpg", "status": "available", "adoption_url": "https://x/1"},
+    {"external_id": "dt-2", "name": "Luna", "primary_image_url": "https://img/2.jpg", "status": "available", "adoption_url": "https://x/2"},
+]
+
+
+class _StubScraper(BaseScraper):
+    def collect_data(self):
+        return []
+
+
+@pytest.fixture
+def database_service():
+    service = Mock(spec=DatabaseService)
+    service.get_listing_fingerprint.return_value = listing_fingerprint(CARDS)
+    return service
+
+
+@pytest.fixture
+def scraper(database_service):
+    scraper = _StubScraper(organization_id=7, database_service=database_service, session_manager=Mock(spec=SessionManager))
+    scraper.scrape_log_id = 99
+    return scraper
+
+
+@pytest.mark.unit
+class TestListingFingerprint:
+    def test_the_order_cards_are_listed_in_does_not_matter(self):
+        assert listing_fingerprint(CARDS) == listing_fingerprint(list(reversed(CARDS)))
+
+    @pytest.mark.parametrize("field, value", [("name", "Kev"), ("primary_image_url", "https://img/new.jpg"), ("status", "reserved"), ("external_id", "dt-3")])
+    def test_each_listing_visible_field_counts(self, field, value):
+        changed = [{**CARDS[0], field: value}, CARDS[1]]
+
+        assert listing_fingerprint(changed) != listing_fingerprint(CARDS)
+
+    def test_fields_only_detail_pages_show_do_not(self):
+        assert listing_fingerprint([{**CARDS[0], "description": "new"}, CARDS[1]]) == listing_fingerprint(CARDS)
+
+
+@pytest.mark.unit
+class TestUnchangedListingShortcut:
+    def test_every_card_is_recorded_as_seen(self, scraper):
+        assert scraper._listing_unchanged(CARDS) is True
+
+        assert scraper.total_animals_unchanged == 2
+        assert [c.args[0] for c in scraper.session_manager.record_unchanged_animal.call_args_list] == ["dt-1", "dt-2"]
+        assert scraper._get_correct_animals_found_count([]) == 2
+
+    def test_a_changed_listing_is_crawled(self, scraper):
+        assert scraper._listing_unchanged([{**CARDS[0], "status": "reserved"}, CARDS[1]]) is False
+        assert scraper.total_animals_unchanged == 0
+
+    def test_only_recent_full_crawls_are_compared_against(self, scraper, database_service):
+        scraper._listing_unchanged(CARDS)
+
+        organization_id, since = database_service.get_listing_fingerprint.call_args.args
+        assert organization_id == 7
+        assert abs(datetime.now() - since - FULL_CRAWL_MAX_AGE) < timedelta(minutes=1)
+
+    def test_force_rescrape_crawls_everything(self, scraper, database_service):
+        with patch.dict("os.environ", {"FORCE_RESCRAPE": "true"}):
+            assert scraper._listing_unchanged(CARDS) is False
+        database_service.get_listing_fingerprint.assert_not_called()
+
+    def test_cards_without_external_ids_are_never_skipped(self, scraper):
+        assert scraper._listing_unchanged([{**CARDS[0], "external_id": None}, CARDS[1]]) is False
+
+
+@pytest.mark.unit
+class TestStoredFingerprint:
+    def test_a_successful_full_crawl_stores_its_fingerprint(self, scraper, database_service):
+        database_service.get_listing_fingerprint.return_value = None
+        scraper._listing_unchanged(CARDS)
+
+        scraper.complete_scrape_log(status="success", animals_found=2)
+
+        database_service.record_listing_fingerprint.assert_called_once_with(99, listing_fingerprint(CARDS))
+
+    def test_a_shortcut_run_does_not(self, scraper, database_service):
+        scraper._listing_unchanged(CARDS)
+
+        scraper.complete_scrape_log(status="success", animals_found=2)
+
+        database_service.record_listing_fingerprint.assert_not_called()
+
+    def test_a_failed_crawl_does_not(self, scraper, database_service):
+        database_service.get_listing_fingerprint.return_value = None
+        scraper._listing_unchanged(CARDS)
+
+        scraper.complete_scrape_log(status="warning", animals_found=1)
+
+        database_service.record_listing_fingerprint.assert_not_called()
+
+
+@pytest.mark.unit
+def test_dogstrust_skips_detail_pages_for_an_unchanged_listing(database_service):
+    scraper = DogsTrustScraper(database_service=database_service, session_manager=Mock(spec=SessionManager))
+    scraper.organization_id = 7
+    scraper.filtering_service = Mock()
+
+    with patch.object(scraper, "get_animal_list", return_value=CARDS):
+        assert scraper._get_filtered_animals() == []
+
+    scraper.filtering_service.filter_existing_animals.assert_not_called()
+
+
+@pytest.mark.unit
+class TestStoredCardHashes:
+    def test_only_cards_whose_detail_page_was_checked_are_recorded(self, scraper, database_service):
+        scraper.filtering_service.filter_existing_animals(CARDS)
+        scraper._detail_checked_external_ids.add("dt-1")
+
+        scraper.complete_scrape_log(status="success", animals_found=2)
+
+        organization_id, hashes, _ = database_service.record_listing_hashes.call_args.args
+        assert organization_id == 7
+        assert hashes == {"dt-1": card_hash(CARDS[0])}
+
+    def test_nothing_is_recorded_for_a_failed_run(self, scraper, database_service):
+        scraper.filtering_service.filter_existing_animals(CARDS)
+        scraper._detail_checked_external_ids.update({"dt-1", "dt-2"})
+
+        scraper.complete_scrape_log(status="error", animals_found=0)
+
+        database_service.record_listing_hashes.assert_not_called()
@@ -8,6 +8,7 @@ import pytest
 from bs4 import BeautifulSoup
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
+from scrapers.animal_stream import is_animal_stream
 from scrapers.misis_rescue.detail_parser import MisisRescueDetailParser
 from scrapers.misis_rescue.normalizer import (
     calculate_age_years,
@@ -1476,7 +1477,9 @@ class TestListingExtraction:
             mock_detail_fast.return_value = mock_detail_data
             mock_detail.return_value = mock_detail_data
 
-            dogs = scraper.collect_data()
+            stream = scraper.collect_data()
+            assert is_animal_stream(stream)
+            dogs = list(stream)
 
             assert len(dogs) == 2
             for dog in dogs:
@@ -1494,7 +1497,7 @@ class TestListingExtraction:
 
         with patch.object(scraper, "_get_all_dogs_from_listing", side_effect=PlaywrightTimeoutError("listing wait timed out")):
             with pytest.raises(PlaywrightTimeoutError, match="listing wait timed out"):
-                scraper.collect_data()
+                list(scraper.collect_data())
 
         assert "except Exception" not in inspect.getsource(scraper.collect_data), "collect_data must not catch and return [] — that re-introduces the silent-failure bug"
 
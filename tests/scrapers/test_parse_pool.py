@@ -0,0 +1,106 @@
+"""Parsing fetched pages across cores.
+
+The pool has to hand back exactly what parsing in process would have: one
+entry per URL, in order, with None for a page whose parser raised. A scraper
+goes to the workers without its services, and anything that can't go falls
+back to parsing in process rather than failing the scrape.
+"""
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from scrapers.base_scraper import BaseScraper
+from scrapers.http_fetcher import FetchResult
+from scrapers.parse_pool import MIN_POOL_PAGES, ParsePool, open_parse_pool, parse_workers
+
+URLS = [f"https://rescue.example/dog/{n}" for n in range(MIN_POOL_PAGES)]
+
+
+def parse_in_worker(url, html):
+    if html == "broken":
+        raise ValueError("no name heading")
+    return {"url": url, "name": html.upper(), "pid": os.getpid()}
+
+
+class _PoolScraper(BaseScraper):
+    parse_in_processes = True
+
+    def collect_data(self):
+        return []
+
+    def parse_detail(self, url, html):
+        return {"name": html.title(), "organization": self.organization_name, "has_database": self.database_service is not None, "pid": os.getpid()}
+
+
+@pytest.mark.unit
+class TestWorkers:
+    def test_defaults_to_a_share_of_the_cores_per_concurrent_scrape(self):
+        with patch("scrapers.parse_pool.os.cpu_count", return_value=8):
+            assert parse_workers({}) == 2  # SCRAPER_MAX_CONCURRENCY defaults to 4
+            assert parse_workers({"SCRAPER_MAX_CONCURRENCY": "1"}) == 8
+            assert parse_workers({"SCRAPER_MAX_CONCURRENCY": "16"}) == 1
+
+    def test_env_overrides_and_zero_disables(self):
+        assert parse_workers({"SCRAPER_PARSE_WORKERS": "3"}) == 3
+        assert parse_workers({"SCRAPER_PARSE_WORKERS": "0"}) == 0
+        assert parse_workers({"SCRAPER_PARSE_WORKERS": "many"}) == parse_workers({})
+
+    def test_small_batches_and_single_workers_parse_in_process(self):
+        with patch.dict("os.environ", {"SCRAPER_PARSE_WORKERS": "4"}):
+            assert open_parse_pool(parse_in_worker, MIN_POOL_PAGES - 1) is None
+        with patch.dict("os.environ", {"SCRAPER_PARSE_WORKERS": "1"}):
+            assert open_parse_pool(parse_in_worker, 100) is None
+
+    def test_a_callback_that_cannot_be_pickled_parses_in_process(self):
+        with patch.dict("os.environ", {"SCRAPER_PARSE_WORKERS": "2"}):
+            assert open_parse_pool(lambda url, html: html, 100) is None
+
+
+@pytest.mark.unit
+def test_pages_are_parsed_in_other_processes():
+    with ParsePool(parse_in_worker, 2) as pool:
+        ok = pool.submit("https://rescue.example/dog/1", "rex").result()
+        failed = pool.submit("https://rescue.example/dog/2", "broken").result()
+
+    assert ok[0] is True and ok[1]["name"] == "REX" and ok[1]["pid"] != os.getpid()
+    assert failed == (False, "ValueError: no name heading")
+
+
+@pytest.mark.unit
+class TestFetchPages:
+    @pytest.fixture
+    def scraper(self):
+        scraper = _PoolScraper(organization_id=1, database_service=Mock())
+        scraper.response_cache = None
+        return scraper
+
+    def fetched(self, *_args, **_kwargs):
+        results = [FetchResult(url=url, status_code=200, text=f"dog {n}") for n, url in enumerate(URLS)]
+        results[1] = FetchResult(url=URLS[1], error="timeout")
+        return iter(results)
+
+    def test_results_match_parsing_in_process(self, scraper):
+        with patch.dict("os.environ", {"SCRAPER_PARSE_WORKERS": "2"}), patch("scrapers.base_scraper.HttpFetchEngine.fetch_all", side_effect=self.fetched):
+            parsed = scraper.fetch_pages(URLS, scraper.parse_detail)
+
+        assert len(parsed) == len(URLS)
+        assert parsed[1] is None
+        assert parsed[0]["name"] == "Dog 0" and parsed[-1]["name"] == f"Dog {len(URLS) - 1}"
+        assert parsed[0]["organization"] == scraper.organization_name
+        assert {page["pid"] for page in parsed if page} != {os.getpid()}
+
+    def test_workers_get_the_scraper_without_its_services(self, scraper):
+        with patch.dict("os.environ", {"SCRAPER_PARSE_WORKERS": "2"}), patch("scrapers.base_scraper.HttpFetchEngine.fetch_all", side_effect=self.fetched):
+            parsed = scraper.fetch_pages(URLS, scraper.parse_detail)
+
+        assert not parsed[0]["has_database"]
+        assert scraper.database_service is not None
+
+    def test_without_opting_in_pages_are_parsed_in_process(self, scraper):
+        scraper.parse_in_processes = False
+        with patch.dict("os.environ", {"SCRAPER_PARSE_WORKERS": "2"}), patch("scrapers.base_scraper.HttpFetchEngine.fetch_all", side_effect=self.fetched):
+            parsed = scraper.fetch_pages(URLS, scraper.parse_detail)
+
+        assert {page["pid"] for page in parsed if page} == {os.getpid()}
@@ -0,0 +1,115 @@
+"""The rate controller must be as polite as the fixed sleep it replaced, and quicker when the site allows it.
+
+Scrapers used to sleep rate_limit_delay before every request. What has to
+hold is that the first request still waits that long, a fast site earns
+shorter gaps (never below the floor), a slow or throttling one gets longer
+gaps at once, and a server's Retry-After is honoured.
+"""
+
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from scrapers.base_scraper import BaseScraper
+from scrapers.rate_controller import RateController
+
+URL = "https://rescue.example/dogs"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def response(status_code=200, seconds=0.1, url=URL, headers=None):
+    return SimpleNamespace(url=url, status_code=status_code, elapsed=timedelta(seconds=seconds), headers=headers or {})
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def controller(clock):
+    return RateController(2.0, min_delay=0.5, max_delay=20.0, clock=clock)
+
+
+@pytest.mark.unit
+class TestPacing:
+    def test_first_request_waits_the_configured_delay(self, controller, stub_clock):
+        controller.pause(URL)
+
+        assert stub_clock.calls == [2.0]
+
+    def test_requests_are_spaced_one_delay_apart(self, controller, clock, stub_clock):
+        controller.pause(URL)
+        clock.now += 2.0 + 0.5  # slept, then spent 0.5s on the request
+
+        controller.pause(URL)
+
+        assert stub_clock.calls == pytest.approx([2.0, 1.5])
+
+    def test_hosts_are_paced_independently(self, controller, stub_clock):
+        controller.pause(URL)
+        controller.pause("https://other.example/dogs")
+
+        assert stub_clock.calls == [2.0, 2.0]
+
+    def test_concurrent_workers_share_the_delay(self, controller, stub_clock):
+        for _ in range(3):
+            controller.pause(URL, concurrency=2)
+
+        assert stub_clock.calls == pytest.approx([1.0, 2.0, 3.0])
+
+
+@pytest.mark.unit
+class TestAdaptation:
+    def test_fast_responses_shorten_the_delay_down_to_the_floor(self, controller):
+        for _ in range(50):
+            controller.observe_response(response(seconds=0.05))
+
+        assert controller.delay_for(URL) == pytest.approx(0.5, abs=0.01)
+
+    def test_a_slow_response_lengthens_the_delay_at_once(self, controller):
+        controller.observe_response(response(seconds=3.0))
+
+        assert controller.delay_for(URL) == 6.0
+
+    def test_throttling_backs_off_and_honours_retry_after(self, controller, clock, stub_clock):
+        controller.observe_response(response(429, headers={"Retry-After": "9"}))
+
+        assert controller.delay_for(URL) == 9.0
+        controller.pause(URL)
+        assert stub_clock.calls == [9.0]
+
+    def test_errors_back_off_up_to_the_ceiling(self, controller):
+        for _ in range(20):
+            controller.observe_failure(URL)
+
+        assert controller.delay_for(URL) == 20.0
+
+    def test_mock_responses_are_ignored(self, controller):
+        controller.observe_response(Mock())
+
+        assert controller.delay_for(URL) == 2.0
+
+
+class _StubScraper(BaseScraper):
+    def collect_data(self):
+        return []
+
+
+@pytest.mark.unit
+def test_scraper_controller_follows_rate_limit_delay():
+    scraper = _StubScraper(organization_id=1)
+    assert scraper.rate_controller.delay_for(URL) == 1.0
+
+    scraper.rate_limit_delay = 0.2
+
+    assert scraper.rate_controller.delay_for(URL) == 0.2
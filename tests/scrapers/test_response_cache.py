@@ -0,0 +1,202 @@
+"""Unchanged detail pages are skipped without losing track of the dogs on them.
+
+The cache lets a run ask the site whether a page changed since the last
+successful run and skip parsing and saving the dog when it hasn't. What has
+to hold is that those dogs still count as found and seen, and that nothing
+is remembered from a run that didn't finish.
+"""
+
+import logging
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from scrapers.base_scraper import UNCHANGED, BaseScraper
+from scrapers.http_fetcher import FetchResult, HttpFetchEngine
+from scrapers.response_cache import CacheEntry, ResponseCache, content_hash, parser_version
+
+URL = "https://rescue.example/dog/1"
+
+
+def make_engine(handler, cache) -> HttpFetchEngine:
+    return HttpFetchEngine(
+        logger=logging.getLogger("test"),
+        rate_limit_delay=0,
+        max_retries=0,
+        retry_backoff_factor=2.0,
+        timeout=30,
+        transport=httpx.MockTransport(handler),
+        cache=cache,
+    )
+
+
+def make_cache(stored=None, version=None) -> ResponseCache:
+    """A cache over a database that holds stored (URL -> validator tuple), for parser version."""
+    database_service = Mock()
+    database_service.get_page_validators.return_value = stored or {}
+    database_service.record_page_validators.side_effect = lambda organization_id, validators: len(validators)
+    return ResponseCache.for_organization(1, database_service, version, env={})
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    def test_stored_validators_are_loaded_in_one_query(self):
+        cache = make_cache({URL: ("abc", '"v1"', None)})
+
+        assert cache.get(URL) == CacheEntry("abc", etag='"v1"')
+        assert cache.get("https://rescue.example/dog/2") is None
+        cache.database_service.get_page_validators.assert_called_once_with(1)
+
+    def test_entries_are_only_readable_after_commit(self):
+        cache = make_cache()
+        cache.stage(URL, CacheEntry("abc", etag='"v1"'))
+
+        assert cache.get(URL) is None
+        assert cache.commit() == 1
+        assert cache.get(URL) == CacheEntry("abc", etag='"v1"')
+        cache.database_service.record_page_validators.assert_called_once_with(1, {URL: ("abc", '"v1"', None, None)})
+
+    def test_forgotten_entries_are_not_written(self):
+        cache = make_cache()
+        cache.stage(URL, CacheEntry("abc"))
+        cache.forget(URL)
+
+        assert cache.commit() == 0
+        assert cache.get(URL) is None
+        cache.database_service.record_page_validators.assert_not_called()
+
+    def test_entries_the_database_rejected_are_not_used(self):
+        cache = make_cache()
+        cache.database_service.record_page_validators.side_effect = None
+        cache.database_service.record_page_validators.return_value = 0
+        cache.stage(URL, CacheEntry("abc"))
+
+        assert cache.commit() == 0
+        assert cache.get(URL) is None
+
+    def test_entries_from_another_parser_version_are_ignored(self):
+        cache = make_cache({URL: ("abc", '"v1"', None, "old-parser"), "https://rescue.example/dog/2": ("def", None, None, None)}, version="new-parser")
+
+        assert cache.get(URL) is None
+        assert cache.get("https://rescue.example/dog/2") is None
+
+    def test_staged_entries_carry_the_parser_version(self):
+        cache = make_cache(version="new-parser")
+        cache.stage(URL, CacheEntry("abc"))
+        cache.commit()
+
+        assert cache.get(URL) == CacheEntry("abc", parser_version="new-parser")
+        cache.database_service.record_page_validators.assert_called_once_with(1, {URL: ("abc", None, None, "new-parser")})
+
+    def test_parser_version_follows_the_scraper_package(self):
+        assert parser_version("scrapers.rean.dogs_scraper") == parser_version("scrapers.rean.dogs_scraper")
+        assert parser_version("scrapers.rean.dogs_scraper") != parser_version("scrapers.misis_rescue.scraper")
+
+    def test_disabled_under_testing_or_without_a_database(self):
+        assert ResponseCache.for_organization(1, Mock(), env={"TESTING": "true"}) is None
+        assert ResponseCache.for_organization(1, None, env={}) is None
+        assert ResponseCache.for_organization(None, Mock(), env={}) is None
+
+
+@pytest.mark.unit
+class TestConditionalFetch:
+    def test_sends_validators_and_reports_304_as_unchanged(self):
+        cache = make_cache({URL: ("abc", '"v1"', "Mon, 05 Oct 2026 10:00:00 GMT")})
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers)
+            return httpx.Response(304)
+
+        [result] = make_engine(handler, cache).fetch_all([URL])
+
+        assert result.unchanged
+        assert seen[0]["If-None-Match"] == '"v1"'
+        assert seen[0]["If-Modified-Since"] == "Mon, 05 Oct 2026 10:00:00 GMT"
+
+    def test_same_body_without_validators_is_unchanged(self):
+        cache = make_cache({URL: (content_hash("<p>Rex</p>"), None, None)})
+
+        [result] = make_engine(lambda request: httpx.Response(200, text="<p>Rex</p>"), cache).fetch_all([URL])
+
+        assert result.ok and result.unchanged
+
+    def test_changed_body_is_returned_and_staged(self):
+        cache = make_cache({URL: (content_hash("<p>Rex</p>"), None, None)})
+
+        [result] = make_engine(lambda request: httpx.Response(200, text="<p>Rex, reserved</p>", headers={"ETag": '"v2"'}), cache).fetch_all([URL])
+        cache.commit()
+
+        assert result.ok and not result.unchanged
+        assert cache.get(URL) == CacheEntry(content_hash("<p>Rex, reserved</p>"), etag='"v2"')
+
+    def test_failed_fetch_is_not_staged(self):
+        cache = make_cache()
+
+        [result] = make_engine(lambda request: httpx.Response(404), cache).fetch_all([URL])
+
+        assert not result.ok
+        assert cache.commit() == 0
+
+
+class _StubScraper(BaseScraper):
+    def collect_data(self):
+        return []
+
+
+@pytest.mark.unit
+class TestUnchangedAnimals:
+    def test_fetch_pages_marks_unchanged_pages_without_parsing_them(self, monkeypatch):
+        monkeypatch.setattr(HttpFetchEngine, "fetch_all", lambda engine, urls, max_concurrency=1: [FetchResult(URL, 304, unchanged=True), FetchResult("https://rescue.example/dog/2", 200, "new")])
+        parse = Mock(return_value={"name": "Bella"})
+
+        details = _StubScraper(organization_id=1).fetch_pages([URL, "https://rescue.example/dog/2"], parse)
+
+        assert details == [UNCHANGED, {"name": "Bella"}]
+        parse.assert_called_once_with("https://rescue.example/dog/2", "new")
+
+    @pytest.mark.parametrize("parse", [Mock(return_value=None), Mock(side_effect=ValueError("no name"))])
+    def test_pages_that_fail_to_parse_are_not_remembered(self, parse, monkeypatch):
+        monkeypatch.setattr(HttpFetchEngine, "fetch_all", lambda engine, urls, max_concurrency=1: [FetchResult(URL, 200, "<p>Rex</p>")])
+        scraper = _StubScraper(organization_id=1)
+        scraper.response_cache = make_cache()
+        scraper.response_cache.stage(URL, CacheEntry(content_hash("<p>Rex</p>")))
+
+        assert scraper.fetch_pages([URL], parse) == [None]
+        assert scraper.response_cache.commit() == 0
+
+    def test_pages_of_animals_that_fail_validation_are_not_remembered(self):
+        scraper = _StubScraper(organization_id=1)
+        scraper.response_cache = make_cache()
+        scraper.response_cache.stage(URL, CacheEntry("abc"))
+        scraper.progress_tracker = Mock()
+        scraper.image_processing_service = None
+        scraper._validate_animal_data = Mock(return_value=False)
+        scraper.save_animals = Mock(return_value=[])
+
+        scraper._process_animals_data([{"name": "Rex", "external_id": "rex", "adoption_url": URL}])
+
+        assert scraper.response_cache.commit() == 0
+
+    def test_unchanged_animals_are_dropped_but_still_count_as_found(self):
+        scraper = _StubScraper(organization_id=1)
+        scraper.session_manager = Mock()
+        animals = [{"external_id": "rex"}, {"external_id": "bella"}]
+
+        kept, details = scraper._drop_unchanged(animals, [UNCHANGED, {"name": "Bella"}])
+
+        assert (kept, details) == ([{"external_id": "bella"}], [{"name": "Bella"}])
+        scraper.session_manager.record_unchanged_animal.assert_called_once_with("rex")
+        assert scraper._get_correct_animals_found_count(kept) == 2
+
+    @pytest.mark.parametrize("status, committed", [("success", True), ("error", False)])
+    def test_cache_is_committed_only_when_the_run_succeeds(self, status, committed, monkeypatch):
+        scraper = _StubScraper(organization_id=1)
+        scraper.response_cache = Mock()
+        monkeypatch.setattr(scraper, "_publish_metadata", Mock())
+        monkeypatch.setattr(scraper, "_invalidate_frontend_cache", Mock())
+
+        scraper.complete_scrape_log(status)
+
+        assert scraper.response_cache.commit.called is committed
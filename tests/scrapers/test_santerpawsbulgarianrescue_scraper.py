@@ -3,10 +3,23 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from scrapers.http_fetcher import FetchResult, HttpFetchEngine
 from scrapers.santerpawsbulgarianrescue.santerpawsbulgarianrescue_scraper import (
     SanterPawsBulgarianRescueScraper,
 )
 
+DETAIL_HTML = "<html><body></body></html>"
+
+
+def stub_detail_fetch():
+    """Serve every detail page from memory instead of the network."""
+    return patch.object(
+        HttpFetchEngine,
+        "fetch_all",
+        autospec=True,
+        side_effect=lambda engine, urls, max_concurrency=1: [FetchResult(url, 200, DETAIL_HTML) for url in urls],
+    )
+
 
 @pytest.mark.unit
 class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
@@ -244,13 +257,12 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
         assert isinstance(self.scraper.max_retries, int)
         assert isinstance(self.scraper.timeout, (int, float))
 
-    @patch("time.sleep")
-    def test_rate_limiting_uses_config_delay(self, mock_sleep):
+    def test_rate_limiting_uses_config_delay(self):
         """Test that rate limiting uses config-defined delay, not hardcoded value."""
         # Mock the animal list to have one animal
         with (
             patch.object(self.scraper, "get_animal_list") as mock_get_list,
-            patch.object(self.scraper, "_scrape_animal_details") as mock_scrape_details,
+            patch("scrapers.base_scraper.HttpFetchEngine") as mock_engine,
         ):
             mock_get_list.return_value = [
                 {
@@ -261,13 +273,12 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
                     "status": "available",
                 }
             ]
-
-            mock_scrape_details.return_value = {"breed": "Mixed Breed"}
+            mock_engine.return_value.fetch_all.return_value = [FetchResult("https://santerpawsbulgarianrescue.com/dog/test-dog/", 200, DETAIL_HTML)]
 
             self.scraper.collect_data()
 
             # Should use config rate_limit_delay (2.5) not hardcoded (3)
-            mock_sleep.assert_called_with(2.5)
+            self.assertEqual(mock_engine.call_args.kwargs["rate_limit_delay"], 2.5)
 
     def test_get_filtered_animals_basic(self):
         """Test that _get_filtered_animals method returns same animals as get_animal_list when skip_existing_animals=False."""
@@ -329,8 +340,8 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
                 ]
                 mock_get_list.return_value = mock_animals
 
-                # Mock filtering_service to return only "new" URL
-                scraper.filtering_service.filter_existing_urls = Mock(return_value=["https://santerpawsbulgarianrescue.com/dog/new/"])
+                # Mock filtering_service to select only the "new" dog
+                scraper.filtering_service.select_for_detail = Mock(return_value=[mock_animals[1]])
 
                 result = scraper._get_filtered_animals()
 
@@ -338,12 +349,8 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
                 self.assertEqual(len(result), 1)
                 self.assertEqual(result[0]["name"], "New Dog")
 
-                # Verify filtering_service was called with correct URLs
-                expected_urls = [
-                    "https://santerpawsbulgarianrescue.com/dog/existing/",
-                    "https://santerpawsbulgarianrescue.com/dog/new/",
-                ]
-                scraper.filtering_service.filter_existing_urls.assert_called_once_with(expected_urls)
+                # Verify filtering_service was given every listed dog
+                scraper.filtering_service.select_for_detail.assert_called_once_with(mock_animals)
 
     def test_filtering_stats_tracked(self):
         """Test that filtering statistics are properly tracked and logged."""
@@ -371,8 +378,8 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
                 ]
                 mock_get_list.return_value = mock_animals
 
-                # Mock filtering_service to return only 1 URL (2 filtered out)
-                scraper.filtering_service.filter_existing_urls = Mock(return_value=["https://site.com/3/"])
+                # Mock filtering_service to select only 1 dog (2 filtered out)
+                scraper.filtering_service.select_for_detail = Mock(return_value=mock_animals[2:])
 
                 _result = scraper._get_filtered_animals()
 
@@ -382,7 +389,7 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
 
     def test_collect_data_deduplicates_by_url(self):
         """Test that collect_data removes duplicate dogs by URL."""
-        with patch.object(self.scraper, "get_animal_list") as mock_get_list:
+        with stub_detail_fetch(), patch.object(self.scraper, "get_animal_list") as mock_get_list:
             # Return list with duplicates
             mock_get_list.return_value = [
                 {
@@ -418,7 +425,7 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
     def test_process_animals_parallel_single_threaded_fallback(self):
         """Test that _process_animals_parallel uses single-threaded processing for small batches."""
         # Test with batch_size=6, animals=3 (should use single-threaded)
-        with patch.object(self.scraper, "_scrape_animal_details") as mock_scrape_details:
+        with stub_detail_fetch(), patch.object(self.scraper, "_parse_animal_details") as mock_parse_details:
             mock_animals = [
                 {
                     "name": "Dog1",
@@ -432,7 +439,7 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
                 },
             ]
 
-            mock_scrape_details.return_value = {
+            mock_parse_details.return_value = {
                 "breed": "Mixed Breed",
                 "size": "Medium",
             }
@@ -444,8 +451,8 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
             self.assertEqual(result[0]["name"], "Dog1")
             self.assertEqual(result[1]["name"], "Dog2")
 
-            # Should call _scrape_animal_details for each animal
-            self.assertEqual(mock_scrape_details.call_count, 2)
+            # Should parse each animal's detail page
+            self.assertEqual(mock_parse_details.call_count, 2)
 
     def test_process_animals_parallel_batch_processing(self):
         """Test that _process_animals_parallel correctly splits into batches for parallel processing."""
@@ -464,7 +471,7 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
 
             scraper = SanterPawsBulgarianRescueScraper(config_id="santerpawsbulgarianrescue")
 
-            with patch.object(scraper, "_scrape_animal_details") as mock_scrape_details:
+            with stub_detail_fetch(), patch.object(scraper, "_parse_animal_details") as mock_parse_details:
                 # Create 5 animals to trigger parallel processing (more than batch_size=2)
                 mock_animals = [
                     {
@@ -475,7 +482,7 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
                     for i in range(1, 6)
                 ]
 
-                mock_scrape_details.return_value = {
+                mock_parse_details.return_value = {
                     "breed": "Mixed Breed",
                     "size": "Medium",
                 }
@@ -485,34 +492,32 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
                 # Should process all 5 animals
                 self.assertEqual(len(result), 5)
 
-                # Should call _scrape_animal_details for each animal
-                self.assertEqual(mock_scrape_details.call_count, 5)
+                # Should parse each animal's detail page
+                self.assertEqual(mock_parse_details.call_count, 5)
 
     def test_process_animals_parallel_respects_rate_limiting(self):
         """Test that parallel processing respects rate limiting configuration."""
 
         # Test with rate_limit_delay from config (2.5 seconds)
-        with patch("time.sleep") as mock_sleep:
-            with patch.object(self.scraper, "_scrape_animal_details") as mock_scrape_details:
-                mock_animals = [
-                    {
-                        "name": "Dog1",
-                        "adoption_url": "https://site.com/dog1/",
-                        "external_id": "dog1",
-                    }
-                ]
-
-                mock_scrape_details.return_value = {"breed": "Mixed Breed"}
+        with patch("scrapers.base_scraper.HttpFetchEngine") as mock_engine:
+            mock_animals = [
+                {
+                    "name": "Dog1",
+                    "adoption_url": "https://site.com/dog1/",
+                    "external_id": "dog1",
+                }
+            ]
+            mock_engine.return_value.fetch_all.return_value = [FetchResult("https://site.com/dog1/", 200, DETAIL_HTML)]
 
-                result = self.scraper._process_animals_parallel(mock_animals)
+            result = self.scraper._process_animals_parallel(mock_animals)
 
-                # Should have called sleep with rate_limit_delay (2.5 from config)
-                mock_sleep.assert_called_with(2.5)
-                self.assertEqual(len(result), 1)
+            # Engine should rate limit with rate_limit_delay (2.5 from config)
+            self.assertEqual(mock_engine.call_args.kwargs["rate_limit_delay"], 2.5)
+            self.assertEqual(len(result), 1)
 
     def test_process_animals_parallel_handles_errors(self):
         """Test that parallel processing handles errors gracefully and continues processing."""
-        with patch.object(self.scraper, "_scrape_animal_details") as mock_scrape_details:
+        with stub_detail_fetch(), patch.object(self.scraper, "_parse_animal_details") as mock_parse_details:
             mock_animals = [
                 {
                     "name": "GoodDog",
@@ -527,7 +532,7 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
             ]
 
             # Make second call raise exception
-            mock_scrape_details.side_effect = [
+            mock_parse_details.side_effect = [
                 {"breed": "Mixed Breed"},
                 Exception("Network error"),
             ]  # First call succeeds  # Second call fails
@@ -558,7 +563,8 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
 
             with (
                 patch.object(scraper, "get_animal_list") as mock_get_list,
-                patch.object(scraper, "_scrape_animal_details") as mock_scrape_details,
+                stub_detail_fetch(),
+                patch.object(scraper, "_parse_animal_details") as mock_parse_details,
             ):
                 # Mock 4 animals from listing
                 mock_animals = [
@@ -572,15 +578,10 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
                 mock_get_list.return_value = mock_animals
 
                 # Mock filtering_service to filter out 2 animals (2 remain)
-                scraper.filtering_service.filter_existing_urls = Mock(
-                    return_value=[
-                        "https://site.com/dog3/",
-                        "https://site.com/dog4/",
-                    ]
-                )
+                scraper.filtering_service.select_for_detail = Mock(return_value=mock_animals[2:])
 
                 # Mock detail scraping
-                mock_scrape_details.return_value = {
+                mock_parse_details.return_value = {
                     "breed": "Mixed Breed",
                     "size": "Medium",
                 }
@@ -591,17 +592,18 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
                 self.assertEqual(len(result), 2)
 
                 # Should have called filtering_service
-                scraper.filtering_service.filter_existing_urls.assert_called_once()
+                scraper.filtering_service.select_for_detail.assert_called_once()
 
                 # Should have called detail scraping for remaining animals
-                self.assertEqual(mock_scrape_details.call_count, 2)
+                self.assertEqual(mock_parse_details.call_count, 2)
 
     def test_collect_data_integration_single_threaded_with_skip_disabled(self):
         """Test collect_data integration with skip_existing_animals=False and single-threaded processing."""
         # Use default scraper (batch_size=6, skip_existing_animals=False)
         with (
             patch.object(self.scraper, "get_animal_list") as mock_get_list,
-            patch.object(self.scraper, "_scrape_animal_details") as mock_scrape_details,
+            stub_detail_fetch(),
+            patch.object(self.scraper, "_parse_animal_details") as mock_parse_details,
         ):
             # Mock 3 animals (less than batch_size=6, so single-threaded)
             mock_animals = [
@@ -613,7 +615,7 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
                 for i in range(1, 4)
             ]
             mock_get_list.return_value = mock_animals
-            mock_scrape_details.return_value = {
+            mock_parse_details.return_value = {
                 "breed": "Mixed Breed",
                 "size": "Medium",
             }
@@ -624,7 +626,7 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
             self.assertEqual(len(result), 3)
 
             # Should call detail scraping for each animal
-            self.assertEqual(mock_scrape_details.call_count, 3)
+            self.assertEqual(mock_parse_details.call_count, 3)
 
     def test_collect_data_handles_empty_animal_list(self):
         """Test that collect_data handles empty animal list gracefully."""
@@ -862,10 +864,11 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
 
         with (
             patch.object(self.scraper, "get_animal_list") as mock_get_list,
-            patch.object(self.scraper, "_scrape_animal_details") as mock_scrape_details,
+            stub_detail_fetch(),
+            patch.object(self.scraper, "_parse_animal_details") as mock_parse_details,
         ):
             mock_get_list.return_value = [mock_animal_data]
-            mock_scrape_details.return_value = {
+            mock_parse_details.return_value = {
                 "description": "Detailed description from page",
                 "age_text": "01/01/2023",
                 "sex": "Male",
@@ -874,7 +877,7 @@ class TestSanterPawsBulgarianRescueScraper(unittest.TestCase):
 
             result = self.scraper.collect_data()
 
-            mock_scrape_details.assert_called_once_with("https://santerpawsbulgarianrescue.com/dog/test-dog/")
+            mock_parse_details.assert_called_once_with("https://santerpawsbulgarianrescue.com/dog/test-dog/", DETAIL_HTML)
 
             self.assertEqual(len(result), 1)
             dog_data = result[0]
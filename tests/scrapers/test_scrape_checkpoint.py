@@ -0,0 +1,134 @@
+"""A rerun after an interrupted scrape picks up where it stopped.
+
+Only animals the interrupted scrape persisted may be skipped, and skipping
+them must not shrink what stale detection and the partial-failure check see:
+they are still found, and still marked as seen.
+"""
+
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from scrapers.base_scraper import BaseScraper
+from scrapers.constants import CHECKPOINT_RESUME_WINDOW, STREAM_BATCH_SIZE
+from scrapers.filtering.filtering_service import FilteringService
+from services.database_service import DatabaseService
+from services.session_manager import SessionManager
+
+CARDS = [{"external_id": f"dog-{n}", "name": f"Dog {n}", "adoption_url": f"https://x/{n}"} for n in range(1, 5)]
+
+
+class _StubScraper(BaseScraper):
+    def collect_data(self):
+        return []
+
+
+class _InterruptedStreamScraper(BaseScraper):
+    """Streams one batch of dogs, then loses its browser mid-crawl."""
+
+    def collect_data(self):
+        for n in range(STREAM_BATCH_SIZE):
+            yield {"external_id": f"dog-{n}", "name": f"Dog {n}", "adoption_url": f"https://x/{n}"}
+        raise RuntimeError("Browserless disconnected")
+
+
+@pytest.fixture
+def database_service():
+    service = Mock(spec=DatabaseService)
+    service.create_scrape_log.return_value = 42
+    service.resume_checkpoint.return_value = {"dog-1", "dog-2"}
+    service.get_listing_hashes.return_value = {}
+    return service
+
+
+@pytest.fixture
+def scraper(database_service):
+    session_manager = Mock(spec=SessionManager)
+    session_manager.start_scrape_session.return_value = True
+    return _StubScraper(organization_id=7, database_service=database_service, session_manager=session_manager)
+
+
+@pytest.mark.unit
+class TestResume:
+    def test_setup_resumes_the_previous_scrape_within_the_window(self, scraper, database_service):
+        assert scraper._setup_scrape() is True
+
+        organization_id, scrape_log_id, since = database_service.resume_checkpoint.call_args.args
+        assert (organization_id, scrape_log_id) == (7, 42)
+        assert abs(datetime.now() - since - CHECKPOINT_RESUME_WINDOW).total_seconds() < 60
+
+    def test_force_rescrape_starts_over(self, scraper, database_service):
+        with patch.dict("os.environ", {"FORCE_RESCRAPE": "true"}):
+            scraper._setup_scrape()
+
+        database_service.resume_checkpoint.assert_not_called()
+
+    def test_resumed_animals_are_found_but_not_fetched(self, scraper):
+        scraper._setup_scrape()
+
+        remaining = scraper.filtering_service.filter_existing_animals(CARDS)
+
+        assert [card["external_id"] for card in remaining] == ["dog-3", "dog-4"]
+        found = {c.args[0] for c in scraper.session_manager.record_found_animal.call_args_list}
+        unchanged = {c.args[0] for c in scraper.session_manager.record_unchanged_animal.call_args_list}
+        assert found == {"dog-1", "dog-2", "dog-3", "dog-4"}
+        assert unchanged == {"dog-1", "dog-2"}
+
+    def test_the_found_count_still_covers_the_whole_listing(self, scraper):
+        scraper._setup_scrape()
+        remaining = scraper.filtering_service.filter_existing_animals(CARDS)
+
+        assert scraper._get_correct_animals_found_count(remaining) == 4
+
+    def test_with_skip_existing_animals_resumed_animals_count_as_skipped(self, database_service):
+        service = FilteringService(database_service=database_service, organization_id=7, skip_existing_animals=True)
+        service.resume({"dog-1"})
+
+        remaining = service.filter_existing_animals(CARDS)
+
+        assert [card["external_id"] for card in remaining] == ["dog-2", "dog-3", "dog-4"]
+        assert (service.total_animals_before_filter, service.total_animals_skipped) == (4, 1)
+
+
+@pytest.mark.unit
+class TestCheckpoints:
+    def test_only_persisted_animals_are_checkpointed(self, scraper, database_service):
+        scraper.scrape_log_id = 42
+        scraper.progress_tracker = Mock()
+        scraper.image_processing_service = None
+        scraper._validate_animal_data = Mock(return_value=True)
+        scraper.save_animals = Mock(return_value=[(1, "added"), (None, "error"), (3, "no_change")])
+
+        scraper._process_animals_data([dict(card) for card in CARDS[:3]])
+
+        database_service.record_checkpoint.assert_called_once_with(42, ["dog-1", "dog-3"])
+
+    def test_a_completed_scrape_clears_the_checkpoints(self, scraper, database_service):
+        scraper.scrape_log_id = 42
+
+        scraper.complete_scrape_log(status="success", animals_found=4)
+
+        database_service.clear_checkpoints.assert_called_once_with(7)
+
+    def test_a_failed_scrape_keeps_them_for_the_rerun(self, scraper, database_service):
+        scraper.scrape_log_id = 42
+
+        scraper.handle_scraper_failure("Browserless disconnected")
+
+        database_service.clear_checkpoints.assert_not_called()
+
+    def test_a_streaming_scrape_interrupted_mid_crawl_keeps_what_it_saved(self, database_service):
+        database_service.resume_checkpoint.return_value = set()
+        session_manager = Mock(spec=SessionManager)
+        session_manager.start_scrape_session.return_value = True
+        scraper = _InterruptedStreamScraper(organization_id=7, database_service=database_service, session_manager=session_manager)
+        scraper.image_processing_service = None
+        scraper.llm_handler = Mock()
+        scraper._validate_animal_data = Mock(return_value=True)
+        scraper.save_animals = Mock(side_effect=lambda animals: [(n, "added") for n, _ in enumerate(animals, 1)])
+
+        assert scraper._run_with_connection() is False
+
+        database_service.record_checkpoint.assert_called_once_with(42, [f"dog-{n}" for n in range(STREAM_BATCH_SIZE)])
+        database_service.clear_checkpoints.assert_not_called()
@@ -3,9 +3,20 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 from bs4 import BeautifulSoup
 
+from scrapers.http_fetcher import FetchResult, HttpFetchEngine
 from scrapers.theunderdog.theunderdog_scraper import TheUnderdogScraper
 
 
+def serve_detail_pages(pages: dict[str, str]):
+    """Serve detail pages from memory instead of the network."""
+    return patch.object(
+        HttpFetchEngine,
+        "fetch_all",
+        autospec=True,
+        side_effect=lambda engine, urls, max_concurrency=1: [FetchResult(url, 200, pages[url]) for url in urls],
+    )
+
+
 @pytest.mark.database
 @pytest.mark.integration
 @pytest.mark.external
@@ -447,16 +458,14 @@ class TestTheUnderdogIntegration:
         mock_detail_response_vicky,
         mock_detail_response_luna,
     ):
-        mock_responses = [
-            Mock(text=mock_listing_response, status_code=200),
-            Mock(text=mock_detail_response_vicky, status_code=200),
-            Mock(text=mock_detail_response_luna, status_code=200),
-        ]
-        mock_get.side_effect = mock_responses
-
-        scraper.respect_rate_limit = Mock()
+        mock_get.return_value = Mock(text=mock_listing_response, status_code=200)
+        detail_pages = {
+            "https://www.theunderdog.org/adopt/vicky": mock_detail_response_vicky,
+            "https://www.theunderdog.org/adopt/luna": mock_detail_response_luna,
+        }
 
-        results = scraper.collect_data()
+        with serve_detail_pages(detail_pages):
+            results = scraper.collect_data()
 
         assert len(results) == 2
 
@@ -530,17 +539,13 @@ class TestTheUnderdogIntegration:
         </html>
         """
 
-        mock_get.side_effect = [
-            Mock(
-                text='<div class="ProductList-item"><h3 class="ProductList-title">Buddy 🇷🇴</h3><a href="/adopt/buddy"></a></div>',
-                status_code=200,
-            ),
-            Mock(text=minimal_response, status_code=200),
-        ]
-
-        scraper.respect_rate_limit = Mock()
+        mock_get.return_value = Mock(
+            text='<div class="ProductList-item"><h3 class="ProductList-title">Buddy 🇷🇴</h3><a href="/adopt/buddy"></a></div>',
+            status_code=200,
+        )
 
-        results = scraper.collect_data()
+        with serve_detail_pages({"https://www.theunderdog.org/adopt/buddy": minimal_response}):
+            results = scraper.collect_data()
         assert len(results) == 1
 
         buddy = results[0]
@@ -337,27 +337,20 @@ class TestScraperCoreFunctions:
         animals = [
             {"name": "Dog1", "adoption_url": "url1", "external_id": "dog1"},
             {"name": "Dog2", "adoption_url": "url2", "external_id": "dog2"},
+            {"name": "Dog2 again", "adoption_url": "url2", "external_id": "dog2"},
             {"name": "Dog3", "adoption_url": "url3", "external_id": "dog3"},
-            {"name": "Dog4", "adoption_url": "url4", "external_id": "dog4"},
         ]
 
-        call_count = 0
+        def fake_fetch_pages(urls, parse, max_concurrency, headers):
+            return [None if url == "url3" else {"properties": {"test": f"data_{url}"}} for url in urls]
 
-        def mock_scrape_details(url):
-            nonlocal call_count
-            call_count += 1
-            return {"properties": {"test": f"data_{call_count}"}}
+        with patch.object(scraper, "fetch_pages", side_effect=fake_fetch_pages) as fetch_pages:
+            result = scraper._process_animals_parallel(animals)
 
-        scraper._scrape_animal_details = mock_scrape_details
-        scraper.batch_size = 2
-
-        result = scraper._process_animals_parallel(animals)
-
-        assert len(result) == 4
-        assert call_count == 4
-        for animal in result:
-            assert "properties" in animal
-            assert "test" in animal["properties"]
+        assert fetch_pages.call_args.args[0] == ["url1", "url2", "url3"]
+        assert [animal["name"] for animal in result] == ["Dog1", "Dog2", "Dog3"]
+        assert result[0]["properties"] == {"test": "data_url1"}
+        assert "properties" not in result[2], "an animal whose page failed is kept without details"
 
     @pytest.mark.unit
     def test_hero_image_extraction_from_detail_page(self, scraper):
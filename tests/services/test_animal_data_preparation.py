@@ -5,12 +5,17 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from services.animal_data_preparation import (
+    CURRENT_ROW_COLUMNS,
     PreparedAnimalData,
-    generate_temp_slug,
+    content_fingerprint,
+    generate_final_slugs,
     prepare_animal_data,
+    prepare_animal_update,
+    reserve_animal_ids,
     sanitize_properties,
-    update_to_final_slug,
+    standardized_fields,
 )
+from utils.unified_standardization import UnifiedStandardizer
 
 
 @pytest.mark.unit
@@ -89,41 +94,31 @@ class TestPrepareAnimalData:
 
 
 @pytest.mark.unit
-class TestGenerateTempSlug:
-    def test_generates_slug_with_temp_suffix(self):
-        conn = MagicMock()
-        conn.cursor.return_value.fetchone.return_value = None
-        result = generate_temp_slug({"name": "Max", "breed": "Labrador"}, "Labrador Retriever", conn)
-        assert result.endswith("-temp")
-        assert "max" in result.lower()
-
-    @patch("services.animal_data_preparation.generate_unique_animal_slug", side_effect=Exception("Slug error"))
-    def test_fallback_on_error(self, _mock_slug):
-        conn = MagicMock()
-        result = generate_temp_slug({"name": "Max", "external_id": "ext-123"}, "Lab", conn)
-        assert result.endswith("-temp")
-        assert "ext-123" in result
+class TestReserveAnimalIds:
+    def test_draws_ids_from_the_sequence_in_one_query(self):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [(41,), (42,)]
+        assert reserve_animal_ids(cursor, 2) == [41, 42]
+        cursor.execute.assert_called_once()
+        sql, params = cursor.execute.call_args[0]
+        assert "nextval(pg_get_serial_sequence('animals', 'id'))" in sql
+        assert params == (2,)
 
 
 @pytest.mark.unit
-class TestUpdateToFinalSlug:
-    def test_updates_slug_with_id(self):
-        cursor = MagicMock()
+class TestGenerateFinalSlugs:
+    def test_slugs_end_with_the_reserved_id(self):
         conn = MagicMock()
-        conn.cursor.return_value.fetchone.return_value = None
-        logger = MagicMock()
-        update_to_final_slug(cursor, 42, {"name": "Max", "breed": "Lab"}, "Labrador", conn, logger)
-        cursor.execute.assert_called_once()
-        call_args = cursor.execute.call_args
-        assert call_args[0][1][1] == 42
+        conn.cursor.return_value.fetchall.return_value = []
+        result = generate_final_slugs([(42, {"name": "Max", "breed": "Lab"}, "Labrador Retriever"), (43, {"name": "Luna"}, None)], conn)
+        assert result == ["max-labrador-retriever-42", "luna-43"]
+        # All candidates are checked with a single lookup
+        conn.cursor.return_value.execute.assert_called_once()
 
-    @patch("services.animal_data_preparation.generate_unique_animal_slug", side_effect=Exception("Slug error"))
-    def test_continues_on_error(self, _mock_slug):
-        cursor = MagicMock()
-        conn = MagicMock()
-        logger = MagicMock()
-        update_to_final_slug(cursor, 42, {"name": "Max"}, "Lab", conn, logger)
-        logger.error.assert_called_once()
+    @patch("services.animal_data_preparation.ensure_unique_slugs", side_effect=lambda slugs, conn: [f"{slug}-1" for slug in slugs])
+    def test_collisions_are_resolved_by_ensure_unique_slugs(self, _mock_unique):
+        result = generate_final_slugs([(42, {"name": "Max"}, "Lab")], MagicMock())
+        assert result == ["max-lab-42-1"]
 
 
 @pytest.mark.unit
@@ -193,3 +188,100 @@ class TestPrepareAnimalDataRawBreed:
         animal_data = {"name": "Ghost", "age_text": "1 year"}
         result = prepare_animal_data(animal_data)
         assert result.breed_raw is None
+
+
+@pytest.mark.unit
+class TestContentFingerprint:
+    """The fingerprint stands in for the column-by-column comparison of unchanged dogs."""
+
+    ANIMAL = {"name": "Luna", "breed": "Mischling", "age_text": "2 years", "status": "available", "properties": {"a": 1, "b": "x"}}
+
+    def test_same_data_same_fingerprint_regardless_of_key_order(self):
+        reordered = {**self.ANIMAL, "properties": {"b": "x", "a": 1}}
+
+        assert content_fingerprint(reordered) == content_fingerprint(dict(self.ANIMAL))
+
+    def test_any_compared_field_changes_it(self):
+        base = content_fingerprint(self.ANIMAL)
+
+        assert content_fingerprint({**self.ANIMAL, "status": "reserved"}) != base
+        assert content_fingerprint({**self.ANIMAL, "properties": {"a": 2, "b": "x"}}) != base
+        assert content_fingerprint({**self.ANIMAL, "breed_confidence": 0.8}) != base
+
+    def test_fields_that_are_not_compared_do_not_change_it(self):
+        assert content_fingerprint({**self.ANIMAL, "adoption_url": "https://rescue.example/luna"}) == content_fingerprint(self.ANIMAL)
+
+    def test_update_writes_the_fingerprint(self):
+        row = tuple(self.ANIMAL.get(column) for column in CURRENT_ROW_COLUMNS)
+
+        _, values = prepare_animal_update(self.ANIMAL, row)
+
+        assert values["content_hash"] == content_fingerprint(self.ANIMAL)
+
+
+def pipeline_record(name, breed, age, size=None):
+    """An animal as BaseScraper.process_animal hands it to the save path."""
+    standardized = UnifiedStandardizer().apply_full_standardization(breed=breed, age=age, size=size)
+    return {"name": name, "status": "available", "breed_raw": breed, **standardized}
+
+
+LEGACY_WRAPPERS = ("standardize_breed", "parse_age_text", "standardize_size_value")
+
+
+@pytest.mark.unit
+class TestSinglePassStandardization:
+    """A record standardized by the scraper pipeline is saved without a second pass."""
+
+    def test_pipeline_records_never_reach_the_legacy_wrappers(self):
+        animal = pipeline_record("Luna", "German Shepherd mix", "2 years")
+        row = tuple(animal.get(column) for column in CURRENT_ROW_COLUMNS)
+
+        with patch.multiple("services.animal_data_preparation", **{name: MagicMock(side_effect=AssertionError(name)) for name in LEGACY_WRAPPERS}):
+            prepared = prepare_animal_data(animal)
+            _, values = prepare_animal_update(animal, row)
+
+        assert prepared.standardized_breed == values["standardized_breed"] == "German Shepherd Dog Cross"
+        assert prepared.final_standardized_size == values["standardized_size"] == "Large"
+        assert (prepared.age_months_min, prepared.age_months_max) == (values["age_min_months"], values["age_max_months"]) == (24, 36)
+
+    def test_a_second_pass_would_not_have_changed_anything(self):
+        animal = pipeline_record("Rex", "Jack Russell Terrier x", "6 months", "small")
+
+        with patch.object(UnifiedStandardizer, "apply_full_standardization", side_effect=AssertionError):
+            fields = standardized_fields(animal)
+        legacy = standardized_fields({key: value for key, value in animal.items() if key not in ("standardized_breed", "breed_category")})
+
+        assert fields == legacy
+
+    def test_records_outside_the_pipeline_are_still_standardized(self):
+        fields = standardized_fields({"name": "Bella", "breed": "Labrador", "age_text": "3 years"})
+
+        assert fields.standardized_breed == "Labrador Retriever"
+        assert fields.breed_group == "Sporting"
+        assert fields.standardized_size == "Large"
+        assert fields.age_min_months is not None
+
+
+@pytest.mark.unit
+@pytest.mark.benchmark
+class TestSavePhaseBenchmark:
+    """CPU per dog spent preparing a save, for pipeline records and raw ones."""
+
+    ANIMALS = [("Luna", "German Shepherd mix", "2 years"), ("Rex", "Podenco", "6 months"), ("Bella", "Labrador", "10 years"), ("Milo", "Mestizo", "1 year")] * 25
+
+    def run_update_preparation(self, animals):
+        for animal, row in animals:
+            prepare_animal_update(animal, row)
+
+    @pytest.mark.parametrize("source", ["pipeline", "raw"])
+    def test_update_preparation_per_dog(self, benchmark, source):
+        animals = []
+        for name, breed, age in self.ANIMALS:
+            animal = pipeline_record(name, breed, age) if source == "pipeline" else {"name": name, "breed": breed, "age_text": age, "status": "available"}
+            animals.append((animal, tuple(animal.get(column) for column in CURRENT_ROW_COLUMNS)))
+        benchmark.group = "save phase: prepare_animal_update"
+
+        benchmark(self.run_update_preparation, animals)
+
+        benchmark.extra_info["dogs"] = len(animals)
+        benchmark.extra_info["mean_us_per_dog"] = round(benchmark.stats.stats.mean / len(animals) * 1e6, 2)
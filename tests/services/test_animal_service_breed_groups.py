@@ -10,48 +10,46 @@ from unittest.mock import MagicMock
 import pytest
 
 from api.services.animal_service import AnimalService
+from utils.metadata_dictionary import BREED_GROUP_QUERY, BREED_QUERY, MetadataDictionary
 
 
-def _service_with_rows(rows):
+def _service_with_rows(breeds=(), groups=()):
+    """Service over a cursor with no published snapshot, so the domains are built live."""
+    results = {BREED_QUERY: [{"primary_breed": breed, "breed_group": group} for breed, group in breeds], BREED_GROUP_QUERY: [{"breed_group": group} for group in groups]}
     cursor = MagicMock()
-    cursor.fetchall.return_value = rows
-    return AnimalService(cursor), cursor
+    cursor.execute.side_effect = lambda sql, params=None: cursor.fetchall.configure_mock(return_value=results.get(sql, []))
+    return AnimalService(cursor, metadata=MetadataDictionary()), cursor
 
 
 @pytest.mark.unit
 class TestBreedGroupQueriesUseColumn:
     def test_distinct_breed_groups_queries_the_column(self):
-        service, cursor = _service_with_rows([{"breed_group": "Hound"}, {"breed_group": "Guardian"}])
+        service, _ = _service_with_rows(groups=["Hound", "Guardian"])
 
         result = service.get_distinct_breed_groups()
 
-        sql = cursor.execute.call_args[0][0]
-        assert "properties" not in sql, "still reading the empty JSON field"
-        assert "breed_group" in sql
+        assert "properties" not in BREED_GROUP_QUERY, "still reading the empty JSON field"
+        assert "breed_group" in BREED_GROUP_QUERY
         assert result == ["Hound", "Guardian"]
 
     def test_distinct_breed_groups_returns_real_data_not_a_hardcoded_list(self):
         """Guardian and Designer exist in production but were never returned."""
-        service, _ = _service_with_rows([{"breed_group": "Guardian"}])
+        service, _ = _service_with_rows(groups=["Guardian"])
 
         assert service.get_distinct_breed_groups() == ["Guardian"]
 
     def test_distinct_breeds_filters_by_group_column(self):
-        service, cursor = _service_with_rows([{"primary_breed": "Greyhound"}])
+        service, _ = _service_with_rows(breeds=[("Beagle", "Scent"), ("Greyhound", "Hound")])
 
         result = service.get_distinct_breeds(breed_group="Hound")
 
-        sql, params = cursor.execute.call_args[0]
-        assert "properties->>'breed_group'" not in sql
-        assert "Hound" in params
+        assert "properties->>'breed_group'" not in BREED_QUERY
         assert result == ["Greyhound"]
 
     def test_distinct_breeds_ignores_any_group_sentinel(self):
-        service, cursor = _service_with_rows([{"primary_breed": "Greyhound"}])
+        service, _ = _service_with_rows(breeds=[("Beagle", "Scent"), ("Greyhound", "Hound")])
 
-        service.get_distinct_breeds(breed_group="Any group")
-
-        assert "Any group" not in (cursor.execute.call_args[0][1] or [])
+        assert service.get_distinct_breeds(breed_group="Any group") == ["Beagle", "Greyhound"]
 
 
 @pytest.mark.unit
@@ -65,20 +63,16 @@ class TestDogsFilterUsesCanonicalBreed:
     """
 
     def test_distinct_breeds_lists_canonical_breeds(self):
-        service, cursor = _service_with_rows([{"primary_breed": "Border Collie"}])
+        service, _ = _service_with_rows(breeds=[("Border Collie", "Herding")])
 
         result = service.get_distinct_breeds()
 
-        sql = cursor.execute.call_args[0][0]
-        assert "primary_breed" in sql
-        assert "standardized_breed" not in sql, "the display label splits X from X Cross"
+        assert "primary_breed" in BREED_QUERY
+        assert "standardized_breed" not in BREED_QUERY, "the display label splits X from X Cross"
         assert result == ["Border Collie"]
 
     def test_distinct_breeds_still_filters_by_group(self):
-        service, cursor = _service_with_rows([{"primary_breed": "Greyhound"}])
-
-        service.get_distinct_breeds(breed_group="Hound")
+        service, _ = _service_with_rows(breeds=[("Border Collie", "Herding"), ("Greyhound", "Hound")])
 
-        sql, params = cursor.execute.call_args[0]
-        assert "breed_group = %s" in sql
-        assert "Hound" in params
+        assert service.get_distinct_breeds(breed_group="Hound") == ["Greyhound"]
+        assert service.get_distinct_breeds(breed_group="Toy") == []
@@ -0,0 +1,121 @@
+"""The counters behind /statistics must agree with a full count of the animals table.
+
+The endpoints no longer aggregate animals, so a write path that forgets its
+counter update would show a wrong total with nothing to flag it. Every check
+here compares the stored counters with the recount they replace.
+"""
+
+import psycopg2
+import pytest
+
+from config import DB_CONFIG
+from services.animal_statistics import reconcile_statistics, tracked_update, tracked_write
+from services.database_service import DatabaseService
+
+ORG_ID = 901
+
+
+@pytest.fixture
+def conn():
+    connection = psycopg2.connect(
+        host=DB_CONFIG["host"],
+        port=DB_CONFIG.get("port", 5432),
+        dbname=DB_CONFIG["database"],
+        user=DB_CONFIG["user"],
+        password=DB_CONFIG.get("password"),
+    )
+    yield connection
+    connection.rollback()
+    connection.close()
+
+
+def stored(cursor) -> tuple[int, int, int]:
+    cursor.execute(
+        "SELECT available_count, new_this_week, active_dog_count FROM animal_statistics WHERE organization_id = %s",
+        (ORG_ID,),
+    )
+    return cursor.fetchone()
+
+
+def recounted(cursor) -> tuple[int, int, int]:
+    cursor.execute(
+        """
+        SELECT COUNT(*) FILTER (WHERE status = 'available' AND active AND availability_confidence IN ('high', 'medium')),
+               COUNT(*) FILTER (WHERE status = 'available' AND active AND availability_confidence IN ('high', 'medium')
+                                  AND created_at >= NOW() - INTERVAL '7 days'),
+               COUNT(*) FILTER (WHERE active AND animal_type = 'dog')
+        FROM animals WHERE organization_id = %s
+        """,
+        (ORG_ID,),
+    )
+    return cursor.fetchone()
+
+
+@pytest.mark.database
+@pytest.mark.integration
+class TestAnimalStatisticsCounters:
+    def test_seeded_counters_match_a_recount(self, conn):
+        with conn.cursor() as cursor:
+            assert stored(cursor) == recounted(cursor)
+            assert stored(cursor)[0] == 12
+            assert reconcile_statistics(cursor) == 0
+
+    def test_a_tracked_status_change_moves_the_counts(self, conn):
+        with conn.cursor() as cursor:
+            with tracked_write(cursor, "id = %s", (9001,)):
+                cursor.execute("UPDATE animals SET status = 'adopted', active = false WHERE id = %s", (9001,))
+
+            assert stored(cursor) == recounted(cursor)
+            assert stored(cursor)[0] == 11
+
+    def test_a_single_row_update_moves_the_counts(self, conn):
+        with conn.cursor() as cursor:
+            tracked_update(cursor, 9001, "status = %s, active = false", ("adopted",))
+
+            assert stored(cursor) == recounted(cursor)
+            assert stored(cursor)[0] == 11
+
+    def test_a_single_row_update_outside_the_counts_leaves_the_counters_alone(self, conn):
+        with conn.cursor() as cursor:
+            tracked_update(cursor, 9001, "last_seen_at = NOW(), consecutive_scrapes_missing = %s", (0,))
+
+            assert cursor.rowcount == 0
+            assert stored(cursor) == recounted(cursor)
+
+    def test_a_set_based_write_is_tracked_by_its_predicate(self, conn):
+        with conn.cursor() as cursor:
+            where = "organization_id = %s AND id IN (9001, 9002, 9003)"
+            with tracked_write(cursor, where, (ORG_ID,)):
+                cursor.execute("UPDATE animals SET availability_confidence = 'low' WHERE id IN (9001, 9002)")
+
+            assert stored(cursor) == recounted(cursor)
+            assert stored(cursor)[0] == 10
+
+    def test_a_rolled_back_write_leaves_the_counts_alone(self, conn):
+        with conn.cursor() as cursor:
+            before = stored(cursor)
+            with tracked_write(cursor, "id = %s", (9001,)):
+                cursor.execute("UPDATE animals SET status = 'adopted' WHERE id = %s", (9001,))
+            conn.rollback()
+
+            assert stored(cursor) == before
+
+    def test_reconcile_corrects_writes_that_bypassed_tracking(self, conn):
+        with conn.cursor() as cursor:
+            cursor.execute("UPDATE animals SET active = false WHERE id IN (9001, 9002)")
+            assert stored(cursor) != recounted(cursor)
+
+            assert reconcile_statistics(cursor) == 1
+            assert stored(cursor) == recounted(cursor)
+
+    def test_create_animal_counts_the_new_dog(self, conn):
+        service = DatabaseService(db_config=DB_CONFIG)
+        animal_id, action = service.create_animal({"name": "Counter Dog", "organization_id": ORG_ID, "external_id": "counter-dog-1", "adoption_url": "http://example.com/counter", "breed": "Beagle"})
+        service.close()
+
+        assert action == "added"
+        with conn.cursor() as cursor:
+            assert stored(cursor) == recounted(cursor)
+            assert stored(cursor)[:2] == (13, 13)
+            cursor.execute("DELETE FROM animals WHERE id = %s", (animal_id,))
+            conn.commit()
@@ -13,6 +13,11 @@ import pytest
 from services.session_manager import SessionManager
 
 
+def executed_update(mock_cursor) -> str:
+    """The UPDATE statement, ignoring the statistics counter writes around it."""
+    return next(call[0][0] for call in mock_cursor.execute.call_args_list if "UPDATE animals" in call[0][0])
+
+
 @pytest.mark.database
 @pytest.mark.integration
 class TestAvailabilityConfidenceFix:
@@ -40,7 +45,7 @@ class TestAvailabilityConfidenceFix:
 
         # Verify the SQL query was called
         assert mock_cursor.execute.called
-        executed_query = mock_cursor.execute.call_args[0][0]
+        executed_query = executed_update(mock_cursor)
 
         # Verify the simplified logic: first miss = medium, subsequent = low
         assert "WHEN consecutive_scrapes_missing = 0 THEN 'medium'" in executed_query
@@ -70,7 +75,7 @@ class TestAvailabilityConfidenceFix:
         # Test the SQL logic by examining the query structure
         session_manager.update_stale_data_detection()
 
-        executed_query = mock_cursor.execute.call_args[0][0]
+        executed_query = executed_update(mock_cursor)
 
         # Verify logical progression:
         # consecutive_scrapes_missing = 0 → medium (first miss)
@@ -112,7 +117,7 @@ class TestAvailabilityConfidenceFix:
 
         assert result is True
         assert mock_cursor.execute.called
-        executed_query = mock_cursor.execute.call_args[0][0]
+        executed_query = executed_update(mock_cursor)
 
         # Verify it sets high confidence, resets counter, and updates timestamp
         assert "availability_confidence = 'high'" in executed_query
@@ -60,6 +60,37 @@ class TestBaseScraperWithDatabaseService:
         assert animal_id == 123
         assert action == "added"
 
+    @patch.dict(
+        "os.environ",
+        {
+            "CLOUDINARY_CLOUD_NAME": "",
+            "CLOUDINARY_API_KEY": "",
+            "CLOUDINARY_API_SECRET": "",
+        },
+    )
+    def test_save_animals_writes_the_batch_through_one_upsert(self, mock_scraper_with_service):
+        """Test that save_animals looks up and writes a batch once, keeping per-animal results in order."""
+        mock_db_service = Mock(spec=DatabaseService)
+        mock_db_service.get_existing_animals.return_value = {"test-org1-2": (7, "Old Dog", "2024-01-01")}
+        mock_db_service.upsert_animals.return_value = [(8, "added"), (7, "no_change")]
+
+        scraper = mock_scraper_with_service(organization_id=1, database_service=mock_db_service)
+        scraper.conn = Mock()
+
+        animals = [
+            {"name": "New Dog", "external_id": "test-org1-1", "organization_id": 1, "adoption_url": "https://example.com/adopt/1"},
+            {"name": "Old Dog", "external_id": "test-org1-2", "organization_id": 1, "adoption_url": "https://example.com/adopt/2"},
+        ]
+
+        results = scraper.save_animals(animals)
+
+        mock_db_service.get_existing_animals.assert_called_once_with(1, ["test-org1-1", "test-org1-2"])
+        mock_db_service.upsert_animals.assert_called_once()
+        mock_db_service.get_existing_animal.assert_not_called()
+        assert results == [(8, "added"), (7, "no_change")]
+        # Only the new animal is queued for LLM enrichment
+        assert [animal["id"] for animal in scraper.animals_for_llm_enrichment] == [8]
+
     @patch.dict(
         "os.environ",
         {
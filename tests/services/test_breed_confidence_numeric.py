@@ -34,7 +34,7 @@ class TestLexicalComparisonWasWrong:
 
 @pytest.mark.database
 class TestConfidenceWrittenAsNumber:
-    def _service(self, fetchone_side_effect):
+    def _service(self, fetchall_side_effect, fetchone_side_effect):
         from services.connection_pool import ConnectionPoolService
         from services.database_service import DatabaseService
 
@@ -45,11 +45,12 @@ class TestConfidenceWrittenAsNumber:
         ctx.__exit__ = Mock(return_value=None)
         pool.get_connection_context.return_value = ctx
         conn.cursor.return_value = cursor
+        cursor.fetchall.side_effect = fetchall_side_effect
         cursor.fetchone.side_effect = fetchone_side_effect
         return DatabaseService(db_config={"host": "h", "user": "u", "database": "d"}, connection_pool=pool), cursor
 
     def test_insert_passes_a_number_not_a_string(self):
-        service, cursor = self._service([(0,), (7,)])
+        service, cursor = self._service([[(7,)], []], [(7,)])
 
         service.create_animal(
             {
@@ -112,10 +112,11 @@ class TestDatabaseServiceWithConnectionPool:
         mock_pool_service.get_connection_context.return_value = mock_context
         mock_connection.cursor.return_value = mock_cursor
 
-        mock_cursor.fetchone.side_effect = [
-            (0,),  # slug uniqueness check
-            (456,),  # INSERT RETURNING id
+        mock_cursor.fetchall.side_effect = [
+            [(456,)],  # reserved ID
+            [],  # slug uniqueness check
         ]
+        mock_cursor.fetchone.return_value = (456,)  # INSERT RETURNING id
 
         db_service = DatabaseService(
             db_config={"host": "localhost", "user": "test", "database": "test_db"},
@@ -224,7 +225,7 @@ class TestDatabaseServiceWithConnectionPool:
 class TestDatabaseServiceRawBreedPersistence:
     """Both write paths must persist breed_raw or the original text is lost on disk."""
 
-    def _pooled_service(self, fetchone_side_effect):
+    def _pooled_service(self, fetchall_side_effect, fetchone_side_effect):
         from services.database_service import DatabaseService
 
         mock_pool_service = Mock(spec=ConnectionPoolService)
@@ -236,6 +237,7 @@ class TestDatabaseServiceRawBreedPersistence:
         mock_context.__exit__ = Mock(return_value=None)
         mock_pool_service.get_connection_context.return_value = mock_context
         mock_connection.cursor.return_value = mock_cursor
+        mock_cursor.fetchall.side_effect = fetchall_side_effect
         mock_cursor.fetchone.side_effect = fetchone_side_effect
 
         db_service = DatabaseService(
@@ -245,7 +247,7 @@ class TestDatabaseServiceRawBreedPersistence:
         return db_service, mock_cursor
 
     def test_create_animal_inserts_breed_raw(self):
-        db_service, mock_cursor = self._pooled_service([(0,), (456,)])
+        db_service, mock_cursor = self._pooled_service([[(456,)], []], [(456,)])
 
         db_service.create_animal(
             {
@@ -0,0 +1,118 @@
+"""A scrape's animals are written in bulk, with the results save_animal gave one by one.
+
+upsert_animals replaces a lookup, a write and a commit per dog. The rows it
+leaves behind, the action it reports for each dog and the statistics counters
+must be the same as before; only the number of round trips may change.
+"""
+
+import pytest
+
+from config import DB_CONFIG
+from services.animal_data_preparation import content_fingerprint
+from services.database_service import DatabaseService
+
+ORG_ID = 901
+
+
+def dog(external_id: str, **overrides) -> dict:
+    animal = {
+        "name": f"Dog {external_id}",
+        "external_id": external_id,
+        "organization_id": ORG_ID,
+        "adoption_url": f"https://rescue.example/{external_id}",
+        "primary_image_url": f"https://rescue.example/{external_id}.jpg",
+        "breed": "Labrador Retriever",
+        "age_text": "2 years",
+        "sex": "Female",
+        "status": "available",
+        "properties": {"description": "Friendly"},
+    }
+    animal.update(overrides)
+    return animal
+
+
+@pytest.fixture
+def service():
+    db_service = DatabaseService(DB_CONFIG)
+    assert db_service.connect()
+    yield db_service
+    db_service.close()
+
+
+def rows(service, external_ids):
+    cursor = service.conn.cursor()
+    cursor.execute("SELECT external_id, id, name, slug, status, active FROM animals WHERE organization_id = %s AND external_id = ANY(%s)", (ORG_ID, external_ids))
+    result = {row[0]: row[1:] for row in cursor.fetchall()}
+    cursor.close()
+    return result
+
+
+def counters_match_a_recount(service) -> bool:
+    cursor = service.conn.cursor()
+    cursor.execute("SELECT available_count, active_dog_count FROM animal_statistics WHERE organization_id = %s", (ORG_ID,))
+    stored = cursor.fetchone()
+    cursor.execute(
+        """
+        SELECT COUNT(*) FILTER (WHERE status = 'available' AND active AND availability_confidence IN ('high', 'medium')),
+               COUNT(*) FILTER (WHERE active AND animal_type = 'dog')
+        FROM animals WHERE organization_id = %s
+        """,
+        (ORG_ID,),
+    )
+    recounted = cursor.fetchone()
+    cursor.close()
+    return stored == recounted
+
+
+@pytest.mark.database
+@pytest.mark.integration
+class TestUpsertAnimals:
+    def test_new_animals_are_added_with_final_slugs(self, service):
+        results = service.upsert_animals(ORG_ID, [dog("bulk-1"), dog("bulk-2")])
+
+        stored = rows(service, ["bulk-1", "bulk-2"])
+        assert results == [(stored["bulk-1"][0], "added"), (stored["bulk-2"][0], "added")]
+        assert stored["bulk-1"][2] == f"dog-bulk-1-labrador-retriever-{stored['bulk-1'][0]}"
+        assert counters_match_a_recount(service)
+
+    def test_existing_animals_are_updated_or_left_alone(self, service):
+        service.upsert_animals(ORG_ID, [dog("bulk-1"), dog("bulk-2")])
+
+        results = service.upsert_animals(ORG_ID, [dog("bulk-1", status="reserved"), dog("bulk-2"), dog("bulk-3")])
+
+        stored = rows(service, ["bulk-1", "bulk-2", "bulk-3"])
+        assert [action for _, action in results] == ["updated", "no_change", "added"]
+        assert stored["bulk-1"][3:] == ("reserved", False)
+        assert counters_match_a_recount(service)
+
+    def test_saved_animals_carry_their_content_fingerprint(self, service):
+        service.upsert_animals(ORG_ID, [dog("bulk-1"), dog("bulk-2")])
+        service.upsert_animals(ORG_ID, [dog("bulk-2", status="reserved")])
+
+        fingerprints = service.get_content_fingerprints(ORG_ID)
+        stored = rows(service, ["bulk-1", "bulk-2"])
+        assert fingerprints["bulk-1"] == (stored["bulk-1"][0], content_fingerprint(dog("bulk-1")), "available")
+        assert fingerprints["bulk-2"] == (stored["bulk-2"][0], content_fingerprint(dog("bulk-2", status="reserved")), "reserved")
+
+    def test_a_dog_listed_twice_is_stored_once(self, service):
+        results = service.upsert_animals(ORG_ID, [dog("bulk-1", name="First"), dog("bulk-1", name="Second")])
+
+        stored = rows(service, ["bulk-1"])
+        assert stored["bulk-1"][1] == "Second"
+        assert {animal_id for animal_id, _ in results} == {stored["bulk-1"][0]}
+
+    def test_a_failing_chunk_is_saved_one_animal_at_a_time(self, service):
+        # adoption_url is NOT NULL: the bulk INSERT fails as a whole
+        results = service.upsert_animals(ORG_ID, [dog("bulk-1"), dog("bulk-2", adoption_url=None)])
+
+        assert [action for _, action in results] == ["added", "error"]
+        assert set(rows(service, ["bulk-1", "bulk-2"])) == {"bulk-1"}
+        assert counters_match_a_recount(service)
+
+    def test_existing_animals_are_looked_up_in_one_query(self, service):
+        service.upsert_animals(ORG_ID, [dog("bulk-1")])
+
+        existing = service.get_existing_animals(ORG_ID, ["bulk-1", "bulk-missing"])
+
+        assert list(existing) == ["bulk-1"]
+        assert existing["bulk-1"][1] == "Dog bulk-1"
@@ -16,7 +16,8 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from services.database_service import DatabaseService, _as_float
+from services.animal_data_preparation import _as_float, content_fingerprint
+from services.database_service import DatabaseService
 
 # Column order of update_animal's SELECT. A drift here shifts every later
 # value, which is how #349's positional assertions rotted.
@@ -136,6 +137,45 @@ class TestUpdateAnimalChangeDetection:
         assert update_with(service, row=CURRENT_ROW[:-1]) == "error"
 
 
+@pytest.mark.unit
+class TestUpsertFingerprints:
+    """Unchanged dogs are settled from the prefetched fingerprints alone."""
+
+    def upsert(self, service, stored_status="available", **overrides):
+        cursor = Mock()
+        cursor.fetchall.side_effect = [[("ext-1", 7, content_fingerprint(INCOMING), stored_status)], [(7, "ext-1", None, *CURRENT_ROW)]]
+        service.conn = Mock(cursor=Mock(return_value=cursor))
+        with patch("services.database_service.execute_values"), patch("services.database_service.tracked_write"):
+            return service.upsert_animals(1, [{**INCOMING, "external_id": "ext-1", **overrides}]), cursor
+
+    def test_a_matching_fingerprint_needs_no_row_read_or_write(self, service):
+        results, cursor = self.upsert(service)
+
+        assert results == [(7, "no_change")]
+        # Only the organization's fingerprint query ran
+        assert cursor.execute.call_count == 1
+        assert "content_hash" in cursor.execute.call_args[0][0]
+
+    def test_changed_data_falls_back_to_the_column_comparison(self, service):
+        _, cursor = self.upsert(service, name="Bella Rose")
+
+        assert "FROM animals WHERE organization_id = %s AND external_id = ANY(%s)" in cursor.execute.call_args_list[1][0][0]
+
+    def test_a_status_changed_by_another_writer_is_not_trusted(self, service):
+        """Stale and adoption detection change status without touching content_hash."""
+        results, cursor = self.upsert(service, stored_status="unknown")
+
+        assert cursor.execute.call_count == 2
+        assert results == [(7, "no_change")]
+
+    def test_fingerprints_are_loaded_once_per_scrape(self, service):
+        _, cursor = self.upsert(service)
+        cursor.fetchall.side_effect = None
+        service.upsert_animals(1, [{**INCOMING, "external_id": "ext-1"}])
+
+        assert cursor.execute.call_count == 1
+
+
 @pytest.mark.unit
 class TestAsFloat:
     """availability_confidence used to be text; comparisons must stay numeric."""
@@ -166,23 +206,39 @@ class TestReadPathsDegradeRatherThanRaise:
 
         assert service.get_existing_animal("ext-1", 1) == (7, "Bella", "2026-08-22")
 
-    def test_url_lookup_drops_nulls_rather_than_returning_them(self, service):
+    def test_listing_hash_lookup_is_scoped_to_the_listed_animals(self, service):
         cursor = Mock()
-        cursor.fetchall.return_value = [("http://a",), (None,), ("http://b",)]
+        cursor.fetchall.return_value = [("a", "h1", None), ("b", "h2", "2026-10-01")]
         service.conn = Mock(cursor=Mock(return_value=cursor))
 
-        assert service.get_existing_animal_urls(1) == {"http://a", "http://b"}
+        assert service.get_listing_hashes(1, ["a", "b", "c"]) == {"a": ("h1", None), "b": ("h2", "2026-10-01")}
+        assert cursor.execute.call_args.args[1] == (1, ["a", "b", "c"])
 
-    def test_url_lookup_returns_an_empty_set_on_a_query_error(self, service):
-        """An empty set means 'nothing seen'; it must not be a partial answer."""
+    def test_listing_hash_lookup_returns_none_on_a_query_error(self, service):
+        """None means 'couldn't look'; an empty dict would make every dog look new."""
         service.conn = Mock()
         service.conn.cursor.side_effect = RuntimeError("connection reset")
 
-        assert service.get_existing_animal_urls(1) == set()
+        assert service.get_listing_hashes(1, ["a"]) is None
 
-    def test_url_lookup_gives_up_when_it_cannot_connect(self, service):
+    def test_listing_hash_lookup_gives_up_when_it_cannot_connect(self, service):
         with patch.object(service, "connect", return_value=False):
-            assert service.get_existing_animal_urls(1) == set()
+            assert service.get_listing_hashes(1, ["a"]) is None
+
+    def test_resuming_returns_what_the_interrupted_scrape_saved(self, service):
+        cursor = Mock()
+        cursor.fetchall.return_value = [("a",), ("b",)]
+        service.conn = Mock(cursor=Mock(return_value=cursor))
+
+        assert service.resume_checkpoint(1, 9, "2026-10-19") == {"a", "b"}
+        assert cursor.execute.call_args.args[1] == (1, 9, 9, "2026-10-19")
+
+    def test_resuming_starts_over_on_a_query_error(self, service):
+        """Nothing resumed means a full crawl, which is always safe."""
+        service.conn = Mock()
+        service.conn.cursor.side_effect = RuntimeError("connection reset")
+
+        assert service.resume_checkpoint(1, 9, "2026-10-19") == set()
 
     def test_slug_lookup_short_circuits_on_an_empty_id_list(self, service):
         """Must not open a connection to resolve nothing."""
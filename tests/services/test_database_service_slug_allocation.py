@@ -0,0 +1,135 @@
+"""
+Test suite for ID-first slug allocation in DatabaseService.
+
+Animals get slugs with an ID suffix (name-breed-id format). The ID is drawn
+from the animals.id sequence before the INSERT, so the row is written with its
+final slug at once instead of a temporary slug rewritten by a second UPDATE.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from services.database_service import DatabaseService
+from tests.fixtures.sql_introspection import insert_column_value
+
+
+def mock_service(fetchall_side_effect, animal_id=1234):
+    db_service = DatabaseService({"host": "localhost", "user": "test", "database": "test_db"})
+    mock_conn = Mock()
+    mock_cursor = Mock()
+    mock_conn.cursor.return_value = mock_cursor
+    mock_cursor.fetchall.side_effect = fetchall_side_effect
+    mock_cursor.fetchone.return_value = (animal_id,)  # INSERT RETURNING id
+    db_service.conn = mock_conn
+    return db_service, mock_conn, mock_cursor
+
+
+@pytest.mark.database
+class TestDatabaseServiceSlugAllocation:
+    """Test ID-first slug allocation: reserve the ID, then INSERT with the final slug."""
+
+    def test_create_animal_generates_slug_with_id_suffix(self):
+        """Test that created animals get slugs with ID suffix in format name-breed-id."""
+        db_service, mock_conn, mock_cursor = mock_service(
+            [
+                [(1234,)],  # reserved ID
+                [],  # final slug uniqueness check: none taken
+            ]
+        )
+
+        animal_data = {
+            "name": "Bella",
+            "breed": "Labrador Mix",
+            "external_id": "test-123",
+            "organization_id": 1,
+            "animal_type": "dog",
+            "age_text": "2 years",
+            "sex": "Female",
+            "adoption_url": "http://example.com/adopt/test-123",
+            "primary_image_url": "http://example.com/image.jpg",
+            "status": "available",
+        }
+
+        animal_id, action = db_service.create_animal(animal_data)
+
+        assert animal_id == 1234
+        assert action == "added"
+
+        # 1. Reserve ID, 2. slug uniqueness check, 3. INSERT, 4. statistics counter increment
+        assert mock_cursor.execute.call_count == 4
+        assert "nextval" in mock_cursor.execute.call_args_list[0][0][0]
+
+        insert_call = mock_cursor.execute.call_args_list[2]
+        assert "INSERT INTO animals" in insert_call[0][0]
+        assert insert_column_value(insert_call, "id") == 1234
+        # standardized_breed keeps the cross ("Labrador Mix" -> "Labrador
+        # Retriever Cross"); primary_breed is the bare grouping key.
+        assert insert_column_value(insert_call, "slug") == "bella-labrador-retriever-cross-1234"
+
+        mock_conn.commit.assert_called_once()
+
+    def test_create_animal_handles_slug_collision(self):
+        """Test that final slug allocation handles collisions with one extra query."""
+        db_service, _, mock_cursor = mock_service(
+            [
+                [(1234,)],  # reserved ID
+                [("max-golden-retriever-1234",)],  # base slug is taken
+                [],  # no suffixed variants taken
+            ]
+        )
+
+        animal_data = {
+            "name": "Max",
+            "breed": "Golden Retriever",
+            "external_id": "test-456",
+            "organization_id": 1,
+        }
+
+        animal_id, action = db_service.create_animal(animal_data)
+
+        assert animal_id == 1234
+        assert action == "added"
+
+        # 1. reserve ID, 2. base slug check, 3. suffix lookup, 4. INSERT, 5. statistics counters
+        assert mock_cursor.execute.call_count == 5
+        insert_call = mock_cursor.execute.call_args_list[3]
+        assert insert_column_value(insert_call, "slug") == "max-golden-retriever-1234-1"
+
+    def test_create_animal_fails_cleanly_when_insert_fails(self):
+        """Test that a failed INSERT is rolled back and reported, with nothing half-written."""
+        db_service, mock_conn, mock_cursor = mock_service([[(1234,)], []])
+
+        def execute_side_effect(sql, params=None):
+            if "INSERT INTO animals" in sql:
+                raise Exception("INSERT failed")
+
+        mock_cursor.execute.side_effect = execute_side_effect
+
+        animal_id, action = db_service.create_animal({"name": "Buddy", "breed": "Beagle", "external_id": "test-789", "organization_id": 1})
+
+        assert (animal_id, action) == (None, "error")
+        mock_conn.commit.assert_not_called()
+        mock_conn.rollback.assert_called_once()
+
+    @patch("services.animal_data_preparation.generate_animal_slug")
+    def test_create_animal_slug_generation_parameters(self, mock_slug_generator):
+        """Test that the slug is generated once, with the reserved ID."""
+        db_service, _, mock_cursor = mock_service([[(1234,)], []])
+        mock_slug_generator.return_value = "final-slug-with-id-1234"
+
+        animal_data = {
+            "name": "Rover",
+            "breed": "Mixed Breed",
+            "external_id": "test-999",
+            "organization_id": 1,
+        }
+
+        db_service.create_animal(animal_data)
+
+        mock_slug_generator.assert_called_once()
+        final_call = mock_slug_generator.call_args
+        assert final_call[1]["animal_id"] == 1234
+        assert final_call[1]["name"] == "Rover"
+        assert final_call[1]["breed"] == "Mixed Breed"
+        assert insert_column_value(mock_cursor.execute.call_args_list[2], "slug") == "final-slug-with-id-1234"
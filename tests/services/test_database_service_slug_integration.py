@@ -15,14 +15,22 @@ from tests.fixtures.sql_introspection import insert_column_value
 class TestDatabaseServiceSlugIntegration:
     """Test slug generation integration in DatabaseService."""
 
-    def test_create_animal_generates_slug_with_name_only(self):
-        """Test that create_animal generates slug with just name (two-phase)."""
+    def _mock_connection(self, animal_id=123):
+        """Connection whose cursor reserves animal_id and finds no slug taken."""
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        # Mock for INSERT returning ID (only fetchone that matters since slug generation is mocked)
-        mock_cursor.fetchone.return_value = (123,)
+        mock_cursor.fetchall.side_effect = [[(animal_id,)], []]
+        mock_cursor.fetchone.return_value = (animal_id,)
         mock_conn.cursor.return_value = mock_cursor
+        return mock_conn, mock_cursor
+
+    def _inserted_slug(self, mock_cursor):
+        insert_call = next(c for c in mock_cursor.execute.call_args_list if "INSERT INTO animals" in c[0][0])
+        return insert_column_value(insert_call, "slug")
 
+    def test_create_animal_generates_slug_with_name_only(self):
+        """Test that create_animal inserts the final name-id slug directly."""
+        mock_conn, mock_cursor = self._mock_connection()
         db_service = DatabaseService({"host": "test", "user": "test", "database": "test"})
 
         animal_data = {
@@ -31,56 +39,20 @@ class TestDatabaseServiceSlugIntegration:
             "external_id": "test-123",
         }
 
-        # Mock standardize_breed to return known defaults
+        # Mock standardize_breed to return no usable breed
         with patch("services.animal_data_preparation.standardize_breed") as mock_standardize:
-            mock_standardize.return_value = ("Unknown", "Unknown", None)
-
-            with patch("services.animal_data_preparation.generate_unique_animal_slug") as mock_slug_gen:
-                # Return different values for temp vs final slug
-                mock_slug_gen.side_effect = ["fluffy", "fluffy-123"]
-
-                animal_id, action = db_service._create_animal_with_connection(mock_conn, animal_data)
-
-                # Verify two-phase slug generation: temp slug (no ID) then final slug (with ID)
-                assert mock_slug_gen.call_count == 2
-
-                # First call - temp slug generation
-                temp_call = mock_slug_gen.call_args_list[0]
-                assert temp_call[1]["name"] == "Fluffy"
-                assert temp_call[1]["breed"] is None
-                assert temp_call[1]["standardized_breed"] == "Unknown"
-                assert temp_call[1]["animal_id"] is None
-                assert temp_call[1]["connection"] == mock_conn
-
-                # Second call - final slug generation
-                final_call = mock_slug_gen.call_args_list[1]
-                assert final_call[1]["name"] == "Fluffy"
-                assert final_call[1]["breed"] is None
-                assert final_call[1]["standardized_breed"] == "Unknown"
-                assert final_call[1]["animal_id"] == 123
-                assert final_call[1]["connection"] == mock_conn
-
-                # Verify INSERT was called with temp slug and UPDATE with final slug
-                assert mock_cursor.execute.call_count == 2  # INSERT + UPDATE (slug gen is mocked)
-
-                # Check INSERT uses temp slug
-                insert_call = mock_cursor.execute.call_args_list[0]
-                assert insert_column_value(insert_call, "slug") == "fluffy-temp"
-
-                # Check UPDATE uses final slug
-                update_call = mock_cursor.execute.call_args_list[1]
-                update_values = update_call[0][1]
-                assert "fluffy-123" == update_values[0]  # final slug
-                assert 123 == update_values[1]  # animal_id
+            mock_standardize.return_value = ("", "Unknown", None)
 
-    def test_create_animal_generates_slug_with_breed(self):
-        """Test slug generation with breed information (two-phase)."""
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        # Mock for INSERT returning ID (only fetchone that matters since slug generation is mocked)
-        mock_cursor.fetchone.return_value = (123,)
-        mock_conn.cursor.return_value = mock_cursor
+            animal_id, action = db_service._create_animal_with_connection(mock_conn, animal_data)
 
+        assert (animal_id, action) == (123, "added")
+        assert self._inserted_slug(mock_cursor) == "fluffy-123"
+        # No temporary slug is rewritten after the INSERT
+        assert not any("UPDATE animals SET slug" in c[0][0] for c in mock_cursor.execute.call_args_list)
+
+    def test_create_animal_generates_slug_with_breed(self):
+        """Test slug generation with breed information."""
+        mock_conn, mock_cursor = self._mock_connection()
         db_service = DatabaseService({"host": "test", "user": "test", "database": "test"})
 
         animal_data = {
@@ -94,41 +66,13 @@ class TestDatabaseServiceSlugIntegration:
         with patch("services.animal_data_preparation.standardize_breed") as mock_standardize:
             mock_standardize.return_value = ("German Shepherd Dog", "Herding", "Large")
 
-            with patch("services.animal_data_preparation.generate_unique_animal_slug") as mock_slug_gen:
-                mock_slug_gen.side_effect = [
-                    "max-german-shepherd-dog",
-                    "max-german-shepherd-dog-123",
-                ]
-
-                animal_id, action = db_service._create_animal_with_connection(mock_conn, animal_data)
-
-                # Verify two-phase slug generation
-                assert mock_slug_gen.call_count == 2
-
-                # First call - temp slug generation
-                temp_call = mock_slug_gen.call_args_list[0]
-                assert temp_call[1]["name"] == "Max"
-                assert temp_call[1]["breed"] == "German Shepherd"
-                assert temp_call[1]["standardized_breed"] == "German Shepherd Dog"
-                assert temp_call[1]["animal_id"] is None
-                assert temp_call[1]["connection"] == mock_conn
-
-                # Second call - final slug generation
-                final_call = mock_slug_gen.call_args_list[1]
-                assert final_call[1]["name"] == "Max"
-                assert final_call[1]["breed"] == "German Shepherd"
-                assert final_call[1]["standardized_breed"] == "German Shepherd Dog"
-                assert final_call[1]["animal_id"] == 123
-                assert final_call[1]["connection"] == mock_conn
+            db_service._create_animal_with_connection(mock_conn, animal_data)
 
-    def test_create_animal_uses_standardized_breed_for_slug(self):
-        """Test that standardized breed is preferred over original breed for slug (two-phase)."""
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        # Mock for INSERT returning ID (only fetchone that matters since slug generation is mocked)
-        mock_cursor.fetchone.return_value = (123,)
-        mock_conn.cursor.return_value = mock_cursor
+        assert self._inserted_slug(mock_cursor) == "max-german-shepherd-dog-123"
 
+    def test_create_animal_uses_standardized_breed_for_slug(self):
+        """Test that standardized breed is preferred over original breed for slug."""
+        mock_conn, mock_cursor = self._mock_connection()
         db_service = DatabaseService({"host": "test", "user": "test", "database": "test"})
 
         # Mock standardize_breed to return standardized info
@@ -142,35 +86,14 @@ class TestDatabaseServiceSlugIntegration:
                 "external_id": "test-789",
             }
 
-            with patch("services.animal_data_preparation.generate_unique_animal_slug") as mock_slug_gen:
-                mock_slug_gen.side_effect = [
-                    "bella-labrador-retriever",
-                    "bella-labrador-retriever-123",
-                ]
+            db_service._create_animal_with_connection(mock_conn, animal_data)
 
-                animal_id, action = db_service._create_animal_with_connection(mock_conn, animal_data)
-
-                # Verify two-phase slug generation uses standardized breed
-                assert mock_slug_gen.call_count == 2
-
-                # Both calls should use standardized breed
-                for call_args in mock_slug_gen.call_args_list:
-                    assert call_args[1]["name"] == "Bella"
-                    assert call_args[1]["breed"] == "Lab Mix"
-                    assert call_args[1]["standardized_breed"] == "Labrador Retriever"
-                    assert call_args[1]["connection"] == mock_conn
-
-                # First call should have no animal_id, second should have ID
-                assert mock_slug_gen.call_args_list[0][1]["animal_id"] is None
-                assert mock_slug_gen.call_args_list[1][1]["animal_id"] == 123
-
-    def test_create_animal_handles_slug_generation_failure(self):
-        """Test graceful handling when temp slug generation fails."""
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_cursor.fetchone.return_value = [123]
-        mock_conn.cursor.return_value = mock_cursor
+        assert self._inserted_slug(mock_cursor) == "bella-labrador-retriever-123"
 
+    def test_create_animal_handles_slug_uniqueness_check_failure(self):
+        """Test that a failed uniqueness check still inserts the name-breed-id slug."""
+        mock_conn, mock_cursor = self._mock_connection()
+        mock_cursor.fetchall.side_effect = [[(123,)], Exception("Database connection failed")]
         db_service = DatabaseService({"host": "test", "user": "test", "database": "test"})
 
         animal_data = {
@@ -179,34 +102,19 @@ class TestDatabaseServiceSlugIntegration:
             "external_id": "test-999",
         }
 
-        with patch("services.animal_data_preparation.generate_unique_animal_slug") as mock_slug_gen:
-            # Simulate temp and final slug generation failure
-            mock_slug_gen.side_effect = Exception("Database connection failed")
+        with patch("services.animal_data_preparation.standardize_breed") as mock_standardize:
+            mock_standardize.return_value = ("", "Unknown", None)
 
-            # Should use fallback slug and still create animal
             animal_id, action = db_service._create_animal_with_connection(mock_conn, animal_data)
 
-            # Verify animal was created with fallback slug
-            assert animal_id == 123
-            assert action == "added"
-
-            # Verify slug generation was attempted for temp slug (failed) and there should be an UPDATE attempt
-            assert mock_slug_gen.call_count >= 1
-
-            # Verify INSERT was called with fallback slug pattern
-            insert_call = mock_cursor.execute.call_args_list[0]
-            fallback_slug = insert_column_value(insert_call, "slug")
-            assert "animal-test-999-temp" == fallback_slug
+        assert (animal_id, action) == (123, "added")
+        assert self._inserted_slug(mock_cursor) == "charlie-123"
 
     def test_create_animal_with_connection_pool(self):
-        """Test slug generation works with connection pool (two-phase)."""
+        """Test slug generation works with connection pool."""
         # Create a mock connection pool
         mock_pool = MagicMock()
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        # Mock for INSERT returning ID (only fetchone that matters since slug generation is mocked)
-        mock_cursor.fetchone.return_value = (123,)
-        mock_conn.cursor.return_value = mock_cursor
+        mock_conn, mock_cursor = self._mock_connection()
         mock_pool.get_connection_context.return_value.__enter__.return_value = mock_conn
         mock_pool.get_connection_context.return_value.__exit__.return_value = None
 
@@ -226,29 +134,12 @@ class TestDatabaseServiceSlugIntegration:
         with patch("services.animal_data_preparation.standardize_breed") as mock_standardize:
             mock_standardize.return_value = ("Golden Retriever", "Sporting", "Large")
 
-            with patch("services.animal_data_preparation.generate_unique_animal_slug") as mock_slug_gen:
-                mock_slug_gen.side_effect = [
-                    "luna-golden-retriever",
-                    "luna-golden-retriever-123",
-                ]
-
-                animal_id, action = db_service.create_animal(animal_data)
-
-                # Verify connection pool was used
-                mock_pool.get_connection_context.assert_called_once()
+            animal_id, action = db_service.create_animal(animal_data)
 
-                # Verify two-phase slug generation with pool connection
-                assert mock_slug_gen.call_count == 2
-                # Both calls should use pool connection
-                for call_args in mock_slug_gen.call_args_list:
-                    assert call_args[1]["name"] == "Luna"
-                    assert call_args[1]["breed"] == "Golden Retriever"
-                    assert call_args[1]["standardized_breed"] == "Golden Retriever"
-                    assert call_args[1]["connection"] == mock_conn
-
-                # First call should have no animal_id, second should have ID
-                assert mock_slug_gen.call_args_list[0][1]["animal_id"] is None
-                assert mock_slug_gen.call_args_list[1][1]["animal_id"] == 123
+        # Verify connection pool was used
+        mock_pool.get_connection_context.assert_called_once()
+        assert (animal_id, action) == (123, "added")
+        assert self._inserted_slug(mock_cursor) == "luna-golden-retriever-123"
 
     def test_update_animal_preserves_existing_slug(self):
         """Test that update_animal does not modify existing slug."""
@@ -293,22 +184,22 @@ class TestDatabaseServiceSlugIntegration:
             "external_id": "test-update-123",
         }
 
-        # Mock standardize_breed for update (update_animal imports from database_service)
-        with patch("services.database_service.standardize_breed") as mock_standardize:
+        # Mock standardize_breed for update (prepare_animal_update imports it)
+        with patch("services.animal_data_preparation.standardize_breed") as mock_standardize:
             mock_standardize.return_value = (
                 "New Standardized Breed",
                 "Working",
                 "Large",
             )
 
-            with patch("services.database_service.parse_age_text") as mock_parse_age:
+            with patch("services.animal_data_preparation.parse_age_text") as mock_parse_age:
                 # parse_age_text returns (age_category, min_months, max_months)
                 mock_parse_age.return_value = ("Young", 12, 24)
 
                 animal_id, action = db_service.update_animal(123, animal_data)
 
                 # Verify UPDATE query was called
-                update_calls = [call for call in mock_cursor.execute.call_args_list if call[0][0].strip().upper().startswith("UPDATE")]
+                update_calls = [call for call in mock_cursor.execute.call_args_list if "UPDATE animals" in call[0][0]]
 
                 assert len(update_calls) > 0
                 update_sql = update_calls[0][0][0]
@@ -321,13 +212,8 @@ class TestDatabaseServiceSlugIntegration:
                 assert len(slug_updates) == 0, "Main slug field should not be updated"
 
     def test_create_animal_slug_with_empty_name_fallback(self):
-        """Test slug generation with empty name uses fallback (two-phase)."""
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        # Mock for INSERT returning ID (only fetchone that matters since slug generation is mocked)
-        mock_cursor.fetchone.return_value = (123,)
-        mock_conn.cursor.return_value = mock_cursor
-
+        """Test slug generation with empty name uses fallback."""
+        mock_conn, mock_cursor = self._mock_connection()
         db_service = DatabaseService({"host": "test", "user": "test", "database": "test"})
 
         animal_data = {
@@ -341,24 +227,20 @@ class TestDatabaseServiceSlugIntegration:
         with patch("services.animal_data_preparation.standardize_breed") as mock_standardize:
             mock_standardize.return_value = ("Mixed Breed", "Unknown", None)
 
-            with patch("services.animal_data_preparation.generate_unique_animal_slug") as mock_slug_gen:
-                mock_slug_gen.side_effect = [
-                    "animal-mixed-breed",
-                    "animal-mixed-breed-123",
-                ]
+            db_service._create_animal_with_connection(mock_conn, animal_data)
+
+        assert self._inserted_slug(mock_cursor) == "animal-mixed-breed-123"
 
-                animal_id, action = db_service._create_animal_with_connection(mock_conn, animal_data)
+    def test_create_animal_slug_collision_gets_suffix(self):
+        """Test that a taken name-breed-id slug gets the next free suffix."""
+        mock_conn, mock_cursor = self._mock_connection()
+        # Reserved ID, the taken base slug, then its taken suffixed variants
+        mock_cursor.fetchall.side_effect = [[(123,)], [("max-beagle-123",)], [("max-beagle-123-1",)]]
+        db_service = DatabaseService({"host": "test", "user": "test", "database": "test"})
 
-                # Verify two-phase slug generation with empty name
-                assert mock_slug_gen.call_count == 2
+        with patch("services.animal_data_preparation.standardize_breed") as mock_standardize:
+            mock_standardize.return_value = ("Beagle", "Hound", "Medium")
 
-                # Both calls should have empty name and use fallback
-                for call_args in mock_slug_gen.call_args_list:
-                    assert call_args[1]["name"] == ""
-                    assert call_args[1]["breed"] == "Mixed Breed"
-                    assert call_args[1]["standardized_breed"] == "Mixed Breed"
-                    assert call_args[1]["connection"] == mock_conn
+            db_service._create_animal_with_connection(mock_conn, {"name": "Max", "breed": "Beagle", "organization_id": 1, "external_id": "test-max"})
 
-                # First call should have no animal_id, second should have ID
-                assert mock_slug_gen.call_args_list[0][1]["animal_id"] is None
-                assert mock_slug_gen.call_args_list[1][1]["animal_id"] == 123
+        assert self._inserted_slug(mock_cursor) == "max-beagle-123-2"
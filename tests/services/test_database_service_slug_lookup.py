@@ -66,7 +66,7 @@ class TestGetSlugsForAnimals:
         cursor.execute.assert_not_called()
 
     def test_drops_null_slugs(self, service_with_cursor):
-        """An animal mid-way through two-phase slug assignment has no slug yet."""
+        """An animal stored without a slug is skipped."""
         service, cursor = service_with_cursor
         cursor.fetchall.return_value = [("rex-terrier-101",), (None,)]
 
@@ -0,0 +1,157 @@
+"""Cross-organization duplicates by perceptual image hash.
+
+A cross-posted photo is usually re-encoded or resized, so the hash has to
+survive that while telling different dogs apart; the BK-tree has to find
+exactly what a scan of every hash would; and a likely duplicate has to skip
+its upload and LLM profiling and be recorded as a duplicate instead.
+"""
+
+import random
+from io import BytesIO
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from PIL import Image
+
+from api.models.requests import AnimalFilterCountRequest, AnimalFilterRequest
+from api.services.animal_service import DUPLICATE_LISTED_CONDITION, AnimalService
+from scrapers.base_scraper import BaseScraper
+from services.database_service import DatabaseService
+from services.image_hash_index import DUPLICATE_MAX_DISTANCE, HashedAnimal, ImageHashIndex, dhash, from_bigint, hamming_distance, to_bigint
+from services.image_processing_service import ImageProcessingService
+
+
+def photo(seed: int, size=(320, 240), fmt="JPEG", quality=90) -> bytes:
+    """A blocky random "photo" with enough structure to hash."""
+    rng = random.Random(seed)
+    small = Image.new("RGB", (16, 12))
+    small.putdata([(rng.randrange(256), rng.randrange(256), rng.randrange(256)) for _ in range(16 * 12)])
+    buffer = BytesIO()
+    small.resize(size, Image.Resampling.BILINEAR).save(buffer, fmt, quality=quality)
+    return buffer.getvalue()
+
+
+def hashed(animal_id, image_hash, name="Luna", organization_id=2):
+    return HashedAnimal(animal_id, organization_id, name, image_hash, f"https://images.rescuedogs.me/org/{animal_id}.jpg")
+
+
+@pytest.mark.unit
+class TestDHash:
+    def test_a_resized_reencoded_copy_hashes_alike(self):
+        original = dhash(photo(1))
+        copy = dhash(photo(1, size=(800, 600), fmt="PNG"))
+        recompressed = dhash(photo(1, quality=40))
+
+        assert hamming_distance(original, copy) <= DUPLICATE_MAX_DISTANCE
+        assert hamming_distance(original, recompressed) <= DUPLICATE_MAX_DISTANCE
+
+    def test_different_photos_do_not(self):
+        assert hamming_distance(dhash(photo(1)), dhash(photo(2))) > DUPLICATE_MAX_DISTANCE
+
+    def test_blank_and_undecodable_images_have_no_hash(self):
+        buffer = BytesIO()
+        Image.new("RGB", (64, 64), "white").save(buffer, "PNG")
+
+        assert dhash(buffer.getvalue()) is None
+        assert dhash(b"<html>not found</html>") is None
+
+    def test_hashes_round_trip_through_bigint(self):
+        for value in (1, (1 << 63) - 1, 1 << 63, (1 << 64) - 1):
+            assert -(1 << 63) <= to_bigint(value) < 1 << 63
+            assert from_bigint(to_bigint(value)) == value
+
+
+@pytest.mark.unit
+class TestImageHashIndex:
+    def test_search_finds_what_a_full_scan_finds(self):
+        rng = random.Random(7)
+        entries = [hashed(i, rng.getrandbits(64)) for i in range(500)]
+        # Near copies of a few entries, so there is something to find
+        entries += [hashed(1000 + i, entries[i].image_hash ^ (1 << rng.randrange(64))) for i in range(20)]
+        index = ImageHashIndex(entries)
+
+        for query in [entry.image_hash for entry in entries[:20]] + [rng.getrandbits(64) for _ in range(20)]:
+            expected = sorted((hamming_distance(query, e.image_hash), e.animal_id) for e in entries if hamming_distance(query, e.image_hash) <= DUPLICATE_MAX_DISTANCE)
+            assert [(distance, entry.animal_id) for distance, entry in index.search(query)] == expected
+        assert len(index) == len(entries)
+
+    def test_a_duplicate_needs_the_same_name(self):
+        index = ImageHashIndex([hashed(1, 0b1011, name="Coming Soon Dog"), hashed(2, 0b1111, name="Luna")])
+
+        assert index.find_duplicate(0b1011, "  luna ").animal_id == 2
+        assert index.find_duplicate(0b1011, "Rex") is None
+        assert index.find_duplicate(0b1011, None) is None
+
+
+@pytest.mark.unit
+class TestBatchProcessing:
+    @pytest.fixture
+    def connection(self):
+        conn = Mock()
+        cursor = Mock()
+        # No existing R2 mappings; then the other organizations' hashed dogs
+        cursor.fetchall.side_effect = [[], [(42, 2, "Luna", to_bigint(0xF0F0), "https://images.rescuedogs.me/other/luna.jpg")]]
+        conn.cursor.return_value = cursor
+        return conn
+
+    @pytest.fixture
+    def r2_service(self):
+        r2 = Mock()
+        r2.batch_upload_images_with_stats.return_value = ([("https://images.rescuedogs.me/org/rex.jpg", True)], {"successful": 1, "total": 1, "success_rate": 100.0, "total_time": 0.1})
+        return r2
+
+    def test_a_likely_duplicate_reuses_the_existing_image_instead_of_uploading(self, connection, r2_service):
+        animals = [
+            {"name": "Luna", "primary_image_url": "https://rescue.example/luna.jpg"},
+            {"name": "Rex", "primary_image_url": "https://rescue.example/rex.jpg"},
+        ]
+        hashes = {"https://rescue.example/luna.jpg": 0xF0F1, "https://rescue.example/rex.jpg": 0x0F0F}
+
+        with patch("services.image_processing_service.fetch_image_hash", side_effect=hashes.get), patch("services.image_processing_service.execute_values") as store:
+            result = ImageProcessingService(r2_service=r2_service).batch_process_images(animals, "org", use_concurrent=False, database_connection=connection, organization_id=1)
+
+        assert result[0]["primary_image_url"] == "https://images.rescuedogs.me/other/luna.jpg"
+        assert result[0]["duplicate_of_id"] == 42
+        assert "duplicate_of_id" not in result[1]
+        assert [image[0] for image in r2_service.batch_upload_images_with_stats.call_args.args[0]] == ["https://rescue.example/rex.jpg"]
+        # Both hashes are stored for other organizations to match against
+        assert {url for url, _ in store.call_args.args[2]} == set(hashes)
+
+    def test_without_an_organization_nothing_is_hashed(self, connection, r2_service):
+        with patch("services.image_processing_service.fetch_image_hash") as fetch:
+            ImageProcessingService(r2_service=r2_service).batch_process_images([{"name": "Rex", "primary_image_url": "https://rescue.example/rex.jpg"}], "org", database_connection=connection)
+
+        fetch.assert_not_called()
+
+
+class _StubScraper(BaseScraper):
+    def collect_data(self):
+        return []
+
+
+@pytest.mark.unit
+def test_a_saved_duplicate_is_recorded_and_not_profiled():
+    database_service = Mock(spec=DatabaseService)
+    database_service.get_existing_animals.return_value = {}
+    database_service.upsert_animals.return_value = [(7, "added"), (8, "added")]
+    scraper = _StubScraper(organization_id=1, database_service=database_service)
+    animals = [
+        {"name": "Luna", "external_id": "luna", "primary_image_url": "https://images.rescuedogs.me/other/luna.jpg", "original_image_url": "https://rescue.example/luna.jpg", "duplicate_of_id": 42},
+        {"name": "Rex", "external_id": "rex"},
+    ]
+
+    with patch.object(scraper, "process_animal", side_effect=lambda animal: animal):
+        scraper.save_animals(animals)
+
+    database_service.record_duplicates.assert_called_once_with({7: 42})
+    assert [item["id"] for item in scraper.animals_for_llm_enrichment] == [8]
+
+
+@pytest.mark.unit
+class TestHideDuplicates:
+    def test_listings_can_hide_duplicates_of_listed_dogs(self):
+        service = AnimalService(MagicMock())
+
+        assert DUPLICATE_LISTED_CONDITION in service._build_animals_query(AnimalFilterRequest(hide_duplicates=True, status="all"))[0]
+        assert DUPLICATE_LISTED_CONDITION not in service._build_animals_query(AnimalFilterRequest(status="all"))[0]
+        assert DUPLICATE_LISTED_CONDITION in service._build_count_base_conditions(AnimalFilterCountRequest(hide_duplicates=True))[0]
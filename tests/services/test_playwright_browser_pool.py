@@ -0,0 +1,228 @@
+"""Tests for the pooled browser behind PlaywrightBrowserService.run().
+
+Coroutines submitted through run() share one browser loop, so get_browser()
+leases pages from a pool instead of launching a browser per call. The fakes
+below stand in for Playwright's browser, context and page objects. The light
+render profile and settle() are covered at the end.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services.playwright_browser_service import (
+    PlaywrightBrowserService,
+    PlaywrightOptions,
+    RenderStats,
+    is_tracker_url,
+    settle,
+)
+
+
+def fake_playwright():
+    """A Playwright stand-in whose launch() returns a browser handing out fresh contexts."""
+
+    def new_context(**kwargs):
+        page = MagicMock()
+        page.is_closed.return_value = False
+        page.goto = AsyncMock()
+        page.set_viewport_size = AsyncMock()
+        page.close = AsyncMock()
+        context = MagicMock()
+        context.new_page = AsyncMock(return_value=page)
+        context.route = AsyncMock()
+        context.close = AsyncMock()
+        return context
+
+    browser = MagicMock()
+    browser.is_connected.return_value = True
+    browser.new_context = AsyncMock(side_effect=new_context)
+    browser.close = AsyncMock()
+    playwright = MagicMock()
+    playwright.chromium.launch = AsyncMock(return_value=browser)
+    return playwright, browser
+
+
+@pytest.fixture
+def pooled_service(monkeypatch):
+    monkeypatch.delenv("BROWSERLESS_WS_ENDPOINT", raising=False)
+    monkeypatch.setenv("PLAYWRIGHT_MAX_PAGES", "2")
+    service = PlaywrightBrowserService()
+    playwright, browser = fake_playwright()
+    with patch.object(service, "_get_or_start_playwright", AsyncMock(return_value=playwright)):
+        yield service, playwright, browser
+    service.close()
+
+
+async def page_of(service, options=None):
+    async with service.get_browser(options) as result:
+        return result.page
+
+
+@pytest.mark.unit
+class TestBrowserPool:
+    def test_sequential_calls_reuse_one_browser_and_page(self, pooled_service):
+        service, playwright, _ = pooled_service
+
+        first = service.run(page_of(service))
+        second = service.run(page_of(service))
+
+        assert first is second
+        playwright.chromium.launch.assert_awaited_once()
+        first.goto.assert_awaited_with("about:blank")
+
+    def test_contexts_are_not_shared_across_incompatible_options(self, pooled_service):
+        service, playwright, browser = pooled_service
+
+        plain = service.run(page_of(service))
+        stealthy = service.run(page_of(service, PlaywrightOptions(stealth_mode=True)))
+
+        assert plain is not stealthy
+        assert browser.new_context.await_count == 2
+        playwright.chromium.launch.assert_awaited_once()
+
+    def test_open_pages_are_capped_across_callers(self, pooled_service):
+        service, _, _ = pooled_service
+        open_pages = []
+        most_open = 0
+
+        async def hold_page():
+            nonlocal most_open
+            async with service.get_browser():
+                open_pages.append(1)
+                most_open = max(most_open, len(open_pages))
+                loop = asyncio.get_running_loop()
+                held = loop.create_future()
+                loop.call_later(0.01, held.set_result, None)
+                await held
+                open_pages.pop()
+
+        async def five_at_once():
+            await asyncio.gather(*(hold_page() for _ in range(5)))
+
+        service.run(five_at_once())
+
+        assert most_open == 2
+
+    def test_a_failed_lease_is_closed_not_reused(self, pooled_service):
+        service, _, browser = pooled_service
+
+        async def fail():
+            async with service.get_browser() as result:
+                failed.append(result)
+                raise RuntimeError("navigation failed")
+
+        failed = []
+        with pytest.raises(RuntimeError):
+            service.run(fail())
+        replacement = service.run(page_of(service))
+
+        assert replacement is not failed[0].page
+        failed[0].context.close.assert_awaited_once()
+        browser.close.assert_not_awaited()
+
+    def test_close_shuts_the_pool_down(self, pooled_service):
+        service, _, browser = pooled_service
+        page = service.run(page_of(service))
+
+        service.close()
+
+        page.close.assert_awaited()
+        browser.close.assert_awaited_once()
+        assert service.health_check()["pooled_browsers"] == 0
+
+
+@pytest.mark.unit
+class TestResourceBlocking:
+    def test_disable_images_blocks_the_image_type(self):
+        options = PlaywrightOptions(disable_images=True, blocked_resource_types=("font",))
+
+        assert options.resource_types_to_block() == frozenset({"image", "font"})
+
+    def test_tracker_hosts_match_subdomains_only(self):
+        assert is_tracker_url("https://www.google-analytics.com/collect?v=1")
+        assert is_tracker_url("https://connect.facebook.net/en_US/fbevents.js")
+        assert not is_tracker_url("https://rescue.example/dogs/analytics")
+        assert not is_tracker_url("https://notdoubleclick.net/")
+
+    def test_light_profile_blocks_heavy_types_and_trackers(self):
+        options = PlaywrightOptions(render_profile="light")
+
+        assert options.resource_types_to_block() == frozenset({"image", "media", "font"})
+        assert options.blocks_trackers()
+        assert PlaywrightOptions().resource_types_to_block() == frozenset()
+
+    def test_blocked_requests_are_aborted_and_counted(self):
+        service = PlaywrightBrowserService()
+        context = MagicMock()
+        context.route = AsyncMock()
+        stats = RenderStats()
+
+        def route_for(resource_type, url):
+            route = MagicMock()
+            route.request.resource_type = resource_type
+            route.request.url = url
+            route.abort = AsyncMock()
+            route.continue_ = AsyncMock()
+            return route
+
+        async def route_three():
+            await service._apply_resource_blocking(context, PlaywrightOptions(render_profile="light"), stats)
+            handle = context.route.await_args[0][1]
+            routes = [
+                route_for("image", "https://img.rescue.example/dog.jpg"),
+                route_for("script", "https://www.googletagmanager.com/gtm.js"),
+                route_for("document", "https://rescue.example/dogs"),
+            ]
+            for route in routes:
+                await handle(route)
+            return routes
+
+        image, tracker, document = asyncio.run(route_three())
+
+        image.abort.assert_awaited_once()
+        tracker.abort.assert_awaited_once()
+        document.continue_.assert_awaited_once()
+        assert stats.blocked_by_type == {"image": 1, "script": 1}
+        assert stats.estimated_bytes_saved == 150_000 + 30_000
+
+
+@pytest.mark.unit
+class TestSettle:
+    def test_returns_once_no_new_resources_are_requested(self):
+        page = MagicMock()
+        page.evaluate = AsyncMock(side_effect=[12, 15, 15])
+        stats = RenderStats()
+
+        asyncio.run(settle(page, budget=2, stats=stats))
+
+        assert page.evaluate.await_count == 3
+        assert 0 < stats.wait_seconds_saved <= 2
+
+    def test_waits_for_the_selector_first(self):
+        page = MagicMock()
+        page.wait_for_selector = AsyncMock()
+        page.evaluate = AsyncMock(return_value=3)
+
+        asyncio.run(settle(page, budget=5, selector="a.dog"))
+
+        page.wait_for_selector.assert_awaited_once_with("a.dog", timeout=5000)
+
+    def test_a_page_that_errors_does_not_raise(self):
+        page = MagicMock()
+        page.evaluate = AsyncMock(side_effect=RuntimeError("Target closed"))
+
+        assert asyncio.run(settle(page, budget=1)) < 1
+
+    def test_stats_merge_across_leases(self):
+        total = RenderStats()
+        lease = RenderStats(blocked_by_type={"font": 2}, bytes_loaded=5_000)
+        lease.record_wait(2, 0.5)
+
+        total.merge(lease)
+        total.merge(lease)
+
+        assert total.blocked_by_type == {"font": 4}
+        assert total.bytes_loaded == 10_000
+        assert total.wait_seconds_saved == 3.0
@@ -0,0 +1,48 @@
+"""Concurrent scrapes share one bounded set of database connections.
+
+Loading a scraper must neither replace the process's global pool while other
+scrapes are using it nor open a pool of its own, so the connections a batch
+holds depend on its concurrency, not on how many organizations it scrapes.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import services.connection_pool as connection_pool
+import utils.db_connection as db_connection
+from services.connection_pool import CONNECTIONS_PER_SCRAPE, ConnectionPoolService, get_scrape_connection_pool
+from utils.db_connection import DatabaseConfig, ensure_database_pool, initialize_database_pool
+
+DB_CONFIG = {"host": "localhost", "user": "test", "database": "test_db"}
+
+
+@pytest.fixture
+def no_pools(monkeypatch):
+    monkeypatch.setattr(connection_pool, "_scrape_pool", None)
+    monkeypatch.setattr(db_connection, "_connection_pool", None)
+    with patch.object(ConnectionPoolService, "_create_pool", return_value=MagicMock()):
+        yield
+
+
+@pytest.mark.unit
+class TestScrapeConnectionPool:
+    def test_every_scrape_gets_the_same_pool_sized_for_the_batch(self, no_pools):
+        first = get_scrape_connection_pool(DB_CONFIG, max_concurrency=4)
+
+        assert get_scrape_connection_pool(DB_CONFIG, max_concurrency=4) is first
+        assert first.pool_config.max_connections == 4 * CONNECTIONS_PER_SCRAPE
+
+    def test_the_global_pool_is_initialized_once(self, no_pools):
+        config = DatabaseConfig(host="localhost", user="test", database="test_db")
+        pool = ensure_database_pool(config)
+
+        assert ensure_database_pool(config) is pool
+
+    def test_reinitializing_the_global_pool_closes_the_old_one(self, no_pools):
+        config = DatabaseConfig(host="localhost", user="test", database="test_db")
+        old = ensure_database_pool(config)
+
+        with patch.object(old, "close_all_connections") as close:
+            assert initialize_database_pool(config) is not old
+        close.assert_called_once()
@@ -14,6 +14,13 @@ import pytest
 from services.session_manager import SessionManager
 
 
+def update_call(mock_cursor):
+    """The single UPDATE issued, between the statistics counter writes around it."""
+    updates = [call for call in mock_cursor.execute.call_args_list if "UPDATE animals" in call[0][0]]
+    assert len(updates) == 1
+    return updates[0]
+
+
 @pytest.fixture
 def db_config():
     """Minimal DB config for testing."""
@@ -127,15 +134,15 @@ class TestMarkSkippedAnimalsAsSeen:
         result = session_manager.mark_skipped_animals_as_seen()
 
         # Verify SQL was executed with external_id filter
-        mock_cursor.execute.assert_called_once()
-        call_args = mock_cursor.execute.call_args
+        call_args = update_call(mock_cursor)
         sql = call_args[0][0]
         params = call_args[0][1]
 
         # SQL should include external_id = ANY(%s) clause
         assert "external_id = ANY" in sql
         assert "WHERE organization_id" in sql
-        assert "AND status = 'available'" in sql
+        # Adopted and reserved dogs keep their status
+        assert "AND status IN ('available', 'unknown')" in sql
 
         # Parameters should include the list of found external_ids
         assert params[0] == session_manager.current_scrape_session
@@ -144,6 +151,63 @@ class TestMarkSkippedAnimalsAsSeen:
 
         assert result == 3
 
+    @patch("services.session_manager.psycopg2")
+    def test_marks_unchanged_animals_seen_without_skip_existing(self, mock_psycopg2, db_config):
+        """Dogs whose detail page was unchanged are marked seen even when skipping is off."""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.rowcount = 1
+        mock_conn.cursor.return_value = mock_cursor
+        mock_psycopg2.connect.return_value = mock_conn
+        session_manager = SessionManager(db_config=db_config, organization_id=1, skip_existing_animals=False)
+        session_manager.start_scrape_session()
+        session_manager.record_found_animal("dog-123")
+        session_manager.record_unchanged_animal("dog-456")
+
+        result = session_manager.mark_skipped_animals_as_seen()
+
+        sql, params = update_call(mock_cursor)[0]
+        assert set(params[2]) == {"dog-456"}
+        # An unchanged dog is never re-saved, so one stale detection hid is restored here
+        assert "SET status = 'available'" in sql
+        assert "active = true" in sql
+        assert session_manager.found_external_ids == {"dog-123", "dog-456"}
+        assert result == 1
+
+
+class TestMarkAnimalsAsSeen:
+    """Tests for the set-based mark_animals_as_seen() method."""
+
+    @patch("services.session_manager.psycopg2")
+    def test_marks_all_ids_in_one_update(self, mock_psycopg2, session_manager):
+        """Every saved animal is marked seen by a single UPDATE over ANY(ids)."""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.rowcount = 3
+        mock_conn.cursor.return_value = mock_cursor
+        mock_psycopg2.connect.return_value = mock_conn
+        session_manager.start_scrape_session()
+
+        result = session_manager.mark_animals_as_seen([12, 11, 12, 13])
+
+        sql, params = update_call(mock_cursor)[0]
+        assert "WHERE id = ANY(%s)" in sql
+        assert "availability_confidence = 'high'" in sql
+        assert "consecutive_scrapes_missing = 0" in sql
+        assert params == (session_manager.current_scrape_session, [11, 12, 13])
+        mock_conn.commit.assert_called_once()
+        assert result == 3
+
+    def test_returns_zero_without_ids_or_session(self, session_manager):
+        """Nothing is written for an empty batch or outside a session."""
+        session_manager.conn = MagicMock()
+
+        assert session_manager.mark_animals_as_seen([1, 2]) == 0
+
+        session_manager.start_scrape_session()
+        assert session_manager.mark_animals_as_seen([]) == 0
+        session_manager.conn.cursor.assert_not_called()
+
 
 class TestUpdateStaleDataDetection:
     """Tests for the active=false fix in update_stale_data_detection()."""
@@ -165,8 +229,7 @@ class TestUpdateStaleDataDetection:
         result = session_manager.update_stale_data_detection()
 
         # Verify SQL includes active=false case
-        mock_cursor.execute.assert_called_once()
-        sql = mock_cursor.execute.call_args[0][0]
+        sql = update_call(mock_cursor)[0][0]
 
         # SQL should include the active column update
         assert "active = CASE" in sql
@@ -0,0 +1,61 @@
+"""The random and diverse listings read a stored weekly shuffle order.
+
+The order must not move within a week: the frontend caches these listings and
+ISR pages are built from them, so a reshuffle on refresh would be visible.
+"""
+
+import psycopg2
+import pytest
+
+from config import DB_CONFIG
+from services.weekly_shuffle import SHUFFLE_KEY, refresh_shuffle_keys
+
+
+@pytest.mark.database
+@pytest.mark.integration
+class TestWeeklyShuffle:
+    def test_a_second_refresh_in_the_same_week_rewrites_nothing(self, cursor):
+
+        assert refresh_shuffle_keys(cursor) == 0
+
+    def test_keys_are_the_weekly_hash_of_the_id(self, cursor):
+        cursor.execute(f"SELECT COUNT(*) FROM animals WHERE shuffle_key IS DISTINCT FROM {SHUFFLE_KEY}")
+
+        assert cursor.fetchone()[0] == 0
+
+    def test_a_new_dog_gets_a_key_without_moving_the_others(self, cursor):
+        cursor.execute("SELECT id, shuffle_key FROM animals ORDER BY id")
+        before = cursor.fetchall()
+        cursor.execute(
+            "INSERT INTO animals (name, organization_id, adoption_url, external_id) VALUES ('Shuffle Dog', 901, 'http://example.com/s', 'shuffle-1')",
+        )
+
+        assert refresh_shuffle_keys(cursor) == 1
+        cursor.execute("SELECT id, shuffle_key FROM animals WHERE id = ANY(%s) ORDER BY id", ([row[0] for row in before],))
+        assert cursor.fetchall() == before
+
+    def test_random_returns_dogs_in_shuffle_order(self, client, cursor):
+        cursor.execute("SELECT id FROM animals WHERE status = 'available' AND active AND animal_type = 'dog' ORDER BY shuffle_key, id LIMIT 3")
+        expected = [row[0] for row in cursor.fetchall()]
+
+        first = [dog["id"] for dog in client.get("/api/animals/random?limit=3").json()]
+        second = [dog["id"] for dog in client.get("/api/animals/random?limit=3").json()]
+
+        assert first == expected
+        assert second == first
+
+
+@pytest.fixture
+def cursor():
+    conn = psycopg2.connect(
+        host=DB_CONFIG["host"],
+        port=DB_CONFIG.get("port", 5432),
+        dbname=DB_CONFIG["database"],
+        user=DB_CONFIG["user"],
+        password=DB_CONFIG.get("password"),
+    )
+    cursor = conn.cursor()
+    yield cursor
+    conn.rollback()
+    cursor.close()
+    conn.close()
@@ -32,9 +32,9 @@ class TestBaseScraperImageValidation:
             metrics_collector=Mock(),
         )
 
-        # Mock the save_animal method to track calls
-        save_animal_mock = Mock(return_value=(1, "added"))
-        scraper.save_animal = save_animal_mock
+        # Mock the save_animals method to track which animals reach it
+        save_animals_mock = Mock(side_effect=lambda animals: [(1, "added")] * len(animals))
+        scraper.save_animals = save_animals_mock
 
         # Mock logger to verify warnings
         scraper.logger = Mock()
@@ -77,9 +77,10 @@ class TestBaseScraperImageValidation:
         # Process animals
         _stats = scraper._process_animals_data(animals_data)
 
-        # Verify that save_animal was called only for valid animals
+        # Verify that only valid animals were saved
         # Both empty string and None should be rejected
-        assert save_animal_mock.call_count == 2  # Valid Dog 1 and Valid Dog 2 only
+        [saved_animals] = save_animals_mock.call_args.args
+        assert [animal["name"] for animal in saved_animals] == ["Valid Dog 1", "Valid Dog 2"]
 
         # Verify warning was logged for invalid animal
         warning_calls = [call for call in scraper.logger.warning.call_args_list if "Invalid Dog - Empty String" in str(call)]
@@ -146,7 +147,7 @@ class TestBaseScraperImageValidation:
             metrics_collector=Mock(),
         )
 
-        # Mock methods needed for save_animal
+        # Mock methods needed for save_animals
         mock_db.get_existing_animal = Mock(return_value=None)
         mock_db.create_animal = Mock(return_value=(1, "added"))
         scraper.logger = Mock()
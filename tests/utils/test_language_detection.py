@@ -0,0 +1,130 @@
+"""Language detection must give langdetect's answers without langdetect's cost per call.
+
+What has to hold is that the same text always gets the same language, that
+text seen before is answered from the cache, that too little text falls
+back to the default, and that an organization configured with a language
+is never detected at all.
+"""
+
+import re
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+from langdetect import DetectorFactory, detect
+
+from scrapers.base_scraper import BaseScraper
+from services.animal_data_preparation import prepare_animal_data
+from utils.config_models import OrganizationMetadata
+from utils.language_detection import LanguageDetector
+
+GERMAN = "Luna ist eine freundliche Hündin, die gerne mit anderen Hunden spielt und Kinder liebt."
+ENGLISH = "Luna is a friendly girl who loves playing with other dogs and adores children."
+SPANISH = "Luna es una perra muy cariñosa que adora jugar con otros perros y con los niños."
+
+
+@pytest.fixture(scope="module")
+def detector():
+    return LanguageDetector()
+
+
+@pytest.mark.unit
+class TestLanguageDetector:
+    def test_detects_the_languages_langdetect_does(self, detector):
+        assert [detector.detect(text) for text in (GERMAN, ENGLISH, SPANISH)] == ["de", "en", "es"]
+
+    def test_a_repeated_text_is_answered_from_the_cache(self):
+        detector = LanguageDetector()
+
+        first = detector.detect(GERMAN)
+        with patch.object(detector._factory, "create", side_effect=AssertionError("detected twice")):
+            assert detector.detect(f"  {GERMAN} ") == first
+        assert (detector.hits, detector.misses) == (1, 1)
+
+    def test_too_little_text_gets_the_default(self, detector):
+        assert detector.detect("Rex", default="de") == "de"
+        assert detector.detect(None) == "en"
+
+    def test_batches_detect_each_distinct_text_once(self):
+        detector = LanguageDetector()
+
+        assert detector.detect_many([GERMAN, ENGLISH, GERMAN, None]) == ["de", "en", "de", "en"]
+        assert detector.misses == 2
+
+    def test_the_cache_is_bounded(self):
+        detector = LanguageDetector(cache_size=2)
+
+        for text in (GERMAN, ENGLISH, SPANISH, GERMAN):
+            detector.detect(text)
+
+        assert len(detector._cache) == 2
+        assert detector.misses == 4
+
+
+class _StubScraper(BaseScraper):
+    def collect_data(self):
+        return []
+
+
+@pytest.mark.unit
+class TestConfiguredLanguage:
+    def test_metadata_language_is_a_two_letter_code(self):
+        assert OrganizationMetadata(language=" EN ").language == "en"
+        with pytest.raises(ValueError):
+            OrganizationMetadata(language="english")
+
+    def test_a_configured_language_short_circuits_detection(self):
+        scraper = _StubScraper(organization_id=1)
+        scraper.listing_language = "en"
+
+        with patch("scrapers.base_scraper.get_language_detector", side_effect=AssertionError("detected")):
+            assert scraper.detect_language(GERMAN) == "en"
+
+    def test_it_is_stamped_only_on_animals_that_state_no_language(self):
+        scraper = _StubScraper(organization_id=1)
+        scraper.listing_language = "en"
+
+        assert scraper._with_listing_language({"name": "Luna"})["language"] == "en"
+        assert scraper._with_listing_language({"name": "Luna", "language": "de"})["language"] == "de"
+
+    def test_a_stated_language_is_saved_without_detection(self):
+        with patch("services.animal_data_preparation.detect_language", side_effect=AssertionError("detected")):
+            prepared = prepare_animal_data({"name": "Luna", "breed": "Mischling", "age_text": "2 Jahre", "language": "de"})
+
+        assert prepared.language == "de"
+
+
+def config_descriptions(count=300):
+    """Descriptions built from the organizations' own config texts, each listed twice as a rescrape sees it."""
+    sentences = []
+    for path in sorted(Path(__file__).parents[2].joinpath("configs", "organizations").glob("*.yaml")):
+        description = (yaml.safe_load(path.read_text()).get("metadata") or {}).get("description") or ""
+        sentences.extend(sentence for sentence in re.split(r"(?<=[.!?])\s+", description) if len(sentence) > 20)
+    distinct = [" ".join(sentences[i % len(sentences) : i % len(sentences) + 3]) for i in range(count // 2)]
+    return distinct * 2
+
+
+@pytest.mark.unit
+@pytest.mark.benchmark
+class TestLanguageDetectionBenchmark:
+    """Detection time for one scrape's worth of descriptions."""
+
+    DESCRIPTIONS = config_descriptions()
+
+    def test_langdetect_per_description(self, benchmark):
+        def detect_each():
+            for text in self.DESCRIPTIONS:
+                DetectorFactory.seed = 0
+                detect(text)
+
+        benchmark.group = "language detection: 300 descriptions"
+        benchmark.pedantic(detect_each, rounds=3, warmup_rounds=1)
+
+    def test_language_detector_batch_with_a_cold_cache(self, benchmark):
+        benchmark.group = "language detection: 300 descriptions"
+        benchmark.pedantic(
+            lambda detector: detector.detect_many(self.DESCRIPTIONS),
+            setup=lambda: ((LanguageDetector(),), {}),
+            rounds=3,
+        )
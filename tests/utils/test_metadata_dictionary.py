@@ -0,0 +1,147 @@
+"""The /meta filters are served from a published snapshot held in memory.
+
+Each API process may only look for a newer snapshot once per check interval,
+must keep serving what it holds when that check fails, and must show a newly
+published snapshot once the interval has passed.
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import psycopg2
+import pytest
+
+from config import DB_CONFIG
+from utils.metadata_dictionary import LATEST_SQL, MetadataDictionary, MetadataDomains, build_domains, publish_metadata
+
+DOMAINS = MetadataDomains(
+    breeds=["Beagle", "Greyhound"],
+    breeds_by_group={"Hound": ["Beagle", "Greyhound"]},
+    breed_groups=["Hound"],
+    location_countries=["DE"],
+    available_countries=["DE", "UK"],
+    regions_by_country={"DE": ["Berlin"]},
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def snapshot_cursor(published_at=datetime(2026, 10, 18), domains=DOMAINS):
+    """Cursor whose snapshot row sends the body only when the caller's version differs."""
+    cursor = MagicMock()
+
+    def execute(sql, params=None):
+        assert sql == LATEST_SQL
+        held = params[0]
+        cursor.fetchall.return_value = [{"published_at": published_at, "domains": None if held == published_at else domains.to_json()}]
+
+    cursor.execute.side_effect = execute
+    return cursor
+
+
+@pytest.mark.unit
+class TestMetadataDictionary:
+    def test_serves_from_memory_within_the_check_interval(self):
+        clock = FakeClock()
+        dictionary = MetadataDictionary(check_interval=60, clock=clock)
+        cursor = snapshot_cursor()
+
+        assert dictionary.get(cursor) == DOMAINS
+        clock.now = 59
+        assert dictionary.get(cursor) == DOMAINS
+
+        assert cursor.execute.call_count == 1
+
+    def test_an_unchanged_snapshot_is_not_reloaded(self):
+        clock = FakeClock()
+        dictionary = MetadataDictionary(check_interval=60, clock=clock)
+        cursor = snapshot_cursor()
+        first = dictionary.get(cursor)
+
+        clock.now = 61
+        assert dictionary.get(cursor) is first
+        assert cursor.execute.call_count == 2
+
+    def test_a_newer_snapshot_replaces_the_held_copy(self):
+        clock = FakeClock()
+        dictionary = MetadataDictionary(check_interval=60, clock=clock)
+        dictionary.get(snapshot_cursor())
+
+        newer = MetadataDomains(breeds=["Saluki"], breed_groups=["Sighthound"])
+        clock.now = 61
+        assert dictionary.get(snapshot_cursor(published_at=datetime(2026, 10, 19), domains=newer)) == newer
+
+    def test_a_failed_check_keeps_serving_the_held_copy(self):
+        clock = FakeClock()
+        dictionary = MetadataDictionary(check_interval=60, clock=clock)
+        dictionary.get(snapshot_cursor())
+        broken = MagicMock()
+        broken.execute.side_effect = psycopg2.OperationalError("connection lost")
+
+        clock.now = 61
+        assert dictionary.get(broken) == DOMAINS
+        assert dictionary.get(broken) == DOMAINS
+        assert broken.execute.call_count == 1, "the failed check should wait out another interval"
+
+    def test_the_first_load_surfaces_database_errors(self):
+        broken = MagicMock()
+        broken.execute.side_effect = psycopg2.OperationalError("connection lost")
+
+        with pytest.raises(psycopg2.OperationalError):
+            MetadataDictionary().get(broken)
+
+    def test_domains_round_trip_through_json(self):
+        assert MetadataDomains.from_json(DOMAINS.to_json()) == DOMAINS
+
+    def test_breeds_for_treats_any_group_as_all(self):
+        assert DOMAINS.breeds_for("Any group") == DOMAINS.breeds
+        assert DOMAINS.breeds_for("Toy") == []
+        assert DOMAINS.regions_for("UK") == []
+
+
+@pytest.mark.database
+@pytest.mark.integration
+class TestPublishedSnapshot:
+    def test_publish_stores_the_live_domains(self, conn):
+        with conn.cursor() as cursor:
+            published = publish_metadata(cursor)
+
+            assert published == build_domains(cursor)
+            assert MetadataDictionary().get(cursor) == published
+
+    def test_without_a_snapshot_the_domains_are_built_live(self, conn):
+        with conn.cursor() as cursor:
+            cursor.execute("UPDATE animals SET breed_group = 'Live Group' WHERE id = 9001")
+
+            assert "Live Group" in MetadataDictionary().get(cursor).breed_groups
+
+    def test_api_serves_the_published_breed_groups(self, client, conn):
+        with conn.cursor() as cursor:
+            cursor.execute("UPDATE animals SET breed_group = 'Published Group' WHERE id = 9001")
+            publish_metadata(cursor)
+            cursor.execute("UPDATE animals SET breed_group = 'Unpublished Group' WHERE id = 9001")
+            conn.commit()
+
+        groups = client.get("/api/animals/meta/breed_groups").json()
+        assert "Published Group" in groups
+        assert "Unpublished Group" not in groups
+
+
+@pytest.fixture
+def conn():
+    connection = psycopg2.connect(
+        host=DB_CONFIG["host"],
+        port=DB_CONFIG.get("port", 5432),
+        dbname=DB_CONFIG["database"],
+        user=DB_CONFIG["user"],
+        password=DB_CONFIG.get("password"),
+    )
+    yield connection
+    connection.rollback()
+    connection.close()
@@ -20,6 +20,7 @@ from utils.organization_sync_service import (
     NullLogoUploadService,
     OrganizationRecord,
     OrganizationSyncService,
+    SyncResult,
 )
 
 
@@ -205,3 +206,30 @@ class TestOrganizationSyncEnabledCascade:
         assert len(update_calls) == 1, "Expected exactly one UPDATE, got {}".format(len(update_calls))
         _, params = update_calls[0].args
         assert params[-2] is False, f"Flip to enabled=False must UPDATE with active=False (got {params[-2]})"
+
+    def test_sync_all_organizations_republishes_metadata(self):
+        """Country and region filters come from the published snapshot, so a sync must refresh it."""
+        service = OrganizationSyncService(logo_service=NullLogoUploadService())
+
+        with (
+            patch.object(service, "get_database_organizations", return_value={}),
+            patch.object(service, "sync_single_organization", return_value=SyncResult(42, "testorg", True, True)),
+            patch("utils.organization_sync_service.get_db_cursor"),
+            patch("utils.organization_sync_service.publish_metadata") as mock_publish,
+        ):
+            summary = service.sync_all_organizations({"testorg": _make_config()})
+
+        assert summary.processed == 1
+        mock_publish.assert_called_once()
+
+    def test_sync_all_organizations_survives_a_failed_publish(self):
+        service = OrganizationSyncService(logo_service=NullLogoUploadService())
+
+        with (
+            patch.object(service, "get_database_organizations", return_value={}),
+            patch.object(service, "sync_single_organization", return_value=SyncResult(42, "testorg", True, True)),
+            patch("utils.organization_sync_service.get_db_cursor", side_effect=RuntimeError("pool closed")),
+        ):
+            summary = service.sync_all_organizations({"testorg": _make_config()})
+
+        assert summary.created == 1
@@ -0,0 +1,136 @@
+"""A replayed scrape must see the responses the recorded one saw, without the network.
+
+Recording goes through a real HTTP server on loopback, so what is stored is
+what requests and httpx actually received; the server stays up during replay
+and must not be asked again.
+"""
+
+import asyncio
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+import requests
+
+from utils.replay import FixtureStore, NetworkDisabledError, active_session, fixture_key, network_disabled, recording, replaying
+
+PAGES = {
+    "/dogs": (200, "text/html; charset=utf-8", "<html><body><a href='/dogs/rex'>Rex</a> – Hündin</body></html>"),
+    "/dogs/rex": (200, "text/html", "<html><h1>Rex</h1></html>"),
+    "/old": (301, "text/html", ""),
+}
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        SiteHandler.hits += 1
+        status, content_type, body = PAGES.get(self.path, (404, "text/plain", "missing"))
+        payload = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Set-Cookie", "session=abc")
+        if status == 301:
+            self.send_header("Location", "/dogs/rex")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SiteHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return FixtureStore(tmp_path / "org")
+
+
+@pytest.mark.unit
+class TestFixtureStore:
+    def test_requests_are_keyed_by_method_url_and_body(self):
+        assert fixture_key("get", "https://x.org/a") == fixture_key("GET", "https://x.org/a")
+        assert fixture_key("GET", "https://x.org/a") != fixture_key("GET", "https://x.org/b")
+        assert fixture_key("POST", "https://x.org/a", b"page=1") != fixture_key("POST", "https://x.org/a", b"page=2")
+
+    def test_organizations_get_their_own_directory(self, tmp_path):
+        assert FixtureStore.for_organization("dogstrust", env={"SCRAPER_REPLAY_DIR": str(tmp_path)}).directory == tmp_path / "dogstrust"
+
+
+@pytest.mark.unit
+class TestRecordThenReplay:
+    def test_requests(self, site, store):
+        with recording(store) as session:
+            live = requests.get(f"{site}/dogs", timeout=5)
+            redirected = requests.Session().get(f"{site}/old", timeout=5)
+        assert session.recorded == 3
+        hits = SiteHandler.hits
+
+        with replaying(store) as session:
+            replayed = requests.get(f"{site}/dogs", timeout=5)
+            followed = requests.Session().get(f"{site}/old", timeout=5)
+
+        assert SiteHandler.hits == hits
+
+        assert (replayed.status_code, replayed.text, replayed.encoding) == (live.status_code, live.text, "utf-8")
+        assert followed.url == redirected.url == f"{site}/dogs/rex"
+        assert "Set-Cookie" not in replayed.headers
+        assert (session.served, session.missed) == (3, 0)
+
+    def test_httpx_sync_and_async(self, site, store):
+        async def fetch():
+            async with httpx.AsyncClient() as client:
+                return (await client.get(f"{site}/dogs/rex")).text
+
+        with recording(store):
+            live = httpx.get(f"{site}/dogs").text
+            live_async = asyncio.run(fetch())
+
+        hits = SiteHandler.hits
+        with replaying(store) as session:
+            assert httpx.get(f"{site}/dogs").text == live
+            assert asyncio.run(fetch()) == live_async
+        assert session.served == 2
+        assert SiteHandler.hits == hits
+
+    def test_an_unrecorded_request_fails_like_the_network(self, site, store):
+        with replaying(store) as session:
+            with pytest.raises(requests.ConnectionError):
+                requests.get(f"{site}/dogs", timeout=5)
+            with pytest.raises(httpx.ConnectError):
+                httpx.get(f"{site}/dogs")
+        assert session.missed == 2
+
+    def test_patches_are_removed_afterwards(self, site, store):
+        with replaying(store):
+            pass
+
+        assert active_session() is None
+        assert requests.get(f"{site}/dogs", timeout=5).status_code == 200
+
+    def test_sessions_do_not_nest(self, store):
+        with recording(store), pytest.raises(RuntimeError):
+            with replaying(store):
+                pass
+
+
+@pytest.mark.unit
+class TestNetworkDisabled:
+    def test_only_loopback_is_reachable(self, site):
+        with network_disabled():
+            with pytest.raises(NetworkDisabledError):
+                socket.create_connection(("203.0.113.1", 80), timeout=1)
+            host, port = site.removeprefix("http://").split(":")
+            socket.create_connection((host, int(port)), timeout=1).close()
@@ -0,0 +1,132 @@
+"""The cron batch scrapes organizations side by side within its limits.
+
+Running one site after another made the batch the sum of every crawl. Running
+them together must still never put two crawlers on one site, exceed the
+Browserless session budget, or let one organization's failure touch another's
+result.
+"""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from utils.config_models import OrganizationConfig
+from utils.scrape_scheduler import SchedulerLimits, ScrapeJob, ScrapeScheduler, job_for
+from utils.secure_config_scraper_runner import BatchRunResult, ScraperRunResult, SecureConfigScraperRunner
+
+
+class Tracker:
+    """Work function that records how many jobs overlap, by domain and browser use."""
+
+    def __init__(self, fail: set[str] = frozenset()):
+        self.lock = threading.Lock()
+        self.running: list[ScrapeJob] = []
+        self.peak = 0
+        self.peak_per_domain: dict[str, int] = {}
+        self.peak_browsers = 0
+        self.started: list[str] = []
+        self.fail = fail
+
+    def __call__(self, job: ScrapeJob) -> ScraperRunResult:
+        with self.lock:
+            self.started.append(job.config_id)
+            self.running.append(job)
+            self.peak = max(self.peak, len(self.running))
+            same_domain = sum(1 for j in self.running if j.domain == job.domain)
+            self.peak_per_domain[job.domain] = max(self.peak_per_domain.get(job.domain, 0), same_domain)
+            self.peak_browsers = max(self.peak_browsers, sum(j.uses_browser for j in self.running))
+        # Give other workers a chance to start before this one finishes
+        threading.Event().wait(0.01)
+        with self.lock:
+            self.running.remove(job)
+        if job.config_id in self.fail:
+            raise RuntimeError(f"{job.config_id} blew up")
+        return ScraperRunResult(config_id=job.config_id, success=True)
+
+
+def failed(job: ScrapeJob, e: Exception) -> ScraperRunResult:
+    return ScraperRunResult(config_id=job.config_id, success=False, error=str(e))
+
+
+@pytest.mark.unit
+class TestScrapeScheduler:
+    def test_runs_organizations_concurrently_up_to_the_cap(self):
+        tracker = Tracker()
+        jobs = [ScrapeJob(f"org{i}", f"site{i}.org") for i in range(6)]
+
+        ScrapeScheduler(SchedulerLimits(max_concurrency=3)).run(jobs, tracker, failed)
+
+        assert 1 < tracker.peak <= 3
+
+    def test_never_two_crawlers_on_one_domain(self):
+        tracker = Tracker()
+        jobs = [ScrapeJob("a", "shared.org"), ScrapeJob("b", "shared.org"), ScrapeJob("c", "other.org")]
+
+        ScrapeScheduler(SchedulerLimits(max_concurrency=3)).run(jobs, tracker, failed)
+
+        assert tracker.peak_per_domain["shared.org"] == 1
+
+    def test_browser_scrapes_stay_within_the_session_budget(self):
+        tracker = Tracker()
+        jobs = [ScrapeJob(f"b{i}", f"b{i}.org", uses_browser=True) for i in range(4)] + [ScrapeJob("h", "h.org")]
+
+        ScrapeScheduler(SchedulerLimits(max_concurrency=4, browser_sessions=2)).run(jobs, tracker, failed)
+
+        assert tracker.peak_browsers <= 2
+
+    def test_results_come_back_in_job_order_and_failures_stay_isolated(self):
+        tracker = Tracker(fail={"b"})
+        jobs = [ScrapeJob("a", "a.org"), ScrapeJob("b", "b.org"), ScrapeJob("c", "c.org")]
+
+        results = ScrapeScheduler(SchedulerLimits(max_concurrency=2)).run(jobs, tracker, failed)
+
+        assert [r.config_id for r in results] == ["a", "b", "c"]
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].error == "b blew up"
+
+    def test_longest_expected_scrape_starts_first(self):
+        tracker = Tracker()
+        jobs = [ScrapeJob("quick", "q.org", expected_seconds=60), ScrapeJob("slow", "s.org", expected_seconds=3600)]
+
+        ScrapeScheduler(SchedulerLimits(max_concurrency=1)).run(jobs, tracker, failed)
+
+        assert tracker.started == ["slow", "quick"]
+
+
+@pytest.mark.unit
+class TestJobFor:
+    def _config(self, website_url, **scraper_config):
+        return OrganizationConfig(
+            schema_version="1.0",
+            id="testorg",
+            name="Test Org",
+            enabled=True,
+            scraper={"class_name": "FakeScraper", "module": "scrapers.fake.fake_scraper", "config": scraper_config},
+            metadata={"website_url": website_url},
+        )
+
+    def test_domain_ignores_www(self):
+        assert job_for(self._config("https://www.dogstrust.org.uk/rehoming")).domain == "dogstrust.org.uk"
+
+    def test_browser_use_comes_from_the_scraper_config(self):
+        assert job_for(self._config("https://example.com", uses_browser=True)).uses_browser is True
+        assert job_for(self._config("https://example.com")).uses_browser is False
+
+
+@pytest.mark.unit
+class TestRunAllEnabledScrapers:
+    def test_returns_a_batch_result_in_config_order(self):
+        orgs = [Mock(id=name, metadata=Mock(website_url=f"https://{name}.org"), scraper=Mock(config=None)) for name in ("a", "b", "c")]
+        config_loader = Mock()
+        config_loader.get_enabled_orgs.return_value = orgs
+        runner = SecureConfigScraperRunner(config_loader=config_loader, scraper_loader=Mock(), sync_service=Mock(), scheduler=ScrapeScheduler(SchedulerLimits(max_concurrency=3)))
+        runner.recent_scrape_durations = Mock(return_value={"c": 900.0})
+        runner.run_scraper = Mock(side_effect=lambda config_id, sync_first: ScraperRunResult(config_id=config_id, success=config_id != "b"))
+
+        result = runner.run_all_enabled_scrapers()
+
+        assert isinstance(result, BatchRunResult)
+        assert [r.config_id for r in result.results] == ["a", "b", "c"]
+        assert (result.total_orgs, result.successful, result.failed) == (3, 2, 1)
+        assert all(call.kwargs["sync_first"] is False for call in runner.run_scraper.call_args_list)
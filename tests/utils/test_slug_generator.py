@@ -9,6 +9,7 @@ import pytest
 
 from utils.slug_generator import (
     ensure_unique_slug,
+    ensure_unique_slugs,
     generate_animal_slug,
     generate_unique_animal_slug,
     sanitize_for_slug,
@@ -102,7 +103,7 @@ class TestEnsureUniqueSlug:
         """Test that unique slug is returned unchanged."""
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchone.return_value = (0,)  # No existing slugs
+        mock_cursor.fetchall.return_value = []  # No existing slugs
         mock_conn.cursor.return_value = mock_cursor
 
         result = ensure_unique_slug("test-slug", mock_conn)
@@ -112,8 +113,7 @@ class TestEnsureUniqueSlug:
         """Test that duplicate slug gets numeric suffix."""
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        # First call returns 1 (exists), second call returns 0 (unique with -1 suffix)
-        mock_cursor.fetchone.side_effect = [(1,), (0,)]
+        mock_cursor.fetchall.return_value = [("test-slug",)]
         mock_conn.cursor.return_value = mock_cursor
 
         result = ensure_unique_slug("test-slug", mock_conn)
@@ -123,18 +123,33 @@ class TestEnsureUniqueSlug:
         """Test handling of multiple duplicate slugs."""
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        # First 3 calls return 1 (exists), 4th call returns 0 (unique with -3 suffix)
-        mock_cursor.fetchone.side_effect = [(1,), (1,), (1,), (0,)]
+        # Base and first two suffixes taken; an unrelated longer slug does not block -3
+        mock_cursor.fetchall.return_value = [("test-slug",), ("test-slug-1",), ("test-slug-2",), ("test-slug-30",)]
         mock_conn.cursor.return_value = mock_cursor
 
         result = ensure_unique_slug("test-slug", mock_conn)
         assert result == "test-slug-3"
 
+    def test_all_candidates_fetched_in_one_query(self):
+        """Test that taken suffixes are fetched once rather than probed one by one."""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [("luna",)] + [(f"luna-{i}",) for i in range(1, 50)]
+        mock_conn.cursor.return_value = mock_cursor
+
+        result = ensure_unique_slug("luna", mock_conn)
+
+        assert result == "luna-50"
+        mock_cursor.execute.assert_called_once()
+        sql, params = mock_cursor.execute.call_args[0]
+        assert "slug LIKE %s" in sql
+        assert params == ["luna", "luna-%"]
+
     def test_exclude_id_parameter(self):
         """Test exclude_id parameter for updates."""
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchone.return_value = (0,)
+        mock_cursor.fetchall.return_value = []
         mock_conn.cursor.return_value = mock_cursor
 
         ensure_unique_slug("test-slug", mock_conn, exclude_id=123)
@@ -157,6 +172,41 @@ class TestEnsureUniqueSlug:
         assert result == "test-slug"
 
 
+class TestEnsureUniqueSlugs:
+    """Test batch slug uniqueness checking."""
+
+    def test_free_slugs_need_one_query(self):
+        """Test that a batch with no collisions is checked with a single lookup."""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        mock_conn.cursor.return_value = mock_cursor
+
+        result = ensure_unique_slugs(["max-1", "luna-2"], mock_conn)
+
+        assert result == ["max-1", "luna-2"]
+        mock_cursor.execute.assert_called_once()
+
+    def test_collisions_get_suffixes_unique_within_the_batch(self):
+        """Test that taken slugs get the next free suffix, never one already handed out."""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.side_effect = [[("max-1",)], [("max-1-1",)]]
+        mock_conn.cursor.return_value = mock_cursor
+
+        result = ensure_unique_slugs(["max-1", "max-1", "luna-2"], mock_conn)
+
+        assert result == ["max-1-2", "max-1-3", "luna-2"]
+        assert mock_cursor.execute.call_count == 2
+
+    def test_database_error_fallback(self):
+        """Test that the base slugs are returned on database error."""
+        mock_conn = MagicMock()
+        mock_conn.cursor.side_effect = Exception("Database error")
+
+        assert ensure_unique_slugs(["max-1"], mock_conn) == ["max-1"]
+
+
 class TestGenerateUniqueAnimalSlug:
     """Test combined slug generation and uniqueness checking."""
 
@@ -164,7 +214,7 @@ class TestGenerateUniqueAnimalSlug:
         """Test full slug generation with uniqueness check."""
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchone.return_value = (0,)  # Unique
+        mock_cursor.fetchall.return_value = []  # Unique
         mock_conn.cursor.return_value = mock_cursor
 
         result = generate_unique_animal_slug("Fluffy", breed="Mixed", animal_id=123, connection=mock_conn)
@@ -174,7 +224,7 @@ class TestGenerateUniqueAnimalSlug:
         """Test handling of slug collisions."""
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchone.side_effect = [(1,), (0,)]  # First exists, second unique
+        mock_cursor.fetchall.return_value = [("fluffy-mixed-123",)]  # Base exists, first suffix free
         mock_conn.cursor.return_value = mock_cursor
 
         result = generate_unique_animal_slug("Fluffy", breed="Mixed", animal_id=123, connection=mock_conn)
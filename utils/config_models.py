@@ -59,6 +59,20 @@ class OrganizationMetadata(BaseModel):
     ships_to: list[str] = []  # Countries where they ship animals
     established_year: int | None = None
     logo_url: str | None = None
+    language: str | None = None  # ISO 639-1 code, when every listing is written in it
+
+    @field_validator("language")
+    @classmethod
+    def validate_language(cls, v):
+        """Validate language is a two-letter language code."""
+        if v is None:
+            return v
+
+        language = v.strip().lower()
+        if len(language) != 2 or not language.isalpha():
+            raise ValueError(f"Invalid language code: {v}")
+
+        return language
 
     @field_validator("service_regions")
     @classmethod
@@ -124,8 +138,11 @@ class ScraperConfig(BaseModel):
     model_config = ConfigDict(extra="allow")  # Allow additional fields
 
     rate_limit_delay: float | None = None
+    rate_limit_min_delay: float | None = None
+    rate_limit_max_delay: float | None = None
     max_retries: int | None = None
     timeout: int | None = None
+    uses_browser: bool = False
 
 
 class ScraperInfo(BaseModel):
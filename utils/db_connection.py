@@ -104,15 +104,32 @@ class DatabaseConnectionPool:
 
 # Global connection pool instance
 _connection_pool: DatabaseConnectionPool | None = None
+_connection_pool_lock = Lock()
 
 
 def initialize_database_pool(config: DatabaseConfig) -> DatabaseConnectionPool:
-    """Initialize global database connection pool."""
+    """Initialize global database connection pool, closing any pool it replaces."""
     global _connection_pool
-    _connection_pool = DatabaseConnectionPool(config)
+    with _connection_pool_lock:
+        previous, _connection_pool = _connection_pool, DatabaseConnectionPool(config)
+    if previous:
+        previous.close_all_connections()
     return _connection_pool
 
 
+def ensure_database_pool(config: DatabaseConfig) -> DatabaseConnectionPool:
+    """Return the global pool, initializing it only if this process has none.
+
+    Scrapers loaded while others are running use this, so the pool their
+    neighbours hold connections from is never swapped out from under them.
+    """
+    global _connection_pool
+    with _connection_pool_lock:
+        if _connection_pool is None:
+            _connection_pool = DatabaseConnectionPool(config)
+        return _connection_pool
+
+
 def get_database_pool() -> DatabaseConnectionPool:
     """Get global database connection pool."""
     if _connection_pool is None:
@@ -0,0 +1,104 @@
+"""
+Language identification for scraped animal text.
+
+langdetect.detect() builds a detector from the module-wide factory on every
+call and runs its randomised trials over the whole text, and callers used
+to reseed DetectorFactory before each one. LanguageDetector loads the
+langdetect profiles into its own factory once, with a fixed seed so the same
+text always gets the same answer, looks at no more than SAMPLE_LENGTH
+characters, and remembers results by a hash of that sample: rescrapes and
+templated listings are mostly text it has seen before.
+
+Organizations whose listings are all in one language can say so with
+metadata.language in their config; BaseScraper then stamps that language
+on every animal and nothing is detected.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LANGUAGE = "en"
+
+MIN_TEXT_LENGTH = 10
+"""Shorter text says too little to identify; it gets the default language."""
+
+SAMPLE_LENGTH = 500
+"""Characters of a text used for detection; more does not change the answer."""
+
+CACHE_SIZE = 10_000
+"""Texts whose language is remembered, least recently used dropped first."""
+
+
+class LanguageDetector:
+    """langdetect with profiles loaded once, a fixed seed and a result cache."""
+
+    def __init__(self, cache_size: int = CACHE_SIZE, seed: int = 0):
+        from langdetect.detector_factory import PROFILES_DIRECTORY, DetectorFactory
+
+        self._factory = DetectorFactory()
+        self._factory.load_profile(PROFILES_DIRECTORY)
+        self._factory.set_seed(seed)
+        self._cache: OrderedDict[bytes, str] = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def detect(self, text: str | None, default: str = DEFAULT_LANGUAGE) -> str:
+        """ISO 639-1 code of text's language, or default when it cannot be told."""
+        sample = (text or "").strip()[:SAMPLE_LENGTH]
+        if len(sample) < MIN_TEXT_LENGTH:
+            return default
+
+        key = hashlib.blake2b(sample.encode(), digest_size=16).digest()
+        with self._lock:
+            language = self._cache.get(key)
+            if language is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return language
+
+        try:
+            detector = self._factory.create()
+            detector.append(sample)
+            language = detector.detect()
+        except Exception as e:
+            logger.warning(f"Language detection failed, defaulting to {default}: {e}")
+            return default
+
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = language
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return language
+
+    def detect_many(self, texts: Iterable[str | None], default: str = DEFAULT_LANGUAGE) -> list[str]:
+        """detect() for each text, running each distinct text once."""
+        texts = list(texts)
+        languages = {text: self.detect(text, default) for text in dict.fromkeys(texts)}
+        return [languages[text] for text in texts]
+
+
+_detector: LanguageDetector | None = None
+_detector_lock = threading.Lock()
+
+
+def get_language_detector() -> LanguageDetector:
+    """The process-wide LanguageDetector, created on first use."""
+    global _detector
+    if _detector is None:
+        with _detector_lock:
+            if _detector is None:
+                _detector = LanguageDetector()
+    return _detector
+
+
+def detect_language(text: str | None, default: str = DEFAULT_LANGUAGE) -> str:
+    """Language of text via the shared detector."""
+    return get_language_detector().detect(text, default)
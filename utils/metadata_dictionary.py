@@ -0,0 +1,210 @@
+"""
+In-memory dictionary of the distinct values behind the /meta endpoints.
+
+The breed, breed group, country and region filters each ran a SELECT DISTINCT
+over animals, service_regions or organizations whenever the CDN cache missed.
+Those domains only change when organizations are synced or a scrape completes,
+so both events publish a snapshot (publish_metadata) and every API process
+serves the filters from its in-memory copy of the latest one.
+
+The publishing process is never the API process, so a copy looks for a newer
+snapshot at most once per check interval: one primary-key read per process per
+minute instead of a DISTINCT scan per request. Until a snapshot is published
+the domains are built from the live tables on the same schedule.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CHECK_INTERVAL_SECONDS = 60.0
+
+# Each query returns its columns in ORDER BY order, so lists keep the
+# database collation rather than Python's.
+BREED_QUERY = """
+    SELECT DISTINCT primary_breed, breed_group
+    FROM animals
+    WHERE primary_breed IS NOT NULL
+      AND primary_breed != ''
+      AND primary_breed NOT IN ('Yes', 'No', 'Unknown')
+      AND LENGTH(primary_breed) > 1
+      AND status = 'available'
+      AND active = true
+    ORDER BY primary_breed
+"""
+
+BREED_GROUP_QUERY = """
+    SELECT DISTINCT breed_group
+    FROM animals
+    WHERE breed_group IS NOT NULL
+      AND breed_group != ''
+      AND breed_group NOT IN ('Unknown')
+      AND status = 'available'
+      AND active = true
+    ORDER BY breed_group
+"""
+
+LOCATION_COUNTRY_QUERY = """
+    SELECT DISTINCT country
+    FROM organizations
+    WHERE country IS NOT NULL AND country != '' AND active = TRUE
+    ORDER BY country ASC
+"""
+
+AVAILABLE_COUNTRY_QUERY = """
+    SELECT DISTINCT sr.country
+    FROM service_regions sr
+    JOIN organizations o ON sr.organization_id = o.id
+    WHERE sr.country IS NOT NULL AND sr.country != '' AND o.active = TRUE
+    ORDER BY sr.country ASC
+"""
+
+REGION_QUERY = """
+    SELECT DISTINCT sr.country, sr.region
+    FROM service_regions sr
+    JOIN organizations o ON sr.organization_id = o.id
+    WHERE sr.country IS NOT NULL AND sr.region IS NOT NULL AND sr.region != '' AND o.active = TRUE
+    ORDER BY sr.country ASC, sr.region ASC
+"""
+
+PUBLISH_SQL = """
+    INSERT INTO metadata_dictionary (id, domains, published_at)
+    VALUES (1, %s::jsonb, NOW())
+    ON CONFLICT (id) DO UPDATE SET domains = EXCLUDED.domains, published_at = EXCLUDED.published_at
+"""
+
+# The snapshot body is only sent when it differs from the copy already held.
+LATEST_SQL = """
+    SELECT published_at, CASE WHEN published_at IS DISTINCT FROM %s THEN domains END AS domains
+    FROM metadata_dictionary
+    WHERE id = 1
+"""
+
+
+@dataclass(frozen=True)
+class MetadataDomains:
+    """The distinct values each /meta endpoint serves."""
+
+    breeds: list[str] = field(default_factory=list)
+    breeds_by_group: dict[str, list[str]] = field(default_factory=dict)
+    breed_groups: list[str] = field(default_factory=list)
+    location_countries: list[str] = field(default_factory=list)
+    available_countries: list[str] = field(default_factory=list)
+    regions_by_country: dict[str, list[str]] = field(default_factory=dict)
+
+    def breeds_for(self, breed_group: str | None = None) -> list[str]:
+        """Canonical breeds, optionally within one group ("Any group" means all)."""
+        if breed_group and breed_group != "Any group":
+            return list(self.breeds_by_group.get(breed_group, []))
+        return list(self.breeds)
+
+    def regions_for(self, country: str) -> list[str]:
+        return list(self.regions_by_country.get(country, []))
+
+    def to_json(self) -> str:
+        return json.dumps(self.__dict__)
+
+    @classmethod
+    def from_json(cls, payload: str | dict) -> "MetadataDomains":
+        data = json.loads(payload) if isinstance(payload, str) else payload
+        return cls(**{name: data.get(name, default.default_factory()) for name, default in cls.__dataclass_fields__.items()})
+
+
+def _rows(cursor: Any, query: str, params: tuple | None = None) -> list[tuple]:
+    """Fetch rows as tuples from either a tuple or a RealDictCursor."""
+    cursor.execute(query, params)
+    return [tuple(row.values()) if isinstance(row, dict) else tuple(row) for row in cursor.fetchall()]
+
+
+def build_domains(cursor: Any) -> MetadataDomains:
+    """Read every domain from the live tables."""
+    breeds: dict[str, None] = {}
+    breeds_by_group: dict[str, list[str]] = {}
+    for breed, group in _rows(cursor, BREED_QUERY):
+        breeds[breed] = None
+        if group is not None:
+            breeds_by_group.setdefault(group, []).append(breed)
+
+    regions_by_country: dict[str, list[str]] = {}
+    for country, region in _rows(cursor, REGION_QUERY):
+        regions_by_country.setdefault(country, []).append(region)
+
+    return MetadataDomains(
+        breeds=list(breeds),
+        breeds_by_group=breeds_by_group,
+        breed_groups=[row[0] for row in _rows(cursor, BREED_GROUP_QUERY)],
+        location_countries=[row[0] for row in _rows(cursor, LOCATION_COUNTRY_QUERY)],
+        available_countries=[row[0] for row in _rows(cursor, AVAILABLE_COUNTRY_QUERY)],
+        regions_by_country=regions_by_country,
+    )
+
+
+def publish_metadata(cursor: Any) -> MetadataDomains:
+    """Rebuild the domains and store them as the current snapshot. The caller commits."""
+    domains = build_domains(cursor)
+    cursor.execute(PUBLISH_SQL, (domains.to_json(),))
+    return domains
+
+
+class MetadataDictionary:
+    """Process-wide copy of the latest published snapshot."""
+
+    def __init__(self, check_interval: float = CHECK_INTERVAL_SECONDS, clock: Callable[[], float] = time.monotonic):
+        self._check_interval = check_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._domains: MetadataDomains | None = None
+        self._published_at: datetime | None = None
+        self._checked_at = 0.0
+
+    def get(self, cursor: Any) -> MetadataDomains:
+        """
+        Return the domains, consulting the database only when a check is due.
+
+        The first call in a process must reach the database, and its errors
+        propagate. Later checks that fail keep serving the copy already held.
+        """
+        with self._lock:
+            if self._domains is not None and self._clock() - self._checked_at < self._check_interval:
+                return self._domains
+
+            if self._domains is None:
+                self._refresh(cursor)
+                return self._domains
+
+            try:
+                self._refresh(cursor)
+            except Exception as e:
+                logger.warning(f"Serving cached metadata; snapshot check failed: {e}")
+                self._checked_at = self._clock()
+            return self._domains
+
+    def _refresh(self, cursor: Any) -> None:
+        rows = _rows(cursor, LATEST_SQL, (self._published_at,))
+        if rows:
+            published_at, payload = rows[0]
+            if payload is not None:
+                self._domains = MetadataDomains.from_json(payload)
+                self._published_at = published_at
+        else:
+            # Nothing published yet - a fresh database, or tests seeding raw SQL.
+            self._domains = build_domains(cursor)
+            self._published_at = None
+        self._checked_at = self._clock()
+
+    def invalidate(self) -> None:
+        """Drop the held copy so the next request reloads it."""
+        with self._lock:
+            self._domains = None
+            self._published_at = None
+            self._checked_at = 0.0
+
+
+metadata_dictionary = MetadataDictionary()
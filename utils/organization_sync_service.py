@@ -11,7 +11,8 @@ from typing import Any, Protocol
 import psycopg2.extras
 
 from utils.config_models import OrganizationConfig
-from utils.db_connection import execute_command, execute_query, execute_transaction
+from utils.db_connection import execute_command, execute_query, execute_transaction, get_db_cursor
+from utils.metadata_dictionary import publish_metadata
 from utils.r2_logo_uploader import R2OrganizationLogoUploader as OrganizationLogoUploader
 from utils.slug_generator import generate_unique_organization_slug
 
@@ -422,8 +423,19 @@ class OrganizationSyncService:
 
         logger.info(f"Sync completed: {summary.processed}/{summary.total_configs} processed ({summary.created} created, {summary.updated} updated, {len(summary.errors)} errors)")
 
+        self._publish_metadata()
+
         return summary
 
+    def _publish_metadata(self) -> None:
+        """Republish the /meta filter domains; organization countries and regions may have changed."""
+        try:
+            with get_db_cursor() as cursor:
+                publish_metadata(cursor)
+                cursor.connection.commit()
+        except Exception as e:
+            logger.warning(f"Failed to publish metadata dictionary: {e}")
+
     def get_config_to_db_mapping(self) -> dict[str, int]:
         """Get mapping from organization name to database organization ID."""
         query = """
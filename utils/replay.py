@@ -0,0 +1,367 @@
+"""
+Record and replay of scraper traffic, for measuring scrapers offline.
+
+Timing a scraper used to mean scraping the live site, where the site's
+response time and the politeness delays swamp the parsing and saving the
+scraper itself is responsible for. This module captures every response a
+scraper receives into a FixtureStore and later serves them back in place of
+the network:
+
+- requests, through requests.adapters.HTTPAdapter.send (requests.get and
+  every Session)
+- httpx, through HTTPTransport / AsyncHTTPTransport (HttpFetchEngine)
+- Playwright, through a route on each browser context that
+  PlaywrightBrowserService creates while a session is active
+
+Responses are keyed by method, URL and request body, so redirects replay
+hop by hop. While replaying, a request with no recording fails with the
+client's own connection error, and Python sockets may only connect to loopback addresses, so a
+replayed scrape can reach a local Postgres and nothing else.
+
+Selenium drives a browser process of its own that none of this can
+intercept; Selenium code paths still go to the network.
+
+Usage:
+    with recording(FixtureStore.for_organization("dogstrust")):
+        scraper.collect_data()
+
+    with replaying(FixtureStore.for_organization("dogstrust")) as session:
+        scraper.collect_data()
+    session.served, session.missed
+
+Configuration:
+- SCRAPER_REPLAY_DIR: fixture root (default tests/fixtures/replay). Each
+  organization gets its own subdirectory.
+"""
+
+import hashlib
+import http.client
+import ipaddress
+import json
+import logging
+import os
+import socket
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from pathlib import Path
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FIXTURE_DIR = Path(__file__).parents[1] / "tests" / "fixtures" / "replay"
+
+RECORD = "record"
+REPLAY = "replay"
+
+DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive", "set-cookie"})
+"""Not kept with a recording: the body is stored decoded, and cookies are per session."""
+
+
+class NetworkDisabledError(ConnectionError):
+    """A replayed scrape tried to reach the network."""
+
+
+@dataclass(frozen=True)
+class RecordedResponse:
+    """One response as it was received."""
+
+    method: str
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    body: bytes
+
+
+def fixture_key(method: str, url: str, body: bytes | str | None = None) -> str:
+    """Name of the recording for a request."""
+    digest = hashlib.sha256(f"{method.upper()} {url}".encode())
+    if body:
+        digest.update(b"\0" + (body.encode() if isinstance(body, str) else body))
+    return digest.hexdigest()[:32]
+
+
+def kept_headers(headers) -> dict[str, str]:
+    return {name: value for name, value in headers.items() if name.lower() not in DROPPED_HEADERS}
+
+
+class FixtureStore:
+    """Recorded responses on disk: <key>.json for status and headers, <key>.body for the body."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+
+    @classmethod
+    def for_organization(cls, organization_key: str, env: dict[str, str] | None = None) -> "FixtureStore":
+        env = os.environ if env is None else env
+        root = Path(env["SCRAPER_REPLAY_DIR"]) if env.get("SCRAPER_REPLAY_DIR") else DEFAULT_FIXTURE_DIR
+        return cls(root / organization_key)
+
+    def save(self, response: RecordedResponse, request_body: bytes | str | None = None) -> None:
+        key = fixture_key(response.method, response.url, request_body)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / f"{key}.body").write_bytes(response.body)
+        metadata = {name: value for name, value in asdict(response).items() if name != "body"}
+        (self.directory / f"{key}.json").write_text(json.dumps(metadata, indent=2, sort_keys=True))
+
+    def load(self, method: str, url: str, request_body: bytes | str | None = None) -> RecordedResponse | None:
+        key = fixture_key(method, url, request_body)
+        try:
+            metadata = json.loads((self.directory / f"{key}.json").read_text())
+            body = (self.directory / f"{key}.body").read_bytes()
+        except FileNotFoundError:
+            return None
+        return RecordedResponse(body=body, **metadata)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.directory.glob("*.json")) if self.directory.is_dir() else 0
+
+
+class ReplaySession:
+    """An active recording or replay, with counts of what went through it."""
+
+    def __init__(self, store: FixtureStore, mode: str):
+        self.store = store
+        self.mode = mode
+        self.recorded = 0
+        self.served = 0
+        self.missed = 0
+        self._lock = threading.Lock()
+
+    def record(self, response: RecordedResponse, request_body: bytes | str | None = None) -> None:
+        try:
+            self.store.save(response, request_body)
+        except OSError as e:
+            logger.warning(f"Could not record {response.url}: {e}")
+            return
+        with self._lock:
+            self.recorded += 1
+
+    def serve(self, method: str, url: str, request_body: bytes | str | None = None) -> RecordedResponse | None:
+        """The recording for a request, or None when there is none."""
+        recorded = self.store.load(method, url, request_body)
+        with self._lock:
+            if recorded is None:
+                self.missed += 1
+            else:
+                self.served += 1
+        return recorded
+
+    def unrecorded(self, method: str, url: str) -> str:
+        return f"No recording of {method} {url} in {self.store.directory}"
+
+
+_session: ReplaySession | None = None
+_session_lock = threading.Lock()
+
+
+def active_session() -> ReplaySession | None:
+    """The recording or replay in progress, if any."""
+    return _session
+
+
+@contextmanager
+def recording(store: FixtureStore) -> Iterator[ReplaySession]:
+    """Save every response scrapers receive into store."""
+    with _activate(ReplaySession(store, RECORD)) as session:
+        yield session
+
+
+@contextmanager
+def replaying(store: FixtureStore, block_network: bool = True) -> Iterator[ReplaySession]:
+    """Answer scraper requests from store, with the network off unless block_network is False."""
+    with _activate(ReplaySession(store, REPLAY)) as session:
+        if block_network:
+            with network_disabled():
+                yield session
+        else:
+            yield session
+
+
+@contextmanager
+def _activate(session: ReplaySession) -> Iterator[ReplaySession]:
+    global _session
+    with _session_lock:
+        if _session is not None:
+            raise RuntimeError(f"A {_session.mode} session is already active")
+        _session = session
+    patches = [
+        (HTTPAdapter, "send", _adapter_send),
+        (httpx.HTTPTransport, "handle_request", _transport_handle_request),
+        (httpx.AsyncHTTPTransport, "handle_async_request", _async_transport_handle_request),
+    ]
+    originals = [(owner, name, getattr(owner, name)) for owner, name, _ in patches]
+    try:
+        for owner, name, replacement in patches:
+            setattr(owner, name, replacement)
+        yield session
+    finally:
+        for owner, name, original in originals:
+            setattr(owner, name, original)
+        with _session_lock:
+            _session = None
+
+
+# requests
+
+
+_original_adapter_send = HTTPAdapter.send
+
+
+def _adapter_send(self, request, *args, **kwargs):
+    session = active_session()
+    if session is None:
+        return _original_adapter_send(self, request, *args, **kwargs)
+    if session.mode == REPLAY:
+        recorded = session.serve(request.method, request.url, request.body)
+        if recorded is None:
+            raise requests.ConnectionError(session.unrecorded(request.method, request.url), request=request)
+        return _requests_response(request, recorded)
+
+    response = _original_adapter_send(self, request, *args, **kwargs)
+    session.record(RecordedResponse(request.method, request.url, response.status_code, kept_headers(response.headers), response.content), request.body)
+    return response
+
+
+def _requests_response(request, recorded: RecordedResponse) -> requests.Response:
+    response = requests.Response()
+    response.status_code = recorded.status_code
+    response.reason = http.client.responses.get(recorded.status_code, "")
+    response.headers = CaseInsensitiveDict(recorded.headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.url = request.url
+    response.request = request
+    response.elapsed = timedelta(0)
+    response._content = recorded.body
+    response._content_consumed = True
+    return response
+
+
+# httpx
+
+
+_original_handle_request = httpx.HTTPTransport.handle_request
+_original_handle_async_request = httpx.AsyncHTTPTransport.handle_async_request
+
+
+def _transport_handle_request(self, request: httpx.Request) -> httpx.Response:
+    session = active_session()
+    if session is None:
+        return _original_handle_request(self, request)
+    if session.mode == REPLAY:
+        return _httpx_response(request, session.serve(request.method, str(request.url), request.read()), session)
+
+    response = _original_handle_request(self, request)
+    body = response.read()
+    session.record(RecordedResponse(request.method, str(request.url), response.status_code, kept_headers(response.headers), body), request.read())
+    return httpx.Response(response.status_code, headers=kept_headers(response.headers), content=body, request=request)
+
+
+async def _async_transport_handle_request(self, request: httpx.Request) -> httpx.Response:
+    session = active_session()
+    if session is None:
+        return await _original_handle_async_request(self, request)
+    if session.mode == REPLAY:
+        return _httpx_response(request, session.serve(request.method, str(request.url), await request.aread()), session)
+
+    response = await _original_handle_async_request(self, request)
+    body = await response.aread()
+    session.record(RecordedResponse(request.method, str(request.url), response.status_code, kept_headers(response.headers), body), await request.aread())
+    return httpx.Response(response.status_code, headers=kept_headers(response.headers), content=body, request=request)
+
+
+def _httpx_response(request: httpx.Request, recorded: RecordedResponse | None, session: ReplaySession) -> httpx.Response:
+    if recorded is None:
+        raise httpx.ConnectError(session.unrecorded(request.method, str(request.url)), request=request)
+    return httpx.Response(recorded.status_code, headers=recorded.headers, content=recorded.body, request=request)
+
+
+# Playwright
+
+
+async def route_browser_context(context) -> None:
+    """Record or replay a new Playwright context's traffic when a session is active.
+
+    Called by PlaywrightBrowserService for every context it creates. The
+    replay route is added after resource blocking, so it is consulted first.
+    """
+    session = active_session()
+    if session is None:
+        return
+    if session.mode == RECORD:
+        context.on("response", _record_playwright_response)
+        return
+
+    async def serve(route):
+        request = route.request
+        current = active_session()
+        if current is None or current.mode != REPLAY:
+            await route.fallback()
+            return
+        recorded = current.serve(request.method, request.url, request.post_data_buffer)
+        if recorded is None:
+            await route.abort()
+            return
+        await route.fulfill(status=recorded.status_code, headers=recorded.headers, body=recorded.body)
+
+    await context.route("**/*", serve)
+
+
+async def _record_playwright_response(response) -> None:
+    session = active_session()
+    if session is None or session.mode != RECORD:
+        return
+    request = response.request
+    try:
+        body = await response.body()
+    except Exception:
+        # Redirects and aborted requests have no body to keep
+        return
+    session.record(RecordedResponse(request.method, request.url, response.status, kept_headers(response.headers), body), request.post_data_buffer)
+
+
+# Network
+
+
+def _is_loopback(address) -> bool:
+    if not isinstance(address, tuple):
+        return True  # AF_UNIX path
+    host = address[0]
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+@contextmanager
+def network_disabled() -> Iterator[None]:
+    """Refuse socket connections to anything but loopback addresses and local sockets."""
+    original_connect = socket.socket.connect
+    original_connect_ex = socket.socket.connect_ex
+
+    def connect(sock, address):
+        if not _is_loopback(address):
+            raise NetworkDisabledError(f"Network access to {address!r} is disabled during replay")
+        return original_connect(sock, address)
+
+    def connect_ex(sock, address):
+        if not _is_loopback(address):
+            raise NetworkDisabledError(f"Network access to {address!r} is disabled during replay")
+        return original_connect_ex(sock, address)
+
+    socket.socket.connect = connect
+    socket.socket.connect_ex = connect_ex
+    try:
+        yield
+    finally:
+        socket.socket.connect = original_connect
+        socket.socket.connect_ex = original_connect_ex
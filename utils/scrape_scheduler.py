@@ -0,0 +1,117 @@
+"""
+Concurrent scheduler for the multi-organization scrape batch.
+
+The cron runner used to scrape every organization one after another, so a
+batch took the sum of every site's rate-limited crawl. Organizations are
+independent sites, so they can run side by side under three limits:
+
+- a global cap on concurrent scrapes (SCRAPER_MAX_CONCURRENCY)
+- a per-domain cap, so no site sees more than one crawler from us at a
+  time (SCRAPER_PER_DOMAIN_CONCURRENCY)
+- a cap on concurrent browser scrapes (BROWSERLESS_MAX_SESSIONS). This
+  defaults to 1. Browser scrapes share the Playwright service's pooled
+  browser, whose open pages are capped separately by PLAYWRIGHT_MAX_PAGES.
+
+Jobs start longest-first, using each organization's last successful scrape
+duration, so the batch approaches the slowest organization's time rather
+than the sum.
+"""
+
+import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlparse
+
+from utils.config_models import OrganizationConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ScrapeJob:
+    """One organization's scrape, with the resources it holds while running."""
+
+    config_id: str
+    domain: str
+    uses_browser: bool = False
+    expected_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class SchedulerLimits:
+    """Concurrency limits for a scrape batch."""
+
+    max_concurrency: int = 4
+    per_domain: int = 1
+    browser_sessions: int = 1
+
+    @classmethod
+    def from_env(cls) -> "SchedulerLimits":
+        return cls(
+            max_concurrency=max(1, int(os.getenv("SCRAPER_MAX_CONCURRENCY", "4"))),
+            per_domain=max(1, int(os.getenv("SCRAPER_PER_DOMAIN_CONCURRENCY", "1"))),
+            browser_sessions=max(1, int(os.getenv("BROWSERLESS_MAX_SESSIONS", "1"))),
+        )
+
+
+def job_for(config: OrganizationConfig, expected_seconds: float = 0.0) -> ScrapeJob:
+    """Describe an organization's scrape from its config."""
+    host = urlparse(config.metadata.website_url or "").hostname or config.id
+    domain = host.removeprefix("www.")
+    scraper_config = config.scraper.config
+    uses_browser = bool(scraper_config and scraper_config.uses_browser)
+    return ScrapeJob(config.id, domain, uses_browser, expected_seconds)
+
+
+class ScrapeScheduler:
+    """Run scrape jobs concurrently within SchedulerLimits."""
+
+    def __init__(self, limits: SchedulerLimits | None = None):
+        self.limits = limits or SchedulerLimits.from_env()
+
+    def run(self, jobs: list[ScrapeJob], work: Callable[[ScrapeJob], Any], on_error: Callable[[ScrapeJob, Exception], Any]) -> list[Any]:
+        """
+        Run work(job) for every job and return the results in job order.
+
+        A job that raises does not affect the others; its result is
+        on_error(job, exception).
+        """
+        results: dict[str, Any] = {}
+        pending = sorted(jobs, key=lambda job: job.expected_seconds, reverse=True)
+        running: dict[Future, ScrapeJob] = {}
+        domains: dict[str, int] = {}
+        browsers = 0
+
+        def admissible(job: ScrapeJob) -> bool:
+            if domains.get(job.domain, 0) >= self.limits.per_domain:
+                return False
+            return not job.uses_browser or browsers < self.limits.browser_sessions
+
+        with ThreadPoolExecutor(max_workers=self.limits.max_concurrency, thread_name_prefix="scrape") as executor:
+            while pending or running:
+                for job in list(pending):
+                    if len(running) >= self.limits.max_concurrency:
+                        break
+                    if not admissible(job):
+                        continue
+                    pending.remove(job)
+                    domains[job.domain] = domains.get(job.domain, 0) + 1
+                    browsers += job.uses_browser
+                    running[executor.submit(work, job)] = job
+                    logger.info(f"Started scrape for {job.config_id} ({len(running)} running, {len(pending)} waiting)")
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    domains[job.domain] -= 1
+                    browsers -= job.uses_browser
+                    try:
+                        results[job.config_id] = future.result()
+                    except Exception as e:
+                        logger.error(f"Scrape for {job.config_id} raised: {e}")
+                        results[job.config_id] = on_error(job, e)
+
+        return [results[job.config_id] for job in jobs]
@@ -4,18 +4,30 @@ Follows CLAUDE.md principles: immutable data, pure functions, early returns.
 """
 
 import logging
+import threading
 from dataclasses import dataclass
 from typing import Any, Protocol
 
 from utils.config_loader import ConfigLoader
+from utils.db_connection import execute_query
 from utils.organization_sync_service import (
     OrganizationSyncService,
     create_default_sync_service,
 )
+from utils.scrape_scheduler import ScrapeScheduler, job_for
 from utils.secure_scraper_loader import ScraperModuleInfo, SecureScraperLoader
 
 logger = logging.getLogger(__name__)
 
+# Last successful duration per organization, used to start the longest scrapes first
+RECENT_DURATIONS_QUERY = """
+    SELECT DISTINCT ON (o.config_id) o.config_id, sl.duration_seconds
+    FROM scrape_logs sl
+    JOIN organizations o ON o.id = sl.organization_id
+    WHERE sl.status = 'success' AND sl.duration_seconds IS NOT NULL AND o.config_id IS NOT NULL
+    ORDER BY o.config_id, sl.started_at DESC
+"""
+
 
 @dataclass(frozen=True)
 class ScraperInfo:
@@ -71,11 +83,15 @@ class SecureConfigScraperRunner:
         config_loader: ConfigLoaderProtocol | None = None,
         scraper_loader: SecureScraperLoader | None = None,
         sync_service: OrganizationSyncService | None = None,
+        scheduler: ScrapeScheduler | None = None,
     ):
         """Initialize with injected dependencies."""
         self.config_loader = config_loader or ConfigLoader()
         self.scraper_loader = scraper_loader or SecureScraperLoader()
         self.sync_service = sync_service or create_default_sync_service()
+        self.scheduler = scheduler or ScrapeScheduler()
+        # Scraper construction swaps the process-wide DB pool; scrapes run in parallel, loads don't
+        self._load_lock = threading.Lock()
 
     def list_available_scrapers(self) -> list[ScraperInfo]:
         """List all available scrapers from configs (pure function)."""
@@ -187,7 +203,8 @@ class SecureConfigScraperRunner:
                     )
 
             # Load scraper
-            scraper = self.load_scraper_safely(config_id)
+            with self._load_lock:
+                scraper = self.load_scraper_safely(config_id)
 
             # Run scraper
             success = scraper.run()
@@ -224,11 +241,14 @@ class SecureConfigScraperRunner:
             configs = {org.id: org for org in enabled_orgs}
             sync_results = self.sync_service.sync_all_organizations(configs)
 
-            # Run scrapers
-            results = []
-            for org_config in enabled_orgs:
-                result = self.run_scraper(org_config.id, sync_first=False)
-                results.append(result)
+            # Run scrapers concurrently; each result stays isolated to its organization
+            durations = self.recent_scrape_durations()
+            jobs = [job_for(org, durations.get(org.id, 0.0)) for org in enabled_orgs]
+            results = self.scheduler.run(
+                jobs,
+                lambda job: self.run_scraper(job.config_id, sync_first=False),
+                lambda job, e: ScraperRunResult(config_id=job.config_id, success=False, error=str(e)),
+            )
 
             # Calculate summary
             successful = sum(1 for r in results if r.success)
@@ -254,6 +274,14 @@ class SecureConfigScraperRunner:
                 error=str(e),
             )
 
+    def recent_scrape_durations(self) -> dict[str, float]:
+        """Last successful scrape duration per organization; empty when unavailable."""
+        try:
+            return {row["config_id"]: float(row["duration_seconds"]) for row in execute_query(RECENT_DURATIONS_QUERY)}
+        except Exception as e:
+            logger.warning(f"Could not read recent scrape durations, scheduling in config order: {e}")
+            return {}
+
     def get_scraper_status(self, config_id: str) -> dict[str, Any]:
         """Get status information for a scraper."""
         try:
@@ -308,9 +336,10 @@ def create_secure_scraper_runner(
     config_loader: ConfigLoaderProtocol | None = None,
     scraper_loader: SecureScraperLoader | None = None,
     sync_service: OrganizationSyncService | None = None,
+    scheduler: ScrapeScheduler | None = None,
 ) -> SecureConfigScraperRunner:
     """Create secure scraper runner with dependency injection."""
-    return SecureConfigScraperRunner(config_loader, scraper_loader, sync_service)
+    return SecureConfigScraperRunner(config_loader, scraper_loader, sync_service, scheduler)
 
 
 # Convenience function for backward compatibility
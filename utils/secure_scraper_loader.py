@@ -177,11 +177,12 @@ class SecureScraperLoader:
             try:
                 from utils.db_connection import (
                     create_database_config_from_env,
-                    initialize_database_pool,
+                    ensure_database_pool,
                 )
 
                 db_config = create_database_config_from_env()
-                global_pool = initialize_database_pool(db_config)
+                # Other scrapes may be using the pool already; never replace it
+                global_pool = ensure_database_pool(db_config)
                 if global_pool is None:
                     raise RuntimeError("Global database pool validation failed")
                 logger.info("Global database pool initialized and validated successfully")
@@ -189,17 +190,17 @@ class SecureScraperLoader:
                 logger.error(f"CRITICAL: Global database pool initialization failed: {e}")
                 raise RuntimeError(f"Global database pool validation failed: {e}") from e
 
-            from services.connection_pool import ConnectionPoolService
+            from services.connection_pool import get_scrape_connection_pool
             from services.database_service import DatabaseService
             from services.image_processing_service import ImageProcessingService
             from services.metrics_collector import MetricsCollector
             from services.session_manager import SessionManager
+            from utils.scrape_scheduler import SchedulerLimits
 
-            # Create connection pool for shared database access
+            # One pool for every scrape in this process, sized for the batch's concurrency
             connection_pool = None
             try:
-                connection_pool = ConnectionPoolService(DB_CONFIG, min_connections=2, max_connections=25)
-                logger.info("Service connection pool created successfully")
+                connection_pool = get_scrape_connection_pool(DB_CONFIG, SchedulerLimits.from_env().max_concurrency)
             except Exception as e:
                 logger.error(f"CRITICAL: Connection pool creation failed: {e}")
                 raise RuntimeError(f"Connection pool creation failed: {e}") from e
@@ -230,11 +231,8 @@ class SecureScraperLoader:
                 database_service.close()  # Clean up successful connection
                 raise RuntimeError("SessionManager connection failed - scraper cannot track stale data without session management")
 
-            # Store services for cleanup
-            services_to_store = [database_service, session_manager]
-            if connection_pool:
-                services_to_store.append(connection_pool)
-            scraper_instance._injected_services = services_to_store
+            # Store services for cleanup; the shared pool outlives this scrape
+            scraper_instance._injected_services = [database_service, session_manager]
 
             # Inject services into the scraper instance
             scraper_instance.database_service = database_service
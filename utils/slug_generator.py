@@ -123,10 +123,33 @@ def fetch_slugs_by_ids(connection, animal_ids: list[int]) -> list[str]:
         return []
 
 
+def next_free_slug(base_slug: str, taken: set[str]) -> str:
+    """
+    Pick base_slug, or base_slug with the lowest free numeric suffix.
+
+    Args:
+        base_slug: Preferred slug
+        taken: Slugs already in use
+
+    Returns:
+        The first of base_slug, base_slug-1, base_slug-2, ... not in taken
+    """
+    if base_slug not in taken:
+        return base_slug
+
+    counter = 1
+    while f"{base_slug}-{counter}" in taken:
+        counter += 1
+    return f"{base_slug}-{counter}"
+
+
 def ensure_unique_slug(base_slug: str, connection, exclude_id: int | None = None) -> str:
     """
     Ensure slug is unique by checking database and adding suffix if needed.
 
+    Fetches the base slug and every suffixed variant in one query and picks
+    the first free suffix in memory, instead of probing candidates one by one.
+
     Args:
         base_slug: Base slug to check
         connection: Database connection
@@ -142,46 +165,67 @@ def ensure_unique_slug(base_slug: str, connection, exclude_id: int | None = None
     try:
         cursor = connection.cursor()
 
-        # Check if base slug exists
-        query = "SELECT COUNT(*) FROM animals WHERE slug = %s"
-        params = [base_slug]
+        # Slugs are [a-z0-9-] only, so the base needs no LIKE escaping
+        query = "SELECT slug FROM animals WHERE (slug = %s OR slug LIKE %s)"
+        params = [base_slug, f"{base_slug}-%"]
 
         if exclude_id is not None:
             query += " AND id != %s"
             params.append(exclude_id)
 
         cursor.execute(query, params)
-        count = cursor.fetchone()[0]
+        taken = {row[0] for row in cursor.fetchall()}
         cursor.close()
 
-        # If slug is unique, return it
-        if count == 0:
-            return base_slug
+        return next_free_slug(base_slug, taken)
 
-        # Generate unique slug with suffix
-        counter = 1
-        while counter <= 100:  # Prevent infinite loops
-            candidate_slug = f"{base_slug}-{counter}"
+    except Exception as e:
+        logger.error(f"Error checking slug uniqueness: {e}")
+        # Fallback: return base slug with warning
+        return base_slug
 
-            # Check if candidate is unique
-            cursor = connection.cursor()
-            cursor.execute(query.replace(" = %s", " = %s"), [candidate_slug] + params[1:])
-            count = cursor.fetchone()[0]
-            cursor.close()
 
-            if count == 0:
-                return candidate_slug
+def ensure_unique_slugs(base_slugs: list[str], connection) -> list[str]:
+    """
+    Make a batch of slugs unique against the database and each other.
 
-            counter += 1
+    One indexed lookup finds which bases are taken; only those then need a
+    second query for their suffixed variants.
 
-        # Fallback: append timestamp if all else fails
-        timestamp_suffix = str(int(time.time()))[-6:]  # Last 6 digits of timestamp
-        return f"{base_slug}-{timestamp_suffix}"
+    Args:
+        base_slugs: Preferred slugs, in order
+        connection: Database connection
 
+    Returns:
+        Unique slugs in the same order
+    """
+    if not base_slugs:
+        return []
+
+    if not connection:
+        logger.warning("No database connection provided for slug uniqueness check")
+        return list(base_slugs)
+
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SELECT slug FROM animals WHERE slug = ANY(%s)", (list(base_slugs),))
+        taken = {row[0] for row in cursor.fetchall()}
+
+        collided = sorted(taken.intersection(base_slugs))
+        if collided:
+            cursor.execute("SELECT slug FROM animals WHERE slug LIKE ANY(%s)", ([f"{slug}-%" for slug in collided],))
+            taken.update(row[0] for row in cursor.fetchall())
+        cursor.close()
     except Exception as e:
         logger.error(f"Error checking slug uniqueness: {e}")
-        # Fallback: return base slug with warning
-        return base_slug
+        return list(base_slugs)
+
+    unique_slugs = []
+    for base_slug in base_slugs:
+        slug = next_free_slug(base_slug, taken)
+        taken.add(slug)
+        unique_slugs.append(slug)
+    return unique_slugs
 
 
 def generate_unique_animal_slug(